@@ -7,9 +7,92 @@ class AppConfig(BaseSettings):
     max_file_size_mb: int = 10
     skills_path: str = "src/skills/.config/happy_smile"
     prompts_path: str = "base_prompts"
+    skill_workers: int = 2
+    skill_cache_entries: int = 256
+    skill_timeout_seconds: float = 300.0
     recursive_scan: bool = True
+    scan_archives: bool = True
+    archive_max_members: int = 10000
+    archive_max_member_mb: int = 512
+    archive_max_total_mb: int = 4096
+    archive_max_ratio: float = 200.0
+    archive_memory_mb: int = 64
+    spreadsheet_max_rows: int = 1000
+    dedup_enabled: bool = True
+    document_memory_limit_mb: int = 512
+    document_spill_dir: str | None = None
+    document_spill_compression: str = "zlib"
+    near_duplicate_threshold: float = 0.9
+    retrieval_top_k: int = 0
+    retrieval_embedder: str = "hashing"
+    retrieval_chunk_chars: int = 1500
+    retrieval_chunk_overlap: int = 200
     request_timeout: int = 60
     max_retries: int = 3
+    prompt_cache: bool = True
+    openrouter_vision: bool | None = None
+    openrouter_base_url: str = "https://openrouter.ai/api/v1"
+    openrouter_stream: bool = False
+    llm_provider: str = "openrouter"
+    mock_latency: str = "lognormal"
+    mock_latency_ms: float = 500.0
+    mock_latency_jitter: float = 0.5
+    mock_prompt_ms_per_token: float = 0.05
+    mock_completion_ms_per_token: float = 5.0
+    mock_completion_tokens: int = 200
+    mock_rate_limit_rate: float = 0.0
+    mock_server_error_rate: float = 0.0
+    mock_seed: int = 0
+    mock_vision: bool = False
+    mock_server_host: str = "127.0.0.1"
+    mock_server_port: int = 8799
+    ocr_engines: str = "tesseract,easyocr"
+    ocr_languages: str = "ru,en"
+    ocr_region_confidence: float = 0.6
+    ocr_page_confidence: float = 0.4
+    ocr_llm_confidence: float = 0.3
+    ocr_workers: int = 2
+    model_host: bool = True
+    model_host_batch_size: int = 8
+    model_host_batch_wait_ms: float = 5.0
+    pdf_ocr_dpi: int = 300
+    vision_mode: str = "off"
+    vision_max_pixels: int = 1_200_000
+    vision_jpeg_quality: int = 80
+    vision_payload_budget_mb: float = 20.0
+    vision_text_density_threshold: float = 0.08
+    vision_pdf_max_pages: int = 10
+    summary_workers: int = 4
+    progress: str = "auto"
+    progress_file: str | None = None
+    progress_interval_seconds: float = 1.0
+    transcript_map_chars: int = 12000
+    transcript_map_workers: int = 2
+    preflight_probe: bool = True
+    extraction_timeout_seconds: float = 600.0
+    extraction_checkpoint: bool = True
+    extraction_light_workers: int = 0
+    extraction_heavy_workers: int = 2
+    extraction_heavy_seconds_per_mb: float = 3.0
+    extraction_heavy_worker_memory_mb: int = 1024
+    error_policy: str = "retry"
+    read_retries: int = 1
+    read_retry_delay_seconds: float = 1.0
+    data_dir: str = ".summarizer"
+    log_enqueue: bool = False
+    log_json_file: str | None = None
+    log_json_max_mb: int = 50
+    log_json_backups: int = 5
+    log_sample_first: int = 20
+    log_sample_every: int = 1000
+    batch_concurrency: int = 2
+    batch_output_dir: str = "batch_output"
+    server_host: str = "127.0.0.1"
+    server_port: int = 8765
+    server_workers: int = 2
+    server_queue_size: int = 100
+    watch_debounce_seconds: float = 2.0
+    watch_poll_interval: float = 1.0
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
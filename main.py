@@ -8,6 +8,7 @@ from config import AppConfig
 from src.core.logger import Logger
 from src.core.main_app import App
 from src.dependencies import Container
+from src.output.formatter import OutputFormat
 from src.output.tables import display_error
 
 cli_app = typer.Typer(
@@ -18,8 +19,17 @@ cli_app = typer.Typer(
 
 
 def bootstrap_app(verbose: bool) -> App:
-    logger = Logger(name="main", level="DEBUG" if verbose else "INFO")
     config = AppConfig()
+    logger = Logger(
+        name="main",
+        level="DEBUG" if verbose else "INFO",
+        enqueue=config.log_enqueue,
+        json_file=config.log_json_file,
+        json_max_mb=config.log_json_max_mb,
+        json_backups=config.log_json_backups,
+        sample_first=config.log_sample_first,
+        sample_every=config.log_sample_every,
+    )
 
     container = Container()
     container.config.from_pydantic(config)
@@ -35,6 +45,16 @@ def handle_exception(e: Exception, verbose: bool):
     raise typer.Exit(code=1)
 
 
+def parse_variables(values: list[str] | None) -> dict[str, str]:
+    variables = {}
+    for value in values or []:
+        key, sep, item = value.partition("=")
+        if not sep or not key.strip():
+            raise typer.BadParameter(f"Ожидается KEY=VALUE, получено: {value}")
+        variables[key.strip()] = item
+    return variables
+
+
 @cli_app.command(name="run")
 def run_analysis(
     folder: Path = typer.Argument(
@@ -48,11 +68,199 @@ def run_analysis(
         None, "--prompt", "-p", help="Имя промпта для генерации"
     ),
     skill: str | None = typer.Option(None, "--skill", "-s", help="Навык для обработки"),
+    per_document: bool = typer.Option(
+        False, "--per-document", help="Отдельное саммари для каждого документа"
+    ),
+    output: Path | None = typer.Option(
+        None, "--output", "-o", dir_okay=False, help="Файл для результатов"
+    ),
+    output_format: OutputFormat | None = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="Формат файла результатов (по умолчанию по расширению)",
+    ),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", min=1, help="Число параллельных запросов к LLM"
+    ),
+    top_k: int | None = typer.Option(
+        None,
+        "--top-k",
+        "-k",
+        min=0,
+        help="Отправлять в LLM только k наиболее релевантных фрагментов (0 - всё)",
+    ),
+    query: str | None = typer.Option(
+        None, "--query", "-q", help="Вопрос к документам (используется для поиска)"
+    ),
+    filter_query: str | None = typer.Option(
+        None,
+        "--filter",
+        help="Суммаризировать только документы, найденные полнотекстовым поиском",
+    ),
+    variables: list[str] | None = typer.Option(
+        None, "--var", help="Переменная шаблона промпта в виде KEY=VALUE"
+    ),
+    progress: str | None = typer.Option(
+        None,
+        "--progress",
+        help="Индикатор прогресса: auto, bar, json или off",
+    ),
+    progress_file: Path | None = typer.Option(
+        None,
+        "--progress-file",
+        dir_okay=False,
+        help="Файл для JSON-потока прогресса (по умолчанию stderr)",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Только показать план: файлы, оценки времени и токенов, проверка модели",
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Детальное логирование"),
+):
+    if dry_run:
+        try:
+            with bootstrap_app(verbose) as app:
+                plan = app.plan(
+                    folder,
+                    prompt,
+                    skill,
+                    verbose,
+                    per_document=per_document,
+                    top_k=top_k,
+                    variables=parse_variables(variables),
+                )
+        except Exception as e:
+            handle_exception(e, verbose)
+        if plan.problems:
+            raise typer.Exit(code=1)
+        return
+
+    try:
+        prompt_variables = parse_variables(variables)
+        with bootstrap_app(verbose) as app:
+            app.run(
+                folder,
+                prompt,
+                skill,
+                verbose,
+                per_document=per_document,
+                output=output,
+                output_format=output_format,
+                workers=workers,
+                top_k=top_k,
+                query=query,
+                filter_query=filter_query,
+                variables=prompt_variables,
+                progress=progress,
+                progress_file=progress_file,
+            )
+    except Exception as e:
+        handle_exception(e, verbose)
+
+
+@cli_app.command(name="batch")
+def run_batch(
+    targets: list[str] = typer.Argument(
+        ...,
+        help="Папки, glob-шаблоны папок или JSONL-файлы с заданиями",
+    ),
+    prompt: str | None = typer.Option(
+        None, "--prompt", "-p", help="Имя промпта для генерации"
+    ),
+    skill: str | None = typer.Option(None, "--skill", "-s", help="Навык для обработки"),
+    concurrency: int | None = typer.Option(
+        None, "--concurrency", "-c", min=1, help="Число одновременно выполняемых заданий"
+    ),
+    output_dir: Path | None = typer.Option(
+        None, "--output-dir", "-o", file_okay=False, help="Папка для результатов"
+    ),
+    retry_failed: bool = typer.Option(
+        False, "--retry-failed", help="Повторить задания, завершившиеся ошибкой"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Детальное логирование"),
+):
+    try:
+        with bootstrap_app(verbose) as app:
+            app.batch(
+                targets, prompt, skill, concurrency, output_dir, retry_failed, verbose
+            )
+    except Exception as e:
+        handle_exception(e, verbose)
+
+
+@cli_app.command(name="watch")
+def watch_folder(
+    folder: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Папка, за изменениями в которой нужно следить",
+    ),
+    prompt: str | None = typer.Option(
+        None, "--prompt", "-p", help="Имя промпта для генерации"
+    ),
+    skill: str | None = typer.Option(None, "--skill", "-s", help="Навык для обработки"),
+    output: Path | None = typer.Option(
+        None, "--output", "-o", dir_okay=False, help="Файл для актуального саммари"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Детальное логирование"),
+):
+    try:
+        with bootstrap_app(verbose) as app:
+            app.watch(folder, prompt, skill, output, verbose)
+    except Exception as e:
+        handle_exception(e, verbose)
+
+
+@cli_app.command(name="serve")
+def serve(
+    host: str | None = typer.Option(None, "--host", help="Адрес для HTTP API"),
+    port: int | None = typer.Option(None, "--port", help="Порт для HTTP API"),
+    socket_path: Path | None = typer.Option(
+        None, "--socket", help="Слушать Unix-сокет вместо TCP-порта"
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Детальное логирование"),
+):
+    try:
+        with bootstrap_app(verbose) as app:
+            app.serve(host, port, socket_path, verbose)
+    except Exception as e:
+        handle_exception(e, verbose)
+
+
+@cli_app.command(name="mock-server")
+def mock_server(
+    host: str | None = typer.Option(None, "--host", help="Адрес mock-сервера"),
+    port: int | None = typer.Option(None, "--port", help="Порт mock-сервера"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Детальное логирование"),
+):
+    try:
+        with bootstrap_app(verbose) as app:
+            app.mock_server(host, port, verbose)
+    except Exception as e:
+        handle_exception(e, verbose)
+
+
+@cli_app.command(name="search")
+def search(
+    query: str = typer.Argument(..., help="Поисковый запрос (синтаксис SQLite FTS5)"),
+    folder: Path | None = typer.Option(
+        None,
+        "--folder",
+        "-d",
+        exists=True,
+        file_okay=False,
+        help="Обновить индекс для папки и искать только в ней",
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", min=1, help="Максимум результатов"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Детальное логирование"),
 ):
     try:
-        app = bootstrap_app(verbose)
-        app.run(folder, prompt, skill, verbose)
+        with bootstrap_app(verbose) as app:
+            app.search(query, folder, limit, verbose)
     except Exception as e:
         handle_exception(e, verbose)
 
@@ -62,8 +270,8 @@ def list_prompts(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Детальное логирование"),
 ):
     try:
-        app = bootstrap_app(verbose)
-        app.list_prompts()
+        with bootstrap_app(verbose) as app:
+            app.list_prompts()
     except Exception as e:
         handle_exception(e, verbose)
 
@@ -73,8 +281,8 @@ def list_skills(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Детальное логирование"),
 ):
     try:
-        app = bootstrap_app(verbose)
-        app.list_skills()
+        with bootstrap_app(verbose) as app:
+            app.list_skills()
     except Exception as e:
         handle_exception(e, verbose)
 
@@ -0,0 +1,250 @@
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import zipfile
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import IO, NamedTuple
+
+from src.domain.exceptions import ArchiveError, ArchiveLimitError
+
+ARCHIVE_SUFFIXES = (
+    ".zip",
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tbz2",
+    ".tar.xz",
+    ".txz",
+)
+
+_COPY_CHUNK = 1024 * 1024
+# Мелкие файлы сжимаются сколь угодно сильно, степень сжатия проверяется от мегабайта
+_RATIO_FLOOR = 1024 * 1024
+_RAM_DIR = Path("/dev/shm")
+_OPEN_PER_THREAD = 4
+_READ_ERRORS = (
+    zipfile.BadZipFile,
+    tarfile.TarError,
+    zlib.error,
+    EOFError,
+    RuntimeError,
+    KeyError,
+)
+
+
+class MemberStat(NamedTuple):
+    st_size: int
+    st_mtime_ns: int
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    name: str
+    size: int
+    compressed_size: int | None = None
+
+
+@dataclass(frozen=True)
+class ArchiveLimits:
+    max_members: int = 10_000
+    max_member_bytes: int = 512 * 1024 * 1024
+    max_total_bytes: int = 4 * 1024 * 1024 * 1024
+    max_ratio: float = 200.0
+
+    def check(self, archive: Path, members: list[ArchiveMember]) -> list[ArchiveMember]:
+        # Размеры берутся из оглавления, до распаковки: zip-бомба отсекается целиком,
+        # а не после того, как заполнит память или диск
+        if len(members) > self.max_members:
+            raise ArchiveLimitError(
+                f"{len(members)} members exceed the limit of {self.max_members}"
+            )
+        total = sum(member.size for member in members)
+        if total > self.max_total_bytes:
+            raise ArchiveLimitError(
+                f"{total} unpacked bytes exceed the limit of {self.max_total_bytes}"
+            )
+        packed = archive.stat().st_size
+        if total > _RATIO_FLOOR and packed and total / packed > self.max_ratio:
+            raise ArchiveLimitError(
+                f"compression ratio {total / packed:.0f} exceeds {self.max_ratio:.0f}"
+            )
+        for member in members:
+            if (
+                member.size > _RATIO_FLOOR
+                and member.compressed_size
+                and member.size / member.compressed_size > self.max_ratio
+            ):
+                raise ArchiveLimitError(
+                    f"member {member.name} has compression ratio "
+                    f"{member.size / member.compressed_size:.0f}"
+                )
+        return [member for member in members if member.size <= self.max_member_bytes]
+
+
+def is_archive(path: Path) -> bool:
+    return path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def split_member(path: Path) -> tuple[Path, str] | None:
+    # Файл внутри архива адресуется путем "архив/имя члена"; проверяются
+    # только предки с расширением архива, обычные пути не стоят лишних stat
+    for parent in path.parents:
+        if is_archive(parent) and parent.is_file():
+            return parent, path.relative_to(parent).as_posix()
+    return None
+
+
+def list_members(archive: Path) -> list[ArchiveMember]:
+    stat = archive.stat()
+    return list(_index(archive, stat.st_mtime_ns, stat.st_size).values())
+
+
+def file_stat(path: Path) -> os.stat_result | MemberStat:
+    located = split_member(path)
+    if located is None:
+        return path.stat()
+    archive, name = located
+    stat = archive.stat()
+    try:
+        member = _index(archive, stat.st_mtime_ns, stat.st_size).get(name)
+    except ArchiveError as e:
+        # Для вызывающих кода испорченный архив - такой же нечитаемый файл
+        raise OSError(str(e)) from e
+    if member is None:
+        raise FileNotFoundError(f"No member {name} in archive {archive}")
+    # Время изменения самого архива: при его замене все члены считаются новыми
+    return MemberStat(member.size, stat.st_mtime_ns)
+
+
+def is_file(path: Path) -> bool:
+    if split_member(path) is None:
+        return path.is_file()
+    try:
+        file_stat(path)
+    except OSError:
+        return False
+    return True
+
+
+@contextmanager
+def open_binary(path: Path) -> Iterator[IO[bytes]]:
+    located = split_member(path)
+    if located is None:
+        with open(path, "rb") as f:
+            yield f
+        return
+
+    archive, name = located
+    size = file_stat(path).st_size
+    try:
+        raw = _open_member(archive, name)
+    except _READ_ERRORS as e:
+        raise ArchiveError(f"Cannot read {name} from {archive.name}: {e}") from e
+    with raw:
+        yield _LimitedReader(raw, size, path)
+
+
+@contextmanager
+def materialize(path: Path, memory_limit_bytes: int = 64 * 1024 * 1024) -> Iterator[Path]:
+    if split_member(path) is None:
+        yield path
+        return
+
+    # Читателям нужен настоящий путь: во временный файл попадает один член архива,
+    # а не весь архив. Небольшие пишутся в tmpfs, то есть остаются в памяти
+    size = file_stat(path).st_size
+    directory = (
+        _RAM_DIR if size <= memory_limit_bytes and os.access(_RAM_DIR, os.W_OK) else None
+    )
+    fd, name = tempfile.mkstemp(suffix=f"-{path.name}", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as target, open_binary(path) as source:
+            shutil.copyfileobj(source, target, _COPY_CHUNK)
+        yield Path(name)
+    finally:
+        os.unlink(name)
+
+
+class _LimitedReader:
+    def __init__(self, raw: IO[bytes], limit: int, path: Path):
+        self._raw = raw
+        self._limit = limit
+        self._path = path
+        self._read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        # Оглавлению архива нельзя доверять: читается не больше заявленного размера
+        try:
+            chunk = self._raw.read(size if size >= 0 else self._limit + 1)
+        except _READ_ERRORS as e:
+            raise ArchiveError(f"Cannot read {self._path.name}: {e}") from e
+        self._read += len(chunk)
+        if self._read > self._limit:
+            raise ArchiveLimitError(
+                f"{self._path.name} unpacks to more than the declared {self._limit} bytes"
+            )
+        return chunk
+
+
+def _is_safe(name: str) -> bool:
+    path = PurePosixPath(name)
+    return bool(name) and not path.is_absolute() and ".." not in path.parts
+
+
+@lru_cache(maxsize=64)
+def _index(archive: Path, mtime_ns: int, size: int) -> dict[str, ArchiveMember]:
+    members: dict[str, ArchiveMember] = {}
+    try:
+        if zipfile.is_zipfile(archive):
+            with zipfile.ZipFile(archive) as zf:
+                for info in zf.infolist():
+                    if not info.is_dir() and _is_safe(info.filename):
+                        members[info.filename] = ArchiveMember(
+                            info.filename, info.file_size, info.compress_size
+                        )
+        else:
+            # Для tar.gz оглавление читается потоково, без записи на диск
+            with tarfile.open(archive, "r:*") as tf:
+                for info in tf:
+                    if info.isreg() and _is_safe(info.name):
+                        members[info.name] = ArchiveMember(info.name, info.size)
+    except (OSError, *_READ_ERRORS) as e:
+        raise ArchiveError(f"Cannot read archive {archive.name}: {e}") from e
+    return members
+
+
+_handles = threading.local()
+
+
+def _open_member(archive: Path, name: str) -> IO[bytes]:
+    # Открытый архив держится в потоке между членами: члены tar.gz читаются
+    # по порядку, и распаковка продолжается с места, а не с начала файла
+    cache: dict[tuple[Path, int], zipfile.ZipFile | tarfile.TarFile] = (
+        _handles.__dict__.setdefault("cache", {})
+    )
+    key = (archive, archive.stat().st_mtime_ns)
+    handle = cache.get(key)
+    if handle is None:
+        while len(cache) >= _OPEN_PER_THREAD:
+            cache.pop(next(iter(cache))).close()
+        handle = (
+            zipfile.ZipFile(archive)
+            if zipfile.is_zipfile(archive)
+            else tarfile.open(archive, "r:*")  # noqa: SIM115
+        )
+        cache[key] = handle
+
+    if isinstance(handle, zipfile.ZipFile):
+        return handle.open(name)
+    member = handle.extractfile(name)
+    if member is None:
+        raise ArchiveError(f"{name} in {archive.name} is not a regular file")
+    return member
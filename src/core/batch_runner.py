@@ -0,0 +1,202 @@
+import glob
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.core.document_service import DocumentService
+from src.core.job_queue import JobQueue
+from src.core.logger import Logger
+from src.core.prompt_manager import PromptManager
+from src.core.summary_generator import SummaryGenerator
+from src.domain.exceptions import JobFileError
+from src.domain.models import Job, JobStatus
+from src.prompts.template import PromptTemplate
+from src.skills.engine import SkillEngine
+
+
+class BatchRunner:
+    JOB_FILE_SUFFIXES = {".jsonl", ".ndjson"}
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        prompt_manager: PromptManager,
+        document_service: DocumentService,
+        summary_generator: SummaryGenerator,
+        logger: Logger,
+        concurrency: int = 2,
+        skill_engine: SkillEngine | None = None,
+    ):
+        self._queue = queue
+        self._prompt_manager = prompt_manager
+        self._document_service = document_service
+        self._summary_generator = summary_generator
+        self._logger = logger
+        self._concurrency = max(1, concurrency)
+        self._skill_engine = skill_engine
+        self._prompt_lock = threading.Lock()
+        self._prompts: dict[tuple[str | None, str | None], PromptTemplate] = {}
+
+    def build_jobs(
+        self,
+        targets: list[str],
+        output_dir: Path,
+        prompt_name: str | None = None,
+        skill_name: str | None = None,
+    ) -> list[Job]:
+        jobs: dict[str, Job] = {}
+
+        for target in targets:
+            if Path(target).suffix.lower() in self.JOB_FILE_SUFFIXES:
+                new_jobs = self._load_job_file(
+                    Path(target), output_dir, prompt_name, skill_name
+                )
+            else:
+                new_jobs = [
+                    self._make_job(folder, output_dir, prompt_name, skill_name)
+                    for folder in self._expand_folders(target)
+                ]
+
+            for job in new_jobs:
+                jobs.setdefault(job.id, job)
+
+        return list(jobs.values())
+
+    def submit(self, jobs: list[Job]) -> int:
+        added = self._queue.add(jobs)
+        self._logger.info(f"Queued {added} new job(s), {len(jobs) - added} already known")
+        return added
+
+    def run(self, concurrency: int | None = None) -> dict[JobStatus, int]:
+        recovered = self._queue.recover()
+        if recovered:
+            self._logger.warning(f"Resuming {recovered} job(s) interrupted by a crash")
+
+        workers = max(1, concurrency or self._concurrency)
+        self._logger.info(f"Starting batch with {workers} worker(s)")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as pool:
+            for _ in range(workers):
+                pool.submit(self._worker_loop)
+
+        counts = self._queue.counts()
+        self._logger.info(
+            f"Batch finished: {counts[JobStatus.DONE]} done, "
+            f"{counts[JobStatus.FAILED]} failed"
+        )
+        return counts
+
+    def _worker_loop(self) -> None:
+        while (job := self._queue.claim()) is not None:
+            self._process_job(job)
+
+    def _process_job(self, job: Job) -> None:
+        self._logger.info(f"[{job.id}] Processing {job.folder}")
+        try:
+            summary = self._summarize(job)
+            self._write_output(job.output_path, summary)
+        except Exception as e:
+            self._logger.error(f"[{job.id}] Failed: {e}")
+            self._queue.mark_failed(job.id, str(e))
+            return
+
+        self._queue.mark_done(job.id)
+        self._logger.info(f"[{job.id}] Done -> {job.output_path}")
+
+    def _summarize(self, job: Job) -> str:
+        if not job.folder.is_dir():
+            raise FileNotFoundError(f"Folder not found: {job.folder}")
+
+        prompt = self._resolve_prompt(job.prompt, job.skill)
+        documents = self._document_service.get_documents(job.folder)
+        if not documents:
+            return "Не удалось сгенерировать саммари: в папке нет документов."
+
+        if self._skill_engine is None:
+            return self._summary_generator.generate(documents, prompt)
+        documents = self._skill_engine.run_pre(job.skill, documents)
+        summary = self._summary_generator.generate(documents, prompt)
+        return self._skill_engine.run_post(job.skill, summary, documents)
+
+    def _resolve_prompt(
+        self, prompt_name: str | None, skill_name: str | None
+    ) -> PromptTemplate:
+        key = (prompt_name, skill_name)
+        with self._prompt_lock:
+            if key not in self._prompts:
+                self._prompts[key] = self._prompt_manager.select(prompt_name, skill_name)
+            return self._prompts[key]
+
+    def _write_output(self, output_path: Path, summary: str) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Пишем во временный файл, чтобы не оставить обрезанный результат при падении
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        tmp_path.write_text(summary, encoding="utf-8")
+        tmp_path.replace(output_path)
+
+    def _expand_folders(self, target: str) -> list[Path]:
+        if glob.has_magic(target):
+            folders = [Path(p) for p in sorted(glob.glob(target)) if Path(p).is_dir()]
+            if not folders:
+                self._logger.warning(f"Pattern matched no folders: {target}")
+            return folders
+        return [Path(target)]
+
+    def _load_job_file(
+        self,
+        job_file: Path,
+        output_dir: Path,
+        prompt_name: str | None,
+        skill_name: str | None,
+    ) -> list[Job]:
+        if not job_file.is_file():
+            raise JobFileError(f"Job file not found: {job_file}")
+
+        jobs = []
+        with open(job_file, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                    folder = Path(data["folder"])
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    raise JobFileError(f"{job_file}:{line_no}: invalid job: {e}") from e
+
+                output = data.get("output")
+                jobs.append(
+                    self._make_job(
+                        folder,
+                        output_dir,
+                        data.get("prompt", prompt_name),
+                        data.get("skill", skill_name),
+                        job_id=data.get("id"),
+                        output_path=Path(output) if output else None,
+                    )
+                )
+        return jobs
+
+    def _make_job(
+        self,
+        folder: Path,
+        output_dir: Path,
+        prompt_name: str | None,
+        skill_name: str | None,
+        job_id: str | None = None,
+        output_path: Path | None = None,
+    ) -> Job:
+        job_id = job_id or self._job_id(folder, prompt_name, skill_name)
+        return Job(
+            id=job_id,
+            folder=folder,
+            output_path=output_path or output_dir / f"{folder.name}-{job_id[:8]}.md",
+            prompt=prompt_name,
+            skill=skill_name,
+        )
+
+    @staticmethod
+    def _job_id(folder: Path, prompt_name: str | None, skill_name: str | None) -> str:
+        key = f"{folder.resolve()}|{prompt_name or ''}|{skill_name or ''}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
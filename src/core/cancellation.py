@@ -0,0 +1,44 @@
+import signal
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from src.core.logger import Logger
+
+
+class CancellationToken:
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def reset(self) -> None:
+        self._event.clear()
+
+    @contextmanager
+    def handle_sigint(self, logger: Logger) -> Iterator["CancellationToken"]:
+        self.reset()
+        # Обработчик сигнала можно ставить только из главного потока
+        if threading.current_thread() is not threading.main_thread():
+            yield self
+            return
+
+        def handler(signum, frame) -> None:
+            if self.cancelled:
+                raise KeyboardInterrupt
+            self.cancel()
+            logger.warning(
+                "Interrupted: finishing with what has been collected so far "
+                "(press Ctrl-C again to abort)"
+            )
+
+        previous = signal.signal(signal.SIGINT, handler)
+        try:
+            yield self
+        finally:
+            signal.signal(signal.SIGINT, previous)
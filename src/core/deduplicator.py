@@ -0,0 +1,218 @@
+import hashlib
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from src.core.archives import file_stat, open_binary
+from src.core.logger import Logger
+from src.domain.exceptions import ArchiveError
+from src.domain.models import Document, DuplicateGroup
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_SHINGLE_BASE = 1_000_003
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self._parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        while self._parent[item] != item:
+            self._parent[item] = self._parent[self._parent[item]]
+            item = self._parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self._parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+class Deduplicator:
+    HASH_CHUNK_SIZE = 1024 * 1024
+    SIGNATURE_BLOCK_SIZE = 4096
+
+    def __init__(
+        self,
+        logger: Logger,
+        near_duplicate_threshold: float = 0.9,
+        num_permutations: int = 128,
+        bands: int = 32,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        if num_permutations % bands:
+            raise ValueError("num_permutations must be divisible by bands")
+
+        self._logger = logger
+        self._threshold = near_duplicate_threshold
+        self._bands = bands
+        self._shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._perm_a = rng.integers(1, _MERSENNE_PRIME, num_permutations, dtype=np.int64)
+        self._perm_b = rng.integers(0, _MERSENNE_PRIME, num_permutations, dtype=np.int64)
+
+    def drop_exact_duplicates(
+        self, file_paths: list[Path]
+    ) -> tuple[list[Path], list[DuplicateGroup]]:
+        by_size: dict[int, list[Path]] = defaultdict(list)
+        for path in file_paths:
+            try:
+                by_size[file_stat(path).st_size].append(path)
+            except OSError:
+                by_size[-1].append(path)
+
+        duplicates: set[Path] = set()
+        groups: list[DuplicateGroup] = []
+
+        # Хешируем только файлы с совпадающим размером - остальные уникальны заведомо
+        for size, paths in by_size.items():
+            if size <= 0 or len(paths) < 2:
+                continue
+
+            by_hash: dict[str, list[Path]] = defaultdict(list)
+            for path in paths:
+                digest = self._file_digest(path)
+                if digest is not None:
+                    by_hash[digest].append(path)
+
+            for same in by_hash.values():
+                if len(same) > 1:
+                    representative, *rest = sorted(same)
+                    duplicates.update(rest)
+                    groups.append(
+                        DuplicateGroup(
+                            representative=representative,
+                            duplicates=rest,
+                            kind="exact",
+                            similarity=1.0,
+                        )
+                    )
+
+        self._report(groups)
+        unique = [path for path in file_paths if path not in duplicates]
+        return unique, groups
+
+    def collapse_near_duplicates(
+        self, documents: list[Document]
+    ) -> tuple[list[Document], list[DuplicateGroup]]:
+        groups = self.find_near_duplicates(documents)
+        dropped = {path for group in groups for path in group.duplicates}
+        return [doc for doc in documents if doc.path not in dropped], groups
+
+    def find_near_duplicates(self, documents: Iterable[Document]) -> list[DuplicateGroup]:
+        # Один проход без удержания текстов: от документа остаются подпись и длина
+        paths: list[Path] = []
+        lengths: list[int] = []
+        signatures: list[np.ndarray] = []
+        for document in documents:
+            text = document.content.text_content or ""
+            if text.strip():
+                paths.append(document.path)
+                lengths.append(len(text))
+                signatures.append(self._signature(text))
+
+        if len(signatures) < 2:
+            return []
+
+        matrix = np.stack(signatures)
+        groups: list[DuplicateGroup] = []
+        for members in self._cluster(matrix):
+            # Представителем кластера становится документ с самым длинным текстом
+            best = max(members, key=lambda i: (lengths[i], -i))
+            rest = [i for i in members if i != best]
+            similarity = min(float(np.mean(matrix[best] == matrix[i])) for i in rest)
+            groups.append(
+                DuplicateGroup(
+                    representative=paths[best],
+                    duplicates=[paths[i] for i in rest],
+                    kind="near",
+                    similarity=similarity,
+                )
+            )
+
+        self._report(groups)
+        return groups
+
+    def _signature(self, text: str) -> np.ndarray:
+        shingles = self._shingle_hashes(text)
+        signature = np.full(len(self._perm_a), _MERSENNE_PRIME, dtype=np.int64)
+
+        # Блоками, чтобы матрица (шинглы x перестановки)
+        # не съела память на больших текстах
+        for start in range(0, len(shingles), self.SIGNATURE_BLOCK_SIZE):
+            block = shingles[start : start + self.SIGNATURE_BLOCK_SIZE, None]
+            hashed = (block * self._perm_a + self._perm_b) % _MERSENNE_PRIME
+            np.minimum(signature, hashed.min(axis=0), out=signature)
+        return signature
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        words = _WORD_RE.findall(text.lower())
+        word_hashes = np.fromiter(
+            (zlib.crc32(word.encode("utf-8")) % _MERSENNE_PRIME for word in words),
+            dtype=np.int64,
+            count=len(words),
+        )
+
+        k = min(self._shingle_size, len(word_hashes))
+        if k == 0:
+            return np.zeros(1, dtype=np.int64)
+
+        windows = np.lib.stride_tricks.sliding_window_view(word_hashes, k)
+        shingles = np.zeros(len(windows), dtype=np.int64)
+        for column in range(k):
+            shingles = (shingles * _SHINGLE_BASE + windows[:, column]) % _MERSENNE_PRIME
+        return np.unique(shingles)
+
+    def _cluster(self, signatures: np.ndarray) -> list[list[int]]:
+        rows = signatures.shape[1] // self._bands
+        union_find = _UnionFind(len(signatures))
+
+        for band in range(self._bands):
+            buckets: dict[bytes, list[int]] = defaultdict(list)
+            band_slice = signatures[:, band * rows : (band + 1) * rows]
+            for index, key in enumerate(band_slice):
+                buckets[key.tobytes()].append(index)
+
+            for members in buckets.values():
+                for position, first in enumerate(members):
+                    for other in members[position + 1 :]:
+                        if union_find.find(first) == union_find.find(other):
+                            continue
+                        similarity = np.mean(signatures[first] == signatures[other])
+                        if similarity >= self._threshold:
+                            union_find.union(first, other)
+
+        clusters: dict[int, list[int]] = defaultdict(list)
+        for index in range(len(signatures)):
+            clusters[union_find.find(index)].append(index)
+        return [members for members in clusters.values() if len(members) > 1]
+
+    def _file_digest(self, path: Path) -> str | None:
+        digest = hashlib.blake2b(digest_size=20)
+        try:
+            with open_binary(path) as f:
+                while chunk := f.read(self.HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+        except (OSError, ArchiveError) as e:
+            self._logger.warning(f"Cannot hash {path}: {e}")
+            return None
+        return digest.hexdigest()
+
+    def _report(self, groups: list[DuplicateGroup]) -> None:
+        for group in groups:
+            names = ", ".join(path.name for path in group.duplicates)
+            self._logger.info(
+                "Collapsed {} duplicate(s) of {} (similarity {:.2f}): {}",
+                group.kind,
+                group.representative.name,
+                group.similarity,
+                names,
+                sample="dedup",
+            )
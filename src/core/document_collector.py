@@ -1,9 +1,40 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from pathlib import Path
 
+from src.core.archives import file_stat, is_file, materialize
+from src.core.cancellation import CancellationToken
+from src.core.extraction_checkpoint import ExtractionCheckpoint
+from src.core.extraction_scheduler import ExtractionScheduler
+from src.core.extraction_timings import ExtractionTimings
 from src.core.logger import Logger
-from src.domain.exceptions import DocumentReadError
-from src.domain.models import Document
-from src.readers.factory import ReaderFactory
+from src.core.progress import ProgressTracker
+from src.core.quarantine import Quarantine
+from src.domain.exceptions import (
+    DocumentReaderError,
+    DocumentReadError,
+    ExtractionCancelledError,
+    ExtractionTimeoutError,
+)
+from src.domain.models import (
+    ContentType,
+    Document,
+    DocumentContent,
+    ErrorPolicy,
+    ReadResult,
+)
+from src.readers.contracts import SegmentListener, SegmentReader
+from src.readers.factory import ReaderFactory, reader_name
+from src.readers.vision import VisionPassThrough
+
+_current_checkpoint: ContextVar[ExtractionCheckpoint | None] = ContextVar(
+    "extraction_checkpoint", default=None
+)
+_current_quarantine: ContextVar[Quarantine | None] = ContextVar(
+    "quarantine", default=None
+)
 
 
 class DocumentCollector:
@@ -12,59 +43,267 @@ class DocumentCollector:
         reader_factory: ReaderFactory,
         logger: Logger,
         max_file_size_bytes: int = 10 * 1024 * 1024,  # 10MB default
+        vision: VisionPassThrough | None = None,
+        timings: ExtractionTimings | None = None,
+        cancellation: CancellationToken | None = None,
+        error_policy: ErrorPolicy | str = ErrorPolicy.RETRY,
+        max_retries: int = 1,
+        retry_delay_seconds: float = 1.0,
+        scheduler: ExtractionScheduler | None = None,
+        segment_listeners: list[SegmentListener] | None = None,
+        progress: ProgressTracker | None = None,
+        archive_memory_bytes: int = 64 * 1024 * 1024,
     ):
         self._reader_factory = reader_factory
         self._logger = logger
         self._max_file_size_bytes = max_file_size_bytes
+        self._vision = vision
+        self._timings = timings
+        self._cancellation = cancellation
+        self._error_policy = ErrorPolicy(error_policy)
+        self._max_retries = max(0, max_retries)
+        self._retry_delay_seconds = retry_delay_seconds
+        self._scheduler = scheduler
+        self._segment_listeners = list(segment_listeners or [])
+        self._progress = progress
+        self._archive_memory_bytes = archive_memory_bytes
+
+    @contextmanager
+    def checkpoint_scope(self, checkpoint: ExtractionCheckpoint | None) -> Iterator[None]:
+        token = _current_checkpoint.set(checkpoint)
+        try:
+            yield
+        finally:
+            _current_checkpoint.reset(token)
+
+    @contextmanager
+    def quarantine_scope(self, quarantine: Quarantine | None) -> Iterator[None]:
+        token = _current_quarantine.set(quarantine)
+        try:
+            yield
+        finally:
+            _current_quarantine.reset(token)
 
     def collect(self, file_paths: list[Path]) -> list[Document]:
-        documents = []
+        return list(self.iter_collect(file_paths))
 
-        for file_path in file_paths:
-            if self._should_skip(file_path):
-                continue
+    def iter_collect(self, file_paths: list[Path]) -> Iterator[Document]:
+        # Непрочитанные файлы не попадают в контекст модели
+        for result in self.iter_results(file_paths):
+            if result.document is not None:
+                yield result.document
 
+    def iter_results(self, file_paths: list[Path]) -> Iterator[ReadResult]:
+        # Бюджет на изображения считается отдельно для каждого набора документов
+        with self._vision.budget_scope() if self._vision else nullcontext():
+            try:
+                for result in self._read_all(file_paths):
+                    self._report(result)
+                    if result.ok:
+                        if result.document is None:
+                            continue
+                        self._logger.info("Collected: {}", result.path, sample="collect")
+                    else:
+                        self._quarantine(result)
+                    yield result
+            finally:
+                if self._timings is not None:
+                    self._timings.save()
+
+    def _read_all(self, file_paths: list[Path]) -> Iterator[ReadResult]:
+        paths = [path for path in file_paths if not self._should_skip(path)]
+        if self._progress is not None:
+            self._progress.set_stage("extract")
+            self._progress.queued(paths)
+
+        if self._scheduler is None:
+            for file_path in paths:
+                if self._is_cancelled():
+                    return
+                try:
+                    yield self._read_with_policy(file_path)
+                except ExtractionCancelledError:
+                    self._logger.warning(f"Extraction cancelled at {file_path}")
+                    return
+            return
+
+        try:
+            yield from self._scheduler.run(
+                paths, self._read_with_policy, self._is_cancelled
+            )
+        except ExtractionCancelledError as e:
+            self._logger.warning(f"Extraction cancelled: {e}")
+
+    def _read_with_policy(self, file_path: Path) -> ReadResult:
+        reader = self._reader_factory.get_reader(file_path)
+        name = reader_name(reader) if reader is not None else None
+        attempts = 1
+        if self._error_policy == ErrorPolicy.RETRY:
+            attempts += self._max_retries
+
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 document = self._read_document(file_path)
-                if document:
-                    documents.append(document)
-                    self._logger.info(f"Collected: {file_path}")
+                return ReadResult(
+                    path=file_path, reader=name, document=document, attempts=attempt
+                )
+            except ExtractionCancelledError:
+                raise
             except Exception as e:
-                self._logger.exception(f"Failed to read {file_path}: {e}")
-                raise DocumentReadError(f"Failed to read {file_path}: {e}")
+                error = str(e) if isinstance(e, DocumentReaderError) else repr(e)
+                if self._error_policy == ErrorPolicy.ABORT:
+                    self._logger.exception(f"Failed to read {file_path}: {error}")
+                    raise DocumentReadError(f"Failed to read {file_path}: {error}") from e
 
-        return documents
+                # Зависший файл повторять бессмысленно: он снова съест весь таймаут
+                final = attempt == attempts or isinstance(e, ExtractionTimeoutError)
+                self._logger.warning(
+                    f"Failed to read {file_path} (attempt {attempt}/{attempts}): {error}"
+                )
+                if final:
+                    return ReadResult(
+                        path=file_path, reader=name, error=error, attempts=attempt
+                    )
+                time.sleep(self._retry_delay_seconds * attempt)
 
-    def _should_skip(self, file_path: Path) -> bool:
+    def _report(self, result: ReadResult) -> None:
+        if self._progress is None:
+            return
+        if result.document is not None:
+            size_bytes = result.document.size_bytes
+        else:
+            try:
+                size_bytes = file_stat(result.path).st_size
+            except OSError:
+                size_bytes = 0
+        self._progress.file_done(result.reader, size_bytes, ok=result.ok)
+
+    def _quarantine(self, result: ReadResult) -> None:
+        self._logger.error(f"Quarantined {result.path}: {result.error}")
+        quarantine = _current_quarantine.get()
+        if quarantine is not None:
+            quarantine.add(result)
+
+    def _is_cancelled(self) -> bool:
+        if self._cancellation is None or not self._cancellation.cancelled:
+            return False
+        self._logger.warning("Extraction cancelled, no new files will be read")
+        return True
+
+    def can_collect(self, file_path: Path) -> bool:
+        return not self._should_skip(file_path)
+
+    def skip_reason(self, file_path: Path) -> str | None:
         if file_path.name.startswith("."):
-            return True
+            return "hidden file"
 
-        if not file_path.is_file():
-            return True
+        if not is_file(file_path):
+            return "not a file"
 
         try:
-            file_size = file_path.stat().st_size
-            if file_size > self._max_file_size_bytes:
-                self._logger.warning(
-                    f"File too large ({file_size} bytes), skipping: {file_path}"
-                )
-                return True
-        except OSError:
-            return True
+            file_size = file_stat(file_path).st_size
+        except OSError as e:
+            return f"unreadable: {e.strerror or e}"
+        if file_size > self._max_file_size_bytes:
+            return f"too large ({file_size} bytes)"
 
-        reader = self._reader_factory.get_reader(file_path)
-        if reader is None:
-            self._logger.debug(f"No reader for {file_path}, skipping.")
-            return True
+        if self._reader_factory.get_reader(file_path) is None:
+            return "no reader"
+
+        return None
 
-        return False
+    def _should_skip(self, file_path: Path) -> bool:
+        reason = self.skip_reason(file_path)
+        if reason is None:
+            return False
+
+        if reason.startswith("too large"):
+            self._logger.warning(f"File {reason}, skipping: {file_path}")
+        elif reason == "no reader":
+            self._logger.debug("No reader for {}, skipping.", file_path, sample="skip")
+        return True
 
     def _read_document(self, file_path: Path) -> Document | None:
         reader = self._reader_factory.get_reader(file_path)
         if not reader:
             return None
 
-        content = reader.read(file_path)
-        size_bytes = file_path.stat().st_size
+        size_bytes = file_stat(file_path).st_size
+        checkpoint = _current_checkpoint.get()
+        if checkpoint is not None:
+            content = checkpoint.get(file_path)
+            if content is not None:
+                self._logger.debug(
+                    "Restored from checkpoint: {}", file_path, sample="checkpoint"
+                )
+                return self._document(file_path, size_bytes, content)
 
+        started = time.perf_counter()
+        # Член архива читается из временной копии, но в результатах остается его путь
+        with materialize(file_path, self._archive_memory_bytes) as source:
+            if isinstance(reader, SegmentReader):
+                content = self._read_segments(reader, file_path, checkpoint, source)
+            else:
+                content = reader.read(source)
+        if source != file_path:
+            content = content.model_copy(update={"file_path": file_path})
+
+        if self._timings is not None:
+            self._timings.record(
+                reader_name(reader),
+                file_path.suffix,
+                size_bytes,
+                time.perf_counter() - started,
+                len(content.text_content or ""),
+            )
+        if checkpoint is not None:
+            checkpoint.put(file_path, content)
+
+        return self._document(file_path, size_bytes, content)
+
+    def _document(
+        self, file_path: Path, size_bytes: int, content: DocumentContent
+    ) -> Document:
+        # Изображения учитываются в бюджете запуска здесь, в родительском процессе:
+        # изолированный ридер видит только копию бюджета, снятую при fork
+        if self._vision is not None:
+            content = self._vision.admit(content)
         return Document(path=file_path, size_bytes=size_bytes, content=content)
+
+    def _read_segments(
+        self,
+        reader: SegmentReader,
+        file_path: Path,
+        checkpoint: ExtractionCheckpoint | None,
+        source: Path | None = None,
+    ) -> DocumentContent:
+        # Уже расшифрованное начало записи переживает падение и не распознается заново
+        segments = checkpoint.get_segments(file_path) if checkpoint is not None else []
+        start_seconds = segments[-1].end if segments else 0.0
+        if segments:
+            self._logger.info(
+                f"Resuming transcription of {file_path} from {start_seconds:.0f}s"
+            )
+
+        for listener in self._segment_listeners:
+            listener.on_transcript_start(file_path)
+            for segment in segments:
+                listener.on_segment(file_path, segment)
+
+        for segment in reader.iter_segments(source or file_path, start_seconds):
+            if checkpoint is not None:
+                checkpoint.add_segment(file_path, len(segments), segment)
+            segments.append(segment)
+            for listener in self._segment_listeners:
+                listener.on_segment(file_path, segment)
+
+        for listener in self._segment_listeners:
+            listener.on_transcript_end(file_path)
+
+        return DocumentContent(
+            file_path=file_path,
+            content_type=ContentType.TEXT,
+            text_content=" ".join(segment.text for segment in segments),
+        )
@@ -1,32 +1,94 @@
+from collections.abc import Callable
 from pathlib import Path
 
+from src.core.deduplicator import Deduplicator
 from src.core.document_collector import DocumentCollector
+from src.core.document_store import DocumentStore
 from src.core.folder_scanner import FolderScanner
 from src.core.logger import Logger
-from src.domain.models import Document
+from src.core.progress import ProgressTracker
+from src.domain.models import DuplicateGroup
 
 
 class DocumentService:
     def __init__(
-        self, scanner: FolderScanner, collector: DocumentCollector, logger: Logger
+        self,
+        scanner: FolderScanner,
+        collector: DocumentCollector,
+        logger: Logger,
+        deduplicator: Deduplicator | None = None,
+        store_factory: Callable[[], DocumentStore] = DocumentStore,
+        progress: ProgressTracker | None = None,
     ):
         self._scanner = scanner
         self._collector = collector
         self._logger = logger
+        self._deduplicator = deduplicator
+        self._store_factory = store_factory
+        self._progress = progress
 
-    def get_documents(self, folder_path: Path) -> list[Document]:
+    def get_documents(self, folder_path: Path) -> DocumentStore:
         self._logger.info(f"Scanning folder: {folder_path}")
 
         if not folder_path.exists():
             raise FileNotFoundError(f"Folder not found: {folder_path}")
 
         file_paths = list(self._scanner.scan(folder_path))
+        if self._progress is not None:
+            self._progress.scanned(len(file_paths))
 
         if not file_paths:
             self._logger.warning(f"No files found in {folder_path}")
-            return []
+            return self._store_factory()
 
-        documents = self._collector.collect(file_paths)
-        self._logger.info(f"Loaded {len(documents)} valid documents")
+        return self.get_documents_from_files(file_paths)
 
+    def get_documents_from_files(self, file_paths: list[Path]) -> DocumentStore:
+        documents = self._store_factory()
+        # Пропущенные намеренно файлы (без ридера, скрытые, слишком большие)
+        # запоминаем отдельно от тех, что не удалось прочитать
+        collectable = [path for path in file_paths if self._collector.can_collect(path)]
+        documents.add_skipped(sorted(set(file_paths) - set(collectable)))
+        file_paths = collectable
+
+        if self._deduplicator is None:
+            documents.extend(self._collector.iter_collect(file_paths))
+            documents.reorder(file_paths)
+            self._log_loaded(documents)
+            return documents
+
+        file_paths, exact_groups = self._deduplicator.drop_exact_duplicates(file_paths)
+        documents.extend(self._collector.iter_collect(file_paths))
+        # Параллельное извлечение завершается в произвольном порядке,
+        # а промпт должен быть одинаковым от запуска к запуску
+        documents.reorder(file_paths)
+        near_groups = self._deduplicator.find_near_duplicates(documents)
+        documents.discard({path for group in near_groups for path in group.duplicates})
+
+        self._attach_duplicates(documents, exact_groups + near_groups)
+        collapsed = sum(len(g.duplicates) for g in exact_groups + near_groups)
+        self._log_loaded(documents, [f"{collapsed} duplicate(s) collapsed"])
         return documents
+
+    def _log_loaded(self, documents: DocumentStore, details: list[str] | None = None):
+        details = list(details or [])
+        if documents.spilled_count:
+            details.append(f"{documents.spilled_count} spilled to disk")
+        suffix = f" ({', '.join(details)})" if details else ""
+        self._logger.info(f"Loaded {len(documents)} valid documents{suffix}")
+
+    def _attach_duplicates(
+        self, documents: DocumentStore, groups: list[DuplicateGroup]
+    ) -> None:
+        present = set(documents.paths)
+        # Точные дубли представителя near-кластера тоже переносим к новому представителю
+        owner = {
+            path: group.representative for group in groups for path in group.duplicates
+        }
+
+        for group in groups:
+            root = group.representative
+            while root in owner and root not in present:
+                root = owner[root]
+            if root in present:
+                documents.add_duplicates(root, group.duplicates)
@@ -0,0 +1,225 @@
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import weakref
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import overload
+
+from src.domain.models import Document, DocumentContent
+
+Codec = tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+
+def _create_codec(name: str) -> Codec:
+    if name == "none":
+        return bytes, bytes
+    if name == "zlib":
+        return (lambda data: zlib.compress(data, 1)), zlib.decompress
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd compression requires the 'compression' extra: "
+                "pip install 'ai-document-summarizer[compression]'"
+            ) from e
+        return (
+            zstandard.ZstdCompressor(level=3).compress,
+            zstandard.ZstdDecompressor().decompress,
+        )
+    if name == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as e:
+            raise ImportError(
+                "lz4 compression requires the 'compression' extra: "
+                "pip install 'ai-document-summarizer[compression]'"
+            ) from e
+        return lz4.frame.compress, lz4.frame.decompress
+    raise ValueError(f"Unknown compression: {name}. Use none, zlib, zstd or lz4.")
+
+
+def _remove_spill(conn: sqlite3.Connection, directory: str) -> None:
+    conn.close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class DocumentStore(Sequence[Document]):
+    def __init__(
+        self,
+        memory_limit_bytes: int = 512 * 1024 * 1024,
+        spill_dir: Path | None = None,
+        compression: str = "zlib",
+    ):
+        self._memory_limit_bytes = memory_limit_bytes
+        self._spill_dir = spill_dir
+        self._compress, self._decompress = _create_codec(compression)
+        # В памяти всегда лежат метаданные; содержимое - пока не превышен лимит
+        self._documents: list[Document] = []
+        self._contents: dict[int, DocumentContent] = {}
+        self._spilled: dict[int, int] = {}
+        self._memory_bytes = 0
+        self._skipped: list[Path] = []
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    @property
+    def spilled_count(self) -> int:
+        return len(self._spilled)
+
+    @property
+    def paths(self) -> list[Path]:
+        return [document.path for document in self._documents]
+
+    @property
+    def skipped(self) -> list[Path]:
+        return list(self._skipped)
+
+    @property
+    def settled_paths(self) -> set[Path]:
+        # Файлы с окончательным результатом: прочитанные, их дубли и пропущенные
+        # намеренно. Ошибки чтения сюда не попадают, их стоит повторить
+        settled = set(self._skipped)
+        for document in self._documents:
+            settled.add(document.path)
+            settled.update(document.duplicates)
+        return settled
+
+    def add_skipped(self, paths: Iterable[Path]) -> None:
+        self._skipped.extend(paths)
+
+    def append(self, document: Document) -> None:
+        index = len(self._documents)
+        content = document.content
+        size = self._content_size(content)
+
+        if self._memory_bytes + size <= self._memory_limit_bytes:
+            self._contents[index] = content
+            self._memory_bytes += size
+        else:
+            self._spilled[index] = self._write(content)
+
+        self._documents.append(
+            document.model_copy(update={"content": self._metadata_only(content)})
+        )
+
+    def extend(self, documents: Iterable[Document]) -> None:
+        for document in documents:
+            self.append(document)
+
+    def discard(self, paths: set[Path]) -> None:
+        self._select(
+            [i for i, doc in enumerate(self._documents) if doc.path not in paths]
+        )
+
+    def reorder(self, paths: list[Path]) -> None:
+        # Документы, которых нет в списке, остаются в конце в прежнем порядке
+        position = {path: i for i, path in enumerate(paths)}
+        self._select(
+            sorted(
+                range(len(self._documents)),
+                key=lambda i: position.get(self._documents[i].path, len(position)),
+            )
+        )
+
+    def add_duplicates(self, path: Path, duplicates: list[Path]) -> None:
+        for document in self._documents:
+            if document.path == path:
+                document.duplicates = [*document.duplicates, *duplicates]
+                return
+
+    def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._conn = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    @overload
+    def __getitem__(self, index: int) -> Document: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Document]: ...
+
+    def __getitem__(self, index: int | slice) -> Document | list[Document]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("document index out of range")
+
+        content = self._contents.get(index)
+        if content is None:
+            content = self._read(self._spilled[index])
+        return self._documents[index].model_copy(update={"content": content})
+
+    def __iter__(self) -> Iterator[Document]:
+        # Содержимое выгруженных документов подгружается по одному при обходе
+        for index in range(len(self)):
+            yield self[index]
+
+    def _select(self, kept: list[int]) -> None:
+        contents, spilled = self._contents, self._spilled
+        self._documents = [self._documents[i] for i in kept]
+        self._contents = {
+            new: contents[old] for new, old in enumerate(kept) if old in contents
+        }
+        self._spilled = {
+            new: spilled[old] for new, old in enumerate(kept) if old in spilled
+        }
+        self._memory_bytes = sum(self._content_size(c) for c in self._contents.values())
+
+    def _content_size(self, content: DocumentContent) -> int:
+        size = sys.getsizeof(content.text_content or "")
+        size += len(content.base64_data or "")
+        return size + sum(len(image.base64_data) for image in content.images)
+
+    def _metadata_only(self, content: DocumentContent) -> DocumentContent:
+        return DocumentContent(
+            file_path=content.file_path,
+            content_type=content.content_type,
+            mime_type=content.mime_type,
+        )
+
+    def _write(self, content: DocumentContent) -> int:
+        data = self._compress(content.model_dump_json().encode("utf-8"))
+        with self._lock:
+            cursor = self._connection().execute(
+                "INSERT INTO contents (data) VALUES (?)", (data,)
+            )
+            return int(cursor.lastrowid)
+
+    def _read(self, row_id: int) -> DocumentContent:
+        with self._lock:
+            (data,) = (
+                self._connection()
+                .execute("SELECT data FROM contents WHERE id = ?", (row_id,))
+                .fetchone()
+            )
+        return DocumentContent.model_validate_json(self._decompress(data))
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = tempfile.mkdtemp(prefix="documents-", dir=self._spill_dir)
+            self._conn = sqlite3.connect(
+                Path(directory) / "contents.sqlite3", check_same_thread=False
+            )
+            # Данные временные: надежность записи не нужна, нужна скорость
+            self._conn.execute("PRAGMA journal_mode=OFF")
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.execute(
+                "CREATE TABLE contents (id INTEGER PRIMARY KEY, data BLOB NOT NULL)"
+            )
+            self._finalizer = weakref.finalize(self, _remove_spill, self._conn, directory)
+        return self._conn
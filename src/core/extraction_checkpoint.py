@@ -0,0 +1,135 @@
+import hashlib
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+
+from src.core.registry_cache import file_fingerprint
+from src.domain.models import DocumentContent, TranscriptSegment
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    segment TEXT NOT NULL,
+    PRIMARY KEY (path, idx)
+);
+"""
+
+
+class ExtractionCheckpoint:
+    def __init__(self, db_path: Path):
+        self._db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def for_folder(cls, root: Path, folder: Path) -> "ExtractionCheckpoint":
+        # Свой чекпоинт на каждую папку, чтобы запуски по разным папкам не смешивались
+        digest = hashlib.blake2b(
+            str(folder.resolve()).encode("utf-8"), digest_size=10
+        ).hexdigest()
+        return cls(Path(root) / f"{digest}.sqlite3")
+
+    @property
+    def path(self) -> Path:
+        return self._db_path
+
+    def get(self, file_path: Path) -> DocumentContent | None:
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None or not self._db_path.exists():
+            return None
+
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT content FROM documents "
+                    "WHERE path = ? AND mtime_ns = ? AND size = ?",
+                    (str(file_path), *fingerprint),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return DocumentContent.model_validate_json(zlib.decompress(row[0]))
+
+    def put(self, file_path: Path, content: DocumentContent) -> None:
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None:
+            return
+
+        data = zlib.compress(content.model_dump_json().encode("utf-8"), 1)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents (path, mtime_ns, size, content) "
+                    "VALUES (?, ?, ?, ?)",
+                    (str(file_path), *fingerprint, data),
+                )
+                # Документ готов, промежуточные сегменты больше не нужны
+                conn.execute("DELETE FROM segments WHERE path = ?", (str(file_path),))
+
+    def get_segments(self, file_path: Path) -> list[TranscriptSegment]:
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None or not self._db_path.exists():
+            return []
+
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT segment FROM segments "
+                    "WHERE path = ? AND mtime_ns = ? AND size = ? ORDER BY idx",
+                    (str(file_path), *fingerprint),
+                )
+                .fetchall()
+            )
+        return [TranscriptSegment.model_validate_json(row[0]) for row in rows]
+
+    def add_segment(
+        self, file_path: Path, index: int, segment: TranscriptSegment
+    ) -> None:
+        fingerprint = file_fingerprint(file_path)
+        if fingerprint is None:
+            return
+
+        # Каждый сегмент фиксируется сразу: сбой на 90% записи не теряет первые 90%
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                if index == 0:
+                    conn.execute("DELETE FROM segments WHERE path = ?", (str(file_path),))
+                conn.execute(
+                    "INSERT OR REPLACE INTO segments "
+                    "(path, mtime_ns, size, idx, segment) VALUES (?, ?, ?, ?, ?)",
+                    (str(file_path), *fingerprint, index, segment.model_dump_json()),
+                )
+
+    def clear(self) -> None:
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            self._db_path.with_name(self._db_path.name + suffix).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
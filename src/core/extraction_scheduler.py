@@ -0,0 +1,165 @@
+import contextvars
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Literal
+
+from src.core.archives import file_stat
+from src.core.extraction_timings import ExtractionTimings
+from src.core.logger import Logger
+from src.domain.models import ReadResult
+from src.readers.factory import ReaderFactory, reader_name
+
+WorkClass = Literal["light", "heavy"]
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def available_memory_bytes() -> int | None:
+    # MemAvailable учитывает освобождаемый кэш, в отличие от свободной памяти
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class _Task:
+    def __init__(self, path: Path, estimated_seconds: float):
+        self.path = path
+        self.estimated_seconds = estimated_seconds
+
+
+class ExtractionScheduler:
+    def __init__(
+        self,
+        reader_factory: ReaderFactory,
+        timings: ExtractionTimings,
+        logger: Logger,
+        light_workers: int | None = None,
+        heavy_workers: int = 2,
+        heavy_seconds_per_mb: float = 3.0,
+        heavy_worker_memory_mb: int = 1024,
+        memory_probe: Callable[[], int | None] = available_memory_bytes,
+    ):
+        self._reader_factory = reader_factory
+        self._timings = timings
+        self._logger = logger
+        self._light_workers = max(1, light_workers or os.cpu_count() or 1)
+        self._heavy_workers = max(1, heavy_workers)
+        self._heavy_seconds_per_mb = heavy_seconds_per_mb
+        self._heavy_worker_memory_bytes = heavy_worker_memory_mb * _BYTES_PER_MB
+        self._memory_probe = memory_probe
+
+    def classify(self, reader: str, extension: str) -> WorkClass:
+        # Стоимость берется из истории извлечения: PDF, которым постоянно нужен OCR,
+        # со временем сами переходят в тяжелые
+        seconds, _ = self._timings.estimate(reader, extension, _BYTES_PER_MB)
+        return "heavy" if seconds >= self._heavy_seconds_per_mb else "light"
+
+    def run(
+        self,
+        file_paths: list[Path],
+        read: Callable[[Path], ReadResult],
+        cancelled: Callable[[], bool] = lambda: False,
+    ) -> Iterator[ReadResult]:
+        pending = self._queue(file_paths)
+        if not pending:
+            return
+
+        running: dict[WorkClass, int] = {"light": 0, "heavy": 0}
+        in_flight: dict[Future[ReadResult], WorkClass] = {}
+        self._logger.debug(
+            f"Extracting {len(file_paths)} file(s) with up to {self._light_workers} "
+            f"light and {self._heavy_workers} heavy worker(s)"
+        )
+
+        pool = ThreadPoolExecutor(
+            max_workers=self._light_workers + self._heavy_workers,
+            thread_name_prefix="extract",
+        )
+        try:
+            while pending or in_flight:
+                if pending and cancelled():
+                    pending.clear()
+                else:
+                    self._dispatch(pool, pending, running, in_flight, read)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running[in_flight.pop(future)] -= 1
+                for future in done:
+                    yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _queue(self, file_paths: list[Path]) -> dict[tuple[str, str], deque[_Task]]:
+        # Сначала самые долгие файлы: иначе крупный файл в конце растягивает хвост
+        queues: dict[tuple[str, str], list[_Task]] = {}
+        for path in file_paths:
+            reader = self._reader_factory.get_reader(path)
+            if reader is None:
+                continue
+            name = reader_name(reader)
+            try:
+                size_bytes = file_stat(path).st_size
+            except OSError:
+                size_bytes = 0
+            seconds, _ = self._timings.estimate(name, path.suffix, size_bytes)
+            key = (name, path.suffix.lower())
+            queues.setdefault(key, []).append(_Task(path, seconds))
+
+        return {
+            key: deque(sorted(tasks, key=lambda t: t.estimated_seconds, reverse=True))
+            for key, tasks in queues.items()
+        }
+
+    def _dispatch(
+        self,
+        pool: ThreadPoolExecutor,
+        pending: dict[tuple[str, str], deque[_Task]],
+        running: dict[WorkClass, int],
+        in_flight: dict[Future[ReadResult], WorkClass],
+        read: Callable[[Path], ReadResult],
+    ) -> None:
+        limits: dict[WorkClass, int] = {
+            "light": self._light_workers,
+            "heavy": self._heavy_limit(running["heavy"]),
+        }
+        while True:
+            # Классы пересчитываются на каждом шаге: история пополняется по ходу работы
+            candidates = []
+            for key, queue in pending.items():
+                work_class = self.classify(*key)
+                if running[work_class] < limits[work_class]:
+                    candidates.append((queue[0], key, work_class))
+            if not candidates:
+                return
+
+            task, key, work_class = max(candidates, key=lambda c: c[0].estimated_seconds)
+            pending[key].popleft()
+            if not pending[key]:
+                del pending[key]
+
+            # Чекпоинт и бюджет изображений хранятся в контекстных переменных
+            context = contextvars.copy_context()
+            in_flight[pool.submit(context.run, read, task.path)] = work_class
+            running[work_class] += 1
+
+    def _heavy_limit(self, running_heavy: int) -> int:
+        available = self._memory_probe()
+        if available is None or not self._heavy_worker_memory_bytes:
+            return self._heavy_workers
+        # Уже запущенные воркеры в свободной памяти не учтены, их добавляем сверху
+        affordable = running_heavy + available // self._heavy_worker_memory_bytes
+        return max(1, min(self._heavy_workers, affordable))
@@ -0,0 +1,98 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from src.llm.tokens import CHARS_PER_TOKEN
+
+_BYTES_PER_MB = 1024 * 1024
+
+# Стартовые оценки по типу ридера, пока нет собственной истории:
+# (секунд на мегабайт, токенов текста на байт файла)
+DEFAULT_PRIORS: dict[str, tuple[float, float]] = {
+    "TxtReader": (0.02, 0.25),
+    "PdfReader": (1.0, 0.05),
+    "ImageReader": (4.0, 0.001),
+    "AudioVideoReader": (30.0, 0.0002),
+}
+_FALLBACK_PRIOR = (1.0, 0.01)
+
+
+class TimingRecord(BaseModel):
+    files: int = Field(default=0, ge=0)
+    bytes: int = Field(default=0, ge=0)
+    seconds: float = Field(default=0.0, ge=0)
+    chars: int = Field(default=0, ge=0)
+
+
+class ExtractionTimings:
+    VERSION = 1
+
+    def __init__(self, path: Path | None = None):
+        self._path = Path(path) if path else None
+        self._records: dict[str, TimingRecord] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def record(
+        self, reader: str, extension: str, size_bytes: int, seconds: float, chars: int
+    ) -> None:
+        with self._lock:
+            record = self._load().setdefault(_key(reader, extension), TimingRecord())
+            record.files += 1
+            record.bytes += size_bytes
+            record.seconds += seconds
+            record.chars += chars
+            self._dirty = True
+
+    def estimate(self, reader: str, extension: str, size_bytes: int) -> tuple[float, int]:
+        with self._lock:
+            record = self._load().get(_key(reader, extension))
+
+        if record is not None and record.bytes:
+            seconds_per_byte = record.seconds / record.bytes
+            tokens_per_byte = record.chars / CHARS_PER_TOKEN / record.bytes
+        else:
+            seconds_per_mb, tokens_per_byte = DEFAULT_PRIORS.get(reader, _FALLBACK_PRIOR)
+            seconds_per_byte = seconds_per_mb / _BYTES_PER_MB
+        return size_bytes * seconds_per_byte, int(size_bytes * tokens_per_byte)
+
+    def save(self) -> None:
+        with self._lock:
+            if self._path is None or not self._dirty:
+                return
+            data = {
+                "version": self.VERSION,
+                "records": {
+                    key: record.model_dump() for key, record in self._load().items()
+                },
+            }
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(self._path)
+            self._dirty = False
+
+    def _load(self) -> dict[str, TimingRecord]:
+        if self._records is not None:
+            return self._records
+
+        self._records = {}
+        if self._path is None or not self._path.exists():
+            return self._records
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            if data.get("version") == self.VERSION:
+                self._records = {
+                    key: TimingRecord.model_validate(value)
+                    for key, value in data.get("records", {}).items()
+                }
+        except (OSError, json.JSONDecodeError, ValidationError):
+            pass
+        return self._records
+
+
+def _key(reader: str, extension: str) -> str:
+    return f"{reader}:{extension.lower()}"
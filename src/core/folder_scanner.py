@@ -1,7 +1,9 @@
 from collections.abc import Generator
 from pathlib import Path
 
+from src.core.archives import ArchiveLimits, is_archive, list_members
 from src.core.logger import Logger
+from src.domain.exceptions import ArchiveError
 
 
 class FolderScanner:
@@ -9,18 +11,49 @@ class FolderScanner:
         self,
         logger: Logger,
         recursive: bool = True,
+        archive_limits: ArchiveLimits | None = None,
     ):
         self._logger = logger
         self._recursive = recursive
+        self._archive_limits = archive_limits
 
     def scan(self, folder_path: Path) -> Generator[Path]:
         try:
             for item in folder_path.iterdir():
                 if item.is_file():
-                    yield item
+                    if self._archive_limits is not None and is_archive(item):
+                        yield from self._scan_archive(item)
+                    else:
+                        yield item
                 elif item.is_dir() and self._recursive:
                     if not item.name.startswith("."):
                         yield from self.scan(item)
 
         except PermissionError:
             self._logger.warning(f"Permission denied: {folder_path}")
+
+    def scan_archive(self, archive: Path) -> Generator[Path]:
+        if self._archive_limits is None or not is_archive(archive):
+            return
+        yield from self._scan_archive(archive)
+
+    def _scan_archive(self, archive: Path) -> Generator[Path]:
+        # Архив обходится как каталог: члены читаются из него напрямую, без распаковки
+        try:
+            listed = list_members(archive)
+            members = self._archive_limits.check(archive, listed)
+        except (OSError, ArchiveError) as e:
+            self._logger.warning(f"Skipping archive {archive}: {e}")
+            return
+        if len(members) < len(listed):
+            self._logger.warning(
+                f"Skipping {len(listed) - len(members)} oversized member(s) of {archive}"
+            )
+
+        for member in members:
+            *folders, _ = member.name.split("/")
+            if folders and not self._recursive:
+                continue
+            if any(folder.startswith(".") or folder == "__MACOSX" for folder in folders):
+                continue
+            yield archive / member.name
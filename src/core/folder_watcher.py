@@ -0,0 +1,153 @@
+import queue
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.core.archives import file_stat
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+
+FileSnapshot = dict[Path, tuple[int, int]]
+
+
+class _PollingBackend:
+    def __init__(
+        self, scanner: FolderScanner, folder: Path, events: queue.Queue, interval: float
+    ):
+        self._scanner = scanner
+        self._folder = folder
+        self._events = events
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="watch-poll", daemon=True)
+
+    def start(self) -> None:
+        self._snapshot = self._take_snapshot()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            current = self._take_snapshot()
+            changed = {
+                path
+                for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path)
+            }
+            for path in changed:
+                self._events.put(path)
+            self._snapshot = current
+
+    def _take_snapshot(self) -> FileSnapshot:
+        snapshot: FileSnapshot = {}
+        for path in self._scanner.scan(self._folder):
+            try:
+                stat = file_stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+class _WatchdogBackend:
+    def __init__(self, folder: Path, events: queue.Queue, recursive: bool):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                if event.is_directory or event.event_type in (
+                    "opened",
+                    "closed_no_write",
+                ):
+                    return
+                events.put(Path(event.src_path))
+                if getattr(event, "dest_path", ""):
+                    events.put(Path(event.dest_path))
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), str(folder), recursive=recursive)
+
+    def start(self) -> None:
+        self._observer.start()
+
+    def stop(self) -> None:
+        self._observer.stop()
+        self._observer.join()
+
+
+class FolderWatcher:
+    _WAKEUP_INTERVAL = 0.2
+
+    def __init__(
+        self,
+        scanner: FolderScanner,
+        logger: Logger,
+        debounce_seconds: float = 2.0,
+        poll_interval: float = 1.0,
+        recursive: bool = True,
+    ):
+        self._scanner = scanner
+        self._logger = logger
+        self._debounce_seconds = debounce_seconds
+        self._poll_interval = poll_interval
+        self._recursive = recursive
+
+    def watch(
+        self,
+        folder: Path,
+        on_change: Callable[[set[Path]], None],
+        stop_event: threading.Event | None = None,
+    ) -> None:
+        stop_event = stop_event or threading.Event()
+        events: queue.Queue[Path] = queue.Queue()
+        backend = self._create_backend(folder, events)
+
+        backend.start()
+        try:
+            self._dispatch(events, on_change, stop_event)
+        finally:
+            backend.stop()
+
+    def _create_backend(self, folder: Path, events: queue.Queue):
+        try:
+            backend = _WatchdogBackend(folder, events, self._recursive)
+            self._logger.info(f"Watching {folder} (native file system events)")
+            return backend
+        except ImportError:
+            self._logger.info(
+                f"Watching {folder} (polling every {self._poll_interval}s, "
+                "install 'watchdog' for native events)"
+            )
+            return _PollingBackend(self._scanner, folder, events, self._poll_interval)
+
+    def _dispatch(
+        self,
+        events: queue.Queue,
+        on_change: Callable[[set[Path]], None],
+        stop_event: threading.Event,
+    ) -> None:
+        pending: set[Path] = set()
+        last_event = 0.0
+
+        while not stop_event.is_set():
+            try:
+                pending.add(events.get(timeout=self._WAKEUP_INTERVAL))
+                last_event = time.monotonic()
+                continue
+            except queue.Empty:
+                pass
+
+            # Ждём паузы в событиях, чтобы не пересчитывать саммари на каждый файл
+            if pending and time.monotonic() - last_event >= self._debounce_seconds:
+                changed = {path for path in pending if self._is_relevant(path)}
+                pending.clear()
+                if changed:
+                    on_change(changed)
+
+    def _is_relevant(self, path: Path) -> bool:
+        return not any(part.startswith(".") for part in path.parts[-2:])
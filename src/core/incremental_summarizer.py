@@ -0,0 +1,108 @@
+from pathlib import Path
+
+from src.core.archives import is_archive, is_file
+from src.core.document_collector import DocumentCollector
+from src.core.document_service import DocumentService
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.core.summary_generator import SummaryGenerator
+from src.domain.exceptions import DocumentReadError
+from src.domain.models import Document
+from src.prompts.template import PromptTemplate
+from src.skills.engine import SkillEngine
+
+
+class IncrementalSummarizer:
+    def __init__(
+        self,
+        document_service: DocumentService,
+        collector: DocumentCollector,
+        summary_generator: SummaryGenerator,
+        logger: Logger,
+        scanner: FolderScanner | None = None,
+        skill_engine: SkillEngine | None = None,
+    ):
+        self._document_service = document_service
+        self._collector = collector
+        self._summary_generator = summary_generator
+        self._logger = logger
+        self._scanner = scanner
+        self._skill_engine = skill_engine
+        self._documents: dict[Path, Document] = {}
+
+    @property
+    def documents(self) -> list[Document]:
+        return [self._documents[path] for path in sorted(self._documents)]
+
+    def load(self, folder: Path) -> None:
+        documents = self._document_service.get_documents(folder)
+        self._documents = {doc.path: doc for doc in documents}
+
+    def apply_changes(self, changed_paths: set[Path]) -> bool:
+        changed_paths = self._expand_archives(changed_paths)
+        # Члены архивов ("архив/имя") проверяются через оглавление архива
+        removed = {path for path in changed_paths if not is_file(path)}
+        touched = sorted(changed_paths - removed)
+        modified = False
+
+        for path in removed:
+            if self._documents.pop(path, None) is not None:
+                self._logger.info(f"Removed: {path}")
+                modified = True
+
+        for path in touched:
+            # Читаем по одному файлу, чтобы ошибка в одном не отменяла остальные
+            try:
+                results = list(self._collector.iter_results([path]))
+            except DocumentReadError as e:
+                self._logger.warning(f"Keeping previous version of {path}: {e}")
+                continue
+
+            if results and not results[0].ok:
+                self._logger.warning(
+                    f"Keeping previous version of {path}: {results[0].error}"
+                )
+                continue
+            if results:
+                self._documents[path] = results[0].document
+                modified = True
+            elif self._documents.pop(path, None) is not None:
+                modified = True
+
+        self._logger.info(
+            f"Applied {len(changed_paths)} change(s), "
+            f"{len(self._documents)} document(s) tracked"
+        )
+        return modified
+
+    def _expand_archives(self, paths: set[Path]) -> set[Path]:
+        if self._scanner is None:
+            return paths
+        expanded = set()
+        for path in paths:
+            if not is_archive(path):
+                expanded.add(path)
+                continue
+            # Событие приходит на сам архив: перечитываем его нынешние члены
+            # и убираем прежние, которых в нем больше нет
+            expanded.update(
+                tracked for tracked in self._documents if path in tracked.parents
+            )
+            if path.is_file():
+                expanded.update(self._scanner.scan_archive(path))
+            else:
+                expanded.add(path)
+        return expanded
+
+    def summarize(
+        self, prompt: PromptTemplate, skill_name: str | None = None
+    ) -> str | None:
+        documents = self.documents
+        if not documents:
+            self._logger.warning("No documents to summarize yet.")
+            return None
+        if self._skill_engine is None:
+            return self._summary_generator.generate(documents, prompt)
+        documents = self._skill_engine.run_pre(skill_name, documents)
+        summary = self._summary_generator.generate(documents, prompt)
+        return self._skill_engine.run_post(skill_name, summary, documents)
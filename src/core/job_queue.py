@@ -0,0 +1,154 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+from src.domain.models import Job, JobStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    prompt TEXT,
+    skill TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL DEFAULT (julianday('now')),
+    updated_at REAL NOT NULL DEFAULT (julianday('now'))
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+"""
+
+_COLUMNS = "id, folder, output_path, prompt, skill, status, attempts, error"
+
+
+class JobQueue:
+    def __init__(self, db_path: Path):
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self._db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def add(self, jobs: list[Job]) -> int:
+        rows = [
+            (
+                job.id,
+                str(job.folder),
+                str(job.output_path),
+                job.prompt,
+                job.skill,
+                job.status.value,
+            )
+            for job in jobs
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs "
+                "(id, folder, output_path, prompt, skill, status) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+    def recover(self) -> int:
+        # Задачи в статусе running остаются только после падения процесса
+        return self._set_status_where(JobStatus.RUNNING, JobStatus.PENDING)
+
+    def retry_failed(self) -> int:
+        return self._set_status_where(JobStatus.FAILED, JobStatus.PENDING)
+
+    def claim(self) -> Job | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE status = ? "
+                "ORDER BY created_at, id LIMIT 1",
+                (JobStatus.PENDING.value,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, "
+                "updated_at = julianday('now') WHERE id = ?",
+                (JobStatus.RUNNING.value, row[0]),
+            )
+
+        job = self._row_to_job(row)
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        return job
+
+    def mark_done(self, job_id: str) -> None:
+        self._update(job_id, JobStatus.DONE, None)
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        self._update(job_id, JobStatus.FAILED, error)
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, ids: list[str] | None = None) -> list[Job]:
+        query = f"SELECT {_COLUMNS} FROM jobs"
+        params: list[str] = []
+        if ids is not None:
+            query += f" WHERE id IN ({', '.join('?' * len(ids))})"
+            params = ids
+        query += " ORDER BY created_at, id"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def counts(self) -> dict[JobStatus, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        counts = dict.fromkeys(JobStatus, 0)
+        for status, count in rows:
+            counts[JobStatus(status)] = count
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _update(self, job_id: str, status: JobStatus, error: str | None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = julianday('now') "
+                "WHERE id = ?",
+                (status.value, error, job_id),
+            )
+
+    def _set_status_where(self, current: JobStatus, new: JobStatus) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = julianday('now') "
+                "WHERE status = ?",
+                (new.value, current.value),
+            )
+            return cursor.rowcount
+
+    def _row_to_job(self, row: tuple) -> Job:
+        job_id, folder, output_path, prompt, skill, status, attempts, error = row
+        return Job(
+            id=job_id,
+            folder=Path(folder),
+            output_path=Path(output_path),
+            prompt=prompt,
+            skill=skill,
+            status=JobStatus(status),
+            attempts=attempts,
+            error=error,
+        )
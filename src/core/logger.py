@@ -1,46 +1,234 @@
+import atexit
+import contextlib
+import os
+import queue
 import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
 
 from loguru import logger
 
+_LEVELS = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40}
+
+
+def _write_stderr(message: str) -> None:
+    # Поток берется в момент записи: индикатор прогресса подменяет sys.stderr,
+    # чтобы логи выводились над ним
+    sys.stderr.write(message)
+
+
+class _QueuedSink:
+    # Рабочие потоки только кладут готовую строку в очередь, пишет фоновый поток.
+    # Очередь своя у каждого процесса: enqueue из loguru держит межпроцессную
+    # блокировку, и воркер, убитый по таймауту во время записи, подвесил бы родителя
+    def __init__(self, write: Callable[[str], None]):
+        self._write = write
+        self._start()
+        os.register_at_fork(after_in_child=self._start)
+        atexit.register(self.flush)
+
+    def __call__(self, message: str) -> None:
+        self._queue.put(message)
+
+    def flush(self) -> None:
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout=5)
+
+    def _start(self) -> None:
+        self._queue: queue.SimpleQueue[str | threading.Event] = queue.SimpleQueue()
+        threading.Thread(target=self._run, name="log-writer", daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            message = self._queue.get()
+            if isinstance(message, threading.Event):
+                message.set()
+                continue
+            # Сбой записи лога не должен останавливать фоновый поток
+            with contextlib.suppress(Exception):
+                self._write(message)
+
+
+class _RotatingFile:
+    def __init__(self, path: Path, max_bytes: int, backups: int):
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._backups = max(0, backups)
+        self._lock = threading.Lock()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._path, "a", encoding="utf-8")  # noqa: SIM115
+
+    def __call__(self, message: str) -> None:
+        with self._lock:
+            size = self._file.tell()
+            if self._max_bytes and size and size + len(message) > self._max_bytes:
+                self._rotate()
+            self._file.write(message)
+            self._file.flush()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        # log.jsonl -> log.jsonl.1 -> ... -> log.jsonl.N, самый старый удаляется
+        for index in range(self._backups, 0, -1):
+            source = self._backup(index - 1) if index > 1 else self._path
+            if source.exists():
+                source.replace(self._backup(index))
+        if not self._backups:
+            self._path.unlink(missing_ok=True)
+        self._file = open(self._path, "a", encoding="utf-8")  # noqa: SIM115
+
+    def _backup(self, index: int) -> Path:
+        return self._path.with_name(f"{self._path.name}.{index}")
+
+
+class _Sampler:
+    def __init__(self, first: int, every: int):
+        self._first = first
+        self._every = every
+        self._lock = threading.Lock()
+        self._seen: dict[str, int] = {}
+        self._last: dict[str, int] = {}
+
+    def allow(self, key: str) -> int | None:
+        # Первые first сообщений проходят, дальше каждое every-е;
+        # возвращает число пропущенных перед ним
+        with self._lock:
+            seen = self._seen.get(key, 0) + 1
+            self._seen[key] = seen
+            if seen > self._first and (
+                not self._every or (seen - self._first) % self._every
+            ):
+                return None
+            skipped = seen - self._last.get(key, 0) - 1
+            self._last[key] = seen
+            return skipped
+
+    def drain(self) -> dict[str, int]:
+        with self._lock:
+            # Пропущенные до последнего показанного уже учтены в его "(+N similar)"
+            hidden = {
+                key: seen - self._last.get(key, 0)
+                for key, seen in self._seen.items()
+                if seen > self._last.get(key, 0)
+            }
+            self._seen.clear()
+            self._last.clear()
+        return hidden
+
 
 class Logger:
     _configured = False
+    _min_level = _LEVELS["INFO"]
+    _options: dict[str, Any] = {}
+    _sinks: dict[str, Callable[[str], None]] = {}
+    _sampler = _Sampler(first=20, every=1000)
 
-    def __init__(self, name: str, level: str = "INFO"):
+    def __init__(
+        self,
+        name: str,
+        level: str = "INFO",
+        enqueue: bool = False,
+        json_file: str | Path | None = None,
+        json_max_mb: int = 50,
+        json_backups: int = 5,
+        sample_first: int = 20,
+        sample_every: int = 1000,
+    ):
         self._name = name
         self._level = level
         self._logger = logger.bind(name=name)
 
         if not Logger._configured:
+            Logger._options = {
+                "enqueue": enqueue,
+                "json_file": json_file,
+                "json_max_bytes": json_max_mb * 1024 * 1024,
+                "json_backups": json_backups,
+            }
+            Logger._sampler = _Sampler(sample_first, sample_every)
             self._configure(level)
             Logger._configured = True
 
     def _configure(self, level: str) -> None:
+        options = Logger._options
         logger.remove()
         logger.add(
-            sys.stderr,
+            self._sink("stderr", _write_stderr, options.get("enqueue", False)),
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> |\
             <level>{level: <8}</level> | <cyan>{extra[name]}</cyan>\
             - <level>{message}</level>",
             level=level,
             colorize=True,
         )
+        json_file = options.get("json_file")
+        if json_file:
+            rotating = Logger._sinks.get(f"file:{json_file}") or _RotatingFile(
+                Path(json_file), options["json_max_bytes"], options["json_backups"]
+            )
+            Logger._sinks[f"file:{json_file}"] = rotating
+            logger.add(
+                self._sink(f"json:{json_file}", rotating, options["enqueue"]),
+                serialize=True,
+                level=level,
+            )
+        Logger._min_level = _LEVELS.get(level.upper(), logger.level(level).no)
 
-    def debug(self, msg: str) -> None:
-        self._logger.debug(msg)
+    @staticmethod
+    def _sink(
+        key: str, write: Callable[[str], None], enqueue: bool
+    ) -> Callable[[str], None]:
+        if not enqueue:
+            return write
+        # Один фоновый писатель на приемник, даже если уровень меняется на лету
+        key = f"queued:{key}"
+        if key not in Logger._sinks:
+            Logger._sinks[key] = _QueuedSink(write)
+        return Logger._sinks[key]
 
-    def info(self, msg: str) -> None:
-        self._logger.info(msg)
+    @classmethod
+    def flush(cls) -> None:
+        for sink in list(cls._sinks.values()):
+            if isinstance(sink, _QueuedSink):
+                sink.flush()
 
-    def warning(self, msg: str) -> None:
-        self._logger.warning(msg)
+    def enabled(self, level: str) -> bool:
+        return _LEVELS.get(level, 0) >= Logger._min_level
 
-    def error(self, msg: str) -> None:
-        self._logger.error(msg)
+    # Аргументы подставляются в {} только если сообщение будет записано: на горячих
+    # путях вместо f-строк. sample - ключ этапа для прореживания однотипных сообщений
+    def debug(self, msg: str, *args: Any, sample: str | None = None) -> None:
+        self._log("DEBUG", msg, args, sample)
 
-    def exception(self, msg: str) -> None:
-        self._logger.exception(msg)
+    def info(self, msg: str, *args: Any, sample: str | None = None) -> None:
+        self._log("INFO", msg, args, sample)
+
+    def warning(self, msg: str, *args: Any, sample: str | None = None) -> None:
+        self._log("WARNING", msg, args, sample)
+
+    def error(self, msg: str, *args: Any) -> None:
+        self._log("ERROR", msg, args, None)
+
+    def exception(self, msg: str, *args: Any) -> None:
+        self._logger.opt(depth=1, exception=True).error(msg, *args)
+
+    def log_sampled(self) -> None:
+        for key, hidden in Logger._sampler.drain().items():
+            self._logger.info(f"{hidden} similar '{key}' message(s) were not shown")
 
     def set_level(self, level: str) -> None:
         self._level = level
         self._configure(level)
+
+    def _log(self, level: str, msg: str, args: tuple, sample: str | None) -> None:
+        if _LEVELS[level] < Logger._min_level:
+            return
+        if sample is not None:
+            skipped = Logger._sampler.allow(sample)
+            if skipped is None:
+                return
+            if skipped:
+                msg = f"{msg} (+{skipped} similar)"
+        self._logger.opt(depth=2).log(level, msg, *args)
@@ -1,11 +1,21 @@
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from src.core.extraction_checkpoint import ExtractionCheckpoint
+    from src.core.progress import ProgressTracker
+    from src.core.quarantine import Quarantine
     from src.dependencies import Container
+    from src.domain.models import Document, RunPlan
+    from src.output.formatter import OutputFormat
+    from src.prompts.template import PromptTemplate
 
 
 class App:
+    _FILTER_LIMIT = 10_000
+
     def __init__(self, container: "Container"):
         self._container = container
         self._logger = container.logger()
@@ -14,23 +24,248 @@ class App:
         self._summary_generator = container.summary_generator()
         self._formatter = container.formatter()
 
+    def __enter__(self) -> "App":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._container.reader_factory().close()
+
     def run(
         self,
         folder: Path | None = None,
         prompt_name: str | None = None,
         skill_name: str | None = None,
         verbose: bool = False,
+        per_document: bool = False,
+        output: Path | None = None,
+        output_format: "OutputFormat | None" = None,
+        workers: int | None = None,
+        top_k: int | None = None,
+        query: str | None = None,
+        filter_query: str | None = None,
+        variables: dict[str, str] | None = None,
+        progress: str | None = None,
+        progress_file: Path | None = None,
     ) -> None:
         self._setup_logging(verbose)
         self._validate_folder(folder)
 
-        prompt = self._prompt_manager.select(prompt_name, skill_name)
+        prompt = self._prompt_manager.select(prompt_name, skill_name, variables)
+        if query:
+            prompt = prompt.with_question(query)
         folder = folder or Path(".")
-        documents = self._document_service.get_documents(folder)
+        self._preflight()
+
+        from src.core.quarantine import Quarantine
+
+        cancellation = self._container.cancellation()
+        checkpoint = self._open_checkpoint(folder)
+        quarantine = Quarantine()
+        collector = self._container.document_collector()
+        tracker = self._container.progress_tracker()
+        tracker.start()
+        with (
+            self._progress_reporter(tracker, progress, progress_file),
+            cancellation.handle_sigint(self._logger),
+            collector.checkpoint_scope(checkpoint),
+            collector.quarantine_scope(quarantine),
+        ):
+            try:
+                documents = self._load_documents(
+                    folder, prompt, query, top_k, filter_query
+                )
+            finally:
+                self._write_quarantine(quarantine)
+                self._logger.log_sampled()
+            if cancellation.cancelled:
+                self._logger.warning(
+                    f"Summarizing {len(documents)} document(s) collected before "
+                    "the interruption"
+                )
+
+            if not documents:
+                return
+
+            tracker.set_stage("summarize")
+            skill_engine = self._container.skill_engine()
+            try:
+                documents = skill_engine.run_pre(skill_name, documents)
+                if per_document:
+                    self._run_per_document(
+                        documents, prompt, output, output_format, workers
+                    )
+                else:
+                    summary = self._summary_generator.generate(documents, prompt)
+                    summary = skill_engine.run_post(skill_name, summary, documents)
+                    self._formatter.output(summary)
+            finally:
+                skill_engine.shutdown()
+                self._container.ocr_engine().log_stats()
+                self._log_token_usage()
+                transcript_mapper = self._container.enabled_transcript_mapper()
+                if transcript_mapper is not None:
+                    transcript_mapper.clear()
+
+        if checkpoint is None:
+            return
+        if cancellation.cancelled:
+            checkpoint.close()
+            self._logger.info("Extraction checkpoint kept, the next run will resume")
+        else:
+            checkpoint.clear()
+
+    def plan(
+        self,
+        folder: Path,
+        prompt_name: str | None = None,
+        skill_name: str | None = None,
+        verbose: bool = False,
+        per_document: bool = False,
+        top_k: int | None = None,
+        variables: dict[str, str] | None = None,
+    ) -> "RunPlan":
+        from src.output.tables import display_plan
+
+        self._setup_logging(verbose)
+        self._validate_folder(folder)
+
+        prompt = self._prompt_manager.select(prompt_name, skill_name, variables)
+        if top_k is None:
+            top_k = self._container.config.retrieval_top_k()
+        plan = self._container.run_planner().plan(
+            folder, prompt, per_document=per_document, top_k=top_k
+        )
+        display_plan(plan)
+        return plan
+
+    def batch(
+        self,
+        targets: list[str],
+        prompt_name: str | None = None,
+        skill_name: str | None = None,
+        concurrency: int | None = None,
+        output_dir: Path | None = None,
+        retry_failed: bool = False,
+        verbose: bool = False,
+    ) -> None:
+        from src.output.tables import display_jobs_table
+
+        self._setup_logging(verbose)
+
+        runner = self._container.batch_runner()
+        queue = self._container.job_queue()
+        output_dir = output_dir or Path(self._container.config.batch_output_dir())
+
+        jobs = runner.build_jobs(targets, output_dir, prompt_name, skill_name)
+        runner.submit(jobs)
+        if retry_failed:
+            queue.retry_failed()
 
-        if documents:
-            summary = self._summary_generator.generate(documents, prompt)
-            self._formatter.output(summary)
+        try:
+            runner.run(concurrency)
+        finally:
+            self._container.skill_engine().shutdown()
+        display_jobs_table(queue.list_jobs([job.id for job in jobs]))
+
+    def watch(
+        self,
+        folder: Path,
+        prompt_name: str | None = None,
+        skill_name: str | None = None,
+        output: Path | None = None,
+        verbose: bool = False,
+    ) -> None:
+        self._setup_logging(verbose)
+        self._validate_folder(folder)
+
+        folder = folder.resolve()
+        prompt = self._prompt_manager.select(prompt_name, skill_name)
+        summarizer = self._container.incremental_summarizer()
+
+        def refresh(changed: set[Path] | None = None) -> None:
+            if changed is not None and not summarizer.apply_changes(changed):
+                return
+            summary = summarizer.summarize(prompt, skill_name)
+            if summary is None:
+                return
+            if output:
+                output.parent.mkdir(parents=True, exist_ok=True)
+                output.write_text(summary, encoding="utf-8")
+                self._logger.info(f"Summary updated: {output}")
+            else:
+                self._formatter.output(summary)
+
+        try:
+            summarizer.load(folder)
+            refresh()
+            self._container.folder_watcher().watch(folder, refresh)
+        except KeyboardInterrupt:
+            self._logger.info("Stopped watching.")
+        finally:
+            self._container.skill_engine().shutdown()
+
+    def serve(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        socket_path: Path | None = None,
+        verbose: bool = False,
+    ) -> None:
+        from src.server.api import create_server
+
+        self._setup_logging(verbose)
+
+        config = self._container.config
+        service = self._container.summary_service()
+        server = create_server(
+            service,
+            self._logger,
+            host=host or config.server_host(),
+            port=port or config.server_port(),
+            socket_path=socket_path,
+        )
+
+        service.start()
+        self._logger.info(f"Listening on {socket_path or server.server_address}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self._logger.info("Shutting down...")
+        finally:
+            server.server_close()
+            service.stop()
+            self._container.skill_engine().shutdown()
+
+    def mock_server(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        verbose: bool = False,
+    ) -> None:
+        from src.llm.mock_server import MockOpenRouterServer
+
+        self._setup_logging(verbose)
+
+        config = self._container.config
+        server = MockOpenRouterServer(
+            (host or config.mock_server_host(), port or config.mock_server_port()),
+            self._container.llm_simulator(),
+            self._logger,
+            model=config.openrouter_model(),
+            vision=config.mock_vision(),
+        )
+
+        base_url = "http://{}:{}/api/v1".format(*server.server_address[:2])
+        self._logger.info(f"Mock OpenRouter API listening on {base_url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self._logger.info("Shutting down...")
+        finally:
+            server.server_close()
 
     def list_prompts(self) -> None:
         from src.output.tables import display_prompts_table
@@ -46,6 +281,155 @@ class App:
         registry.load()
         display_skills_table(registry.list_skills())
 
+    def search(
+        self,
+        query: str,
+        folder: Path | None = None,
+        limit: int = 20,
+        verbose: bool = False,
+    ) -> None:
+        from src.output.tables import display_search_results
+
+        self._setup_logging(verbose)
+
+        index = self._container.fulltext_index()
+        if folder is not None:
+            self._validate_folder(folder)
+            index.update(folder, self._document_service.get_documents_from_files)
+        display_search_results(index.search(query, folder, limit))
+
+    def _load_documents(
+        self,
+        folder: Path,
+        prompt: "PromptTemplate",
+        query: str | None,
+        top_k: int | None,
+        filter_query: str | None,
+    ) -> Sequence["Document"]:
+        if top_k is None:
+            top_k = self._container.config.retrieval_top_k() or 0
+
+        if filter_query and top_k > 0:
+            raise ValueError("--filter cannot be combined with --top-k.")
+
+        if filter_query:
+            index = self._container.fulltext_index()
+            index.update(folder, self._document_service.get_documents_from_files)
+            hits = index.search(filter_query, folder, limit=self._FILTER_LIMIT)
+            self._logger.info(f"Filter '{filter_query}' matched {len(hits)} document(s)")
+            return index.get_documents([hit.path for hit in hits])
+
+        if top_k > 0:
+            return self._container.retriever().retrieve(
+                folder,
+                query or prompt.render_instruction(),
+                top_k,
+                self._document_service.get_documents_from_files,
+            )
+
+        return self._document_service.get_documents(folder)
+
+    def _run_per_document(
+        self,
+        documents: Sequence["Document"],
+        prompt: "PromptTemplate",
+        output: Path | None,
+        output_format: "OutputFormat | None",
+        workers: int | None,
+    ) -> None:
+        from src.output.formatter import OutputFormat, create_document_formatter
+        from src.output.writer import StreamingFileWriter
+
+        results = self._summary_generator.generate_per_document(
+            documents, prompt, max_workers=workers
+        )
+
+        if output is None:
+            for result in results:
+                self._formatter.output_document(result)
+            return
+
+        output_format = output_format or self._guess_output_format(output)
+        formatter = create_document_formatter(output_format or OutputFormat.JSONL)
+        with StreamingFileWriter(output, formatter) as writer:
+            for result in results:
+                writer.write(result)
+                self._logger.info(f"Written summary for {result.path.name}")
+
+        self._logger.info(f"Saved {writer.written} summaries to {output}")
+
+    def _open_checkpoint(self, folder: Path) -> "ExtractionCheckpoint | None":
+        from src.core.extraction_checkpoint import ExtractionCheckpoint
+
+        config = self._container.config
+        if not config.extraction_checkpoint():
+            return None
+        # Чекпоинт удаляется только после успешного запуска: после сбоя или Ctrl-C
+        # следующий запуск возьмет уже извлеченные документы из него
+        root = Path(config.data_dir()) / "checkpoints"
+        checkpoint = ExtractionCheckpoint.for_folder(root, folder)
+        if checkpoint.path.exists():
+            self._logger.info(f"Resuming from extraction checkpoint {checkpoint.path}")
+        return checkpoint
+
+    def _progress_reporter(
+        self,
+        tracker: "ProgressTracker",
+        mode: str | None,
+        path: Path | None,
+    ) -> "AbstractContextManager":
+        from src.output.progress import create_progress_reporter
+
+        config = self._container.config
+        if path is None and config.progress_file():
+            path = Path(config.progress_file())
+        return create_progress_reporter(
+            mode or config.progress(),
+            tracker,
+            path,
+            config.progress_interval_seconds(),
+        )
+
+    def _write_quarantine(self, quarantine: "Quarantine") -> None:
+        path = Path(self._container.config.data_dir()) / "quarantine.jsonl"
+        quarantine.write(path)
+        if len(quarantine):
+            self._logger.warning(
+                f"{len(quarantine)} file(s) could not be read and were left out "
+                f"of the summary, see {path}"
+            )
+
+    def _preflight(self) -> None:
+        from src.domain.exceptions import PreflightError
+
+        # Проверяем провайдера до OCR и транскрибации, а не после них
+        if not self._container.config.preflight_probe():
+            return
+        status = self._container.llm_client().probe()
+        if not status.ok:
+            raise PreflightError(f"LLM provider check failed: {status.message}")
+        self._logger.debug(status.message)
+
+    def _log_token_usage(self) -> None:
+        usage = self._container.llm_client().usage
+        if not usage.requests:
+            return
+        self._logger.info(
+            f"LLM usage: {usage.requests} request(s), {usage.prompt_tokens} prompt "
+            f"tokens ({usage.cached_tokens} cached), "
+            f"{usage.completion_tokens} completion tokens"
+        )
+
+    def _guess_output_format(self, output: Path) -> "OutputFormat | None":
+        from src.output.formatter import OutputFormat
+
+        suffixes = {
+            ".jsonl": OutputFormat.JSONL,
+            ".md": OutputFormat.MARKDOWN,
+            ".csv": OutputFormat.CSV,
+        }
+        return suffixes.get(output.suffix.lower())
+
     def _setup_logging(self, verbose: bool) -> None:
         if verbose:
             self._logger.set_level("DEBUG")
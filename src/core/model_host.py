@@ -0,0 +1,297 @@
+import contextlib
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+import numpy as np
+
+from src.core.logger import Logger
+from src.domain.exceptions import ModelHostError, ModelUnavailableError
+
+# Обработчик получает пачку (массив, параметры) и возвращает результат на каждый элемент
+BatchHandler = Callable[[list[tuple[np.ndarray, dict[str, Any]]]], list[Any]]
+HandlerLoader = Callable[[], BatchHandler]
+
+
+@dataclass
+class _Request:
+    conn: Connection
+    lock: threading.Lock
+    buffer: str
+    shape: tuple[int, ...]
+    dtype: str
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Буфер принадлежит клиенту: хост не должен удалять его при своем завершении
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _receive(conn: Connection, requests: queue.Queue) -> None:
+    lock = threading.Lock()
+    with conn:
+        while True:
+            try:
+                buffer, shape, dtype, options = conn.recv()
+            except (EOFError, OSError):
+                return
+            requests.put(_Request(conn, lock, buffer, tuple(shape), dtype, options))
+
+
+def _accept(listener: Listener, requests: queue.Queue) -> None:
+    while True:
+        try:
+            conn = listener.accept()
+        except OSError:
+            return
+        threading.Thread(target=_receive, args=(conn, requests), daemon=True).start()
+
+
+def _next_batch(
+    requests: queue.Queue, max_batch_size: int, wait: float
+) -> list[_Request]:
+    batch = [requests.get()]
+    # Короткое ожидание собирает одновременные запросы разных воркеров в одну пачку
+    deadline = time.monotonic() + wait
+    while len(batch) < max_batch_size:
+        remaining = deadline - time.monotonic()
+        try:
+            batch.append(requests.get(timeout=max(0.0, remaining)))
+        except queue.Empty:
+            break
+    return batch
+
+
+class _LazyHandler:
+    def __init__(self, loader: HandlerLoader):
+        self._loader = loader
+        self._handler: BatchHandler | None = None
+        self._error: str | None = None
+
+    def __call__(self, items: list[tuple[np.ndarray, dict[str, Any]]]) -> list[Any]:
+        # Модель грузится при первом запросе: сам хост запускается заранее, до fork
+        # воркеров, даже если до распознавания в этом запуске дело не дойдет
+        if self._handler is None and self._error is None:
+            try:
+                self._handler = self._loader()
+            except Exception as e:
+                self._error = f"{type(e).__name__}: {e}"
+        if self._error is not None:
+            raise ModelUnavailableError(f"model failed to load: {self._error}")
+        return self._handler(items)
+
+
+def _run_batch(handler: BatchHandler, batch: list[_Request]) -> None:
+    buffers = [_attach(request.buffer) for request in batch]
+    try:
+        items = [
+            (
+                np.ndarray(request.shape, dtype=request.dtype, buffer=buffer.buf),
+                request.options,
+            )
+            for request, buffer in zip(batch, buffers, strict=True)
+        ]
+        try:
+            results = handler(items)
+            if len(results) != len(batch):
+                raise ModelHostError(
+                    f"handler returned {len(results)} results for {len(batch)} requests"
+                )
+            replies = [("ok", result) for result in results]
+        except Exception as e:
+            replies = [_error_reply(e)] * len(batch)
+        del items
+    finally:
+        for buffer in buffers:
+            buffer.close()
+
+    for request, reply in zip(batch, replies, strict=True):
+        _reply(request, reply)
+
+
+def _reply(request: _Request, reply: tuple[str, Any]) -> None:
+    with request.lock, contextlib.suppress(OSError):
+        request.conn.send(reply)
+
+
+def _error_reply(error: Exception) -> tuple[str, str]:
+    if isinstance(error, ModelUnavailableError):
+        return "unavailable", str(error)
+    return "error", str(error) if isinstance(error, ModelHostError) else repr(error)
+
+
+def _host_main(
+    loader: HandlerLoader,
+    ready: Connection,
+    authkey: bytes,
+    max_batch_size: int,
+    batch_wait_seconds: float,
+) -> None:
+    # Ctrl-C обрабатывает родитель, он же останавливает хост
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        listener = Listener(authkey=authkey)
+    except Exception as e:
+        ready.send((False, repr(e)))
+        return
+    ready.send((True, listener.address))
+    ready.close()
+
+    handler = _LazyHandler(loader)
+    requests: queue.Queue[_Request] = queue.Queue()
+    threading.Thread(target=_accept, args=(listener, requests), daemon=True).start()
+    while True:
+        batch = _next_batch(requests, max_batch_size, batch_wait_seconds)
+        try:
+            _run_batch(handler, batch)
+        except Exception as e:
+            # Например, клиент не дождался ответа и уже удалил свой буфер
+            for request in batch:
+                _reply(request, _error_reply(e))
+
+
+class ModelHostClient:
+    def __init__(self, name: str, address: Any, authkey: bytes):
+        self._name = name
+        self._address = address
+        self._authkey = authkey
+        self._local = threading.local()
+
+    def infer(self, array: np.ndarray, **options: Any) -> Any:
+        array = np.ascontiguousarray(array)
+        # Массив кладется в разделяемую память: хост читает его на месте, без pickle
+        buffer = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        try:
+            np.ndarray(array.shape, dtype=array.dtype, buffer=buffer.buf)[...] = array
+            conn = self._connection()
+            try:
+                conn.send((buffer.name, array.shape, array.dtype.str, options))
+                status, payload = conn.recv()
+            except (EOFError, OSError) as e:
+                self._local.conn = None
+                raise ModelHostError(f"{self._name} model host is not responding") from e
+        finally:
+            buffer.close()
+            buffer.unlink()
+
+        if status == "unavailable":
+            raise ModelUnavailableError(f"{self._name}: {payload}")
+        if status != "ok":
+            raise ModelHostError(f"{self._name} model host failed: {payload}")
+        return payload
+
+    def _connection(self) -> Connection:
+        # Соединение свое у каждого потока и каждого процесса (в том числе после fork)
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = Client(self._address, authkey=self._authkey)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+
+class ModelHost:
+    def __init__(
+        self,
+        name: str,
+        loader: HandlerLoader,
+        logger: Logger,
+        max_batch_size: int = 8,
+        batch_wait_ms: float = 5.0,
+        start_timeout_seconds: float = 30.0,
+    ):
+        self.name = name
+        self._loader = loader
+        self._logger = logger
+        self._max_batch_size = max(1, max_batch_size)
+        self._batch_wait_seconds = batch_wait_ms / 1000
+        self._start_timeout_seconds = start_timeout_seconds
+        self._lock = threading.Lock()
+        self._process: BaseProcess | None = None
+        self._client: ModelHostClient | None = None
+        self._owner_pid = os.getpid()
+
+    def start(self) -> "ModelHost":
+        self.client()
+        return self
+
+    def client(self) -> ModelHostClient:
+        with self._lock:
+            if self._client is None:
+                self._client = self._start()
+            return self._client
+
+    def close(self) -> None:
+        with self._lock:
+            # Воркеры, унаследовавшие хост через fork, не должны его останавливать
+            if self._process is None or os.getpid() != self._owner_pid:
+                return
+            self._process.kill()
+            self._process.join()
+            self._process = None
+            self._client = None
+            self._logger.debug(f"{self.name} model host stopped")
+
+    def _start(self) -> ModelHostClient:
+        if os.getpid() != self._owner_pid:
+            raise ModelHostError(
+                f"{self.name} model host must be started before worker processes fork"
+            )
+
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        context = multiprocessing.get_context(method)
+        authkey = os.urandom(32)
+        # Общий с клиентами трекер разделяемой памяти: иначе до Python 3.13 хост
+        # считает подключенные буферы своими и "чистит" их при завершении
+        resource_tracker.ensure_running()
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_host_main,
+            args=(
+                self._loader,
+                child_conn,
+                authkey,
+                self._max_batch_size,
+                self._batch_wait_seconds,
+            ),
+            name=f"{self.name}-host",
+            daemon=True,
+        )
+        started = time.perf_counter()
+        process.start()
+        child_conn.close()
+
+        try:
+            if parent_conn.poll(self._start_timeout_seconds):
+                ok, payload = parent_conn.recv()
+            else:
+                ok, payload = False, "timed out"
+        except EOFError:
+            ok, payload = False, f"exit code {process.exitcode}"
+        finally:
+            parent_conn.close()
+
+        if not ok:
+            process.kill()
+            process.join()
+            raise ModelHostError(f"{self.name} model host failed to start: {payload}")
+
+        self._process = process
+        self._logger.debug(
+            f"{self.name} model host started in {time.perf_counter() - started:.1f}s "
+            f"(pid {process.pid})"
+        )
+        return ModelHostClient(self.name, payload, authkey)
@@ -0,0 +1,157 @@
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.core.archives import file_stat
+from src.domain.models import ProgressSnapshot, TokenUsage, TranscriptSegment
+
+
+class ProgressTracker:
+    def __init__(
+        self,
+        usage: TokenUsage | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._usage = usage
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Страницы OCR распознаются и в изолированных воркерах: счетчик в разделяемой
+        # памяти наследуется ими через fork
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self._ocr_pages = multiprocessing.get_context(method).Value("q", 0)
+        self._llm_in_flight = 0
+        self._reset()
+
+    def start(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def set_stage(self, stage: str) -> None:
+        with self._lock:
+            self._stage = stage
+            if stage == "extract" and self._extract_started is None:
+                self._extract_started = self._clock()
+
+    def scanned(self, count: int) -> None:
+        with self._lock:
+            self._files_scanned += count
+
+    def queued(self, file_paths: list[Path]) -> None:
+        sizes = []
+        for path in file_paths:
+            try:
+                sizes.append(file_stat(path).st_size)
+            except OSError:
+                sizes.append(0)
+        with self._lock:
+            self._files_total += len(file_paths)
+            self._bytes_total += sum(sizes)
+
+    def file_done(self, reader: str | None, size_bytes: int, ok: bool = True) -> None:
+        with self._lock:
+            self._files_done += 1
+            self._bytes_done += size_bytes
+            if not ok:
+                self._files_failed += 1
+            elif reader is not None:
+                self._bytes_by_reader[reader] = (
+                    self._bytes_by_reader.get(reader, 0) + size_bytes
+                )
+
+    def ocr_page(self) -> None:
+        with self._ocr_pages.get_lock():
+            self._ocr_pages.value += 1
+
+    def on_transcript_start(self, file_path: Path) -> None:
+        with self._lock:
+            self._audio_positions[file_path] = 0.0
+
+    def on_segment(self, file_path: Path, segment: TranscriptSegment) -> None:
+        with self._lock:
+            position = self._audio_positions.get(file_path, 0.0)
+            self._audio_seconds += max(0.0, segment.end - position)
+            self._audio_positions[file_path] = max(position, segment.end)
+
+    def on_transcript_end(self, file_path: Path) -> None:
+        with self._lock:
+            self._audio_positions.pop(file_path, None)
+
+    @contextmanager
+    def llm_request(self) -> Iterator[None]:
+        with self._lock:
+            self._llm_in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._llm_in_flight -= 1
+                self._llm_requests += 1
+
+    def snapshot(self) -> ProgressSnapshot:
+        now = self._clock()
+        with self._lock:
+            extract_seconds = (
+                now - self._extract_started if self._extract_started is not None else 0.0
+            )
+            ocr_pages = self._ocr_pages.value - self._ocr_pages_baseline
+            prompt_tokens, completion_tokens = self._tokens()
+            return ProgressSnapshot(
+                stage=self._stage,
+                elapsed_seconds=now - self._started,
+                files_scanned=self._files_scanned,
+                files_total=self._files_total,
+                files_done=self._files_done,
+                files_failed=self._files_failed,
+                bytes_total=self._bytes_total,
+                bytes_done=self._bytes_done,
+                bytes_by_reader=dict(self._bytes_by_reader),
+                ocr_pages=ocr_pages,
+                ocr_pages_per_second=_rate(ocr_pages, extract_seconds),
+                audio_seconds=self._audio_seconds,
+                audio_speed=_rate(self._audio_seconds, extract_seconds),
+                llm_in_flight=self._llm_in_flight,
+                llm_requests=self._llm_requests,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                eta_seconds=self._eta(extract_seconds),
+            )
+
+    def _reset(self) -> None:
+        self._stage = "scan"
+        self._started = self._clock()
+        self._extract_started: float | None = None
+        self._files_scanned = 0
+        self._files_total = 0
+        self._files_done = 0
+        self._files_failed = 0
+        self._bytes_total = 0
+        self._bytes_done = 0
+        self._bytes_by_reader: dict[str, int] = {}
+        self._ocr_pages_baseline = self._ocr_pages.value
+        self._audio_seconds = 0.0
+        self._audio_positions: dict[Path, float] = {}
+        self._llm_requests = 0
+        self._tokens_baseline = self._tokens_total()
+
+    def _tokens_total(self) -> tuple[int, int]:
+        if self._usage is None:
+            return 0, 0
+        return self._usage.prompt_tokens, self._usage.completion_tokens
+
+    def _tokens(self) -> tuple[int, int]:
+        prompt, completion = self._tokens_total()
+        return prompt - self._tokens_baseline[0], completion - self._tokens_baseline[1]
+
+    def _eta(self, extract_seconds: float) -> float | None:
+        # Оценка по объему: скорость извлечения в байтах за все время этапа
+        if self._stage != "extract" or not self._bytes_done or not extract_seconds:
+            return None
+        remaining = max(0, self._bytes_total - self._bytes_done)
+        return remaining * extract_seconds / self._bytes_done
+
+
+def _rate(amount: float, seconds: float) -> float:
+    return amount / seconds if seconds > 0 else 0.0
@@ -1,7 +1,10 @@
 from src.core.logger import Logger
 from src.prompts.registry import PromptRegistry
+from src.prompts.template import PromptTemplate
 from src.skills.registry import SkillRegistry
 
+DEFAULT_PROMPT = "Проанализируй документы и создай краткое саммари."
+
 
 class PromptManager:
     def __init__(
@@ -15,15 +18,22 @@ class PromptManager:
         self._logger = logger
 
     def select(
-        self, prompt_name: str | None = None, skill_name: str | None = None
-    ) -> str:
-        self._load_registries()
+        self,
+        prompt_name: str | None = None,
+        skill_name: str | None = None,
+        variables: dict[str, str] | None = None,
+    ) -> PromptTemplate:
+        return self._select(prompt_name, skill_name).with_variables(variables or {})
 
+    def _select(self, prompt_name: str | None, skill_name: str | None) -> PromptTemplate:
+        # Реестр навыков читается только когда навык действительно запрошен
         if skill_name:
+            self._skill_registry.load()
             skill_prompt = self._get_skill_prompt(skill_name)
             if skill_prompt:
-                return skill_prompt
+                return PromptTemplate(instruction=skill_prompt)
 
+        self._prompt_registry.load()
         if prompt_name:
             named_prompt = self._get_named_prompt(prompt_name)
             if named_prompt:
@@ -31,10 +41,6 @@ class PromptManager:
 
         return self._get_default_prompt()
 
-    def _load_registries(self) -> None:
-        self._prompt_registry.load()
-        self._skill_registry.load()
-
     def _get_skill_prompt(self, skill_name: str) -> str | None:
         skill = self._skill_registry.get(skill_name)
         if skill and skill.prompt:
@@ -43,17 +49,17 @@ class PromptManager:
         self._logger.warning(f"Skill not found or has no prompt: {skill_name}")
         return None
 
-    def _get_named_prompt(self, prompt_name: str) -> str | None:
+    def _get_named_prompt(self, prompt_name: str) -> PromptTemplate | None:
         prompt = self._prompt_registry.get(prompt_name)
         if prompt:
             self._logger.info(f"Using prompt: {prompt_name}")
-            return prompt.prompt
+            return prompt.template()
         self._logger.warning(f"Prompt not found: {prompt_name}")
         return None
 
-    def _get_default_prompt(self) -> str:
+    def _get_default_prompt(self) -> PromptTemplate:
         default_prompt = self._prompt_registry.get("default")
         if default_prompt:
             self._logger.info("Using default prompt")
-            return default_prompt.prompt
-        return "Проанализируй документы и создай краткое саммари."
+            return default_prompt.template()
+        return PromptTemplate(instruction=DEFAULT_PROMPT)
@@ -0,0 +1,38 @@
+import os
+import threading
+from pathlib import Path
+
+from src.domain.models import ReadResult
+
+
+class Quarantine:
+    def __init__(self):
+        self._entries: list[ReadResult] = []
+        self._lock = threading.Lock()
+
+    def add(self, result: ReadResult) -> None:
+        with self._lock:
+            self._entries.append(result)
+
+    @property
+    def entries(self) -> list[ReadResult]:
+        with self._lock:
+            return list(self._entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def write(self, path: Path) -> None:
+        # Список перезаписывается каждым запуском: старые сбои могли быть уже исправлены
+        entries = self.entries
+        if not entries:
+            path.unlink(missing_ok=True)
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(entry.model_dump_json(exclude={"document"}) + "\n")
+        tmp_path.replace(path)
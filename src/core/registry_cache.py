@@ -0,0 +1,55 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from src.core.archives import file_stat
+
+FileFingerprint = tuple[int, int]
+
+
+def file_fingerprint(file_path: Path) -> FileFingerprint | None:
+    try:
+        stat = file_stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class RegistrySnapshot:
+    VERSION = 1
+
+    def __init__(self, cache_path: Path | None):
+        self._cache_path = Path(cache_path) if cache_path else None
+
+    def load(self) -> dict[str, tuple[FileFingerprint, dict[str, Any]]]:
+        if self._cache_path is None or not self._cache_path.exists():
+            return {}
+
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if data.get("version") != self.VERSION:
+            return {}
+
+        return {
+            path: (tuple(item["fingerprint"]), item["entry"])
+            for path, item in data.get("files", {}).items()
+        }
+
+    def save(self, files: dict[str, tuple[FileFingerprint, dict[str, Any]]]) -> None:
+        if self._cache_path is None:
+            return
+
+        data = {
+            "version": self.VERSION,
+            "files": {
+                path: {"fingerprint": list(fingerprint), "entry": entry}
+                for path, (fingerprint, entry) in files.items()
+            },
+        }
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self._cache_path)
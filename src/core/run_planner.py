@@ -0,0 +1,138 @@
+from pathlib import Path
+
+from src.core.archives import file_stat
+from src.core.deduplicator import Deduplicator
+from src.core.document_collector import DocumentCollector
+from src.core.extraction_timings import ExtractionTimings
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.core.summary_generator import DEFAULT_SYSTEM_PROMPT
+from src.domain.models import PlannedFile, RunPlan
+from src.llm.contracts import LLMProvider
+from src.llm.tokens import CHARS_PER_TOKEN, estimate_tokens
+from src.prompts.template import PromptTemplate
+from src.readers.factory import ReaderFactory, reader_name
+
+
+class RunPlanner:
+    def __init__(
+        self,
+        scanner: FolderScanner,
+        collector: DocumentCollector,
+        reader_factory: ReaderFactory,
+        timings: ExtractionTimings,
+        llm_provider: LLMProvider,
+        logger: Logger,
+        deduplicator: Deduplicator | None = None,
+        chunk_chars: int = 1500,
+        completion_tokens_per_request: int = 500,
+    ):
+        self._scanner = scanner
+        self._collector = collector
+        self._reader_factory = reader_factory
+        self._timings = timings
+        self._llm = llm_provider
+        self._logger = logger
+        self._deduplicator = deduplicator
+        self._chunk_chars = chunk_chars
+        self._completion_tokens_per_request = completion_tokens_per_request
+
+    def plan(
+        self,
+        folder: Path,
+        prompt: PromptTemplate,
+        per_document: bool = False,
+        top_k: int | None = None,
+        probe: bool = True,
+    ) -> RunPlan:
+        self._logger.info(f"Planning run for {folder}")
+        plan = RunPlan(
+            files=[self._plan_file(path) for path in self._scanner.scan(folder)]
+        )
+        self._mark_exact_duplicates(plan)
+
+        selected = plan.selected
+        if not selected:
+            plan.problems.append(f"No supported files found in {folder}")
+
+        # Статичная часть запроса повторяется в каждом запросе
+        overhead = estimate_tokens(
+            prompt.render_instruction()
+            + (prompt.render_system() or DEFAULT_SYSTEM_PROMPT)
+        )
+        context_cap = top_k * self._chunk_chars // CHARS_PER_TOKEN if top_k else None
+        if per_document:
+            request_tokens = [
+                overhead + _capped(file.estimated_tokens, context_cap)
+                for file in selected
+            ]
+        elif selected:
+            documents = sum(file.estimated_tokens for file in selected)
+            request_tokens = [overhead + _capped(documents, context_cap)]
+        else:
+            request_tokens = []
+
+        plan.requests = len(request_tokens)
+        plan.prompt_tokens = sum(request_tokens)
+        plan.completion_tokens = plan.requests * self._completion_tokens_per_request
+        plan.extraction_seconds = sum(file.estimated_seconds for file in selected)
+
+        if probe:
+            plan.provider = self._llm.probe()
+            self._check_provider(plan, max(request_tokens, default=0))
+        return plan
+
+    def _plan_file(self, path: Path) -> PlannedFile:
+        try:
+            size_bytes = file_stat(path).st_size
+        except OSError:
+            size_bytes = 0
+
+        reader = self._reader_factory.get_reader(path)
+        name = reader_name(reader) if reader is not None else None
+        planned = PlannedFile(
+            path=path,
+            size_bytes=size_bytes,
+            reader=name,
+            skip_reason=self._collector.skip_reason(path),
+        )
+        if planned.skip_reason is None and name is not None:
+            planned.estimated_seconds, planned.estimated_tokens = self._timings.estimate(
+                name, path.suffix, size_bytes
+            )
+        return planned
+
+    def _mark_exact_duplicates(self, plan: RunPlan) -> None:
+        if self._deduplicator is None:
+            return
+
+        by_path = {file.path: file for file in plan.selected}
+        _, groups = self._deduplicator.drop_exact_duplicates(list(by_path))
+        for group in groups:
+            reason = f"duplicate of {group.representative.name}"
+            for duplicate in group.duplicates:
+                by_path[duplicate].skip_reason = reason
+
+    def _check_provider(self, plan: RunPlan, largest_request: int) -> None:
+        provider = plan.provider
+        if provider is None:
+            return
+        if not provider.ok:
+            plan.problems.append(provider.message)
+            return
+
+        if provider.context_length and largest_request > provider.context_length:
+            plan.problems.append(
+                f"Estimated request of {largest_request} tokens exceeds the model "
+                f"context of {provider.context_length} tokens; "
+                "use --per-document or --top-k"
+            )
+        if provider.prompt_price is not None:
+            plan.estimated_cost = (
+                plan.prompt_tokens * provider.prompt_price
+                + plan.completion_tokens * (provider.completion_price or 0.0)
+            )
+
+
+def _capped(tokens: int, cap: int | None) -> int:
+    return min(tokens, cap) if cap is not None else tokens
@@ -1,37 +1,135 @@
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from src.core.cancellation import CancellationToken
 from src.core.logger import Logger
-from src.domain.models import ContentType, Document
+from src.core.transcript_mapper import TranscriptMapper
+from src.domain.models import ContentType, Document, DocumentSummary, ImageData
 from src.llm.contracts import LLMProvider, Message  # Message теперь живет в контрактах
+from src.prompts.template import PromptTemplate
+
+DEFAULT_SYSTEM_PROMPT = "You are an expert editor and summarizer."
 
 
 class SummaryGenerator:
-    def __init__(self, llm_provider: LLMProvider, logger: Logger):
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        logger: Logger,
+        max_workers: int = 4,
+        cancellation: CancellationToken | None = None,
+        transcript_mapper: TranscriptMapper | None = None,
+    ):
         self._llm = llm_provider
         self._logger = logger
+        self._max_workers = max(1, max_workers)
+        self._cancellation = cancellation
+        self._transcript_mapper = transcript_mapper
 
     def generate(
         self,
-        documents: list[Document],
-        user_prompt: str,
-        system_prompt: str | None = "You are an expert editor and summarizer.",
+        documents: Sequence[Document],
+        user_prompt: str | PromptTemplate,
+        system_prompt: str | None = DEFAULT_SYSTEM_PROMPT,
     ) -> str:
         self._logger.info(f"Starting summary generation for {len(documents)} documents.")
 
-        context_text = self._build_context_from_docs(documents)
+        template = self._as_template(user_prompt)
+        context_text = self._build_context_from_docs(documents, template)
         if not context_text.strip():
             self._logger.warning("No valid text found in documents to summarize.")
             return "Не удалось сгенерировать саммари: в документах нет поддерживаемого текста."
 
-        messages = self._build_messages(context_text, user_prompt, system_prompt)
+        messages = self._build_messages(
+            context_text, template, system_prompt, self._collect_images(documents)
+        )
 
         self._logger.info("Sending prepared messages to LLM provider...")
         return self._llm.generate_response(messages)
 
-    def _build_context_from_docs(self, documents: list[Document]) -> str:
+    def generate_per_document(
+        self,
+        documents: Iterable[Document],
+        user_prompt: str | PromptTemplate,
+        system_prompt: str | None = DEFAULT_SYSTEM_PROMPT,
+        max_workers: int | None = None,
+    ) -> Iterator[DocumentSummary]:
+        template = self._as_template(user_prompt)
+        workers = max(1, max_workers or self._max_workers)
+        self._logger.info(f"Starting per-document summaries with {workers} worker(s).")
+
+        # Держим в работе не больше workers задач, чтобы память не росла с числом файлов
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="summary"
+        ) as pool:
+            in_flight: set[Future[DocumentSummary]] = set()
+            for document in documents:
+                if self._cancellation is not None and self._cancellation.cancelled:
+                    # Новые запросы не отправляем, уже запущенные дожидаемся
+                    self._logger.warning("Cancelled, finishing requests in flight")
+                    break
+                if len(in_flight) >= workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+                in_flight.add(
+                    pool.submit(
+                        self._summarize_document, document, template, system_prompt
+                    )
+                )
+
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+
+    def _summarize_document(
+        self, document: Document, template: PromptTemplate, system_prompt: str | None
+    ) -> DocumentSummary:
+        started = time.perf_counter()
+        result = DocumentSummary(path=document.path, size_bytes=document.size_bytes)
+
+        images = self._collect_images([document])
+        if not (document.content.text_content or "").strip() and not images:
+            result.error = "No supported text in document."
+            return result
+
+        context_text = self._build_context_from_docs([document], template)
+        messages = self._build_messages(context_text, template, system_prompt, images)
+        try:
+            result.summary = self._llm.generate_response(messages)
+        except Exception as e:
+            self._logger.error(f"Failed to summarize {document.path.name}: {e}")
+            result.error = str(e)
+
+        result.duration_seconds = time.perf_counter() - started
+        return result
+
+    def _as_template(self, user_prompt: str | PromptTemplate) -> PromptTemplate:
+        if isinstance(user_prompt, PromptTemplate):
+            return user_prompt
+        return PromptTemplate(instruction=user_prompt)
+
+    def _build_context_from_docs(
+        self, documents: Sequence[Document], template: PromptTemplate
+    ) -> str:
         parts = []
         for doc in documents:
             if doc.content.content_type in [ContentType.TEXT, ContentType.MULTIMODAL]:
-                formatted_doc = f"--- {doc.path.name} ---\n{doc.content.text_content}"
-                parts.append(formatted_doc)
+                header = doc.path.name
+                if doc.duplicates:
+                    copies = ", ".join(path.name for path in doc.duplicates)
+                    header += f" (также: {copies})"
+                text = doc.content.text_content or ""
+                # Длинные записи уже законспектированы по частям во время расшифровки
+                notes = (
+                    self._transcript_mapper.notes(doc.path)
+                    if self._transcript_mapper is not None
+                    else None
+                )
+                if notes is not None:
+                    header += " (конспект расшифровки по фрагментам)"
+                    text = notes
+                parts.append(template.render_document(header, text))
             else:
                 self._logger.debug(
                     f"Skipping document {doc.path.name}: "
@@ -39,14 +137,62 @@ class SummaryGenerator:
                 )
         return "\n\n".join(parts)
 
+    def _collect_images(
+        self, documents: Sequence[Document]
+    ) -> list[tuple[str, ImageData]]:
+        images = []
+        for doc in documents:
+            content = doc.content
+            if content.content_type != ContentType.MULTIMODAL:
+                continue
+            if content.base64_data and content.mime_type:
+                images.append(
+                    (
+                        doc.path.name,
+                        ImageData(
+                            base64_data=content.base64_data, mime_type=content.mime_type
+                        ),
+                    )
+                )
+            images.extend((doc.path.name, image) for image in content.images)
+        return images
+
     def _build_messages(
-        self, context: str, user_prompt: str, system_prompt: str | None
+        self,
+        context: str,
+        template: PromptTemplate,
+        system_prompt: str | None,
+        images: list[tuple[str, ImageData]] | None = None,
     ) -> list[Message]:
         messages: list[Message] = []
 
-        if system_prompt:
-            messages.append(Message(role="system", content=system_prompt))
+        system = template.render_system() or system_prompt
+        if system:
+            messages.append(Message(role="system", content=system))
+
+        # Инструкция не зависит от документов и идёт отдельным сообщением перед ними:
+        # так префикс запроса совпадает между вызовами и кэшируется провайдером
+        messages.append(
+            Message(role="user", content=template.render_instruction(), cache_prefix=True)
+        )
+
+        final_user_content = f"Контекст документов:\n{context}"
+        if template.question:
+            final_user_content += f"\n\nВопрос: {template.question}"
+        if not images:
+            messages.append(Message(role="user", content=final_user_content))
+            return messages
 
-        final_user_content = f"{user_prompt}\n\nКонтекст документов:\n{context}"
-        messages.append(Message(role="user", content=final_user_content))
+        parts: list[dict] = [{"type": "text", "text": final_user_content}]
+        for name, image in images:
+            parts.append({"type": "text", "text": f"Изображение из {name}:"})
+            parts.append(
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:{image.mime_type};base64,{image.base64_data}"
+                    },
+                }
+            )
+        messages.append(Message(role="user", content=parts))
         return messages
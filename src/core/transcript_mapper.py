@@ -0,0 +1,108 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from src.core.logger import Logger
+from src.domain.models import TranscriptSegment
+from src.llm.contracts import LLMProvider, Message
+
+MAP_PROMPT = (
+    "Кратко законспектируй фрагмент расшифровки аудиозаписи. Сохрани факты, имена, "
+    "числа, решения и договоренности; ничего не добавляй от себя."
+)
+
+
+class _Transcript:
+    def __init__(self):
+        self.buffer: list[TranscriptSegment] = []
+        self.chars = 0
+        self.chunks: list[tuple[float, float, Future[str]]] = []
+
+
+class TranscriptMapper:
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        logger: Logger,
+        chunk_chars: int = 12_000,
+        max_workers: int = 2,
+    ):
+        self._llm = llm_provider
+        self._logger = logger
+        self._chunk_chars = chunk_chars
+        self._max_workers = max(1, max_workers)
+        self._transcripts: dict[Path, _Transcript] = {}
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def on_transcript_start(self, file_path: Path) -> None:
+        # Повторная попытка чтения начинает расшифровку заново
+        with self._lock:
+            self._transcripts[file_path] = _Transcript()
+
+    def on_segment(self, file_path: Path, segment: TranscriptSegment) -> None:
+        with self._lock:
+            transcript = self._transcripts.setdefault(file_path, _Transcript())
+            transcript.buffer.append(segment)
+            transcript.chars += len(segment.text)
+            if transcript.chars >= self._chunk_chars:
+                self._submit(file_path, transcript)
+
+    def on_transcript_end(self, file_path: Path) -> None:
+        with self._lock:
+            transcript = self._transcripts.get(file_path)
+            # Короткую запись целиком отдаст модели сам генератор саммари
+            if transcript is not None and transcript.chunks and transcript.buffer:
+                self._submit(file_path, transcript)
+
+    def notes(self, file_path: Path) -> str | None:
+        with self._lock:
+            transcript = self._transcripts.get(file_path)
+            chunks = list(transcript.chunks) if transcript is not None else []
+        if not chunks:
+            return None
+
+        parts = []
+        for start, end, future in chunks:
+            try:
+                summary = future.result()
+            except Exception as e:
+                self._logger.warning(
+                    f"Chunk summary of {file_path.name} failed, using the transcript: {e}"
+                )
+                return None
+            parts.append(f"[{_timestamp(start)}–{_timestamp(end)}] {summary}")
+        return "\n\n".join(parts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._transcripts.clear()
+
+    def _submit(self, file_path: Path, transcript: _Transcript) -> None:
+        segments, transcript.buffer, transcript.chars = transcript.buffer, [], 0
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="transcript-map"
+            )
+
+        start, end = segments[0].start, segments[-1].end
+        text = " ".join(segment.text for segment in segments)
+        self._logger.debug(
+            f"Summarizing {file_path.name} {_timestamp(start)}–{_timestamp(end)} "
+            "while transcription continues"
+        )
+        transcript.chunks.append((start, end, self._pool.submit(self._summarize, text)))
+
+    def _summarize(self, text: str) -> str:
+        return self._llm.generate_response(
+            [
+                Message(role="user", content=MAP_PROMPT, cache_prefix=True),
+                Message(role="user", content=text),
+            ]
+        )
+
+
+def _timestamp(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -1,17 +1,56 @@
+import os
+from functools import partial
+from pathlib import Path
+
 from dependency_injector import containers, providers
 
+from src.core.archives import ArchiveLimits
+from src.core.batch_runner import BatchRunner
+from src.core.cancellation import CancellationToken
+from src.core.deduplicator import Deduplicator
 from src.core.document_collector import DocumentCollector
 from src.core.document_service import DocumentService
+from src.core.document_store import DocumentStore
+from src.core.extraction_scheduler import ExtractionScheduler
+from src.core.extraction_timings import ExtractionTimings
 from src.core.folder_scanner import FolderScanner
+from src.core.folder_watcher import FolderWatcher
+from src.core.incremental_summarizer import IncrementalSummarizer
+from src.core.job_queue import JobQueue
 from src.core.logger import Logger
+from src.core.model_host import ModelHost
+from src.core.progress import ProgressTracker
 from src.core.prompt_manager import PromptManager
+from src.core.run_planner import RunPlanner
 from src.core.summary_generator import SummaryGenerator
+from src.core.transcript_mapper import TranscriptMapper
+from src.llm.mock import MockLLMProvider
 from src.llm.openrouter import OpenRouterLLMProvider
+from src.llm.simulation import LLMSimulator, SimulationProfile
+from src.llm.tracked import ProgressLLMProvider
+from src.ocr.cascade import (
+    DEFAULT_OCR_ENGINES,
+    OcrCascade,
+    create_ocr_cascade,
+    parse_languages,
+)
+from src.ocr.engines import load_easyocr_handler
+from src.ocr.page_cache import OcrPageCache
 from src.output.formatter import ConsoleFormatter, Formatter
 from src.prompts.registry import PromptRegistry
 from src.readers.factory import ReaderFactory
+from src.readers.isolation import isolate
+from src.readers.office_reader import OfficeReader
 from src.readers.pdf_reader import PdfReader
 from src.readers.txt_reader import TxtReader
+from src.readers.vision import ImageEncoder, VisionPassThrough
+from src.retrieval.chunker import TextChunker
+from src.retrieval.embedders import create_embedder
+from src.retrieval.fulltext import FullTextIndex
+from src.retrieval.retriever import Retriever
+from src.server.service import SummaryService
+from src.skills.cache import SkillResultCache
+from src.skills.engine import SkillEngine
 from src.skills.registry import SkillRegistry
 
 
@@ -19,16 +58,140 @@ def _mb_to_bytes(mb: int) -> int:
     return mb * 1024 * 1024
 
 
-def _create_audio_video_reader():
+def _enabled(flag: bool, value):
+    return value if flag else None
+
+
+def _listeners(*listeners) -> list:
+    return [listener for listener in listeners if listener is not None]
+
+
+def _archive_limits(
+    enabled: bool,
+    max_members: int,
+    max_member_mb: int,
+    max_total_mb: int,
+    max_ratio: float,
+) -> ArchiveLimits | None:
+    if not enabled:
+        return None
+    return ArchiveLimits(
+        max_members=max_members,
+        max_member_bytes=_mb_to_bytes(max_member_mb),
+        max_total_bytes=_mb_to_bytes(max_total_mb),
+        max_ratio=max_ratio,
+    )
+
+
+def _data_file(data_dir: str, name: str) -> Path:
+    return Path(data_dir) / name
+
+
+def _isolated(
+    reader,
+    logger: Logger,
+    timeout_seconds: float,
+    cancellation: CancellationToken,
+    max_workers: int | None = None,
+):
+    if not timeout_seconds or timeout_seconds <= 0:
+        return reader
+    return isolate(
+        reader,
+        logger,
+        timeout_seconds=timeout_seconds,
+        cancellation=cancellation,
+        max_workers=max_workers or os.cpu_count() or 1,
+    )
+
+
+def _llm_provider_name(name: str | None) -> str:
+    return name or "openrouter"
+
+
+def _start_model_host(
+    name: str, loader, logger: Logger, max_batch_size: int, batch_wait_ms: float
+) -> ModelHost:
+    # Хост запускается сразу, до fork воркеров; сама модель грузится при первом запросе
+    return ModelHost(
+        name,
+        loader,
+        logger,
+        max_batch_size=max_batch_size,
+        batch_wait_ms=batch_wait_ms,
+    ).start()
+
+
+def _create_easyocr_host(
+    enabled: bool,
+    engines: str | None,
+    languages: str | None,
+    logger: Logger,
+    max_batch_size: int,
+    batch_wait_ms: float,
+) -> ModelHost | None:
+    selected = (engines or DEFAULT_OCR_ENGINES).split(",")
+    if not enabled or "easyocr" not in (name.strip() for name in selected):
+        return None
+    loader = partial(load_easyocr_handler, parse_languages(languages))
+    return _start_model_host("easyocr", loader, logger, max_batch_size, batch_wait_ms)
+
+
+def _load_whisper_handler():
+    from src.readers.audio_vide_reader import load_whisper_handler
+
+    return load_whisper_handler()
+
+
+def _create_whisper_host(
+    enabled: bool, logger: Logger, max_batch_size: int, batch_wait_ms: float
+) -> ModelHost | None:
+    if not enabled:
+        return None
+    return _start_model_host(
+        "whisper", _load_whisper_handler, logger, max_batch_size, batch_wait_ms
+    )
+
+
+def _create_audio_video_reader(host: ModelHost | None = None):
     from src.readers.audio_vide_reader import AudioVideoReader
 
-    return AudioVideoReader()
+    return AudioVideoReader(host=host)
 
 
-def _create_image_reader():
+def _create_image_reader(
+    ocr: OcrCascade,
+    vision: VisionPassThrough | None = None,
+    llm_confidence_threshold: float = 0.3,
+):
     from src.readers.image_reader import ImageReader
 
-    return ImageReader()
+    return ImageReader(
+        vision=vision, ocr=ocr, llm_confidence_threshold=llm_confidence_threshold
+    )
+
+
+def _create_vision(
+    mode: str,
+    llm_provider: OpenRouterLLMProvider,
+    logger: Logger,
+    max_pixels: int,
+    jpeg_quality: int,
+    payload_budget_mb: float,
+    density_threshold: float,
+    pdf_max_pages: int,
+) -> VisionPassThrough | None:
+    if mode in (None, "", "off"):
+        return None
+    return VisionPassThrough(
+        encoder=ImageEncoder(max_pixels=max_pixels, jpeg_quality=jpeg_quality),
+        supports_vision=llm_provider.supports_multimodal,
+        logger=logger,
+        mode=mode,
+        payload_budget_bytes=int(payload_budget_mb * 1024 * 1024),
+        density_threshold=density_threshold,
+        pdf_max_pages=pdf_max_pages,
+    )
 
 
 class Container(containers.DeclarativeContainer):
@@ -40,15 +203,39 @@ class Container(containers.DeclarativeContainer):
         level="INFO",
     )
 
+    cancellation = providers.Singleton(CancellationToken)
+
     prompt_registry = providers.Singleton(
         PromptRegistry,
         prompts_path=config.prompts_path,
+        logger=logger,
+        cache_path=providers.Callable(
+            _data_file, config.data_dir, "registry_cache/prompts.json"
+        ),
     )
 
     skill_registry = providers.Singleton(
         SkillRegistry,
         skills_path=config.skills_path,
         logger=logger,
+        cache_path=providers.Callable(
+            _data_file, config.data_dir, "registry_cache/skills.json"
+        ),
+    )
+
+    skill_engine = providers.Singleton(
+        SkillEngine,
+        skill_registry=skill_registry,
+        logger=logger,
+        max_workers=config.skill_workers,
+        timeout_seconds=config.skill_timeout_seconds,
+        cache=providers.Factory(
+            SkillResultCache,
+            db_path=providers.Callable(
+                _data_file, config.data_dir, "skill_cache.sqlite3"
+            ),
+            max_entries=config.skill_cache_entries,
+        ),
     )
 
     prompt_manager = providers.Singleton(
@@ -58,29 +245,158 @@ class Container(containers.DeclarativeContainer):
         logger=logger,
     )
 
+    llm_simulator = providers.Singleton(
+        LLMSimulator,
+        profile=providers.Factory(
+            SimulationProfile,
+            latency=config.mock_latency,
+            latency_ms=config.mock_latency_ms,
+            latency_jitter=config.mock_latency_jitter,
+            prompt_ms_per_token=config.mock_prompt_ms_per_token,
+            completion_ms_per_token=config.mock_completion_ms_per_token,
+            completion_tokens=config.mock_completion_tokens,
+            rate_limit_rate=config.mock_rate_limit_rate,
+            server_error_rate=config.mock_server_error_rate,
+            seed=config.mock_seed,
+        ),
+    )
+
+    llm_client = providers.Selector(
+        providers.Callable(_llm_provider_name, config.llm_provider),
+        openrouter=providers.Singleton(
+            OpenRouterLLMProvider,
+            api_key=config.openrouter_api_key,
+            model=config.openrouter_model,
+            logger=logger,
+            timeout=config.request_timeout,
+            prompt_cache=config.prompt_cache,
+            vision=config.openrouter_vision,
+            base_url=config.openrouter_base_url,
+            stream=config.openrouter_stream,
+        ),
+        mock=providers.Singleton(
+            MockLLMProvider,
+            simulator=llm_simulator,
+            logger=logger,
+            vision=config.mock_vision,
+        ),
+    )
+
+    progress_tracker = providers.Singleton(
+        ProgressTracker, usage=llm_client.provided.usage
+    )
+
+    tracked_llm_client = providers.Singleton(
+        ProgressLLMProvider, provider=llm_client, progress=progress_tracker
+    )
+
+    vision = providers.Singleton(
+        _create_vision,
+        mode=config.vision_mode,
+        llm_provider=llm_client,
+        logger=logger,
+        max_pixels=config.vision_max_pixels,
+        jpeg_quality=config.vision_jpeg_quality,
+        payload_budget_mb=config.vision_payload_budget_mb,
+        density_threshold=config.vision_text_density_threshold,
+        pdf_max_pages=config.vision_pdf_max_pages,
+    )
+
     txt_reader = providers.Singleton(TxtReader)
-    pdf_reader = providers.Singleton(PdfReader)
-    image_reader = providers.Singleton(_create_image_reader)
-    video_audio_reader = providers.Singleton(_create_audio_video_reader)
+    office_reader = providers.Singleton(
+        OfficeReader,
+        max_rows_per_sheet=config.spreadsheet_max_rows,
+        archive_limits=providers.Callable(
+            _archive_limits,
+            True,
+            config.archive_max_members,
+            config.archive_max_member_mb,
+            config.archive_max_total_mb,
+            config.archive_max_ratio,
+        ),
+    )
+
+    easyocr_host = providers.Singleton(
+        _create_easyocr_host,
+        enabled=config.model_host,
+        engines=config.ocr_engines,
+        languages=config.ocr_languages,
+        logger=logger,
+        max_batch_size=config.model_host_batch_size,
+        batch_wait_ms=config.model_host_batch_wait_ms,
+    )
+
+    whisper_host = providers.Singleton(
+        _create_whisper_host,
+        enabled=config.model_host,
+        logger=logger,
+        max_batch_size=config.model_host_batch_size,
+        batch_wait_ms=config.model_host_batch_wait_ms,
+    )
+
+    ocr_engine = providers.Singleton(
+        create_ocr_cascade,
+        engines=config.ocr_engines,
+        languages=config.ocr_languages,
+        logger=logger,
+        region_threshold=config.ocr_region_confidence,
+        page_threshold=config.ocr_page_confidence,
+        easyocr_host=easyocr_host,
+        progress=progress_tracker,
+    )
 
+    ocr_page_cache = providers.Singleton(
+        OcrPageCache,
+        db_path=providers.Callable(_data_file, config.data_dir, "ocr_cache.sqlite3"),
+    )
+
+    pdf_reader = providers.Singleton(
+        PdfReader,
+        vision=vision,
+        ocr=ocr_engine,
+        page_cache=ocr_page_cache,
+        ocr_dpi=config.pdf_ocr_dpi,
+        ocr_workers=config.ocr_workers,
+        llm_confidence_threshold=config.ocr_llm_confidence,
+        logger=logger,
+    )
+
+    image_reader = providers.Singleton(
+        _create_image_reader,
+        ocr=ocr_engine,
+        vision=vision,
+        llm_confidence_threshold=config.ocr_llm_confidence,
+    )
+    video_audio_reader = providers.Singleton(
+        _create_audio_video_reader, host=whisper_host
+    )
+
+    # Тяжелые ридеры работают в отдельном процессе, который можно убить по таймауту
     reader_factory = providers.Singleton(
         ReaderFactory,
         readers=providers.List(
             txt_reader.provided,
-            pdf_reader.provided,
+            office_reader.provided,
+            providers.Singleton(
+                _isolated,
+                pdf_reader,
+                logger,
+                config.extraction_timeout_seconds,
+                cancellation,
+                config.extraction_light_workers,
+            ),
             image_reader.provided,
-            video_audio_reader.provided,
+            providers.Singleton(
+                _isolated,
+                video_audio_reader,
+                logger,
+                config.extraction_timeout_seconds,
+                cancellation,
+                config.extraction_heavy_workers,
+            ),
         ),
     )
 
-    llm_client = providers.Singleton(
-        OpenRouterLLMProvider,
-        api_key=config.openrouter_api_key,
-        model=config.openrouter_model,
-        logger=logger,
-        timeout=config.request_timeout,
-    )
-
     max_file_size_bytes = providers.Callable(
         _mb_to_bytes,
         config.max_file_size_mb,
@@ -90,6 +406,42 @@ class Container(containers.DeclarativeContainer):
         FolderScanner,
         logger=logger,
         recursive=config.recursive_scan,
+        archive_limits=providers.Callable(
+            _archive_limits,
+            config.scan_archives,
+            config.archive_max_members,
+            config.archive_max_member_mb,
+            config.archive_max_total_mb,
+            config.archive_max_ratio,
+        ),
+    )
+
+    extraction_timings = providers.Singleton(
+        ExtractionTimings,
+        path=providers.Callable(_data_file, config.data_dir, "extraction_timings.json"),
+    )
+
+    extraction_scheduler = providers.Singleton(
+        ExtractionScheduler,
+        reader_factory=reader_factory,
+        timings=extraction_timings,
+        logger=logger,
+        light_workers=config.extraction_light_workers,
+        heavy_workers=config.extraction_heavy_workers,
+        heavy_seconds_per_mb=config.extraction_heavy_seconds_per_mb,
+        heavy_worker_memory_mb=config.extraction_heavy_worker_memory_mb,
+    )
+
+    transcript_mapper = providers.Singleton(
+        TranscriptMapper,
+        llm_provider=tracked_llm_client,
+        logger=logger,
+        chunk_chars=config.transcript_map_chars,
+        max_workers=config.transcript_map_workers,
+    )
+
+    enabled_transcript_mapper = providers.Callable(
+        _enabled, config.transcript_map_chars, transcript_mapper
     )
 
     document_collector = providers.Singleton(
@@ -97,6 +449,33 @@ class Container(containers.DeclarativeContainer):
         reader_factory=reader_factory,
         logger=logger,
         max_file_size_bytes=max_file_size_bytes,
+        vision=vision,
+        timings=extraction_timings,
+        cancellation=cancellation,
+        error_policy=config.error_policy,
+        max_retries=config.read_retries,
+        retry_delay_seconds=config.read_retry_delay_seconds,
+        scheduler=extraction_scheduler,
+        segment_listeners=providers.Callable(
+            _listeners, enabled_transcript_mapper, progress_tracker
+        ),
+        progress=progress_tracker,
+        archive_memory_bytes=providers.Callable(_mb_to_bytes, config.archive_memory_mb),
+    )
+
+    deduplicator = providers.Singleton(
+        Deduplicator,
+        logger=logger,
+        near_duplicate_threshold=config.near_duplicate_threshold,
+    )
+
+    document_store = providers.Factory(
+        DocumentStore,
+        memory_limit_bytes=providers.Callable(
+            _mb_to_bytes, config.document_memory_limit_mb
+        ),
+        spill_dir=config.document_spill_dir,
+        compression=config.document_spill_compression,
     )
 
     document_service = providers.Singleton(
@@ -104,12 +483,54 @@ class Container(containers.DeclarativeContainer):
         scanner=folder_scanner,
         collector=document_collector,
         logger=logger,
+        deduplicator=providers.Callable(_enabled, config.dedup_enabled, deduplicator),
+        store_factory=document_store.provider,
+        progress=progress_tracker,
+    )
+
+    embedder = providers.Singleton(create_embedder, config.retrieval_embedder)
+
+    text_chunker = providers.Singleton(
+        TextChunker,
+        chunk_chars=config.retrieval_chunk_chars,
+        overlap_chars=config.retrieval_chunk_overlap,
+    )
+
+    retriever = providers.Singleton(
+        Retriever,
+        scanner=folder_scanner,
+        embedder=embedder,
+        chunker=text_chunker,
+        logger=logger,
+        index_root=providers.Callable(_data_file, config.data_dir, "indexes"),
+    )
+
+    fulltext_index = providers.Singleton(
+        FullTextIndex,
+        db_path=providers.Callable(_data_file, config.data_dir, "fulltext.sqlite3"),
+        scanner=folder_scanner,
+        logger=logger,
     )
 
     summary_generator = providers.Singleton(
         SummaryGenerator,
+        llm_provider=tracked_llm_client,
+        logger=logger,
+        max_workers=config.summary_workers,
+        cancellation=cancellation,
+        transcript_mapper=enabled_transcript_mapper,
+    )
+
+    run_planner = providers.Singleton(
+        RunPlanner,
+        scanner=folder_scanner,
+        collector=document_collector,
+        reader_factory=reader_factory,
+        timings=extraction_timings,
         llm_provider=llm_client,
         logger=logger,
+        deduplicator=providers.Callable(_enabled, config.dedup_enabled, deduplicator),
+        chunk_chars=config.retrieval_chunk_chars,
     )
 
     console_formatter = providers.Singleton(ConsoleFormatter)
@@ -118,3 +539,49 @@ class Container(containers.DeclarativeContainer):
         Formatter,
         formatter=console_formatter,
     )
+
+    job_queue = providers.Singleton(
+        JobQueue,
+        db_path=providers.Callable(_data_file, config.data_dir, "batch_queue.sqlite3"),
+    )
+
+    batch_runner = providers.Singleton(
+        BatchRunner,
+        queue=job_queue,
+        prompt_manager=prompt_manager,
+        document_service=document_service,
+        summary_generator=summary_generator,
+        logger=logger,
+        concurrency=config.batch_concurrency,
+        skill_engine=skill_engine,
+    )
+
+    summary_service = providers.Singleton(
+        SummaryService,
+        prompt_manager=prompt_manager,
+        document_service=document_service,
+        summary_generator=summary_generator,
+        logger=logger,
+        workers=config.server_workers,
+        queue_size=config.server_queue_size,
+        skill_engine=skill_engine,
+    )
+
+    folder_watcher = providers.Singleton(
+        FolderWatcher,
+        scanner=folder_scanner,
+        logger=logger,
+        debounce_seconds=config.watch_debounce_seconds,
+        poll_interval=config.watch_poll_interval,
+        recursive=config.recursive_scan,
+    )
+
+    incremental_summarizer = providers.Factory(
+        IncrementalSummarizer,
+        document_service=document_service,
+        collector=document_collector,
+        summary_generator=summary_generator,
+        logger=logger,
+        scanner=folder_scanner,
+        skill_engine=skill_engine,
+    )
@@ -16,3 +16,67 @@ class LLMConnectionError(LLMError):
 
 class LLMResponseError(LLMError):
     pass
+
+
+class JobError(Exception):
+    pass
+
+
+class JobFileError(JobError):
+    pass
+
+
+class ServiceBusyError(Exception):
+    pass
+
+
+class SearchQueryError(ValueError):
+    pass
+
+
+class SkillError(Exception):
+    pass
+
+
+class SkillLoadError(SkillError):
+    pass
+
+
+class SkillTimeoutError(SkillError):
+    pass
+
+
+class OcrError(DocumentReaderError):
+    pass
+
+
+class OcrEngineUnavailableError(OcrError):
+    pass
+
+
+class PreflightError(Exception):
+    pass
+
+
+class ExtractionTimeoutError(DocumentReadError):
+    pass
+
+
+class ExtractionCancelledError(DocumentReaderError):
+    pass
+
+
+class ModelHostError(Exception):
+    pass
+
+
+class ModelUnavailableError(ModelHostError):
+    pass
+
+
+class ArchiveError(DocumentReaderError):
+    pass
+
+
+class ArchiveLimitError(ArchiveError):
+    pass
@@ -1,5 +1,6 @@
 from enum import Enum
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -9,6 +10,11 @@ class ContentType(str, Enum):
     MULTIMODAL = "multimodal"
 
 
+class ImageData(BaseModel):
+    base64_data: str
+    mime_type: str
+
+
 class DocumentContent(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
 
@@ -17,6 +23,15 @@ class DocumentContent(BaseModel):
     text_content: str | None = None
     base64_data: str | None = None
     mime_type: str | None = None
+    # Растрированные страницы, которые передаются модели как изображения
+    images: list[ImageData] = Field(default_factory=list)
+
+
+class TranscriptSegment(BaseModel):
+    # Границы фрагмента в секундах от начала записи
+    start: float = Field(..., ge=0)
+    end: float = Field(..., ge=0)
+    text: str
 
 
 class Document(BaseModel):
@@ -25,3 +40,161 @@ class Document(BaseModel):
     path: Path
     size_bytes: int = Field(..., ge=0)
     content: DocumentContent
+    duplicates: list[Path] = Field(default_factory=list)
+
+
+class ErrorPolicy(str, Enum):
+    ABORT = "abort"
+    SKIP = "skip"
+    # Повторить чтение, а если не помогло - пропустить файл
+    RETRY = "retry"
+
+
+class ReadResult(BaseModel):
+    path: Path
+    reader: str | None = None
+    document: Document | None = None
+    error: str | None = None
+    attempts: int = Field(default=1, ge=1)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    id: str
+    folder: Path
+    output_path: Path
+    prompt: str | None = None
+    skill: str | None = None
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = Field(default=0, ge=0)
+    error: str | None = None
+
+
+class SummaryTask(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    id: str
+    folder: Path | None = None
+    files: list[Path] = Field(default_factory=list)
+    prompt: str | None = None
+    skill: str | None = None
+    status: JobStatus = JobStatus.PENDING
+    summary: str | None = None
+    error: str | None = None
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+
+
+class DocumentSummary(BaseModel):
+    path: Path
+    size_bytes: int = Field(default=0, ge=0)
+    summary: str | None = None
+    error: str | None = None
+    duration_seconds: float = Field(default=0.0, ge=0)
+
+
+class DuplicateGroup(BaseModel):
+    representative: Path
+    duplicates: list[Path]
+    kind: Literal["exact", "near"]
+    similarity: float = Field(..., ge=0, le=1)
+
+
+class TextChunk(BaseModel):
+    path: Path
+    index: int = Field(..., ge=0)
+    text: str
+
+
+class SearchHit(BaseModel):
+    path: Path
+    score: float
+    snippet: str = ""
+
+
+class TokenUsage(BaseModel):
+    requests: int = Field(default=0, ge=0)
+    prompt_tokens: int = Field(default=0, ge=0)
+    completion_tokens: int = Field(default=0, ge=0)
+    cached_tokens: int = Field(default=0, ge=0)
+
+
+class ProgressSnapshot(BaseModel):
+    stage: str
+    elapsed_seconds: float = Field(ge=0)
+    files_scanned: int = 0
+    files_total: int = 0
+    files_done: int = 0
+    files_failed: int = 0
+    bytes_total: int = 0
+    bytes_done: int = 0
+    bytes_by_reader: dict[str, int] = Field(default_factory=dict)
+    ocr_pages: int = 0
+    ocr_pages_per_second: float = 0.0
+    # Секунды записи, расшифрованные за секунду работы
+    audio_seconds: float = 0.0
+    audio_speed: float = 0.0
+    llm_in_flight: int = 0
+    llm_requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    eta_seconds: float | None = None
+
+
+class OcrRegion(BaseModel):
+    text: str
+    confidence: float = Field(..., ge=0, le=1)
+    # (x, y, ширина, высота) в пикселях исходного изображения
+    bbox: tuple[int, int, int, int]
+
+
+class OcrResult(BaseModel):
+    text: str
+    confidence: float = Field(..., ge=0, le=1)
+    engines: list[str] = Field(default_factory=list)
+
+
+class ProviderStatus(BaseModel):
+    ok: bool
+    message: str
+    context_length: int | None = None
+    # Цена за токен в долларах, если провайдер ее сообщает
+    prompt_price: float | None = None
+    completion_price: float | None = None
+
+
+class PlannedFile(BaseModel):
+    path: Path
+    size_bytes: int = Field(..., ge=0)
+    reader: str | None = None
+    skip_reason: str | None = None
+    estimated_seconds: float = 0.0
+    estimated_tokens: int = 0
+
+
+class RunPlan(BaseModel):
+    files: list[PlannedFile] = Field(default_factory=list)
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    extraction_seconds: float = 0.0
+    estimated_cost: float | None = None
+    provider: ProviderStatus | None = None
+    problems: list[str] = Field(default_factory=list)
+
+    @property
+    def selected(self) -> list[PlannedFile]:
+        return [file for file in self.files if file.skip_reason is None]
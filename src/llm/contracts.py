@@ -1,13 +1,18 @@
 from typing import Literal, Protocol
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.domain.models import ProviderStatus
 
 
 class Message(BaseModel):
     role: Literal["system", "user", "assistant"]
     content: str | list[dict]  # Поддержка мультимодальности
+    # Конец статичного префикса запроса, провайдер может пометить его для кэширования
+    cache_prefix: bool = Field(default=False, exclude=True)
 
 
 class LLMProvider(Protocol):
     def supports_multimodal(self) -> bool: ...
+    def probe(self) -> ProviderStatus: ...
     def generate_response(self, messages: list[Message]) -> str: ...
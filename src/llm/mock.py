@@ -0,0 +1,59 @@
+import threading
+import time
+from collections.abc import Callable
+
+from src.core.logger import Logger
+from src.domain.exceptions import LLMConnectionError, LLMResponseError
+from src.domain.models import ProviderStatus, TokenUsage
+from src.llm.contracts import LLMProvider, Message
+from src.llm.openrouter import retry_transient
+from src.llm.simulation import LLMSimulator
+
+
+class MockLLMProvider(LLMProvider):
+    def __init__(
+        self,
+        simulator: LLMSimulator,
+        logger: Logger,
+        vision: bool = False,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._simulator = simulator
+        self._logger = logger
+        self._vision = vision
+        self._sleep = sleep
+        self._usage_lock = threading.Lock()
+        self.usage = TokenUsage()
+
+    def supports_multimodal(self) -> bool:
+        return self._vision
+
+    def probe(self) -> ProviderStatus:
+        return ProviderStatus(ok=True, message="Simulated provider", prompt_price=0.0)
+
+    def generate_response(self, messages: list[Message]) -> str:
+        return self._execute_interaction([message.model_dump() for message in messages])
+
+    @retry_transient
+    def _execute_interaction(self, messages: list[dict]) -> str:
+        completion = self._simulator.complete(messages)
+        self._sleep(completion.total_delay)
+
+        # Ошибки те же, что у OpenRouterLLMProvider, чтобы ретраи вели себя одинаково
+        if completion.status_code == 429:
+            self._logger.error("Mock API Error 429: simulated rate limit")
+            raise LLMResponseError("Rate limit exceeded or insufficient funds.")
+        if completion.status_code != 200:
+            self._logger.error(f"Mock API Error {completion.status_code}")
+            raise LLMConnectionError(f"Simulated server error {completion.status_code}")
+
+        with self._usage_lock:
+            self.usage.requests += 1
+            self.usage.prompt_tokens += completion.prompt_tokens
+            self.usage.completion_tokens += completion.completion_tokens
+        self._logger.debug(
+            f"Mock response in {completion.total_delay:.3f}s: "
+            f"{completion.prompt_tokens} prompt, "
+            f"{completion.completion_tokens} completion tokens"
+        )
+        return completion.text
@@ -0,0 +1,176 @@
+import json
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.core.logger import Logger
+from src.llm.simulation import LLMSimulator, SimulatedCompletion
+
+
+class MockOpenRouterHandler(BaseHTTPRequestHandler):
+    server_version = "MockOpenRouter/1.0"
+    protocol_version = "HTTP/1.1"
+    MAX_BODY_BYTES = 64 * 1024 * 1024
+
+    @property
+    def simulator(self) -> LLMSimulator:
+        return self.server.simulator  # type: ignore[attr-defined]
+
+    @property
+    def logger(self) -> Logger:
+        return self.server.logger  # type: ignore[attr-defined]
+
+    @property
+    def model(self) -> str:
+        return self.server.model  # type: ignore[attr-defined]
+
+    @property
+    def vision(self) -> bool:
+        return self.server.vision  # type: ignore[attr-defined]
+
+    @property
+    def context_length(self) -> int:
+        return self.server.context_length  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:
+        if self._path_parts()[-1:] == ["models"]:
+            self._send_json(HTTPStatus.OK, {"data": self._models()})
+        elif self._path_parts()[-1:] == ["key"]:
+            self._send_json(HTTPStatus.OK, {"data": {"label": "mock", "limit": None}})
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+
+    def do_POST(self) -> None:
+        if self._path_parts()[-2:] != ["chat", "completions"]:
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+
+        try:
+            payload = self._read_json()
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+
+        completion = self.simulator.complete(payload.get("messages") or [])
+        model = payload.get("model") or "mock"
+        if completion.status_code != 200:
+            time.sleep(completion.first_token_delay)
+            self._send_failure(completion.status_code)
+        elif payload.get("stream"):
+            self._stream(completion, model)
+        else:
+            time.sleep(completion.total_delay)
+            self._send_json(HTTPStatus.OK, self._completion_payload(completion, model))
+
+    def log_message(self, format: str, *args) -> None:
+        self.logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _models(self) -> list[dict]:
+        modalities = ["text", "image"] if self.vision else ["text"]
+        return [
+            {
+                "id": self.model,
+                "context_length": self.context_length,
+                "architecture": {"input_modalities": modalities},
+                "pricing": {"prompt": "0", "completion": "0"},
+            }
+        ]
+
+    def _stream(self, completion: SimulatedCompletion, model: str) -> None:
+        # Ответ без Content-Length: соединение закрывается после [DONE]
+        self.close_connection = True
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        time.sleep(completion.first_token_delay)
+        for token in completion.tokens():
+            self._send_event({"model": model, "choices": [{"delta": {"content": token}}]})
+            time.sleep(completion.token_delay)
+
+        self._send_event(
+            {"model": model, "choices": [], "usage": self._usage(completion)}
+        )
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _send_event(self, payload: dict) -> None:
+        data = json.dumps(payload, ensure_ascii=False)
+        self.wfile.write(f"data: {data}\n\n".encode())
+        self.wfile.flush()
+
+    def _completion_payload(self, completion: SimulatedCompletion, model: str) -> dict:
+        return {
+            "model": model,
+            "choices": [{"message": {"role": "assistant", "content": completion.text}}],
+            "usage": self._usage(completion),
+        }
+
+    def _usage(self, completion: SimulatedCompletion) -> dict:
+        return {
+            "prompt_tokens": completion.prompt_tokens,
+            "completion_tokens": completion.completion_tokens,
+        }
+
+    def _send_failure(self, status_code: int) -> None:
+        status = HTTPStatus(status_code)
+        body = json.dumps(
+            {"error": {"code": status_code, "message": f"Simulated {status.phrase}"}}
+        ).encode("utf-8")
+        self.send_response(status)
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.send_header("Retry-After", "1")
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _path_parts(self) -> list[str]:
+        path = self.path.split("?", 1)[0]
+        return [part for part in path.split("/") if part]
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > self.MAX_BODY_BYTES:
+            raise ValueError("Request body too large.")
+        body = self.rfile.read(length) if length else b"{}"
+        try:
+            data = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object.")
+        return data
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": {"code": status.value, "message": message}})
+
+    def _send_json(self, status: HTTPStatus, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockOpenRouterServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        simulator: LLMSimulator,
+        logger: Logger,
+        model: str = "mock/model",
+        vision: bool = False,
+        context_length: int = 128_000,
+    ):
+        self.simulator = simulator
+        self.logger = logger
+        self.model = model
+        self.vision = vision
+        self.context_length = context_length
+        super().__init__(address, MockOpenRouterHandler)
@@ -1,3 +1,6 @@
+import json
+import threading
+
 import requests
 from pydantic import BaseModel, Field, ValidationError
 from tenacity import (
@@ -9,19 +12,60 @@ from tenacity import (
 
 from src.core.logger import Logger
 from src.domain.exceptions import LLMConnectionError, LLMResponseError
+from src.domain.models import ProviderStatus, TokenUsage
 from src.llm.contracts import LLMProvider, Message
 
+# Модели, которым OpenRouter нужен явный cache_control; остальные кэшируют префикс сами
+CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/", "google/gemini")
+
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+
+retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=4, max=10),
+    retry=retry_if_exception_type(
+        (requests.exceptions.RequestException, LLMConnectionError)
+    ),
+    reraise=True,
+)
+
 
 class LLMChoice(BaseModel):
     message: Message
 
 
+class PromptTokensDetails(BaseModel):
+    cached_tokens: int = 0
+
+
+class LLMUsage(BaseModel):
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    prompt_tokens_details: PromptTokensDetails | None = None
+
+
 class LLMResponse(BaseModel):
     choices: list[LLMChoice] = Field(..., min_length=1)
+    usage: LLMUsage | None = None
+
+
+class LLMDelta(BaseModel):
+    content: str | None = None
+
+
+class LLMStreamChoice(BaseModel):
+    delta: LLMDelta = Field(default_factory=LLMDelta)
+
+
+class LLMStreamChunk(BaseModel):
+    choices: list[LLMStreamChoice] = Field(default_factory=list)
+    usage: LLMUsage | None = None
 
 
 class OpenRouterLLMProvider(LLMProvider):
-    API_URL = "https://openrouter.ai/api/v1/chat/completions"
+    API_URL = f"{DEFAULT_BASE_URL}/chat/completions"
+    MODELS_URL = f"{DEFAULT_BASE_URL}/models"
+    KEY_URL = f"{DEFAULT_BASE_URL}/key"
 
     def __init__(
         self,
@@ -29,36 +73,129 @@ class OpenRouterLLMProvider(LLMProvider):
         model: str,
         logger: Logger,
         timeout: int = 60,
+        prompt_cache: bool = True,
+        vision: bool | None = None,
+        base_url: str | None = None,
+        stream: bool = False,
     ):
+        if base_url and base_url.rstrip("/") != DEFAULT_BASE_URL:
+            # Например, локальный mock-сервер для нагрузочных тестов
+            self.API_URL = f"{base_url.rstrip('/')}/chat/completions"
+            self.MODELS_URL = f"{base_url.rstrip('/')}/models"
+            self.KEY_URL = f"{base_url.rstrip('/')}/key"
         self._api_key = api_key
         self._model = model
         self._logger = logger
         self._timeout = timeout
+        self._prompt_cache = prompt_cache
+        self._vision = vision
+        self._stream = stream
+        self._usage_lock = threading.Lock()
+        self.usage = TokenUsage()
+
+    def supports_multimodal(self) -> bool:
+        if self._vision is None:
+            self._vision = self._probe_vision()
+        return self._vision
+
+    def probe(self) -> ProviderStatus:
+        # Дешевая проверка до тяжелой обработки: ключ, модель, размер контекста
+        if not self._api_key:
+            return ProviderStatus(ok=False, message="OPENROUTER_API_KEY is not set")
+
+        try:
+            response = requests.get(
+                self.KEY_URL, headers=self._get_headers(), timeout=self._timeout
+            )
+            if response.status_code == 401:
+                return ProviderStatus(ok=False, message="Invalid OpenRouter API Key.")
+            response.raise_for_status()
+            model = self._model_info()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return ProviderStatus(ok=False, message=f"OpenRouter is unreachable: {e}")
+
+        if model is None:
+            return ProviderStatus(ok=False, message=f"Model not found: {self._model}")
+
+        pricing = model.get("pricing") or {}
+        return ProviderStatus(
+            ok=True,
+            message=f"Model {self._model} is available",
+            context_length=model.get("context_length"),
+            prompt_price=_price(pricing.get("prompt")),
+            completion_price=_price(pricing.get("completion")),
+        )
+
+    def _probe_vision(self) -> bool:
+        # Возможности модели берем из каталога OpenRouter, если не заданы явно
+        try:
+            model = self._model_info()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self._logger.warning(f"Could not fetch model capabilities: {e}")
+            return False
+
+        if model is None:
+            self._logger.warning(f"Model {self._model} not found in OpenRouter catalog")
+            return False
+        modalities = model.get("architecture", {}).get("input_modalities", [])
+        return "image" in modalities
+
+    def _model_info(self) -> dict | None:
+        response = requests.get(
+            self.MODELS_URL, headers=self._get_headers(), timeout=self._timeout
+        )
+        response.raise_for_status()
+
+        base_model = self._model.split(":", 1)[0]
+        for model in response.json().get("data", []):
+            if model.get("id") in (self._model, base_model):
+                return model
+        return None
+
+    def supports_cache_control(self) -> bool:
+        return self._prompt_cache and self._model.startswith(CACHE_CONTROL_MODEL_PREFIXES)
 
     def generate_response(self, messages: list[Message]) -> str:
         payload = {
             "model": self._model,
-            "messages": [msg.model_dump() for msg in messages],
+            "messages": [self._format_message(msg) for msg in messages],
         }
+        if self._stream:
+            payload["stream"] = True
         return self._execute_interaction(payload)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type(
-            (requests.exceptions.RequestException, LLMConnectionError)
-        ),
-        reraise=True,
-    )
+    def _format_message(self, message: Message) -> dict:
+        data = message.model_dump()
+        if not (message.cache_prefix and self.supports_cache_control()):
+            return data
+
+        content = data["content"]
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        # Точка кэширования ставится на последний блок статичного префикса
+        content[-1] = {**content[-1], "cache_control": {"type": "ephemeral"}}
+        data["content"] = content
+        return data
+
+    @retry_transient
     def _execute_interaction(self, payload: dict) -> str:
         headers = self._get_headers()
 
-        self._logger.info(f"Sending request to {self.API_URL} (Model: {self._model})")
+        self._logger.info(
+            "Sending request to {} (Model: {})", self.API_URL, self._model, sample="llm"
+        )
 
         try:
             response = requests.post(
-                self.API_URL, headers=headers, json=payload, timeout=self._timeout
+                self.API_URL,
+                headers=headers,
+                json=payload,
+                timeout=self._timeout,
+                stream=self._stream,
             )
+            if self._stream:
+                with response:
+                    return self._process_stream(response)
             return self._process_response(response)
 
         except requests.exceptions.Timeout as e:
@@ -90,6 +227,7 @@ class OpenRouterLLMProvider(LLMProvider):
 
         try:
             validated_data = LLMResponse.model_validate(raw_data)
+            self._record_usage(validated_data.usage)
             content = validated_data.choices[0].message.content
             if not isinstance(content, str):
                 raise LLMResponseError(
@@ -101,6 +239,47 @@ class OpenRouterLLMProvider(LLMProvider):
             self._logger.error(f"Failed to parse LLM response: {e}")
             raise LLMResponseError(f"Invalid response schema: {e}") from e
 
+    def _process_stream(self, response: requests.Response) -> str:
+        if response.status_code != 200:
+            self._handle_error(response)
+
+        parts: list[str] = []
+        # Server-Sent Events: строки "data: {...}", комментарии начинаются с ":".
+        # Декодируем сами: без charset requests считает поток латиницей
+        for raw_line in response.iter_lines():
+            line = raw_line.decode("utf-8")
+            if not line or line.startswith(":") or not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            try:
+                chunk = LLMStreamChunk.model_validate(json.loads(data))
+            except (ValueError, ValidationError) as e:
+                self._logger.error(f"Failed to parse stream chunk: {data[:200]}")
+                raise LLMResponseError(f"Invalid stream chunk: {e}") from e
+
+            parts.extend(c.delta.content for c in chunk.choices if c.delta.content)
+            self._record_usage(chunk.usage)
+
+        return "".join(parts)
+
+    def _record_usage(self, usage: LLMUsage | None) -> None:
+        if usage is None:
+            return
+
+        details = usage.prompt_tokens_details
+        cached = details.cached_tokens if details else 0
+        with self._usage_lock:
+            self.usage.requests += 1
+            self.usage.prompt_tokens += usage.prompt_tokens
+            self.usage.completion_tokens += usage.completion_tokens
+            self.usage.cached_tokens += cached
+        self._logger.debug(
+            f"Tokens: {usage.prompt_tokens} prompt ({cached} cached), "
+            f"{usage.completion_tokens} completion"
+        )
+
     def _handle_error(self, response: requests.Response) -> None:
         error_msg = response.text
         self._logger.error(f"API Error {response.status_code}: {error_msg}")
@@ -113,3 +292,10 @@ class OpenRouterLLMProvider(LLMProvider):
             raise LLMResponseError("Rate limit exceeded or insufficient funds.")
 
         response.raise_for_status()
+
+
+def _price(value: str | float | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from src.llm.tokens import estimate_tokens
+
+LatencyDistribution = Literal["fixed", "uniform", "normal", "lognormal", "exponential"]
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class SimulationProfile(BaseModel):
+    latency: LatencyDistribution = "lognormal"
+    # Медиана задержки до первого токена и относительный разброс вокруг нее
+    latency_ms: float = Field(default=500.0, ge=0)
+    latency_jitter: float = Field(default=0.5, ge=0)
+    prompt_ms_per_token: float = Field(default=0.05, ge=0)
+    completion_ms_per_token: float = Field(default=5.0, ge=0)
+    completion_tokens: int = Field(default=200, ge=1)
+    rate_limit_rate: float = Field(default=0.0, ge=0, le=1)
+    server_error_rate: float = Field(default=0.0, ge=0, le=1)
+    seed: int = 0
+
+
+class SimulatedCompletion(BaseModel):
+    status_code: int = 200
+    text: str = ""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Задержка до первого токена и между токенами, в секундах
+    first_token_delay: float = 0.0
+    token_delay: float = 0.0
+
+    @property
+    def total_delay(self) -> float:
+        return self.first_token_delay + self.token_delay * self.completion_tokens
+
+    def tokens(self) -> list[str]:
+        # Разбиение ответа на куски для потоковой отдачи; склейка дает исходный текст
+        words = self.text.split(" ")
+        return [word if i == 0 else f" {word}" for i, word in enumerate(words)]
+
+
+class LLMSimulator:
+    def __init__(self, profile: SimulationProfile | None = None):
+        self.profile = profile or SimulationProfile()
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+
+    def complete(self, messages: list[dict]) -> SimulatedCompletion:
+        with self._lock:
+            roll = self._rng.random()
+            latency = self._sample_latency()
+
+        profile = self.profile
+        if roll < profile.rate_limit_rate:
+            return SimulatedCompletion(status_code=429, first_token_delay=latency)
+        if roll < profile.rate_limit_rate + profile.server_error_rate:
+            return SimulatedCompletion(status_code=503, first_token_delay=latency)
+
+        prompt_text = _prompt_text(messages)
+        prompt_tokens = estimate_tokens(prompt_text)
+        text = _deterministic_text(messages, prompt_text, profile.completion_tokens)
+        return SimulatedCompletion(
+            text=text,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=len(text.split(" ")),
+            first_token_delay=latency
+            + prompt_tokens * profile.prompt_ms_per_token / 1000,
+            token_delay=profile.completion_ms_per_token / 1000,
+        )
+
+    def _sample_latency(self) -> float:
+        profile = self.profile
+        median = profile.latency_ms / 1000
+        jitter = profile.latency_jitter
+
+        if profile.latency == "fixed" or median == 0:
+            value = median
+        elif profile.latency == "uniform":
+            value = self._rng.uniform(median * (1 - jitter), median * (1 + jitter))
+        elif profile.latency == "normal":
+            value = self._rng.gauss(median, median * jitter)
+        elif profile.latency == "exponential":
+            value = self._rng.expovariate(1 / median)
+        else:
+            # Тяжелый правый хвост, как у реальных API
+            value = self._rng.lognormvariate(math.log(median), jitter)
+        return max(0.0, value)
+
+
+def _prompt_text(messages: list[dict]) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content", "")
+        if isinstance(content, str):
+            parts.append(content)
+            continue
+        parts.extend(
+            block.get("text", "") for block in content if isinstance(block, dict)
+        )
+    return "\n".join(parts)
+
+
+def _deterministic_text(messages: list[dict], prompt_text: str, tokens: int) -> str:
+    # Один и тот же запрос всегда дает один и тот же ответ, независимо от порядка вызовов
+    digest = hashlib.blake2b(
+        json.dumps(messages, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+    vocabulary = sorted(set(_WORD_PATTERN.findall(prompt_text.lower()))) or ["mock"]
+    rng = random.Random(digest)
+    words = [rng.choice(vocabulary) for _ in range(tokens - 1)]
+    return " ".join([f"[mock:{digest}]", *words])
@@ -0,0 +1,6 @@
+# Грубая оценка без токенизатора: около четырех символов на токен
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
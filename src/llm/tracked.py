@@ -0,0 +1,23 @@
+from src.core.progress import ProgressTracker
+from src.domain.models import ProviderStatus, TokenUsage
+from src.llm.contracts import LLMProvider, Message
+
+
+class ProgressLLMProvider(LLMProvider):
+    def __init__(self, provider: LLMProvider, progress: ProgressTracker):
+        self._provider = provider
+        self._progress = progress
+
+    @property
+    def usage(self) -> TokenUsage:
+        return self._provider.usage
+
+    def supports_multimodal(self) -> bool:
+        return self._provider.supports_multimodal()
+
+    def probe(self) -> ProviderStatus:
+        return self._provider.probe()
+
+    def generate_response(self, messages: list[Message]) -> str:
+        with self._progress.llm_request():
+            return self._provider.generate_response(messages)
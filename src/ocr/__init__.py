@@ -0,0 +1,13 @@
+from src.ocr.cascade import OcrCascade, OcrEngineStats, create_ocr_cascade
+from src.ocr.contracts import OcrEngine
+from src.ocr.engines import EasyOcrEngine, TesseractEngine, load_image
+
+__all__ = [
+    "OcrEngine",
+    "OcrCascade",
+    "OcrEngineStats",
+    "create_ocr_cascade",
+    "TesseractEngine",
+    "EasyOcrEngine",
+    "load_image",
+]
@@ -0,0 +1,222 @@
+import multiprocessing
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from src.core.logger import Logger
+from src.core.model_host import ModelHost
+from src.core.progress import ProgressTracker
+from src.domain.exceptions import OcrEngineUnavailableError
+from src.domain.models import OcrRegion, OcrResult
+from src.ocr.contracts import OcrEngine
+from src.ocr.engines import (
+    EasyOcrEngine,
+    HostedOcrEngine,
+    TesseractEngine,
+    load_image,
+)
+
+# Поля вокруг региона при повторном распознавании более точным движком
+_CROP_PADDING = 4
+
+
+@dataclass
+class OcrEngineStats:
+    calls: int = 0
+    total_seconds: float = 0.0
+    confidence_sum: float = 0.0
+
+    @property
+    def mean_confidence(self) -> float:
+        return self.confidence_sum / self.calls if self.calls else 0.0
+
+
+class OcrCascade:
+    def __init__(
+        self,
+        engines: list[OcrEngine],
+        logger: Logger | None = None,
+        region_threshold: float = 0.6,
+        page_threshold: float = 0.4,
+        progress: ProgressTracker | None = None,
+    ):
+        self._engines = engines
+        self._logger = logger
+        self._region_threshold = region_threshold
+        self._page_threshold = page_threshold
+        self._progress = progress
+        self._unavailable: set[str] = set()
+        self._lock = threading.Lock()
+        # Страницы PDF распознаются в изолированных воркерах: счетчики движков
+        # (вызовы, секунды, сумма уверенности) лежат в разделяемой памяти,
+        # которую воркеры наследуют через fork
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self._counters = multiprocessing.get_context(method).Array("d", 3 * len(engines))
+
+    def recognize_file(self, file_path: Path) -> OcrResult:
+        return self.recognize(load_image(file_path))
+
+    def recognize(self, image: np.ndarray) -> OcrResult:
+        regions: list[OcrRegion] | None = None
+        used: list[str] = []
+
+        # Каждый следующий движок медленнее и точнее: он получает только то,
+        # в чем предыдущий не уверен
+        for engine in self._engines:
+            if regions is None:
+                regions = self._run(engine, image)
+                if regions is not None:
+                    used.append(engine.name)
+                continue
+
+            if not regions or _confidence(regions) < self._page_threshold:
+                candidate = self._run(engine, image)
+                if candidate and _confidence(candidate) > _confidence(regions):
+                    regions = candidate
+                    used.append(engine.name)
+                continue
+
+            weak = [
+                i for i, r in enumerate(regions) if r.confidence < self._region_threshold
+            ]
+            if not weak:
+                break
+            if self._escalate_regions(engine, image, regions, weak):
+                used.append(engine.name)
+
+        if regions is None:
+            raise OcrEngineUnavailableError("No OCR engine is available")
+        if self._progress is not None:
+            self._progress.ocr_page()
+        return OcrResult(
+            text=_join(regions), confidence=_confidence(regions), engines=used
+        )
+
+    @property
+    def stats(self) -> dict[str, OcrEngineStats]:
+        with self._counters.get_lock():
+            counters = list(self._counters)
+        stats = {}
+        for i, engine in enumerate(self._engines):
+            calls, seconds, confidence = counters[3 * i : 3 * i + 3]
+            if calls:
+                stats[engine.name] = OcrEngineStats(int(calls), seconds, confidence)
+        return stats
+
+    def log_stats(self) -> None:
+        if self._logger is None:
+            return
+        for name, stats in self.stats.items():
+            self._logger.info(
+                f"OCR {name}: {stats.calls} call(s), {stats.total_seconds:.2f}s, "
+                f"mean confidence {stats.mean_confidence:.2f}"
+            )
+
+    def _escalate_regions(
+        self,
+        engine: OcrEngine,
+        image: np.ndarray,
+        regions: list[OcrRegion],
+        weak: list[int],
+    ) -> bool:
+        improved = False
+        height, width = image.shape[:2]
+        for i in weak:
+            x, y, w, h = regions[i].bbox
+            x0, y0 = max(0, x - _CROP_PADDING), max(0, y - _CROP_PADDING)
+            x1 = min(width, x + w + _CROP_PADDING)
+            y1 = min(height, y + h + _CROP_PADDING)
+            if x1 <= x0 or y1 <= y0:
+                continue
+
+            candidate = self._run(engine, image[y0:y1, x0:x1])
+            if not candidate or _confidence(candidate) <= regions[i].confidence:
+                continue
+            regions[i] = OcrRegion(
+                text=_join(candidate),
+                confidence=_confidence(candidate),
+                bbox=regions[i].bbox,
+            )
+            improved = True
+        return improved
+
+    def _run(self, engine: OcrEngine, image: np.ndarray) -> list[OcrRegion] | None:
+        if engine.name in self._unavailable:
+            return None
+
+        started = time.perf_counter()
+        try:
+            regions = engine.recognize(image)
+        except OcrEngineUnavailableError as e:
+            with self._lock:
+                self._unavailable.add(engine.name)
+            if self._logger is not None:
+                self._logger.warning(f"OCR engine {engine.name} disabled: {e}")
+            return None
+
+        elapsed = time.perf_counter() - started
+        offset = 3 * self._engines.index(engine)
+        with self._counters.get_lock():
+            self._counters[offset] += 1
+            self._counters[offset + 1] += elapsed
+            self._counters[offset + 2] += _confidence(regions)
+        return regions
+
+
+def _confidence(regions: list[OcrRegion]) -> float:
+    weights = [len(region.text) for region in regions]
+    if not sum(weights):
+        return 0.0
+    return float(np.average([region.confidence for region in regions], weights=weights))
+
+
+def _join(regions: list[OcrRegion]) -> str:
+    ordered = sorted(regions, key=lambda region: (region.bbox[1], region.bbox[0]))
+    return "\n".join(region.text for region in ordered if region.text).strip()
+
+
+DEFAULT_OCR_ENGINES = "tesseract,easyocr"
+DEFAULT_OCR_LANGUAGES = "ru,en"
+
+
+def parse_languages(languages: str | None) -> list[str]:
+    languages = languages or DEFAULT_OCR_LANGUAGES
+    return [lang.strip() for lang in languages.split(",") if lang.strip()]
+
+
+def create_ocr_cascade(
+    engines: str | None = DEFAULT_OCR_ENGINES,
+    languages: str | None = DEFAULT_OCR_LANGUAGES,
+    logger: Logger | None = None,
+    region_threshold: float = 0.6,
+    page_threshold: float = 0.4,
+    easyocr_host: ModelHost | None = None,
+    progress: ProgressTracker | None = None,
+) -> OcrCascade:
+    engines = engines or DEFAULT_OCR_ENGINES
+    language_list = parse_languages(languages)
+    factories = {
+        "tesseract": lambda: TesseractEngine(language_list),
+        "easyocr": lambda: (
+            HostedOcrEngine("easyocr", easyocr_host)
+            if easyocr_host is not None
+            else EasyOcrEngine(language_list)
+        ),
+    }
+
+    selected = []
+    for name in (name.strip() for name in engines.split(",")):
+        if name not in factories:
+            raise ValueError(f"Unknown OCR engine: {name}. Use 'tesseract' or 'easyocr'.")
+        selected.append(factories[name]())
+
+    return OcrCascade(
+        selected,
+        logger=logger,
+        region_threshold=region_threshold,
+        page_threshold=page_threshold,
+        progress=progress,
+    )
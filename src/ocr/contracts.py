@@ -0,0 +1,11 @@
+from typing import Protocol
+
+import numpy as np
+
+from src.domain.models import OcrRegion
+
+
+class OcrEngine(Protocol):
+    name: str
+
+    def recognize(self, image: np.ndarray) -> list[OcrRegion]: ...
@@ -0,0 +1,168 @@
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.core.model_host import BatchHandler, ModelHost
+from src.domain.exceptions import (
+    ModelHostError,
+    ModelUnavailableError,
+    OcrEngineUnavailableError,
+    OcrError,
+)
+from src.domain.models import OcrRegion
+
+# Коды языков EasyOCR -> Tesseract
+_TESSERACT_LANGUAGES = {"ru": "rus", "en": "eng", "de": "deu", "fr": "fra", "uk": "ukr"}
+
+
+def load_image(file_path: Path) -> np.ndarray:
+    import cv2
+
+    # np.fromfile вместо cv2.imread, чтобы не споткнуться о нелатинские пути
+    image = cv2.imdecode(np.fromfile(file_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise OcrError(f"Cannot decode image: {file_path.name}")
+    return image
+
+
+class TesseractEngine:
+    name = "tesseract"
+
+    def __init__(self, languages: list[str], config: str = "--oem 1 --psm 3"):
+        self._languages = "+".join(
+            _TESSERACT_LANGUAGES.get(lang, lang) for lang in languages
+        )
+        self._config = config
+
+    def recognize(self, image: np.ndarray) -> list[OcrRegion]:
+        try:
+            import pytesseract
+        except ImportError as e:
+            raise OcrEngineUnavailableError("pytesseract is not installed") from e
+
+        try:
+            data = pytesseract.image_to_data(
+                image,
+                lang=self._languages,
+                config=self._config,
+                output_type=pytesseract.Output.DICT,
+            )
+        except pytesseract.TesseractNotFoundError as e:
+            raise OcrEngineUnavailableError("tesseract binary is not installed") from e
+        return self._group_blocks(data)
+
+    def _group_blocks(self, data: dict[str, list[Any]]) -> list[OcrRegion]:
+        # Регион = блок текста Tesseract, строки внутри блока сохраняются
+        blocks: dict[int, list[int]] = defaultdict(list)
+        for i, word in enumerate(data["text"]):
+            if str(word).strip() and float(data["conf"][i]) >= 0:
+                blocks[data["block_num"][i]].append(i)
+
+        regions = []
+        for indices in blocks.values():
+            lines: dict[tuple[int, int], list[str]] = defaultdict(list)
+            weights = [len(str(data["text"][i]).strip()) for i in indices]
+            for i in indices:
+                lines[(data["par_num"][i], data["line_num"][i])].append(
+                    str(data["text"][i]).strip()
+                )
+
+            left = min(data["left"][i] for i in indices)
+            top = min(data["top"][i] for i in indices)
+            right = max(data["left"][i] + data["width"][i] for i in indices)
+            bottom = max(data["top"][i] + data["height"][i] for i in indices)
+            confidence = np.average(
+                [float(data["conf"][i]) / 100 for i in indices], weights=weights
+            )
+            regions.append(
+                OcrRegion(
+                    text="\n".join(" ".join(words) for words in lines.values()),
+                    confidence=float(np.clip(confidence, 0, 1)),
+                    bbox=(left, top, right - left, bottom - top),
+                )
+            )
+        return regions
+
+
+class EasyOcrEngine:
+    name = "easyocr"
+
+    def __init__(self, languages: list[str], gpu: bool = False):
+        self._languages = languages
+        self._gpu = gpu
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def recognize(self, image: np.ndarray) -> list[OcrRegion]:
+        results = self._get_reader().readtext(image, detail=1, paragraph=False)
+        return _easyocr_regions(results)
+
+    def _get_reader(self):
+        # Модели EasyOCR грузятся долго, поэтому только при первом обращении
+        with self._lock:
+            if self._reader is None:
+                self._reader = _create_easyocr_reader(self._languages, self._gpu)
+            return self._reader
+
+
+class HostedOcrEngine:
+    def __init__(self, name: str, host: ModelHost):
+        self.name = name
+        self._host = host
+
+    def recognize(self, image: np.ndarray) -> list[OcrRegion]:
+        try:
+            return self._host.client().infer(image)
+        except ModelUnavailableError as e:
+            raise OcrEngineUnavailableError(str(e)) from e
+        except ModelHostError as e:
+            raise OcrError(str(e)) from e
+
+
+def load_easyocr_handler(languages: list[str], gpu: bool = False) -> BatchHandler:
+    reader = _create_easyocr_reader(languages, gpu)
+
+    def handle(items: list[tuple[np.ndarray, dict[str, Any]]]) -> list[list[OcrRegion]]:
+        results: list[list[OcrRegion]] = [[] for _ in items]
+        # readtext_batched принимает только изображения одного размера
+        by_shape: dict[tuple[int, ...], list[int]] = defaultdict(list)
+        for i, (image, _) in enumerate(items):
+            by_shape[image.shape].append(i)
+
+        for indices in by_shape.values():
+            images = [items[i][0] for i in indices]
+            if len(images) == 1:
+                batch = [reader.readtext(images[0], detail=1, paragraph=False)]
+            else:
+                batch = reader.readtext_batched(images, detail=1, paragraph=False)
+            for i, found in zip(indices, batch, strict=True):
+                results[i] = _easyocr_regions(found)
+        return results
+
+    return handle
+
+
+def _create_easyocr_reader(languages: list[str], gpu: bool):
+    try:
+        import easyocr
+    except ImportError as e:
+        raise OcrEngineUnavailableError("easyocr is not installed") from e
+    return easyocr.Reader(languages, gpu=gpu)
+
+
+def _easyocr_regions(results) -> list[OcrRegion]:
+    regions = []
+    for points, text, confidence in results:
+        xs = [int(x) for x, _ in points]
+        ys = [int(y) for _, y in points]
+        regions.append(
+            OcrRegion(
+                text=text.strip(),
+                confidence=float(np.clip(confidence, 0, 1)),
+                bbox=(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)),
+            )
+        )
+    return regions
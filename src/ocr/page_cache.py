@@ -0,0 +1,99 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from src.domain.models import OcrResult
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr_pages (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    engines TEXT NOT NULL
+);
+"""
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def image_digest(image: np.ndarray) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(str(image.shape).encode("ascii"))
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+class OcrPageCache:
+    def __init__(self, db_path: Path):
+        self._db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+
+    @staticmethod
+    def page_key(file_hash: str, page_number: int) -> str:
+        return f"page:{file_hash}:{page_number}"
+
+    @staticmethod
+    def image_key(image_hash: str) -> str:
+        return f"image:{image_hash}"
+
+    def get(self, key: str) -> OcrResult | None:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT text, confidence, engines FROM ocr_pages WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        text, confidence, engines = row
+        return OcrResult(
+            text=text, confidence=confidence, engines=[e for e in engines.split(",") if e]
+        )
+
+    def put(self, keys: list[str], result: OcrResult) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ocr_pages (key, text, confidence, engines) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (key, result.text, result.confidence, ",".join(result.engines))
+                        for key in keys
+                    ],
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # Соединение унаследовано от родителя через fork: им нельзя пользоваться
+            self._conn = None
+            self._pid = os.getpid()
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
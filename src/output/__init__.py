@@ -1,13 +1,45 @@
-from src.output.formatter import ConsoleFormatter, Formatter, OutputFormatter
-from src.output.progress import FileProgress
-from src.output.tables import display_error, display_prompts_table, display_skills_table
+from src.output.formatter import (
+    ConsoleFormatter,
+    CsvFormatter,
+    DocumentOutputFormatter,
+    Formatter,
+    JsonlFormatter,
+    MarkdownFormatter,
+    OutputFormat,
+    OutputFormatter,
+    create_document_formatter,
+)
+from src.output.progress import (
+    JsonProgressStream,
+    ProgressDisplay,
+    create_progress_reporter,
+)
+from src.output.tables import (
+    display_error,
+    display_jobs_table,
+    display_prompts_table,
+    display_search_results,
+    display_skills_table,
+)
+from src.output.writer import StreamingFileWriter
 
 __all__ = [
     "OutputFormatter",
+    "DocumentOutputFormatter",
+    "OutputFormat",
     "ConsoleFormatter",
+    "JsonlFormatter",
+    "MarkdownFormatter",
+    "CsvFormatter",
+    "create_document_formatter",
+    "StreamingFileWriter",
     "Formatter",
-    "FileProgress",
+    "ProgressDisplay",
+    "JsonProgressStream",
+    "create_progress_reporter",
     "display_prompts_table",
     "display_skills_table",
+    "display_jobs_table",
+    "display_search_results",
     "display_error",
 ]
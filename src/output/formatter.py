@@ -1,19 +1,89 @@
+import csv
+import io
+import json
+from enum import Enum
 from typing import Protocol
 
 from rich.console import Console
 from rich.panel import Panel
 
+from src.domain.models import DocumentSummary
+
+
+class OutputFormat(str, Enum):
+    JSONL = "jsonl"
+    MARKDOWN = "markdown"
+    CSV = "csv"
+
 
 class OutputFormatter(Protocol):
     def format(self, summary: str) -> str: ...
 
 
+class DocumentOutputFormatter(OutputFormatter, Protocol):
+    def header(self) -> str: ...
+    def format_document(self, result: DocumentSummary) -> str: ...
+
+
 class ConsoleFormatter:
     def format(self, summary: str) -> str:
         # Можно добавить markdown рендеринг в будущем
         return summary
 
 
+class JsonlFormatter:
+    def format(self, summary: str) -> str:
+        return json.dumps({"summary": summary}, ensure_ascii=False) + "\n"
+
+    def header(self) -> str:
+        return ""
+
+    def format_document(self, result: DocumentSummary) -> str:
+        return json.dumps(result.model_dump(mode="json"), ensure_ascii=False) + "\n"
+
+
+class MarkdownFormatter:
+    def format(self, summary: str) -> str:
+        return f"# Summary\n\n{summary}\n"
+
+    def header(self) -> str:
+        return "# Document summaries\n\n"
+
+    def format_document(self, result: DocumentSummary) -> str:
+        body = result.summary if result.error is None else f"**Error:** {result.error}"
+        return f"## {result.path.name}\n\n`{result.path}`\n\n{body}\n\n"
+
+
+class CsvFormatter:
+    FIELDS = ["path", "size_bytes", "summary", "error", "duration_seconds"]
+
+    def format(self, summary: str) -> str:
+        return self._row(["summary"]) + self._row([summary])
+
+    def header(self) -> str:
+        return self._row(self.FIELDS)
+
+    def format_document(self, result: DocumentSummary) -> str:
+        data = result.model_dump(mode="json")
+        return self._row([data[field] for field in self.FIELDS])
+
+    def _row(self, values: list) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+        return buffer.getvalue()
+
+
+_FORMATTERS: dict[OutputFormat, type[DocumentOutputFormatter]] = {
+    OutputFormat.JSONL: JsonlFormatter,
+    OutputFormat.MARKDOWN: MarkdownFormatter,
+    OutputFormat.CSV: CsvFormatter,
+}
+
+
+def create_document_formatter(output_format: OutputFormat) -> DocumentOutputFormatter:
+    return _FORMATTERS[OutputFormat(output_format)]()
+
+
 class Formatter:
     def __init__(self, formatter: OutputFormatter):
         self._formatter = formatter
@@ -23,3 +93,11 @@ class Formatter:
         content = self._formatter.format(summary)
         panel = Panel(content, title="Summary", border_style="green")
         self._console.print(panel)
+
+    def output_document(self, result: DocumentSummary) -> None:
+        if result.error is not None:
+            panel = Panel(result.error, title=result.path.name, border_style="red")
+        else:
+            content = self._formatter.format(result.summary or "")
+            panel = Panel(content, title=result.path.name, border_style="green")
+        self._console.print(panel)
@@ -1,38 +1,161 @@
-from collections.abc import Callable
-from typing import Any
+import sys
+import threading
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import TextIO
 
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+from rich.console import Console, Group, RenderableType
+from rich.live import Live
+from rich.progress_bar import ProgressBar
+from rich.table import Table
+from rich.text import Text
 
+from src.core.progress import ProgressTracker
+from src.domain.models import ProgressSnapshot
 
-class FileProgress:
-    def __init__(self, items: list[Any], description: str = "Processing"):
-        self._items = items
-        self._description = description
-        self._progress = self._create_progress()
+PROGRESS_MODES = ("auto", "bar", "json", "off")
 
-    def _create_progress(self) -> Progress:
-        return Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+_STAGES = {"scan": "Scanning", "extract": "Extracting", "summarize": "Summarizing"}
+_MB = 1024 * 1024
+
+
+class ProgressDisplay:
+    def __init__(
+        self,
+        tracker: ProgressTracker,
+        refresh_seconds: float = 0.5,
+        console: Console | None = None,
+    ):
+        self._tracker = tracker
+        # Логи loguru пишут в текущий sys.stderr, который Live подменяет на время
+        # работы: строки логов печатаются над индикатором, а не поверх него
+        self._live = Live(
+            console=console or Console(stderr=True),
+            get_renderable=self._render,
+            refresh_per_second=1 / max(refresh_seconds, 0.05),
+            transient=True,
+            redirect_stdout=sys.stdout.isatty(),
+            redirect_stderr=True,
         )
 
-    def __enter__(self):
-        self._progress.start()
+    def __enter__(self) -> "ProgressDisplay":
+        self._live.start()
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self._progress.stop()
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._live.stop()
+
+    def _render(self) -> RenderableType:
+        return render_snapshot(self._tracker.snapshot())
+
+
+class JsonProgressStream:
+    def __init__(
+        self,
+        tracker: ProgressTracker,
+        stream: TextIO,
+        interval_seconds: float = 1.0,
+        close_stream: bool = False,
+    ):
+        self._tracker = tracker
+        self._stream = stream
+        self._close_stream = close_stream
+        self._interval_seconds = interval_seconds
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "JsonProgressStream":
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="progress-json", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        # Итоговая строка с этапом "done" сообщает оркестратору, что запуск завершен
+        self._write("done")
+        if self._close_stream:
+            self._stream.close()
+
+    def _loop(self) -> None:
+        while not self._stopped.wait(self._interval_seconds):
+            self._write()
+
+    def _write(self, stage: str | None = None) -> None:
+        snapshot = self._tracker.snapshot()
+        if stage is not None:
+            snapshot.stage = stage
+        self._stream.write(snapshot.model_dump_json() + "\n")
+        self._stream.flush()
 
-    def track(self, callback: Callable[[Any], None]) -> None:
-        task_id = self._progress.add_task(self._description, total=len(self._items))
 
-        for item in self._items:
-            self._update_item(task_id, item)
-            callback(item)
-            self._progress.advance(task_id)
+def create_progress_reporter(
+    mode: str,
+    tracker: ProgressTracker,
+    path: Path | None = None,
+    interval_seconds: float = 1.0,
+) -> AbstractContextManager:
+    if mode not in PROGRESS_MODES:
+        raise ValueError(f"Unknown progress mode: {mode}. Use one of {PROGRESS_MODES}.")
+
+    if mode == "json":
+        if path is None:
+            return JsonProgressStream(tracker, sys.stderr, interval_seconds)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stream = open(path, "w", encoding="utf-8")  # noqa: SIM115
+        return JsonProgressStream(tracker, stream, interval_seconds, close_stream=True)
+
+    # Без терминала индикатор только засоряет перенаправленный вывод
+    if mode == "bar" or (mode == "auto" and sys.stderr.isatty()):
+        return ProgressDisplay(tracker, interval_seconds / 2)
+    return nullcontext()
+
+
+def render_snapshot(snapshot: ProgressSnapshot) -> RenderableType:
+    grid = Table.grid(padding=(0, 1))
+    eta = f"ETA {_duration(snapshot.eta_seconds)}" if snapshot.eta_seconds else ""
+    grid.add_row(
+        Text(_STAGES.get(snapshot.stage, snapshot.stage), style="bold cyan"),
+        ProgressBar(
+            total=max(snapshot.bytes_total, 1), completed=snapshot.bytes_done, width=30
+        ),
+        f"{snapshot.files_done}/{snapshot.files_total} files",
+        f"{snapshot.bytes_done / _MB:.1f}/{snapshot.bytes_total / _MB:.1f} MB",
+        eta,
+    )
+    lines: list[RenderableType] = [grid]
+
+    if snapshot.bytes_by_reader:
+        readers = " · ".join(
+            f"{name} {size / _MB:.1f} MB"
+            for name, size in sorted(snapshot.bytes_by_reader.items())
+        )
+        lines.append(Text(f"  {readers}", style="dim"))
+
+    stats = [f"{snapshot.files_scanned} scanned"]
+    if snapshot.files_failed:
+        stats.append(f"{snapshot.files_failed} failed")
+    if snapshot.ocr_pages:
+        stats.append(
+            f"OCR {snapshot.ocr_pages} pages ({snapshot.ocr_pages_per_second:.1f}/s)"
+        )
+    if snapshot.audio_seconds:
+        stats.append(
+            f"audio {_duration(snapshot.audio_seconds)} ({snapshot.audio_speed:.1f}x)"
+        )
+    stats.append(
+        f"LLM {snapshot.llm_in_flight} in flight, {snapshot.llm_requests} done, "
+        f"{snapshot.prompt_tokens} → {snapshot.completion_tokens} tokens"
+    )
+    lines.append(Text(f"  {' | '.join(stats)}"))
+    return Group(*lines)
+
 
-    def _update_item(self, task_id: Any, item: Any) -> None:
-        name = getattr(item, "name", str(item))
-        self._progress.update(task_id, description=f"{self._description}: {name}")
+def _duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
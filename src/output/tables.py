@@ -2,6 +2,7 @@ from typing import Any
 
 from rich import box
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
@@ -27,6 +28,81 @@ def display_skills_table(skills: dict[str, Any]) -> None:
     _display_registry_table("Available Skills", skills)
 
 
+def display_jobs_table(jobs: list[Any]) -> None:
+    console = Console()
+    table = Table(title="Batch Jobs", box=box.SIMPLE)
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Folder", style="white")
+    table.add_column("Status", no_wrap=True)
+    table.add_column("Output / Error", style="white")
+
+    styles = {"done": "green", "failed": "red", "running": "yellow"}
+    for job in jobs:
+        status = job.status.value
+        style = styles.get(status, "white")
+        details = job.error if job.error else str(job.output_path)
+        table.add_row(job.id, str(job.folder), f"[{style}]{status}[/{style}]", details)
+
+    console.print(table)
+
+
+def display_search_results(hits: list[Any]) -> None:
+    console = Console()
+    if not hits:
+        console.print("[yellow]Nothing found.[/yellow]")
+        return
+
+    table = Table(title="Search Results", box=box.SIMPLE)
+    table.add_column("File", style="cyan")
+    table.add_column("Score", justify="right", no_wrap=True)
+    table.add_column("Fragment", style="white")
+
+    for hit in hits:
+        # Совпадения в сниппете отмечены [ и ], которые rich принял бы за разметку
+        table.add_row(escape(str(hit.path)), f"{hit.score:.2f}", escape(hit.snippet))
+
+    console.print(table)
+
+
+def display_plan(plan: Any) -> None:
+    console = Console()
+    table = Table(title="Run Plan", box=box.SIMPLE)
+    table.add_column("File", style="cyan")
+    table.add_column("Reader", no_wrap=True)
+    table.add_column("Size", justify="right", no_wrap=True)
+    table.add_column("Est. time", justify="right", no_wrap=True)
+    table.add_column("Est. tokens", justify="right", no_wrap=True)
+    table.add_column("Status", style="white")
+
+    for file in plan.files:
+        status = "[green]ok[/green]" if file.skip_reason is None else file.skip_reason
+        table.add_row(
+            str(file.path),
+            file.reader or "-",
+            f"{file.size_bytes / 1024:.0f} KiB",
+            f"{file.estimated_seconds:.1f}s",
+            str(file.estimated_tokens),
+            status,
+        )
+    console.print(table)
+
+    lines = [
+        f"Files: {len(plan.selected)} of {len(plan.files)}",
+        f"Extraction: ~{plan.extraction_seconds:.0f}s",
+        f"LLM requests: {plan.requests}",
+        f"Tokens: ~{plan.prompt_tokens} prompt, ~{plan.completion_tokens} completion",
+    ]
+    if plan.estimated_cost is not None:
+        lines.append(f"Cost: ~${plan.estimated_cost:.4f}")
+    if plan.provider is not None:
+        style = "green" if plan.provider.ok else "red"
+        lines.append(f"Provider: [{style}]{plan.provider.message}[/{style}]")
+    lines.extend(f"[red]{problem}[/red]" for problem in plan.problems)
+
+    border = "red" if plan.problems else "green"
+    console.print(Panel("\n".join(lines), title="Summary", border_style=border))
+
+
 def display_error(message: str, verbose: bool = False) -> None:
     console = Console()
     panel = Panel(message, title="Error", border_style="red")
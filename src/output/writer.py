@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+
+from src.domain.models import DocumentSummary
+from src.output.formatter import DocumentOutputFormatter
+
+
+class StreamingFileWriter:
+    def __init__(
+        self,
+        path: Path,
+        formatter: DocumentOutputFormatter,
+        fsync: bool = True,
+        append: bool = False,
+    ):
+        self._path = path
+        self._formatter = formatter
+        self._fsync = fsync
+        self._append = append
+        self._file = None
+        self.written = 0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Повторный запуск по умолчанию перезаписывает файл, иначе строки дублируются
+        is_new = (
+            not self._append or not self._path.exists() or self._path.stat().st_size == 0
+        )
+        mode = "a" if self._append else "w"
+        self._file = open(self._path, mode, encoding="utf-8", newline="")  # noqa: SIM115
+        if is_new:
+            self._write(self._formatter.header())
+
+    def write(self, result: DocumentSummary) -> None:
+        self._write(self._formatter.format_document(result))
+        self.written += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, text: str) -> None:
+        if not text:
+            return
+        if self._file is None:
+            raise RuntimeError(f"Writer for {self._path} is not open.")
+
+        self._file.write(text)
+        # Каждая запись сразу уходит на диск, чтобы пережить падение процесса
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
@@ -1,4 +1,5 @@
 from src.prompts.contracts import PromptProvider
 from src.prompts.registry import PromptConfig, PromptRegistry
+from src.prompts.template import PromptTemplate
 
-__all__ = ["PromptProvider", "PromptConfig", "PromptRegistry"]
+__all__ = ["PromptProvider", "PromptConfig", "PromptRegistry", "PromptTemplate"]
@@ -1,52 +1,163 @@
 from pathlib import Path
+from typing import Any
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError
+
+from src.core.logger import Logger
+from src.core.registry_cache import FileFingerprint, RegistrySnapshot, file_fingerprint
+from src.prompts.template import DEFAULT_DOCUMENT_TEMPLATE, PromptTemplate
 
 
 class PromptConfig(BaseModel):
     name: str
     description: str
     prompt: str
+    system: str | None = None
+    variables: dict[str, str] = Field(default_factory=dict)
+    sections: dict[str, str] = Field(default_factory=dict)
+    document_template: str = DEFAULT_DOCUMENT_TEMPLATE
+
+    def template(self) -> PromptTemplate:
+        return PromptTemplate(
+            instruction=self.prompt,
+            system=self.system,
+            variables=self.variables,
+            sections=self.sections,
+            document_template=self.document_template,
+        )
 
 
 class PromptRegistry:
-    def __init__(self, prompts_path: str):
+    def __init__(
+        self,
+        prompts_path: str,
+        logger: Logger | None = None,
+        cache_path: Path | None = None,
+    ):
         self._prompts_path = Path(prompts_path)
+        self._logger = logger
+        self._snapshot = RegistrySnapshot(cache_path)
+        self._files: dict[str, tuple[FileFingerprint, dict[str, Any]]] = {}
+        self._index: dict[str, Path] = {}
+        self._descriptions: dict[str, str] = {}
         self._prompts: dict[str, PromptConfig] = {}
+        self.errors: dict[Path, str] = {}
 
     def load(self) -> None:
         if not self._prompts_path.exists():
             return
 
-        for file_path in self._find_yaml_files():
-            self._load_single_file(file_path)
+        current = {
+            str(path): fingerprint
+            for path in self._find_yaml_files()
+            if (fingerprint := file_fingerprint(path)) is not None
+        }
+        if self._files and current == {p: fp for p, (fp, _) in self._files.items()}:
+            return
+
+        cached = self._files or self._snapshot.load()
+        files: dict[str, tuple[FileFingerprint, dict[str, Any]]] = {}
+        compiled: dict[str, PromptConfig] = {}
+
+        # Разбираем только новые и изменившиеся файлы, остальное берём из снимка
+        for path, fingerprint in current.items():
+            item = cached.get(path)
+            if item is None or tuple(item[0]) != fingerprint:
+                entry, config = self._compile_file(Path(path))
+                item = (fingerprint, entry)
+                if config is not None:
+                    compiled[config.name] = config
+            files[path] = item
+
+        if files != cached:
+            self._snapshot.save(files)
+
+        self._files = files
+        self._rebuild_index(compiled)
 
     def _find_yaml_files(self) -> list[Path]:
         return list(self._prompts_path.glob("*.yaml")) + list(
             self._prompts_path.glob("*.yml")
         )
 
-    def _load_single_file(self, file_path: Path) -> None:
+    def _compile_file(
+        self, file_path: Path
+    ) -> tuple[dict[str, Any], PromptConfig | None]:
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            config = self._load_single_file(file_path)
+        except (OSError, yaml.YAMLError, ValueError, ValidationError) as e:
+            return {"error": f"{type(e).__name__}: {e}"}, None
+        return {"name": config.name, "description": config.description}, config
+
+    def _load_single_file(self, file_path: Path) -> PromptConfig:
+        with open(file_path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
 
-            config = self._create_config(data, file_path)
-            self._prompts[config.name] = config
-        except Exception:
-            # TODO: Logger should be here, but avoid coupling for now or add to __init__
-            pass
+        if not isinstance(data, dict):
+            raise ValueError("expected a mapping with 'name', 'description', 'prompt'")
+        return self._create_config(data, file_path)
 
     def _create_config(self, data: dict, file_path: Path) -> PromptConfig:
         return PromptConfig(
             name=data.get("name", file_path.stem),
             description=data.get("description", ""),
             prompt=data.get("prompt", ""),
+            system=data.get("system"),
+            variables=self._string_map(data.get("variables")),
+            sections=self._string_map(data.get("sections")),
+            document_template=data.get("document_template", DEFAULT_DOCUMENT_TEMPLATE),
         )
 
+    @staticmethod
+    def _string_map(value: Any) -> dict[str, str]:
+        if not value:
+            return {}
+        if not isinstance(value, dict):
+            raise ValueError("'variables' and 'sections' must be mappings")
+        return {str(key): str(item) for key, item in value.items()}
+
+    def _rebuild_index(self, compiled: dict[str, PromptConfig]) -> None:
+        self._index.clear()
+        self._descriptions.clear()
+        self.errors.clear()
+
+        for path, (_, entry) in sorted(self._files.items()):
+            if "error" in entry:
+                self.errors[Path(path)] = entry["error"]
+                self._warn(f"Skipping malformed prompt file {path}: {entry['error']}")
+                continue
+            self._index[entry["name"]] = Path(path)
+            self._descriptions[entry["name"]] = entry["description"]
+
+        # Тексты промптов из неизменившихся файлов остаются в памяти
+        self._prompts = {
+            name: config
+            for name, config in {**self._prompts, **compiled}.items()
+            if name in self._index
+        }
+
     def get(self, name: str) -> PromptConfig | None:
-        return self._prompts.get(name)
+        if name in self._prompts:
+            return self._prompts[name]
+
+        file_path = self._index.get(name)
+        if file_path is None:
+            return None
+
+        try:
+            config = self._load_single_file(file_path)
+        except (OSError, yaml.YAMLError, ValueError, ValidationError) as e:
+            self._warn(f"Failed to load prompt '{name}' from {file_path}: {e}")
+            return None
+
+        self._prompts[name] = config
+        return config
 
     def list_prompts(self) -> dict[str, PromptConfig]:
-        return self._prompts.copy()
+        prompts = {name: self.get(name) for name in self._index}
+        return {name: config for name, config in prompts.items() if config is not None}
+
+    def _warn(self, msg: str) -> None:
+        if self._logger is not None:
+            self._logger.warning(msg)
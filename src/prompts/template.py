@@ -0,0 +1,40 @@
+from string import Template
+
+from pydantic import BaseModel, Field
+
+DEFAULT_DOCUMENT_TEMPLATE = "--- $name ---\n$content"
+
+
+class PromptTemplate(BaseModel):
+    instruction: str
+    system: str | None = None
+    variables: dict[str, str] = Field(default_factory=dict)
+    sections: dict[str, str] = Field(default_factory=dict)
+    document_template: str = DEFAULT_DOCUMENT_TEMPLATE
+    question: str | None = None
+
+    def with_variables(self, variables: dict[str, str]) -> "PromptTemplate":
+        if not variables:
+            return self
+        return self.model_copy(update={"variables": {**self.variables, **variables}})
+
+    def with_question(self, question: str | None) -> "PromptTemplate":
+        return self.model_copy(update={"question": question})
+
+    def render_instruction(self) -> str:
+        parts = [self.instruction.strip()]
+        for title, text in self.sections.items():
+            parts.append(f"## {title}\n{text.strip()}")
+        return self._substitute("\n\n".join(parts))
+
+    def render_system(self) -> str | None:
+        return self._substitute(self.system) if self.system else None
+
+    def render_document(self, name: str, content: str) -> str:
+        # Текст документа подставляется значением и сам не разбирается как шаблон
+        return Template(self.document_template).safe_substitute(
+            self.variables, name=name, content=content
+        )
+
+    def _substitute(self, text: str) -> str:
+        return Template(text).safe_substitute(self.variables)
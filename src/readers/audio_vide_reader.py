@@ -1,11 +1,14 @@
-from collections.abc import Iterable
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from faster_whisper import WhisperModel
-from faster_whisper.transcribe import Segment, Word
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from faster_whisper.transcribe import Segment
 
-from src.domain.models import ContentType, DocumentContent
+from src.core.model_host import BatchHandler, ModelHost
+from src.domain.exceptions import DocumentReadError, ModelHostError
+from src.domain.models import ContentType, DocumentContent, TranscriptSegment
 
 WhisperModelSize = Literal[
     "tiny", "base", "small", "medium", "large", "large-v2", "large-v3"
@@ -13,6 +16,13 @@ WhisperModelSize = Literal[
 DeviceType = Literal["cpu", "cuda", "auto"]
 ComputeType = Literal["int8", "float16", "float32", "int8_float16"]
 
+# Слово и вероятность его распознавания
+TranscribedWord = tuple[str, float]
+# Начало и конец сегмента в секундах и его слова
+RawSegment = tuple[float, float, list[TranscribedWord]]
+
+SAMPLING_RATE = 16000
+
 
 class AudioVideoReader:
     SUPPORTED_EXTENSIONS = {
@@ -29,6 +39,8 @@ class AudioVideoReader:
     }
 
     DEFAULT_BEAM_SIZE = 5
+    # Окно записи, которое уходит хосту модели за один запрос
+    HOST_WINDOW_SECONDS = 300
     UNRECOGNIZED_TAG: str = " [НЕРАЗБОРЧИВО]"
 
     def __init__(
@@ -37,8 +49,15 @@ class AudioVideoReader:
         prob_threashold: float = 0.6,
         device: DeviceType = "cpu",
         compute_type: ComputeType = "int8",
+        host: ModelHost | None = None,
     ):
-        self._model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        # С хостом модель живет в одном отдельном процессе, а не в каждом воркере
+        self._host = host
+        self._model = (
+            None
+            if host is not None
+            else WhisperModel(model_size, device=device, compute_type=compute_type)
+        )
         self._threashold = prob_threashold
 
     def supports(self, file_path: Path) -> bool:
@@ -51,40 +70,96 @@ class AudioVideoReader:
         return DocumentContent(
             file_path=file_path,
             content_type=ContentType.TEXT,
-            text_content=self._extract_text(file_path),
+            text_content=" ".join(
+                segment.text for segment in self.iter_segments(file_path)
+            ),
             mime_type="text/plain",
         )
 
-    def _extract_text(self, file_path: Path) -> str:
-        raw_segments = self._transcribe(file_path)
-        clean_segments = self._process_segments(raw_segments)
-        return " ".join(clean_segments)
-
-    def _transcribe(self, file_path: Path) -> Iterable[Segment]:
+    def iter_segments(
+        self, file_path: Path, start_seconds: float = 0.0
+    ) -> Iterator[TranscriptSegment]:
+        # Сегменты отдаются по мере распознавания, а не после всей записи
+        for start, end, words in self._transcribe(file_path, start_seconds):
+            text = self._format_segment(words)
+            if text:
+                yield TranscriptSegment(start=start, end=end, text=text)
+
+    def _transcribe(self, file_path: Path, start_seconds: float) -> Iterator[RawSegment]:
+        if self._host is None and not start_seconds:
+            yield from self._transcribe_local(str(file_path), 0.0)
+            return
+
+        audio = decode_audio(str(file_path), sampling_rate=SAMPLING_RATE)
+        offset = int(start_seconds * SAMPLING_RATE)
+        if self._host is None:
+            yield from self._transcribe_local(audio[offset:], start_seconds)
+            return
+
+        # Хост отвечает на запрос целиком, поэтому запись уходит к нему окнами
+        window = self.HOST_WINDOW_SECONDS * SAMPLING_RATE
+        for position in range(offset, len(audio), window):
+            shift = position / SAMPLING_RATE
+            try:
+                segments = self._host.client().infer(
+                    audio[position : position + window],
+                    beam_size=self.DEFAULT_BEAM_SIZE,
+                )
+            except ModelHostError as e:
+                raise DocumentReadError(
+                    f"Transcription of {file_path.name} failed: {e}"
+                ) from e
+            for start, end, words in segments:
+                yield start + shift, end + shift, words
+
+    def _transcribe_local(
+        self, audio: str | np.ndarray, shift: float
+    ) -> Iterator[RawSegment]:
         segments, _ = self._model.transcribe(
-            str(file_path),
+            audio,
             word_timestamps=True,
             beam_size=self.DEFAULT_BEAM_SIZE,
         )
-
-        return segments
-
-    def _process_segments(self, segments: Iterable[Segment]) -> list[str]:
-        processed = []
-
         for segment in segments:
-            clean_text = self._format_segment(segment)
-            if clean_text:
-                processed.append(clean_text)
-
-        return processed
+            start, end, words = _raw_segment(segment)
+            yield start + shift, end + shift, words
 
-    def _format_segment(self, segment: Segment) -> str:
-        words = segment.words or []
-        formated_words = [self._evalate_word(word) for word in words]
-        return "".join(formated_words)
+    def _format_segment(self, words: list[TranscribedWord]) -> str:
+        formated_words = [self._evalate_word(*word) for word in words]
+        return "".join(formated_words).strip()
 
-    def _evalate_word(self, word: Word) -> str:
-        if word.probability < self._threashold:
+    def _evalate_word(self, word: str, probability: float) -> str:
+        if probability < self._threashold:
             return self.UNRECOGNIZED_TAG
-        return word.word
+        return word
+
+
+def load_whisper_handler(
+    model_size: WhisperModelSize = "small",
+    device: DeviceType = "cpu",
+    compute_type: ComputeType = "int8",
+    batch_size: int = 8,
+) -> BatchHandler:
+    model = WhisperModel(model_size, device=device, compute_type=compute_type)
+    # Распознавание разных файлов не склеить в один батч, поэтому батчатся
+    # фрагменты внутри файла
+    pipeline = BatchedInferencePipeline(model=model)
+
+    def handle(items: list[tuple[np.ndarray, dict[str, Any]]]) -> list[Any]:
+        results = []
+        for audio, options in items:
+            segments, _ = pipeline.transcribe(
+                audio,
+                word_timestamps=True,
+                batch_size=batch_size,
+                beam_size=options.get("beam_size", AudioVideoReader.DEFAULT_BEAM_SIZE),
+            )
+            results.append([_raw_segment(segment) for segment in segments])
+        return results
+
+    return handle
+
+
+def _raw_segment(segment: Segment) -> RawSegment:
+    words = [(word.word, word.probability) for word in segment.words or []]
+    return segment.start, segment.end, words
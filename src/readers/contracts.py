@@ -1,10 +1,24 @@
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
-from src.domain.models import DocumentContent
+from src.domain.models import DocumentContent, TranscriptSegment
 
 
 class DocumentReader(Protocol):
     def supports(self, file_path: Path) -> bool: ...
     def read(self, file_path: Path) -> DocumentContent: ...
     def get_supported_extensions(self) -> list[str]: ...
+
+
+@runtime_checkable
+class SegmentReader(Protocol):
+    def iter_segments(
+        self, file_path: Path, start_seconds: float = 0.0
+    ) -> Iterator[TranscriptSegment]: ...
+
+
+class SegmentListener(Protocol):
+    def on_transcript_start(self, file_path: Path) -> None: ...
+    def on_segment(self, file_path: Path, segment: TranscriptSegment) -> None: ...
+    def on_transcript_end(self, file_path: Path) -> None: ...
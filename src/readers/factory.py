@@ -3,6 +3,11 @@ from pathlib import Path
 from src.readers.contracts import DocumentReader
 
 
+def reader_name(reader: DocumentReader) -> str:
+    # Обертки (например, изолированный ридер) сообщают имя исходного ридера
+    return getattr(reader, "name", None) or type(reader).__name__
+
+
 class ReaderFactory:
     def __init__(self, readers: list[DocumentReader]):
         self._readers = readers
@@ -18,3 +23,10 @@ class ReaderFactory:
         for reader in self._readers:
             extensions.extend(reader.get_supported_extensions())
         return list(set(extensions))
+
+    def close(self) -> None:
+        # Изолированные ридеры держат процессы-воркеры между файлами
+        for reader in self._readers:
+            close = getattr(reader, "close", None)
+            if callable(close):
+                close()
@@ -1,8 +1,9 @@
 from pathlib import Path
 
-import easyocr
-
+from src.domain.exceptions import DocumentReadError
 from src.domain.models import ContentType, DocumentContent
+from src.ocr.cascade import OcrCascade, create_ocr_cascade
+from src.readers.vision import VisionPassThrough
 
 
 class ImageReader:
@@ -14,33 +15,53 @@ class ImageReader:
         ".webp": "image/webp",
     }
 
-    def __init__(self, supported_extensions: list[str] | None = None):
+    def __init__(
+        self,
+        supported_extensions: list[str] | None = None,
+        vision: VisionPassThrough | None = None,
+        ocr: OcrCascade | None = None,
+        llm_confidence_threshold: float = 0.3,
+    ):
         self._supported_extensions = supported_extensions or list(self._MIME_TYPES.keys())
-        self._reader = easyocr.Reader(["ru", "en"])
+        self._vision = vision
+        self._ocr = ocr or create_ocr_cascade()
+        self._llm_confidence_threshold = llm_confidence_threshold
 
     def supports(self, file_path: Path) -> bool:
         return file_path.suffix.lower() in self._supported_extensions
 
     def read(self, file_path: Path) -> DocumentContent:
-        text_content = self._extract_text_from_image(file_path)
+        # Сначала пробуем отдать изображение модели напрямую, без локального OCR
+        if self._vision is not None:
+            content = self._vision.read_image(file_path)
+            if content is not None:
+                return content
+
+        try:
+            result = self._ocr.recognize_file(file_path)
+        except Exception as e:
+            raise DocumentReadError(
+                f"Error extracting text from {file_path.name}: {e}"
+            ) from e
+
+        # Если даже последний OCR-движок не уверен, отдаем изображение модели
+        if (
+            self._vision is not None
+            and result.confidence < self._llm_confidence_threshold
+        ):
+            content = self._vision.read_image(file_path, force=True)
+            if content is not None:
+                return content
 
+        return self._text_content(file_path, result.text)
+
+    def _text_content(self, file_path: Path, text: str) -> DocumentContent:
         return DocumentContent(
             file_path=file_path,
             content_type=ContentType.TEXT,
-            text_content=text_content,
+            text_content=text,
             mime_type="text/plain",
         )
 
-    def _extract_text_from_image(self, file_path: Path) -> str:
-        try:
-            results = self._reader.readtext(str(file_path), detail=0)
-            text = " ".join(results)
-            return text.strip()
-        except Exception as e:
-            return f"Error extracting text from {file_path.name}: {str(e)}"
-
-    def _get_mime_type(self, file_path: Path) -> str:
-        return self._MIME_TYPES.get(file_path.suffix.lower(), "image/jpeg")
-
     def get_supported_extensions(self) -> list[str]:
         return self._supported_extensions
@@ -0,0 +1,236 @@
+import contextlib
+import multiprocessing
+import signal
+import threading
+import time
+from collections.abc import Iterator
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any
+
+from src.core.cancellation import CancellationToken
+from src.core.logger import Logger
+from src.domain.exceptions import (
+    DocumentReadError,
+    ExtractionCancelledError,
+    ExtractionTimeoutError,
+)
+from src.domain.models import DocumentContent, TranscriptSegment
+from src.readers.contracts import DocumentReader, SegmentReader
+
+# Без fork ридер (с моделями, кэшами и потоками) не передать в дочерний процесс
+FORK_AVAILABLE = "fork" in multiprocessing.get_all_start_methods()
+
+
+def _serve(reader: DocumentReader, conn: Connection) -> None:
+    # Ctrl-C обрабатывает родитель: он сам остановит воркер, если нужно
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        _serve_requests(reader, conn)
+    finally:
+        # Процесс завершается без atexit: фоновая очередь логов дописывается здесь
+        Logger.flush()
+
+
+def _serve_requests(reader: DocumentReader, conn: Connection) -> None:
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+
+        kind, file_path, args = request
+        try:
+            if kind == "segments":
+                # Каждый сегмент уходит родителю сразу, как только распознан
+                for segment in reader.iter_segments(file_path, *args):
+                    conn.send(("segment", segment))
+                conn.send(("done", None))
+            else:
+                conn.send(("ok", reader.read(file_path)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    def __init__(self, reader: DocumentReader, name: str):
+        context = multiprocessing.get_context("fork")
+        self.conn, child_conn = context.Pipe()
+        self.process: BaseProcess = context.Process(
+            target=_serve, args=(reader, child_conn), name=name, daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self, graceful: bool = False, grace_seconds: float = 1.0) -> None:
+        if graceful:
+            with contextlib.suppress(OSError):
+                self.conn.send(None)
+            self.process.join(timeout=grace_seconds)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class IsolatedReader:
+    def __init__(
+        self,
+        reader: DocumentReader,
+        logger: Logger,
+        timeout_seconds: float = 600.0,
+        cancellation: CancellationToken | None = None,
+        poll_interval: float = 0.2,
+        max_workers: int = 1,
+    ):
+        self._reader = reader
+        self._logger = logger
+        self._timeout_seconds = timeout_seconds
+        self._cancellation = cancellation
+        self._poll_interval = poll_interval
+        self._max_workers = max(1, max_workers)
+        self._available = threading.Condition()
+        self._idle: list[_Worker] = []
+        self._busy = 0
+
+    @property
+    def name(self) -> str:
+        return type(self._reader).__name__
+
+    def supports(self, file_path: Path) -> bool:
+        return self._reader.supports(file_path)
+
+    def get_supported_extensions(self) -> list[str]:
+        return self._reader.get_supported_extensions()
+
+    def read(self, file_path: Path) -> DocumentContent:
+        if not FORK_AVAILABLE:
+            return self._reader.read(file_path)
+
+        # Воркеры живут между файлами, чтобы модели OCR и распознавания речи
+        # загружались один раз; после таймаута воркер убивается и создается заново
+        worker = self._acquire()
+        try:
+            worker.conn.send(("read", file_path, ()))
+            status, payload = self._wait(worker, file_path)
+        except BaseException:
+            worker.stop()
+            worker = None
+            raise
+        finally:
+            self._release(worker)
+
+        if status == "error":
+            raise DocumentReadError(payload)
+        return payload
+
+    def close(self) -> None:
+        with self._available:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop(graceful=True, grace_seconds=self._poll_interval * 5)
+            self._logger.debug(f"{self.name} worker stopped")
+
+    def _acquire(self) -> _Worker:
+        with self._available:
+            while True:
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive:
+                        self._busy += 1
+                        return worker
+                    worker.stop()
+                if self._busy < self._max_workers:
+                    self._busy += 1
+                    break
+                self._available.wait()
+
+        try:
+            return _Worker(self._reader, f"{self.name}-worker")
+        except BaseException:
+            self._release(None)
+            raise
+
+    def _release(self, worker: _Worker | None) -> None:
+        with self._available:
+            self._busy -= 1
+            if worker is not None:
+                self._idle.append(worker)
+            self._available.notify()
+
+    def _wait(self, worker: _Worker, file_path: Path) -> tuple[str, Any]:
+        deadline = time.monotonic() + self._timeout_seconds
+        while True:
+            if worker.conn.poll(self._poll_interval):
+                try:
+                    return worker.conn.recv()
+                except EOFError:
+                    worker.process.join()
+                    raise DocumentReadError(
+                        f"{self.name} worker died while reading {file_path.name} "
+                        f"(exit code {worker.process.exitcode})"
+                    ) from None
+
+            if self._cancellation is not None and self._cancellation.cancelled:
+                raise ExtractionCancelledError(f"Reading {file_path.name} was cancelled")
+
+            if self._timeout_seconds > 0 and time.monotonic() > deadline:
+                raise ExtractionTimeoutError(
+                    f"Reading {file_path.name} timed out after "
+                    f"{self._timeout_seconds:.0f}s"
+                )
+
+
+class IsolatedSegmentReader(IsolatedReader):
+    def iter_segments(
+        self, file_path: Path, start_seconds: float = 0.0
+    ) -> Iterator[TranscriptSegment]:
+        if not FORK_AVAILABLE:
+            yield from self._reader.iter_segments(file_path, start_seconds)
+            return
+
+        # Таймаут считается от последнего сегмента: длинная запись не должна
+        # упираться в лимит, пока распознавание идет
+        worker = self._acquire()
+        finished = False
+        try:
+            worker.conn.send(("segments", file_path, (start_seconds,)))
+            while True:
+                status, payload = self._wait(worker, file_path)
+                if status == "segment":
+                    yield payload
+                    continue
+                finished = True
+                if status == "error":
+                    raise DocumentReadError(payload)
+                return
+        finally:
+            # Брошенный на середине поток не дочитать: воркер пересоздается
+            if not finished:
+                worker.stop()
+                worker = None
+            self._release(worker)
+
+
+def isolate(
+    reader: DocumentReader,
+    logger: Logger,
+    timeout_seconds: float = 600.0,
+    cancellation: CancellationToken | None = None,
+    max_workers: int = 1,
+) -> IsolatedReader:
+    cls = IsolatedSegmentReader if isinstance(reader, SegmentReader) else IsolatedReader
+    return cls(
+        reader,
+        logger,
+        timeout_seconds=timeout_seconds,
+        cancellation=cancellation,
+        max_workers=max_workers,
+    )
@@ -0,0 +1,336 @@
+import posixpath
+import re
+import zipfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import IO
+from xml.etree import ElementTree as ET
+
+from src.core.archives import ArchiveLimits, list_members
+from src.domain.exceptions import DocumentReadError
+from src.domain.models import ContentType, DocumentContent
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_S = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+_TABLE = "{urn:oasis:names:tc:opendocument:xmlns:table:1.0}"
+
+_CELL_REF = re.compile(r"([A-Z]+)")
+# В итог по пропущенным строкам попадают только первые столбцы
+_SUMMARY_COLUMNS = 20
+
+
+class OfficeReader:
+    def __init__(
+        self,
+        supported_extensions: list[str] | None = None,
+        max_rows_per_sheet: int = 1000,
+        archive_limits: ArchiveLimits | None = None,
+    ):
+        self._supported_extensions = supported_extensions or [
+            ".docx",
+            ".xlsx",
+            ".pptx",
+            ".odt",
+        ]
+        self._max_rows_per_sheet = max(1, max_rows_per_sheet)
+        self._archive_limits = archive_limits or ArchiveLimits()
+
+    def supports(self, file_path: Path) -> bool:
+        return file_path.suffix.lower() in self._supported_extensions
+
+    def read(self, file_path: Path) -> DocumentContent:
+        try:
+            # Офисный файл - тот же zip: оглавление проверяется до распаковки XML
+            self._archive_limits.check(file_path, list_members(file_path))
+            with zipfile.ZipFile(file_path) as zf:
+                lines = list(self._lines(zf, file_path.suffix.lower()))
+        except Exception as e:
+            raise DocumentReadError(
+                f"Error extracting text from {file_path.name}: {e}"
+            ) from e
+
+        return DocumentContent(
+            file_path=file_path,
+            content_type=ContentType.TEXT,
+            text_content="\n".join(lines),
+        )
+
+    def get_supported_extensions(self) -> list[str]:
+        return self._supported_extensions
+
+    def _lines(self, zf: zipfile.ZipFile, suffix: str) -> Iterator[str]:
+        if suffix == ".docx":
+            with zf.open("word/document.xml") as stream:
+                yield from _flow_lines(
+                    stream, {f"{_W}p"}, f"{_W}tc", f"{_W}tr", _docx_paragraph
+                )
+        elif suffix == ".pptx":
+            yield from self._slides(zf)
+        elif suffix == ".xlsx":
+            yield from self._sheets(zf)
+        else:
+            with zf.open("content.xml") as stream:
+                yield from _flow_lines(
+                    stream,
+                    {f"{_TEXT}p", f"{_TEXT}h"},
+                    f"{_TABLE}table-cell",
+                    f"{_TABLE}table-row",
+                    _odt_paragraph,
+                )
+
+    def _slides(self, zf: zipfile.ZipFile) -> Iterator[str]:
+        targets = _relationships(zf, "ppt/presentation.xml")
+        with zf.open("ppt/presentation.xml") as stream:
+            ids = [
+                elem.get(f"{_R}id")
+                for event, elem in _iter_elements(stream, {f"{_P}sldId"})
+                if event == "end" and elem.get(f"{_R}id") in targets
+            ]
+        for number, rel_id in enumerate(ids, start=1):
+            yield f"## Slide {number}"
+            with zf.open(targets[rel_id]) as stream:
+                yield from _flow_lines(
+                    stream, {f"{_A}p"}, f"{_A}tc", f"{_A}tr", _pptx_paragraph
+                )
+
+    def _sheets(self, zf: zipfile.ZipFile) -> Iterator[str]:
+        shared = _shared_strings(zf)
+        targets = _relationships(zf, "xl/workbook.xml")
+        with zf.open("xl/workbook.xml") as stream:
+            sheets = [
+                (elem.get("name"), targets[elem.get(f"{_R}id")])
+                for event, elem in _iter_elements(stream, {f"{_S}sheet"})
+                if event == "end" and elem.get(f"{_R}id") in targets
+            ]
+        for name, target in sheets:
+            yield f"## Sheet: {name}"
+            with zf.open(target) as stream:
+                yield from self._sheet_rows(stream, shared)
+
+    def _sheet_rows(self, stream: IO[bytes], shared: list[str]) -> Iterator[str]:
+        # Огромные таблицы обрезаются: модели хватает первых строк и сводки по
+        # остальным, а разбор продолжается потоково, без накопления строк в памяти
+        header: list[str] | None = None
+        shown = 0
+        omitted = _OmittedRows()
+        for event, row in _iter_elements(stream, {f"{_S}row"}):
+            if event == "start":
+                continue
+            values = _row_values(row, shared)
+            if not any(values):
+                continue
+            if shown < self._max_rows_per_sheet:
+                header = header or values
+                shown += 1
+                yield " | ".join(values)
+            else:
+                omitted.add(row.get("r"), values)
+        if omitted.count:
+            yield omitted.describe(header or [])
+
+
+class _OmittedRows:
+    def __init__(self):
+        self.count = 0
+        self._first: str | None = None
+        self._last: str | None = None
+        self._numbers: dict[int, list[float]] = {}
+        self._texts: dict[int, int] = {}
+
+    def add(self, number: str | None, values: list[str]) -> None:
+        self.count += 1
+        self._first = self._first or number
+        self._last = number
+        for column, value in enumerate(values[:_SUMMARY_COLUMNS]):
+            if not value:
+                continue
+            try:
+                numeric = float(value)
+            except ValueError:
+                self._texts[column] = self._texts.get(column, 0) + 1
+                continue
+            # count, min, max, sum
+            stats = self._numbers.setdefault(column, [0, numeric, numeric, 0.0])
+            stats[0] += 1
+            stats[1] = min(stats[1], numeric)
+            stats[2] = max(stats[2], numeric)
+            stats[3] += numeric
+
+    def describe(self, header: list[str]) -> str:
+        rows = f" (rows {self._first}–{self._last})" if self._first else ""
+        columns = []
+        for column in sorted(self._numbers.keys() | self._texts.keys()):
+            name = (
+                header[column]
+                if column < len(header) and header[column]
+                else f"column {column + 1}"
+            )
+            if column in self._numbers:
+                count, low, high, total = self._numbers[column]
+                columns.append(
+                    f"{name}: {count:.0f} numbers, min {low:g}, max {high:g}, "
+                    f"mean {total / count:g}"
+                )
+            else:
+                columns.append(f"{name}: {self._texts[column]} text values")
+        summary = f"[... {self.count} more rows not shown{rows}"
+        if columns:
+            summary += ". Omitted rows: " + "; ".join(columns)
+        return summary + "]"
+
+
+def _iter_elements(stream: IO[bytes], tags: set[str]) -> Iterator[tuple[str, ET.Element]]:
+    # Потоковый разбор без полного DOM: обработанный элемент сразу удаляется из
+    # дерева, и память не растет с размером документа
+    parents: list[ET.Element] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            if elem.tag in tags:
+                yield event, elem
+            continue
+        parents.pop()
+        if elem.tag in tags:
+            yield event, elem
+            if parents:
+                parents[-1].remove(elem)
+
+
+def _flow_lines(
+    stream: IO[bytes],
+    paragraph_tags: set[str],
+    cell_tag: str,
+    row_tag: str,
+    paragraph_text: Callable[[ET.Element], str],
+) -> Iterator[str]:
+    # Строка таблицы выводится одной линией "ячейка | ячейка"
+    cells: list[list[str]] = []
+    rows: list[list[str]] = []
+    for event, elem in _iter_elements(stream, {*paragraph_tags, cell_tag, row_tag}):
+        if event == "start":
+            if elem.tag == cell_tag:
+                cells.append([])
+            elif elem.tag == row_tag:
+                rows.append([])
+            continue
+
+        if elem.tag == cell_tag:
+            text = " ".join(part for part in cells.pop() if part)
+            if rows:
+                rows[-1].append(text)
+            continue
+        if elem.tag == row_tag:
+            text = " | ".join(rows.pop())
+        else:
+            text = paragraph_text(elem).strip()
+        if cells:
+            cells[-1].append(text)
+        elif text:
+            yield text
+
+
+def _docx_paragraph(elem: ET.Element) -> str:
+    parts = []
+    for node in elem.iter():
+        if node.tag == f"{_W}t":
+            parts.append(node.text or "")
+        elif node.tag == f"{_W}tab":
+            parts.append("\t")
+        elif node.tag in (f"{_W}br", f"{_W}cr"):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _odt_paragraph(elem: ET.Element) -> str:
+    # В ODF табуляции, серии пробелов и переносы строк - отдельные элементы,
+    # а текст после них лежит в tail
+    parts = [elem.text or ""]
+    for child in elem:
+        if child.tag == f"{_TEXT}tab":
+            parts.append("\t")
+        elif child.tag == f"{_TEXT}s":
+            parts.append(" " * int(child.get(f"{_TEXT}c", "1")))
+        elif child.tag == f"{_TEXT}line-break":
+            parts.append("\n")
+        else:
+            parts.append(_odt_paragraph(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _pptx_paragraph(elem: ET.Element) -> str:
+    return "".join(
+        node.text or "" if node.tag == f"{_A}t" else "\n"
+        for node in elem.iter()
+        if node.tag in (f"{_A}t", f"{_A}br")
+    )
+
+
+def _relationships(zf: zipfile.ZipFile, part: str) -> dict[str, str]:
+    folder, name = posixpath.split(part)
+    with zf.open(posixpath.join(folder, "_rels", f"{name}.rels")) as stream:
+        return {
+            elem.get("Id"): _resolve(folder, elem.get("Target", ""))
+            for event, elem in _iter_elements(stream, {f"{_REL}Relationship"})
+            if event == "end"
+        }
+
+
+def _resolve(folder: str, target: str) -> str:
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(folder, target))
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> list[str]:
+    try:
+        stream = zf.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    with stream:
+        return [
+            "".join(node.text or "" for node in elem.iter(f"{_S}t"))
+            for event, elem in _iter_elements(stream, {f"{_S}si"})
+            if event == "end"
+        ]
+
+
+def _row_values(row: ET.Element, shared: list[str]) -> list[str]:
+    values: list[str] = []
+    for cell in row.iter(f"{_S}c"):
+        column = _column_index(cell.get("r"), len(values))
+        values.extend([""] * (column - len(values)))
+        values.append(_cell_value(cell, shared))
+    while values and not values[-1]:
+        values.pop()
+    return values
+
+
+def _column_index(reference: str | None, default: int) -> int:
+    match = _CELL_REF.match(reference or "")
+    if match is None:
+        return default
+    index = 0
+    for letter in match.group(1):
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _cell_value(cell: ET.Element, shared: list[str]) -> str:
+    kind = cell.get("t")
+    if kind == "inlineStr":
+        return "".join(node.text or "" for node in cell.iter(f"{_S}t")).strip()
+    value = cell.findtext(f"{_S}v") or ""
+    if kind == "s":
+        try:
+            return shared[int(value)].strip()
+        except (ValueError, IndexError):
+            return ""
+    if kind == "b":
+        return "TRUE" if value == "1" else "FALSE"
+    return value.strip()
@@ -1,40 +1,181 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
+import numpy as np
 import pdfplumber
 
-from src.domain.models import ContentType, DocumentContent
+from src.core.logger import Logger
+from src.domain.exceptions import DocumentReadError
+from src.domain.models import ContentType, DocumentContent, ImageData, OcrResult
+from src.ocr.cascade import OcrCascade
+from src.ocr.page_cache import OcrPageCache, file_digest, image_digest
+from src.readers.vision import VisionPassThrough
+
+# Страница с меньшим числом символов считается сканом без текстового слоя
+MIN_PAGE_TEXT_CHARS = 50
 
 
 class PdfReader:
     _MIME_TYPE: str = "application/pdf"
 
-    def __init__(self, supported_extensions: list[str] | None = None):
+    def __init__(
+        self,
+        supported_extensions: list[str] | None = None,
+        vision: VisionPassThrough | None = None,
+        ocr: OcrCascade | None = None,
+        page_cache: OcrPageCache | None = None,
+        ocr_dpi: int = 300,
+        ocr_workers: int = 2,
+        llm_confidence_threshold: float = 0.3,
+        logger: Logger | None = None,
+    ):
         self._supported_extensions = supported_extensions or [".pdf"]
+        self._vision = vision
+        self._ocr = ocr
+        self._page_cache = page_cache
+        self._ocr_dpi = ocr_dpi
+        self._ocr_workers = max(1, ocr_workers)
+        self._llm_confidence_threshold = llm_confidence_threshold
+        self._logger = logger
 
     def supports(self, file_path: Path) -> bool:
         return file_path.suffix.lower() in self._supported_extensions
 
     def read(self, file_path: Path) -> DocumentContent:
-        text_content = self._extract_text_from_pdf(file_path)
+        images: list[ImageData] = []
+        text_content = self._extract_text_from_pdf(file_path, images)
 
         return DocumentContent(
             file_path=file_path,
-            content_type=ContentType.TEXT,
+            content_type=ContentType.MULTIMODAL if images else ContentType.TEXT,
             text_content=text_content,
             mime_type="text/plain",
+            images=images,
         )
 
-    def _extract_text_from_pdf(self, file_path: Path) -> str:
+    def _extract_text_from_pdf(self, file_path: Path, images: list[ImageData]) -> str:
         try:
             with pdfplumber.open(file_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                return text.strip()
+                pages: dict[int, str] = {}
+                scanned: list[int] = []
+                for number, page in enumerate(pdf.pages, start=1):
+                    pages[number] = (page.extract_text() or "").strip()
+                    if len(pages[number]) < MIN_PAGE_TEXT_CHARS:
+                        scanned.append(number)
+
+                if scanned:
+                    self._process_scanned_pages(file_path, pdf, scanned, pages, images)
+                return "\n".join(text for _, text in sorted(pages.items()) if text)
         except Exception as e:
-            return f"Error extracting text from PDF {file_path.name}: {str(e)}"
+            raise DocumentReadError(
+                f"Error extracting text from PDF {file_path.name}: {e}"
+            ) from e
+
+    def _process_scanned_pages(
+        self,
+        file_path: Path,
+        pdf,
+        numbers: list[int],
+        pages: dict[int, str],
+        images: list[ImageData],
+    ) -> None:
+        prefers_images = self._vision is not None and self._vision.prefers_images
+        results = {} if prefers_images else self._ocr_pages(file_path, pdf, numbers)
+
+        for number in numbers:
+            result = results.get(number)
+            if result is not None and len(result.text) > len(pages[number]):
+                pages[number] = result.text
+            # Страницы, которые OCR не осилил, передаем модели как изображения
+            if result is None or result.confidence < self._llm_confidence_threshold:
+                self._rasterize(
+                    pdf.pages[number - 1], f"{file_path.name} p.{number}", images
+                )
+
+    def _ocr_pages(
+        self, file_path: Path, pdf, numbers: list[int]
+    ) -> dict[int, OcrResult]:
+        if self._ocr is None:
+            return {}
+
+        self._log(
+            "OCR of {} scanned page(s) in {}", len(numbers), file_path.name, sample="ocr"
+        )
+        file_hash = file_digest(file_path) if self._page_cache is not None else ""
+        results: dict[int, OcrResult] = {}
+        in_flight: dict[Future[OcrResult], tuple[int, list[str]]] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self._ocr_workers, thread_name_prefix="pdf-ocr"
+        ) as pool:
+            for number in numbers:
+                keys: list[str] = []
+                if self._page_cache is not None:
+                    keys.append(OcrPageCache.page_key(file_hash, number))
+                    cached = self._page_cache.get(keys[0])
+                    if cached is not None:
+                        results[number] = cached
+                        continue
+
+                # pypdfium2 не потокобезопасен: рендерим здесь, распознаем в пуле
+                image = self._render(pdf.pages[number - 1])
+                if self._page_cache is not None:
+                    # Страница могла не измениться, даже если изменился сам файл
+                    keys.append(OcrPageCache.image_key(image_digest(image)))
+                    cached = self._page_cache.get(keys[1])
+                    if cached is not None:
+                        results[number] = cached
+                        self._page_cache.put(keys[:1], cached)
+                        continue
+
+                if len(in_flight) >= self._ocr_workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    self._collect(done, in_flight, results)
+                in_flight[pool.submit(self._ocr.recognize, image)] = (number, keys)
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                self._collect(done, in_flight, results)
+
+        return results
+
+    def _collect(
+        self,
+        done: set[Future[OcrResult]],
+        in_flight: dict[Future[OcrResult], tuple[int, list[str]]],
+        results: dict[int, OcrResult],
+    ) -> None:
+        for future in done:
+            number, keys = in_flight.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                self._log("OCR failed on page {}: {}", number, e, warning=True)
+                continue
+            results[number] = result
+            if self._page_cache is not None:
+                self._page_cache.put(keys, result)
+
+    def _render(self, page) -> np.ndarray:
+        rendered = page.to_image(resolution=self._ocr_dpi).original
+        return np.asarray(rendered.convert("L"))
+
+    def _rasterize(self, page, label: str, images: list[ImageData]) -> None:
+        if self._vision is None or len(images) >= self._vision.pdf_max_pages:
+            return
+        image = self._vision.rasterize_page(page, label)
+        if image is not None:
+            images.append(image)
+
+    def _log(
+        self, msg: str, *args, warning: bool = False, sample: str | None = None
+    ) -> None:
+        if self._logger is None:
+            return
+        if warning:
+            self._logger.warning(msg, *args, sample=sample)
+        else:
+            self._logger.info(msg, *args, sample=sample)
 
     def get_supported_extensions(self) -> list[str]:
         return self._supported_extensions
@@ -0,0 +1,225 @@
+import base64
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+
+from src.core.logger import Logger
+from src.domain.models import ContentType, DocumentContent, ImageData
+
+VisionMode = Literal["off", "auto", "always"]
+
+# Ширина, до которой уменьшается изображение для оценки плотности текста
+_DENSITY_SAMPLE_WIDTH = 640
+
+
+def text_density(gray: np.ndarray) -> float:
+    # Доля переходов фон/чернила вдоль строк: у страниц с текстом их много,
+    # у фотографий и схем мало. Считается на прореженном изображении за миллисекунды
+    step = max(1, gray.shape[1] // _DENSITY_SAMPLE_WIDTH)
+    sample = gray[::step, ::step].astype(np.uint8)
+    if sample.size == 0:
+        return 0.0
+
+    ink = sample < _otsu_threshold(sample)
+    return float(np.count_nonzero(ink[:, 1:] != ink[:, :-1])) / ink.size
+
+
+def _otsu_threshold(gray: np.ndarray) -> int:
+    histogram = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    weights = np.cumsum(histogram)
+    means = np.cumsum(histogram * np.arange(256))
+    total = weights[-1]
+
+    background = weights[:-1]
+    foreground = total - background
+    valid = (background > 0) & (foreground > 0)
+    if not valid.any():
+        return int(gray.ravel()[0]) + 1
+
+    mean_bg = means[:-1] / np.where(valid, background, 1)
+    mean_fg = (means[-1] - means[:-1]) / np.where(valid, foreground, 1)
+    variance = np.where(valid, background * foreground * (mean_bg - mean_fg) ** 2, 0)
+    return int(np.argmax(variance)) + 1
+
+
+class PayloadBudget:
+    def __init__(self, limit_bytes: int):
+        self._limit_bytes = limit_bytes
+        self._used_bytes = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, size_bytes: int) -> bool:
+        with self._lock:
+            if self._used_bytes + size_bytes > self._limit_bytes:
+                return False
+            self._used_bytes += size_bytes
+            return True
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+
+_current_budget: ContextVar[PayloadBudget | None] = ContextVar(
+    "payload_budget", default=None
+)
+
+
+class ImageEncoder:
+    def __init__(self, max_pixels: int = 1_200_000, jpeg_quality: int = 80):
+        self._max_pixels = max_pixels
+        self._jpeg_quality = jpeg_quality
+
+    def load(self, file_path: Path) -> np.ndarray | None:
+        import cv2
+
+        # np.fromfile вместо cv2.imread, чтобы не споткнуться о нелатинские пути
+        data = np.fromfile(file_path, dtype=np.uint8)
+        return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+    def to_gray(self, image: np.ndarray) -> np.ndarray:
+        import cv2
+
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    def encode(self, image: np.ndarray) -> ImageData:
+        import cv2
+
+        height, width = image.shape[:2]
+        scale = (self._max_pixels / (height * width)) ** 0.5
+        if scale < 1:
+            size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+        ok, buffer = cv2.imencode(
+            ".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, self._jpeg_quality]
+        )
+        if not ok:
+            raise ValueError("Failed to encode image as JPEG")
+        return ImageData(
+            base64_data=base64.b64encode(buffer.tobytes()).decode("ascii"),
+            mime_type="image/jpeg",
+        )
+
+
+class VisionPassThrough:
+    def __init__(
+        self,
+        encoder: ImageEncoder,
+        supports_vision: Callable[[], bool],
+        logger: Logger,
+        mode: VisionMode = "auto",
+        payload_budget_bytes: int = 20 * 1024 * 1024,
+        density_threshold: float = 0.08,
+        pdf_resolution: int = 150,
+        pdf_max_pages: int = 10,
+    ):
+        self._encoder = encoder
+        self._supports_vision = supports_vision
+        self._logger = logger
+        self._mode = mode
+        self._payload_budget_bytes = payload_budget_bytes
+        self._density_threshold = density_threshold
+        self._pdf_resolution = pdf_resolution
+        self.pdf_max_pages = pdf_max_pages
+        self._active: bool | None = None
+        self._default_budget = PayloadBudget(payload_budget_bytes)
+
+    @property
+    def active(self) -> bool:
+        if self._active is None:
+            self._active = self._mode != "off" and self._supports_vision()
+            if self._mode != "off" and not self._active:
+                self._logger.warning(
+                    "Model does not accept images, falling back to local OCR"
+                )
+        return self._active
+
+    @property
+    def prefers_images(self) -> bool:
+        return self._mode == "always" and self.active
+
+    @contextmanager
+    def budget_scope(self) -> Iterator[PayloadBudget]:
+        budget = PayloadBudget(self._payload_budget_bytes)
+        token = _current_budget.set(budget)
+        try:
+            yield budget
+        finally:
+            _current_budget.reset(token)
+            if budget.used_bytes:
+                self._logger.info(
+                    f"Images sent to the model: {budget.used_bytes / 1024:.0f} KiB"
+                )
+
+    def read_image(self, file_path: Path, force: bool = False) -> DocumentContent | None:
+        if not self.active:
+            return None
+
+        image = self._encoder.load(file_path)
+        if image is None:
+            return None
+
+        if self._mode == "auto" and not force:
+            density = text_density(self._encoder.to_gray(image))
+            if density >= self._density_threshold:
+                self._logger.debug(
+                    "{}: text density {:.3f}, using local OCR",
+                    file_path.name,
+                    density,
+                    sample="vision",
+                )
+                return None
+
+        encoded = self._reserve(self._encoder.encode(image), file_path.name)
+        if encoded is None:
+            return None
+        return DocumentContent(
+            file_path=file_path,
+            content_type=ContentType.MULTIMODAL,
+            base64_data=encoded.base64_data,
+            mime_type=encoded.mime_type,
+        )
+
+    def rasterize_page(self, page: Any, label: str) -> ImageData | None:
+        if not self.active:
+            return None
+
+        # pdfplumber отдает PIL-изображение в RGB, OpenCV работает в BGR.
+        # Бюджет здесь не расходуется: PDF читается в воркере с копией бюджета,
+        # страницы учитываются в родителе через admit
+        rendered = page.to_image(resolution=self._pdf_resolution).original
+        image = np.ascontiguousarray(np.asarray(rendered.convert("RGB"))[:, :, ::-1])
+        return self._encoder.encode(image)
+
+    def admit(self, content: DocumentContent) -> DocumentContent:
+        if not content.images:
+            return content
+        name = content.file_path.name
+        admitted = [
+            image
+            for number, image in enumerate(content.images, start=1)
+            if self._reserve(image, f"{name} image {number}") is not None
+        ]
+        if len(admitted) == len(content.images):
+            return content
+        return content.model_copy(
+            update={
+                "images": admitted,
+                "content_type": (
+                    ContentType.MULTIMODAL if admitted else ContentType.TEXT
+                ),
+            }
+        )
+
+    def _reserve(self, image: ImageData, label: str) -> ImageData | None:
+        budget = _current_budget.get() or self._default_budget
+        if not budget.reserve(len(image.base64_data)):
+            self._logger.info(f"Payload budget exhausted, not sending image of {label}")
+            return None
+        return image
@@ -0,0 +1,21 @@
+from src.retrieval.chunker import TextChunker
+from src.retrieval.contracts import Embedder
+from src.retrieval.embedders import (
+    HashingEmbedder,
+    SentenceTransformerEmbedder,
+    create_embedder,
+)
+from src.retrieval.fulltext import FullTextIndex
+from src.retrieval.index import VectorIndex
+from src.retrieval.retriever import Retriever
+
+__all__ = [
+    "Embedder",
+    "HashingEmbedder",
+    "SentenceTransformerEmbedder",
+    "create_embedder",
+    "TextChunker",
+    "VectorIndex",
+    "FullTextIndex",
+    "Retriever",
+]
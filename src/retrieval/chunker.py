@@ -0,0 +1,39 @@
+import re
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+
+class TextChunker:
+    def __init__(self, chunk_chars: int = 1500, overlap_chars: int = 200):
+        if overlap_chars >= chunk_chars:
+            raise ValueError("overlap_chars must be smaller than chunk_chars")
+        self._chunk_chars = chunk_chars
+        self._overlap_chars = overlap_chars
+
+    def split(self, text: str) -> list[str]:
+        chunks: list[str] = []
+        current = ""
+
+        for paragraph in self._paragraphs(text):
+            if current and len(current) + len(paragraph) + 2 > self._chunk_chars:
+                chunks.append(current)
+                current = current[-self._overlap_chars :] if self._overlap_chars else ""
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+
+        if current.strip():
+            chunks.append(current)
+        return chunks
+
+    def _paragraphs(self, text: str) -> list[str]:
+        paragraphs = []
+        for paragraph in _PARAGRAPH_RE.split(text):
+            paragraph = paragraph.strip()
+            # Слишком длинные абзацы (например, страница PDF без пустых строк) режем
+            # Перекрытие добавит split(), поэтому куски берём без него
+            step = max(1, self._chunk_chars - self._overlap_chars - 2)
+            while len(paragraph) > step:
+                paragraphs.append(paragraph[:step])
+                paragraph = paragraph[step:]
+            if paragraph:
+                paragraphs.append(paragraph)
+        return paragraphs
@@ -0,0 +1,78 @@
+import re
+import zlib
+
+import numpy as np
+
+from src.retrieval.contracts import Embedder
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class HashingEmbedder:
+    def __init__(self, dimension: int = 2048, use_bigrams: bool = True):
+        self.dimension = dimension
+        self._use_bigrams = use_bigrams
+        self.name = f"hashing-{dimension}{'-bigrams' if use_bigrams else ''}"
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        rows, columns, signs = [], [], []
+        for row, text in enumerate(texts):
+            hashes = self._feature_hashes(text)
+            rows.append(np.full(len(hashes), row, dtype=np.int64))
+            columns.append(hashes % self.dimension)
+            # Старший бит хеша задаёт знак, чтобы коллизии гасили друг друга
+            signs.append(np.where(hashes >> 31, -1.0, 1.0).astype(np.float32))
+
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        if rows:
+            np.add.at(
+                matrix,
+                (np.concatenate(rows), np.concatenate(columns)),
+                np.concatenate(signs),
+            )
+
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+    def _feature_hashes(self, text: str) -> np.ndarray:
+        tokens = _TOKEN_RE.findall(text.lower())
+        features = tokens
+        if self._use_bigrams:
+            features = tokens + [
+                f"{a} {b}" for a, b in zip(tokens[:-1], tokens[1:], strict=True)
+            ]
+        return np.fromiter(
+            (zlib.crc32(feature.encode("utf-8")) for feature in features),
+            dtype=np.int64,
+            count=len(features),
+        )
+
+
+class SentenceTransformerEmbedder:
+    def __init__(self, model_name: str, batch_size: int = 32):
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model_name, device="cpu")
+        self._batch_size = batch_size
+        self.dimension = self._model.get_sentence_embedding_dimension()
+        self.name = f"sentence-transformers:{model_name}"
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        vectors = self._model.encode(
+            texts,
+            batch_size=self._batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+        return vectors.astype(np.float32)
+
+
+def create_embedder(name: str) -> Embedder:
+    if name == "hashing":
+        return HashingEmbedder()
+    if name.startswith("sentence-transformers:"):
+        return SentenceTransformerEmbedder(name.split(":", 1)[1])
+    raise ValueError(
+        f"Unknown embedder: {name}. Use 'hashing' or 'sentence-transformers:<model>'."
+    )
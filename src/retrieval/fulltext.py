@@ -0,0 +1,188 @@
+import re
+import sqlite3
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from src.core.archives import file_stat
+from src.core.document_store import DocumentStore
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.domain.exceptions import SearchQueryError
+from src.domain.models import ContentType, Document, DocumentContent, SearchHit
+
+DocumentLoader = Callable[[list[Path]], DocumentStore]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5(
+    path UNINDEXED,
+    content,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class FullTextIndex:
+    def __init__(self, db_path: Path, scanner: FolderScanner, logger: Logger):
+        self._db_path = Path(db_path)
+        self._scanner = scanner
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def update(self, folder: Path, load_documents: DocumentLoader) -> int:
+        folder = folder.resolve()
+        current = self._fingerprints(folder)
+        indexed = self._indexed_files(folder)
+
+        removed = indexed.keys() - current.keys()
+        changed = sorted(path for path, fp in current.items() if indexed.get(path) != fp)
+        if not removed and not changed:
+            self._logger.info(f"Full-text index is up to date for {folder}")
+            return 0
+
+        self._logger.info(
+            f"Updating full-text index: {len(changed)} changed, {len(removed)} removed"
+        )
+        # Извлекаем текст только из новых и изменившихся файлов
+        loaded = load_documents([Path(p) for p in changed])
+        documents = {str(doc.path): doc for doc in loaded}
+        settled = {str(path) for path in loaded.settled_paths}
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for path in [*removed, *changed]:
+                    conn.execute("DELETE FROM documents WHERE path = ?", (path,))
+                    conn.execute("DELETE FROM files WHERE path = ?", (path,))
+                for path in changed:
+                    # Непрочитанный из-за ошибки файл не запоминаем: его попробуем
+                    # извлечь снова. Пропущенные и дубли запоминаются без текста
+                    if path not in settled:
+                        continue
+                    text = self._document_text(documents.get(path))
+                    conn.execute(
+                        "INSERT INTO files (path, size, mtime_ns) VALUES (?, ?, ?)",
+                        (path, *current[path]),
+                    )
+                    if text:
+                        conn.execute(
+                            "INSERT INTO documents (path, content) VALUES (?, ?)",
+                            (path, text),
+                        )
+        return len(changed) + len(removed)
+
+    def search(
+        self, query: str, folder: Path | None = None, limit: int = 50
+    ) -> list[SearchHit]:
+        if not query.strip():
+            raise SearchQueryError("Search query is empty.")
+
+        try:
+            rows = self._query(query, folder, limit)
+        except sqlite3.OperationalError:
+            # Пользовательский ввод вроде "купли-продажи" не является валидным FTS5;
+            # в этом случае ищем все слова как обычные термины
+            quoted = " ".join(f'"{token}"' for token in _TOKEN_RE.findall(query))
+            if not quoted:
+                raise SearchQueryError(f"Invalid search query: {query}") from None
+            rows = self._query(quoted, folder, limit)
+
+        return [
+            SearchHit(path=Path(path), score=-rank, snippet=snippet)
+            for path, rank, snippet in rows
+        ]
+
+    def get_documents(self, paths: list[Path]) -> list[Document]:
+        documents = []
+        with self._lock:
+            conn = self._connection()
+            for path in paths:
+                row = conn.execute(
+                    "SELECT content FROM documents WHERE path = ?", (str(path),)
+                ).fetchone()
+                if row is None:
+                    continue
+                documents.append(
+                    Document(
+                        path=path,
+                        size_bytes=len(row[0].encode("utf-8")),
+                        content=DocumentContent(
+                            file_path=path,
+                            content_type=ContentType.TEXT,
+                            text_content=row[0],
+                        ),
+                    )
+                )
+        return documents
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _query(
+        self, match: str, folder: Path | None, limit: int
+    ) -> list[tuple[str, float, str]]:
+        sql = (
+            "SELECT path, bm25(documents), "
+            "snippet(documents, 1, '[', ']', ' … ', 12) "
+            "FROM documents WHERE documents MATCH ?"
+        )
+        params: list = [match]
+        if folder is not None:
+            sql += " AND path >= ? AND path < ?"
+            params.extend(self._prefix_range(folder.resolve()))
+        sql += " ORDER BY bm25(documents) LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def _indexed_files(self, folder: Path) -> dict[str, tuple[int, int]]:
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT path, size, mtime_ns FROM files WHERE path >= ? AND path < ?",
+                    self._prefix_range(folder),
+                )
+                .fetchall()
+            )
+        return {path: (size, mtime_ns) for path, size, mtime_ns in rows}
+
+    def _fingerprints(self, folder: Path) -> dict[str, tuple[int, int]]:
+        fingerprints = {}
+        for path in self._scanner.scan(folder):
+            try:
+                stat = file_stat(path)
+            except OSError:
+                continue
+            fingerprints[str(path)] = (stat.st_size, stat.st_mtime_ns)
+        return fingerprints
+
+    def _document_text(self, document: Document | None) -> str:
+        if document is None:
+            return ""
+        return document.content.text_content or ""
+
+    def _prefix_range(self, folder: Path) -> tuple[str, str]:
+        # Все пути внутри папки лежат в диапазоне ["folder/", "folder0")
+        prefix = str(folder).rstrip("/") + "/"
+        return prefix, prefix[:-1] + chr(ord("/") + 1)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
@@ -0,0 +1,99 @@
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from src.domain.models import TextChunk
+
+FileFingerprint = tuple[int, int]
+
+
+class VectorIndex:
+    VECTORS_FILE = "vectors.npy"
+    CHUNKS_FILE = "chunks.jsonl"
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, index_dir: Path, embedder_name: str, dimension: int):
+        self._index_dir = index_dir
+        self._embedder_name = embedder_name
+        self._dimension = dimension
+        self._vectors = np.zeros((0, dimension), dtype=np.float32)
+        self._chunks: list[TextChunk] = []
+        self._files: dict[str, FileFingerprint] = {}
+
+    @property
+    def files(self) -> dict[str, FileFingerprint]:
+        return dict(self._files)
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def load(self) -> bool:
+        manifest_path = self._index_dir / self.MANIFEST_FILE
+        if not manifest_path.exists():
+            return False
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if (
+            manifest.get("embedder") != self._embedder_name
+            or manifest.get("dimension") != self._dimension
+        ):
+            return False
+
+        # mmap: при повторных запросах матрица не читается в память целиком
+        self._vectors = np.load(self._index_dir / self.VECTORS_FILE, mmap_mode="r")
+        with open(self._index_dir / self.CHUNKS_FILE, encoding="utf-8") as f:
+            self._chunks = [TextChunk.model_validate_json(line) for line in f]
+        self._files = {path: tuple(fp) for path, fp in manifest["files"].items()}
+        return len(self._chunks) == len(self._vectors)
+
+    def save(self) -> None:
+        tmp_dir = self._index_dir.with_name(self._index_dir.name + ".tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        np.save(tmp_dir / self.VECTORS_FILE, np.asarray(self._vectors, dtype=np.float32))
+        with open(tmp_dir / self.CHUNKS_FILE, "w", encoding="utf-8") as f:
+            for chunk in self._chunks:
+                f.write(chunk.model_dump_json() + "\n")
+        manifest = {
+            "embedder": self._embedder_name,
+            "dimension": self._dimension,
+            "files": self._files,
+        }
+        (tmp_dir / self.MANIFEST_FILE).write_text(json.dumps(manifest), encoding="utf-8")
+
+        shutil.rmtree(self._index_dir, ignore_errors=True)
+        tmp_dir.rename(self._index_dir)
+        self._vectors = np.load(self._index_dir / self.VECTORS_FILE, mmap_mode="r")
+
+    def remove_files(self, paths: set[str]) -> None:
+        if not paths:
+            return
+        keep = [i for i, chunk in enumerate(self._chunks) if str(chunk.path) not in paths]
+        self._vectors = np.asarray(self._vectors[keep], dtype=np.float32)
+        self._chunks = [self._chunks[i] for i in keep]
+        for path in paths:
+            self._files.pop(path, None)
+
+    def add_file(
+        self, path: str, fingerprint: FileFingerprint, chunks: list[TextChunk], vectors
+    ) -> None:
+        self._files[path] = fingerprint
+        if not chunks:
+            return
+        self._vectors = np.vstack([self._vectors, vectors.astype(np.float32)])
+        self._chunks.extend(chunks)
+
+    def search(
+        self, query_vector: np.ndarray, top_k: int
+    ) -> list[tuple[TextChunk, float]]:
+        if not self._chunks or top_k <= 0:
+            return []
+
+        scores = np.asarray(self._vectors @ query_vector.astype(np.float32))
+        top_k = min(top_k, len(scores))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        return [(self._chunks[i], float(scores[i])) for i in best]
@@ -0,0 +1,135 @@
+import hashlib
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from src.core.archives import file_stat
+from src.core.document_store import DocumentStore
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.domain.models import ContentType, Document, DocumentContent, TextChunk
+from src.retrieval.chunker import TextChunker
+from src.retrieval.contracts import Embedder
+from src.retrieval.index import FileFingerprint, VectorIndex
+
+DocumentLoader = Callable[[list[Path]], DocumentStore]
+
+
+class Retriever:
+    EMBED_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        scanner: FolderScanner,
+        embedder: Embedder,
+        chunker: TextChunker,
+        logger: Logger,
+        index_root: Path,
+    ):
+        self._scanner = scanner
+        self._embedder = embedder
+        self._chunker = chunker
+        self._logger = logger
+        self._index_root = Path(index_root)
+
+    def retrieve(
+        self, folder: Path, query: str, top_k: int, load_documents: DocumentLoader
+    ) -> list[Document]:
+        index = self.update_index(folder, load_documents)
+
+        query_vector = self._embedder.embed([query])[0]
+        hits = index.search(query_vector, top_k)
+        self._logger.info(
+            f"Selected {len(hits)} of {len(index)} chunk(s) relevant to the prompt"
+        )
+        return self._to_documents([chunk for chunk, _ in hits])
+
+    def update_index(self, folder: Path, load_documents: DocumentLoader) -> VectorIndex:
+        folder = folder.resolve()
+        index = VectorIndex(
+            self._index_dir(folder), self._embedder.name, self._embedder.dimension
+        )
+        if not index.load():
+            self._logger.info(f"Building new semantic index for {folder}")
+
+        current = self._fingerprints(folder)
+        indexed = index.files
+        removed = indexed.keys() - current.keys()
+        changed = [path for path, fp in current.items() if indexed.get(path) != fp]
+
+        if not removed and not changed:
+            self._logger.info(f"Semantic index is up to date ({len(index)} chunk(s))")
+            return index
+
+        self._logger.info(
+            f"Updating semantic index: {len(changed)} changed, {len(removed)} removed"
+        )
+        index.remove_files(removed | set(changed))
+
+        # Извлекаем текст только из новых и изменившихся файлов
+        loaded = load_documents([Path(p) for p in changed])
+        documents = {str(doc.path): doc for doc in loaded}
+        settled = {str(path) for path in loaded.settled_paths}
+        for path in changed:
+            # Непрочитанный из-за ошибки файл не запоминаем: его попробуем извлечь
+            # снова. Пропущенные и дубли запоминаются без фрагментов
+            if path not in settled:
+                continue
+            chunks = self._chunk(documents.get(path))
+            index.add_file(path, current[path], chunks, self._embed(chunks))
+
+        index.save()
+        return index
+
+    def _chunk(self, document: Document | None) -> list[TextChunk]:
+        if document is None or not document.content.text_content:
+            return []
+        return [
+            TextChunk(path=document.path, index=i, text=text)
+            for i, text in enumerate(self._chunker.split(document.content.text_content))
+        ]
+
+    def _embed(self, chunks: list[TextChunk]) -> np.ndarray | None:
+        texts = [chunk.text for chunk in chunks]
+        batches = [
+            self._embedder.embed(texts[i : i + self.EMBED_BATCH_SIZE])
+            for i in range(0, len(texts), self.EMBED_BATCH_SIZE)
+        ]
+        return np.vstack(batches) if batches else None
+
+    def _to_documents(self, chunks: list[TextChunk]) -> list[Document]:
+        by_path: dict[Path, list[TextChunk]] = defaultdict(list)
+        for chunk in chunks:
+            by_path[chunk.path].append(chunk)
+
+        documents = []
+        for path in sorted(by_path):
+            # Фрагменты идут в порядке документа, а не по убыванию релевантности
+            parts = sorted(by_path[path], key=lambda chunk: chunk.index)
+            text = "\n[...]\n".join(chunk.text for chunk in parts)
+            documents.append(
+                Document(
+                    path=path,
+                    size_bytes=len(text.encode("utf-8")),
+                    content=DocumentContent(
+                        file_path=path, content_type=ContentType.TEXT, text_content=text
+                    ),
+                )
+            )
+        return documents
+
+    def _fingerprints(self, folder: Path) -> dict[str, FileFingerprint]:
+        fingerprints = {}
+        for path in self._scanner.scan(folder):
+            try:
+                stat = file_stat(path)
+            except OSError:
+                continue
+            fingerprints[str(path)] = (stat.st_size, stat.st_mtime_ns)
+        return fingerprints
+
+    def _index_dir(self, folder: Path) -> Path:
+        key = hashlib.sha1(str(folder).encode("utf-8")).hexdigest()[:16]
+        return self._index_root / f"{folder.name}-{key}"
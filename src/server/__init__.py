@@ -0,0 +1,4 @@
+from src.server.api import SummaryHTTPServer, SummaryUnixServer, create_server
+from src.server.service import SummaryService
+
+__all__ = ["SummaryService", "SummaryHTTPServer", "SummaryUnixServer", "create_server"]
@@ -0,0 +1,164 @@
+import json
+import os
+import socketserver
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from src.core.logger import Logger
+from src.domain.exceptions import ServiceBusyError
+from src.domain.models import JobStatus, SummaryTask
+from src.server.service import SummaryService
+
+
+class SubmitRequest(BaseModel):
+    folder: Path | None = None
+    files: list[Path] | None = None
+    prompt: str | None = None
+    skill: str | None = None
+
+
+class SummaryRequestHandler(BaseHTTPRequestHandler):
+    server_version = "AIDocumentSummarizer/1.0"
+    protocol_version = "HTTP/1.1"
+    MAX_BODY_BYTES = 1024 * 1024
+
+    @property
+    def service(self) -> SummaryService:
+        return self.server.service  # type: ignore[attr-defined]
+
+    @property
+    def logger(self) -> Logger:
+        return self.server.logger  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:
+        parts = self._path_parts()
+
+        if parts == ["health"]:
+            self._send_json(HTTPStatus.OK, {"status": "ok", **self.service.stats()})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            self._get_task(parts[1])
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "summary":
+            self._get_summary(parts[1])
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+
+    def do_POST(self) -> None:
+        if self._path_parts() != ["jobs"]:
+            self._send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return
+
+        try:
+            request = SubmitRequest.model_validate(self._read_json())
+            task = self.service.submit(
+                request.folder, request.files, request.prompt, request.skill
+            )
+        except (ValueError, ValidationError, FileNotFoundError) as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        except ServiceBusyError as e:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+            return
+
+        self._send_json(HTTPStatus.ACCEPTED, self._task_payload(task))
+
+    def log_message(self, format: str, *args) -> None:
+        self.logger.debug(f"{self.address_string()} - {format % args}")
+
+    def address_string(self) -> str:
+        # Для Unix-сокета client_address - пустая строка
+        if isinstance(self.client_address, tuple):
+            return str(self.client_address[0])
+        return "unix"
+
+    def _get_task(self, task_id: str) -> None:
+        task = self.service.get(task_id)
+        if task is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job: {task_id}")
+            return
+        self._send_json(HTTPStatus.OK, self._task_payload(task))
+
+    def _get_summary(self, task_id: str) -> None:
+        task = self.service.get(task_id)
+        if task is None:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown job: {task_id}")
+        elif task.status == JobStatus.FAILED:
+            self._send_error(HTTPStatus.CONFLICT, f"Job failed: {task.error}")
+        elif task.status != JobStatus.DONE:
+            self._send_error(HTTPStatus.CONFLICT, f"Job is {task.status.value}")
+        else:
+            self._send_body(
+                HTTPStatus.OK, (task.summary or "").encode("utf-8"), "text/markdown"
+            )
+
+    def _path_parts(self) -> list[str]:
+        path = self.path.split("?", 1)[0]
+        return [part for part in path.split("/") if part]
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > self.MAX_BODY_BYTES:
+            raise ValueError("Request body too large.")
+        body = self.rfile.read(length) if length else b"{}"
+        try:
+            data = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object.")
+        return data
+
+    def _task_payload(self, task: SummaryTask) -> dict:
+        return task.model_dump(mode="json", exclude={"summary"})
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _send_json(self, status: HTTPStatus, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._send_body(status, body, "application/json")
+
+    def _send_body(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SummaryHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: SummaryService, logger: Logger):
+        self.service = service
+        self.logger = logger
+        super().__init__(address, SummaryRequestHandler)
+
+
+class SummaryUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, service: SummaryService, logger: Logger):
+        self.service = service
+        self.logger = logger
+        if socket_path.exists():
+            os.unlink(socket_path)
+        super().__init__(str(socket_path), SummaryRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)
+
+
+def create_server(
+    service: SummaryService,
+    logger: Logger,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    if socket_path is not None:
+        return SummaryUnixServer(socket_path, service, logger)
+    return SummaryHTTPServer((host, port), service, logger)
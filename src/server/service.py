@@ -0,0 +1,172 @@
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+from src.core.document_service import DocumentService
+from src.core.logger import Logger
+from src.core.prompt_manager import PromptManager
+from src.core.summary_generator import SummaryGenerator
+from src.domain.exceptions import ServiceBusyError
+from src.domain.models import JobStatus, SummaryTask
+from src.skills.engine import SkillEngine
+
+_STOP = object()
+
+
+class SummaryService:
+    def __init__(
+        self,
+        prompt_manager: PromptManager,
+        document_service: DocumentService,
+        summary_generator: SummaryGenerator,
+        logger: Logger,
+        workers: int = 2,
+        queue_size: int = 100,
+        max_finished: int = 1000,
+        skill_engine: SkillEngine | None = None,
+    ):
+        self._prompt_manager = prompt_manager
+        self._document_service = document_service
+        self._summary_generator = summary_generator
+        self._logger = logger
+        self._workers = max(1, workers)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._max_finished = max_finished
+        self._skill_engine = skill_engine
+        self._tasks: OrderedDict[str, SummaryTask] = OrderedDict()
+        self._tasks_lock = threading.Lock()
+        self._prompt_lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        if self._threads:
+            return
+
+        for index in range(self._workers):
+            thread = threading.Thread(
+                target=self._worker_loop, name=f"summary-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        self._logger.info(f"Summary service started with {self._workers} worker(s)")
+
+    def stop(self, timeout: float | None = None) -> None:
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+        self._logger.info("Summary service stopped")
+
+    def submit(
+        self,
+        folder: Path | None = None,
+        files: list[Path] | None = None,
+        prompt_name: str | None = None,
+        skill_name: str | None = None,
+    ) -> SummaryTask:
+        if (folder is None) == (not files):
+            raise ValueError("Exactly one of 'folder' or 'files' must be provided.")
+        if folder is not None and not folder.is_dir():
+            raise FileNotFoundError(f"Folder not found: {folder}")
+
+        task = SummaryTask(
+            id=uuid.uuid4().hex,
+            folder=folder,
+            files=files or [],
+            prompt=prompt_name,
+            skill=skill_name,
+            created_at=time.time(),
+        )
+
+        with self._tasks_lock:
+            try:
+                self._queue.put_nowait(task.id)
+            except queue.Full as e:
+                raise ServiceBusyError("Request queue is full, try again later.") from e
+            self._tasks[task.id] = task
+
+        self._logger.info(f"[{task.id}] Accepted ({self._queue.qsize()} queued)")
+        return task.model_copy()
+
+    def get(self, task_id: str) -> SummaryTask | None:
+        with self._tasks_lock:
+            task = self._tasks.get(task_id)
+            return task.model_copy() if task else None
+
+    def stats(self) -> dict[str, int]:
+        with self._tasks_lock:
+            statuses = [task.status for task in self._tasks.values()]
+        return {
+            "workers": self._workers,
+            "queued": statuses.count(JobStatus.PENDING),
+            "running": statuses.count(JobStatus.RUNNING),
+            "done": statuses.count(JobStatus.DONE),
+            "failed": statuses.count(JobStatus.FAILED),
+        }
+
+    def _worker_loop(self) -> None:
+        while (task_id := self._queue.get()) is not _STOP:
+            try:
+                self._process(task_id)
+            finally:
+                self._queue.task_done()
+        self._queue.task_done()
+
+    def _process(self, task_id: str) -> None:
+        task = self._update(task_id, status=JobStatus.RUNNING, started_at=time.time())
+        if task is None:
+            return
+
+        try:
+            summary = self._summarize(task)
+        except Exception as e:
+            self._logger.error(f"[{task_id}] Failed: {e}")
+            self._finish(task_id, status=JobStatus.FAILED, error=str(e))
+            return
+
+        self._finish(task_id, status=JobStatus.DONE, summary=summary)
+        self._logger.info(f"[{task_id}] Done")
+
+    def _summarize(self, task: SummaryTask) -> str:
+        with self._prompt_lock:
+            prompt = self._prompt_manager.select(task.prompt, task.skill)
+
+        if task.folder is not None:
+            documents = self._document_service.get_documents(task.folder)
+        else:
+            documents = self._document_service.get_documents_from_files(task.files)
+
+        if not documents:
+            return "Не удалось сгенерировать саммари: нет поддерживаемых документов."
+        if self._skill_engine is None:
+            return self._summary_generator.generate(documents, prompt)
+        documents = self._skill_engine.run_pre(task.skill, documents)
+        summary = self._summary_generator.generate(documents, prompt)
+        return self._skill_engine.run_post(task.skill, summary, documents)
+
+    def _finish(self, task_id: str, **changes) -> None:
+        self._update(task_id, finished_at=time.time(), **changes)
+        self._evict_finished()
+
+    def _update(self, task_id: str, **changes) -> SummaryTask | None:
+        with self._tasks_lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            for field, value in changes.items():
+                setattr(task, field, value)
+            return task.model_copy()
+
+    def _evict_finished(self) -> None:
+        with self._tasks_lock:
+            finished = [
+                task_id
+                for task_id, task in self._tasks.items()
+                if task.status in (JobStatus.DONE, JobStatus.FAILED)
+            ]
+            for task_id in finished[: max(0, len(finished) - self._max_finished)]:
+                del self._tasks[task_id]
@@ -1,6 +1,12 @@
+from enum import Enum
 from typing import Any, Protocol
 
 
+class SkillStage(str, Enum):
+    PRE = "pre"
+    POST = "post"
+
+
 class Skill(Protocol):
     name: str
     description: str
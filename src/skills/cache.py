@@ -0,0 +1,73 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS skill_results (
+    key TEXT PRIMARY KEY,
+    result BLOB NOT NULL,
+    used REAL NOT NULL
+);
+"""
+
+
+class SkillResultCache:
+    def __init__(self, db_path: Path, max_entries: int = 256):
+        self._db_path = Path(db_path)
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT result FROM skill_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE skill_results SET used = ? WHERE key = ?", (time.time(), key)
+                )
+        return pickle.loads(row[0])
+
+    def put(self, key: str, result: Any) -> None:
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO skill_results (key, result, used) "
+                    "VALUES (?, ?, ?)",
+                    (key, blob, time.time()),
+                )
+                # Давно не использованные результаты вытесняются
+                conn.execute(
+                    "DELETE FROM skill_results WHERE key NOT IN "
+                    "(SELECT key FROM skill_results ORDER BY used DESC LIMIT ?)",
+                    (self._max_entries,),
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # Соединение унаследовано от родителя через fork: им нельзя пользоваться
+            self._conn = None
+            self._pid = os.getpid()
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
@@ -0,0 +1,297 @@
+import contextlib
+import hashlib
+import importlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from src.core.logger import Logger
+from src.domain.exceptions import SkillError, SkillLoadError, SkillTimeoutError
+from src.domain.models import Document
+from src.skills.base import Skill, SkillStage
+from src.skills.cache import SkillResultCache
+from src.skills.registry import SkillConfig, SkillRegistry
+
+_START_METHOD = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _load_skill_class(module_name: str, class_name: str) -> type:
+    try:
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)
+    except (ImportError, AttributeError) as e:
+        raise SkillLoadError(f"Cannot load skill {module_name}.{class_name}: {e}") from e
+
+
+def _serve(conn: Connection) -> None:
+    # Ctrl-C обрабатывает родитель: он сам остановит воркер
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        _serve_requests(conn)
+    finally:
+        Logger.flush()
+
+
+def _serve_requests(conn: Connection) -> None:
+    # Экземпляры навыков живут в воркере между вызовами, импорт - при первом вызове
+    skills: dict[tuple[str, str], Skill] = {}
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+
+        module_name, class_name, context = request
+        try:
+            key = (module_name, class_name)
+            if key not in skills:
+                skills[key] = _load_skill_class(module_name, class_name)()
+            conn.send(("ok", skills[key].execute(context)))
+        except SkillLoadError as e:
+            conn.send(("load_error", str(e)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+def _module_fingerprint(module_name: str) -> list[int]:
+    # Правка кода навыка делает сохраненные результаты недействительными
+    try:
+        spec = importlib.util.find_spec(module_name)
+        stat = os.stat(spec.origin) if spec and spec.origin else None
+    except (ImportError, ValueError, OSError):
+        stat = None
+    return [stat.st_mtime_ns, stat.st_size] if stat else []
+
+
+class _SkillWorker:
+    def __init__(self):
+        context = multiprocessing.get_context(_START_METHOD)
+        self.conn, child_conn = context.Pipe()
+        self.process: BaseProcess = context.Process(
+            target=_serve, args=(child_conn,), name="skill-worker", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self, graceful: bool = False, grace_seconds: float = 1.0) -> None:
+        if graceful:
+            with contextlib.suppress(OSError):
+                self.conn.send(None)
+            self.process.join(timeout=grace_seconds)
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+@dataclass
+class SkillStats:
+    calls: int = 0
+    cache_hits: int = 0
+    total_seconds: float = 0.0
+
+
+class SkillEngine:
+    def __init__(
+        self,
+        skill_registry: SkillRegistry,
+        logger: Logger,
+        max_workers: int = 2,
+        timeout_seconds: float = 300.0,
+        cache: SkillResultCache | None = None,
+        poll_interval: float = 0.1,
+    ):
+        self._registry = skill_registry
+        self._logger = logger
+        self._max_workers = max(1, max_workers)
+        self._timeout_seconds = timeout_seconds
+        self._cache = cache
+        self._poll_interval = poll_interval
+        self._available = threading.Condition()
+        self._idle: list[_SkillWorker] = []
+        self._busy = 0
+        self.stats: dict[str, SkillStats] = {}
+
+    def run_pre(
+        self, skill_name: str | None, documents: Sequence[Document]
+    ) -> Sequence[Document]:
+        config = self._staged_skill(skill_name, SkillStage.PRE)
+        if config is None:
+            return documents
+
+        # Навыку нужен обычный список, даже если документы выгружены на диск
+        context = {"stage": SkillStage.PRE.value, "documents": list(documents)}
+        result = self._run(config, context)
+        if result is None:
+            return documents
+        if not isinstance(result, list) or not all(
+            isinstance(doc, Document) for doc in result
+        ):
+            raise SkillError(f"Skill '{config.name}' must return a list of documents.")
+        return result
+
+    def run_post(
+        self, skill_name: str | None, summary: str, documents: Sequence[Document]
+    ) -> str:
+        config = self._staged_skill(skill_name, SkillStage.POST)
+        if config is None:
+            return summary
+
+        context = {
+            "stage": SkillStage.POST.value,
+            "summary": summary,
+            "documents": list(documents),
+        }
+        result = self._run(config, context)
+        if result is None:
+            return summary
+        if not isinstance(result, str):
+            raise SkillError(f"Skill '{config.name}' must return the summary text.")
+        return result
+
+    def shutdown(self) -> None:
+        with self._available:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop(graceful=True)
+        if self._cache is not None:
+            self._cache.close()
+
+    def _staged_skill(
+        self, skill_name: str | None, stage: SkillStage
+    ) -> SkillConfig | None:
+        if not skill_name:
+            return None
+        self._registry.load()
+        config = self._registry.get(skill_name)
+        if config is None or config.stage != stage.value:
+            return None
+        return config
+
+    def _run(self, config: SkillConfig, context: dict[str, Any]) -> Any:
+        context = {**context, "config": config.config}
+        stats = self.stats.setdefault(config.name, SkillStats())
+        cache_key = self._cache_key(config, context)
+
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                stats.cache_hits += 1
+                self._logger.info(f"Skill '{config.name}': cached result reused")
+                return cached
+
+        timeout = config.timeout or self._timeout_seconds
+        started = time.perf_counter()
+        try:
+            result = self._execute(config, context, timeout)
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.calls += 1
+            stats.total_seconds += elapsed
+
+        self._logger.info(f"Skill '{config.name}' ({config.stage}) took {elapsed:.2f}s")
+        if self._cache is not None and result is not None:
+            self._cache.put(cache_key, result)
+        return result
+
+    def _execute(
+        self, config: SkillConfig, context: dict[str, Any], timeout: float
+    ) -> Any:
+        # Навык выполняется в отдельном процессе: зависший навык по таймауту
+        # убивается вместе с процессом, а следующий вызов получит новый воркер
+        worker = self._acquire()
+        try:
+            worker.conn.send((config.module, config.class_name, context))
+            status, payload = self._wait(worker, config, timeout)
+        except BaseException:
+            worker.stop()
+            worker = None
+            raise
+        finally:
+            self._release(worker)
+
+        if status == "load_error":
+            raise SkillLoadError(payload)
+        if status == "error":
+            raise SkillError(f"Skill '{config.name}' failed: {payload}")
+        return payload
+
+    def _wait(
+        self, worker: _SkillWorker, config: SkillConfig, timeout: float
+    ) -> tuple[str, Any]:
+        deadline = time.monotonic() + timeout
+        while True:
+            if worker.conn.poll(self._poll_interval):
+                try:
+                    return worker.conn.recv()
+                except EOFError:
+                    worker.process.join()
+                    raise SkillError(
+                        f"Skill '{config.name}' worker died "
+                        f"(exit code {worker.process.exitcode})"
+                    ) from None
+            if timeout > 0 and time.monotonic() > deadline:
+                raise SkillTimeoutError(
+                    f"Skill '{config.name}' did not finish in {timeout}s"
+                )
+
+    def _acquire(self) -> _SkillWorker:
+        with self._available:
+            while True:
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive:
+                        self._busy += 1
+                        return worker
+                    worker.stop()
+                if self._busy < self._max_workers:
+                    self._busy += 1
+                    break
+                self._available.wait()
+
+        try:
+            return _SkillWorker()
+        except BaseException:
+            self._release(None)
+            raise
+
+    def _release(self, worker: _SkillWorker | None) -> None:
+        with self._available:
+            self._busy -= 1
+            if worker is not None:
+                self._idle.append(worker)
+            self._available.notify()
+
+    def _cache_key(self, config: SkillConfig, context: dict[str, Any]) -> str:
+        payload = json.dumps(
+            {
+                "skill": [config.name, config.module, config.class_name],
+                "source": _module_fingerprint(config.module),
+                "context": context,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=self._json_default,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _json_default(value: Any) -> Any:
+        if isinstance(value, Document):
+            return value.model_dump(mode="json")
+        return str(value)
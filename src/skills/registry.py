@@ -5,6 +5,9 @@ import toml
 import yaml
 
 from src.core.logger import Logger
+from src.core.registry_cache import FileFingerprint, RegistrySnapshot, file_fingerprint
+
+_PATTERNS = ("*.yaml", "*.yml", "*.toml")
 
 
 class SkillConfig:
@@ -16,6 +19,8 @@ class SkillConfig:
         class_name: str,
         config: dict[str, Any],
         prompt: str | None = None,
+        stage: str | None = None,
+        timeout: float | None = None,
     ):
         self.name = name
         self.description = description
@@ -23,49 +28,84 @@ class SkillConfig:
         self.class_name = class_name
         self.config = config
         self.prompt = prompt
+        self.stage = stage
+        self.timeout = timeout
 
 
 class SkillRegistry:
-    def __init__(self, skills_path: str, logger: Logger):
+    def __init__(self, skills_path: str, logger: Logger, cache_path: Path | None = None):
         self._skills_path = Path(skills_path)
         self._logger = logger
+        self._snapshot = RegistrySnapshot(cache_path)
+        self._files: dict[str, tuple[FileFingerprint, dict[str, Any]]] = {}
         self._skills: dict[str, SkillConfig] = {}
+        self.errors: dict[Path, str] = {}
 
     def load(self) -> None:
-        self._logger.info(f"Loading skills from {self._skills_path}")
         if not self._skills_path.exists():
             return
 
-        self._load_from_format("*.yaml", self._load_yaml_file)
-        self._load_from_format("*.yml", self._load_yaml_file)
-        self._load_from_format("*.toml", self._load_toml_file)
-
-        self._logger.info(f"Loaded {len(self._skills)} skill(s)")
-
-    def _load_from_format(self, pattern: str, loader_func: Any) -> None:
-        for file_path in self._skills_path.glob(pattern):
-            loader_func(file_path)
-
-    def _load_yaml_file(self, file_path: Path) -> None:
-        with open(file_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        self._add_skill(data, file_path)
-
-    def _load_toml_file(self, file_path: Path) -> None:
-        with open(file_path, encoding="utf-8") as f:
-            data = toml.load(f)
-        self._add_skill(data, file_path)
-
-    def _add_skill(self, data: dict, file_path: Path) -> None:
-        config = SkillConfig(
-            name=data.get("name", file_path.stem),
-            description=data.get("description", ""),
-            module=data.get("module", "src.skills"),
-            class_name=data.get("class", f"{file_path.stem.capitalize()}Skill"),
-            config=data.get("config", {}),
-            prompt=data.get("prompt"),
-        )
-        self._skills[config.name] = config
+        current = {
+            str(path): fingerprint
+            for pattern in _PATTERNS
+            for path in self._skills_path.glob(pattern)
+            if (fingerprint := file_fingerprint(path)) is not None
+        }
+        if self._files and current == {p: fp for p, (fp, _) in self._files.items()}:
+            return
+
+        self._logger.info(f"Loading skills from {self._skills_path}")
+        cached = self._files or self._snapshot.load()
+        files: dict[str, tuple[FileFingerprint, dict[str, Any]]] = {}
+        parsed = 0
+        for path, fingerprint in current.items():
+            item = cached.get(path)
+            if item is None or tuple(item[0]) != fingerprint:
+                item = (fingerprint, self._compile_file(Path(path)))
+                parsed += 1
+            files[path] = item
+
+        if files != cached:
+            self._snapshot.save(files)
+
+        self._files = files
+        self._rebuild()
+        self._logger.info(f"Loaded {len(self._skills)} skill(s), {parsed} file(s) parsed")
+
+    def _compile_file(self, file_path: Path) -> dict[str, Any]:
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = toml.load(f) if file_path.suffix == ".toml" else yaml.safe_load(f)
+            if not isinstance(data, dict):
+                raise ValueError("expected a mapping")
+            return self._skill_entry(data, file_path)
+        except (OSError, yaml.YAMLError, toml.TomlDecodeError, ValueError) as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+    def _skill_entry(self, data: dict, file_path: Path) -> dict[str, Any]:
+        return {
+            "name": data.get("name", file_path.stem),
+            "description": data.get("description", ""),
+            "module": data.get("module", "src.skills"),
+            "class_name": data.get("class", f"{file_path.stem.capitalize()}Skill"),
+            "config": data.get("config", {}),
+            "prompt": data.get("prompt"),
+            "stage": data.get("stage"),
+            "timeout": data.get("timeout"),
+        }
+
+    def _rebuild(self) -> None:
+        self._skills.clear()
+        self.errors.clear()
+        for path, (_, entry) in sorted(self._files.items()):
+            if "error" in entry:
+                self.errors[Path(path)] = entry["error"]
+                self._logger.error(
+                    f"Skipping malformed skill file {path}: {entry['error']}"
+                )
+                continue
+            config = SkillConfig(**entry)
+            self._skills[config.name] = config
 
     def get(self, name: str) -> SkillConfig | None:
         return self._skills.get(name)
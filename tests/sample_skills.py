@@ -0,0 +1,36 @@
+import time
+
+from src.domain.models import Document
+
+
+class UppercaseSkill:
+    name = "uppercase"
+    description = "Переводит текст документов в верхний регистр"
+
+    def execute(self, context: dict) -> list[Document]:
+        return [
+            doc.model_copy(
+                update={
+                    "content": doc.content.model_copy(
+                        update={"text_content": doc.content.text_content.upper()}
+                    )
+                }
+            )
+            for doc in context["documents"]
+        ]
+
+
+class SignatureSkill:
+    name = "signature"
+    description = "Добавляет подпись к саммари"
+
+    def execute(self, context: dict) -> str:
+        return f"{context['summary']}\n-- {context['config']['author']}"
+
+
+class SlowSkill:
+    name = "slow"
+    description = "Зависает навсегда"
+
+    def execute(self, context: dict) -> None:
+        time.sleep(3600)
@@ -0,0 +1,149 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from src.core.archives import (
+    ArchiveLimits,
+    file_stat,
+    list_members,
+    materialize,
+    open_binary,
+)
+from src.core.deduplicator import Deduplicator
+from src.core.document_collector import DocumentCollector
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.domain.exceptions import ArchiveLimitError
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+def _zip(path, members: dict[str, bytes]):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+def _tar_gz(path, members: dict[str, bytes]):
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return path
+
+
+def test_scanner_lists_archive_members_as_files(tmp_path, logger):
+    (tmp_path / "plain.txt").write_text("plain")
+    _zip(tmp_path / "docs.zip", {"a.txt": b"alpha", "sub/b.txt": b"beta", "sub/": b""})
+    _tar_gz(tmp_path / "more.tar.gz", {"c.txt": b"gamma", ".git/d.txt": b"hidden"})
+    scanner = FolderScanner(logger, archive_limits=ArchiveLimits())
+
+    found = {path.relative_to(tmp_path).as_posix() for path in scanner.scan(tmp_path)}
+
+    assert found == {
+        "plain.txt",
+        "docs.zip/a.txt",
+        "docs.zip/sub/b.txt",
+        "more.tar.gz/c.txt",
+    }
+
+
+def test_scanner_without_limits_keeps_archives_opaque(tmp_path, logger):
+    _zip(tmp_path / "docs.zip", {"a.txt": b"alpha"})
+
+    assert list(FolderScanner(logger).scan(tmp_path)) == [tmp_path / "docs.zip"]
+
+
+def test_collector_reads_members_under_their_virtual_path(tmp_path, logger):
+    _zip(tmp_path / "docs.zip", {"notes/a.txt": "привет".encode()})
+    _tar_gz(tmp_path / "more.tgz", {"b.txt": b"tar text"})
+    paths = sorted(FolderScanner(logger, archive_limits=ArchiveLimits()).scan(tmp_path))
+    collector = DocumentCollector(ReaderFactory([TxtReader()]), logger, max_retries=0)
+
+    documents = collector.collect(paths)
+
+    assert [document.path for document in documents] == paths
+    assert [document.content.file_path for document in documents] == paths
+    assert [document.content.text_content for document in documents] == [
+        "привет",
+        "tar text",
+    ]
+    assert documents[0].size_bytes == len("привет".encode())
+
+
+def test_materialize_removes_temporary_copy(tmp_path):
+    member = _zip(tmp_path / "docs.zip", {"a.txt": b"alpha"}) / "a.txt"
+
+    with materialize(member) as source:
+        assert source != member
+        assert source.name.endswith("-a.txt")
+        assert source.read_bytes() == b"alpha"
+
+    assert not source.exists()
+    with materialize(tmp_path / "docs.zip") as source:
+        assert source == tmp_path / "docs.zip"
+
+
+def test_compression_bomb_is_rejected_before_unpacking(tmp_path, logger):
+    archive = _zip(tmp_path / "bomb.zip", {"zeros.txt": b"\0" * (20 * 1024 * 1024)})
+    limits = ArchiveLimits(max_ratio=100)
+
+    with pytest.raises(ArchiveLimitError, match="compression ratio"):
+        limits.check(archive, list_members(archive))
+    assert list(FolderScanner(logger, archive_limits=limits).scan(tmp_path)) == []
+
+
+def test_member_and_count_limits(tmp_path, logger):
+    archive = _zip(tmp_path / "docs.zip", {"small.txt": b"x" * 10, "big.txt": b"y" * 500})
+
+    scanner = FolderScanner(logger, archive_limits=ArchiveLimits(max_member_bytes=100))
+    assert list(scanner.scan(tmp_path)) == [archive / "small.txt"]
+
+    with pytest.raises(ArchiveLimitError, match="members exceed"):
+        ArchiveLimits(max_members=1).check(archive, list_members(archive))
+
+
+def test_unsafe_member_names_are_ignored(tmp_path):
+    archive = _tar_gz(
+        tmp_path / "evil.tar.gz",
+        {"../escape.txt": b"x", "/etc/passwd.txt": b"x", "ok.txt": b"x"},
+    )
+
+    assert [member.name for member in list_members(archive)] == ["ok.txt"]
+
+
+def test_reading_stops_at_declared_size(tmp_path, mocker):
+    member = _zip(tmp_path / "docs.zip", {"a.txt": b"alpha"}) / "a.txt"
+    mocker.patch(
+        "src.core.archives.file_stat", return_value=file_stat(member)._replace(st_size=3)
+    )
+
+    with (
+        pytest.raises(ArchiveLimitError, match="declared 3 bytes"),
+        open_binary(member) as f,
+    ):
+        f.read()
+
+
+def test_deduplicator_hashes_archive_members(tmp_path, logger):
+    (tmp_path / "copy.txt").write_bytes(b"same content")
+    archive = _zip(tmp_path / "docs.zip", {"orig.txt": b"same content"})
+
+    unique, groups = Deduplicator(logger).drop_exact_duplicates(
+        [archive / "orig.txt", tmp_path / "copy.txt"]
+    )
+
+    assert len(unique) == 1
+    assert {groups[0].representative, *groups[0].duplicates} == {
+        archive / "orig.txt",
+        tmp_path / "copy.txt",
+    }
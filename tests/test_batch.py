@@ -0,0 +1,187 @@
+import json
+
+import pytest
+import yaml
+
+from src.core.batch_runner import BatchRunner
+from src.core.document_collector import DocumentCollector
+from src.core.document_service import DocumentService
+from src.core.folder_scanner import FolderScanner
+from src.core.job_queue import JobQueue
+from src.core.logger import Logger
+from src.domain.exceptions import JobFileError
+from src.domain.models import Job, JobStatus
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+from src.skills.engine import SkillEngine
+from src.skills.registry import SkillRegistry
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(tmp_path / "state" / "queue.sqlite3")
+    yield queue
+    queue.close()
+
+
+@pytest.fixture
+def runner(queue, logger, mocker):
+    prompt_manager = mocker.Mock()
+    prompt_manager.select.return_value = "Summarize"
+
+    summary_generator = mocker.Mock()
+    summary_generator.generate.side_effect = lambda docs, prompt: (
+        f"{prompt}: {len(docs)} doc(s)"
+    )
+
+    service = DocumentService(
+        scanner=FolderScanner(logger=logger),
+        collector=DocumentCollector(
+            reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+        ),
+        logger=logger,
+    )
+    return BatchRunner(
+        queue=queue,
+        prompt_manager=prompt_manager,
+        document_service=service,
+        summary_generator=summary_generator,
+        logger=logger,
+        concurrency=2,
+    )
+
+
+def _make_folders(root, count):
+    folders = []
+    for i in range(count):
+        folder = root / f"client_{i}"
+        folder.mkdir()
+        (folder / "doc.txt").write_text(f"Document {i}")
+        folders.append(folder)
+    return folders
+
+
+def test_job_queue_recovers_running_jobs(tmp_path):
+    db_path = tmp_path / "queue.sqlite3"
+    queue = JobQueue(db_path)
+    queue.add([Job(id="a", folder=tmp_path, output_path=tmp_path / "a.md")])
+    claimed = queue.claim()
+    assert claimed.status == JobStatus.RUNNING
+    queue.close()
+
+    # Имитируем перезапуск после падения
+    reopened = JobQueue(db_path)
+    assert reopened.claim() is None
+    assert reopened.recover() == 1
+
+    job = reopened.claim()
+    assert job.id == "a"
+    assert job.attempts == 2
+    reopened.close()
+
+
+def test_batch_runs_all_folders_and_writes_outputs(tmp_path, runner, queue):
+    _make_folders(tmp_path, 3)
+    output_dir = tmp_path / "out"
+
+    jobs = runner.build_jobs([str(tmp_path / "client_*")], output_dir)
+    assert runner.submit(jobs) == 3
+
+    counts = runner.run()
+
+    assert counts[JobStatus.DONE] == 3
+    for job in queue.list_jobs():
+        assert job.output_path.read_text(encoding="utf-8") == "Summarize: 1 doc(s)"
+
+
+def test_batch_skips_completed_jobs_on_rerun(tmp_path, runner, queue):
+    folders = _make_folders(tmp_path, 2)
+    output_dir = tmp_path / "out"
+
+    runner.submit(runner.build_jobs([str(f) for f in folders], output_dir))
+    runner.run()
+
+    assert runner.submit(runner.build_jobs([str(f) for f in folders], output_dir)) == 0
+    runner.run()
+    assert runner._summary_generator.generate.call_count == 2
+
+
+def test_batch_marks_missing_folder_failed(tmp_path, runner, queue):
+    runner.submit(runner.build_jobs([str(tmp_path / "missing")], tmp_path / "out"))
+
+    counts = runner.run()
+
+    assert counts[JobStatus.FAILED] == 1
+    assert "Folder not found" in queue.list_jobs()[0].error
+
+
+def test_batch_job_file(tmp_path, runner):
+    folder = _make_folders(tmp_path, 1)[0]
+    job_file = tmp_path / "jobs.jsonl"
+    job_file.write_text(
+        json.dumps({"id": "job-1", "folder": str(folder), "prompt": "legal"}) + "\n\n"
+    )
+
+    jobs = runner.build_jobs([str(job_file)], tmp_path / "out")
+
+    assert len(jobs) == 1
+    assert jobs[0].id == "job-1"
+    assert jobs[0].prompt == "legal"
+
+
+def test_batch_job_file_invalid_line(tmp_path, runner):
+    job_file = tmp_path / "jobs.jsonl"
+    job_file.write_text('{"prompt": "legal"}\n')
+
+    with pytest.raises(JobFileError):
+        runner.build_jobs([str(job_file)], tmp_path / "out")
+
+
+def test_batch_runs_skill_stages(tmp_path, queue, logger, mocker):
+    skills_dir = tmp_path / "skills"
+    skills_dir.mkdir()
+    (skills_dir / "upper.yaml").write_text(
+        yaml.dump(
+            {
+                "name": "upper",
+                "module": "tests.sample_skills",
+                "class": "UppercaseSkill",
+                "stage": "pre",
+            }
+        )
+    )
+    engine = SkillEngine(SkillRegistry(str(skills_dir), logger), logger)
+    summary_generator = mocker.Mock()
+    summary_generator.generate.side_effect = lambda docs, prompt: " ".join(
+        doc.content.text_content for doc in docs
+    )
+    runner = BatchRunner(
+        queue=queue,
+        prompt_manager=mocker.Mock(),
+        document_service=DocumentService(
+            scanner=FolderScanner(logger=logger),
+            collector=DocumentCollector(
+                reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+            ),
+            logger=logger,
+        ),
+        summary_generator=summary_generator,
+        logger=logger,
+        skill_engine=engine,
+    )
+    folder = _make_folders(tmp_path, 1)[0]
+
+    runner.submit(runner.build_jobs([str(folder)], tmp_path / "out", skill_name="upper"))
+    try:
+        runner.run()
+    finally:
+        engine.shutdown()
+
+    (job,) = queue.list_jobs()
+    assert job.output_path.read_text(encoding="utf-8") == "DOCUMENT 0"
+    assert engine.stats["upper"].calls == 1
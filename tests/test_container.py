@@ -3,7 +3,7 @@ from src.core.logger import Logger
 from src.dependencies import Container
 
 
-def test_container_wiring():
+def test_container_wiring(tmp_path):
     container = Container()
     container.config.from_dict(
         {
@@ -15,6 +15,11 @@ def test_container_wiring():
             "max_retries": 3,
             "max_file_size_mb": 10,
             "recursive_scan": True,
+            "data_dir": str(tmp_path),
+            "ocr_workers": 1,
+            "archive_max_member_mb": 512,
+            "archive_max_total_mb": 4096,
+            "spreadsheet_max_rows": 1000,
         }
     )
 
@@ -0,0 +1,104 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from src.core.deduplicator import Deduplicator
+from src.core.document_collector import DocumentCollector
+from src.core.document_service import DocumentService
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.domain.models import ContentType, Document, DocumentContent
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+def _text(seed, words=400):
+    rng = random.Random(seed)
+    vocabulary = [f"слово{i}" for i in range(2000)]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _document(name, text):
+    return Document(
+        path=Path(name),
+        size_bytes=len(text),
+        content=DocumentContent(
+            file_path=Path(name), content_type=ContentType.TEXT, text_content=text
+        ),
+    )
+
+
+def test_exact_duplicates_are_hashed_only_when_sizes_match(tmp_path, logger, mocker):
+    (tmp_path / "contract.txt").write_text("same content")
+    (tmp_path / "contract (1).txt").write_text("same content")
+    (tmp_path / "other.txt").write_text("different content of another size")
+
+    deduplicator = Deduplicator(logger=logger)
+    digest = mocker.spy(deduplicator, "_file_digest")
+    paths = sorted(tmp_path.iterdir())
+
+    unique, groups = deduplicator.drop_exact_duplicates(paths)
+
+    assert sorted(p.name for p in unique) == ["contract (1).txt", "other.txt"]
+    assert groups[0].duplicates == [tmp_path / "contract.txt"]
+    assert digest.call_count == 2
+
+
+def test_near_duplicates_keep_longest_representative(logger):
+    base = _text(1)
+    edited = base.replace(base.split()[10], "исправлено", 1) + " приложение"
+    documents = [
+        _document("contract.txt", base),
+        _document("contract_v2.txt", edited),
+        _document("unrelated.txt", _text(2)),
+    ]
+
+    kept, groups = Deduplicator(logger=logger).collapse_near_duplicates(documents)
+
+    assert [doc.path.name for doc in kept] == ["contract_v2.txt", "unrelated.txt"]
+    assert len(groups) == 1
+    assert groups[0].kind == "near"
+    assert groups[0].similarity >= 0.9
+
+
+def test_signature_handles_large_texts_in_blocks(logger):
+    deduplicator = Deduplicator(logger=logger)
+    deduplicator.SIGNATURE_BLOCK_SIZE = 64
+    text = _text(3, words=1000)
+
+    blocked = deduplicator._signature(text)
+    deduplicator.SIGNATURE_BLOCK_SIZE = 10**6
+    assert (blocked == deduplicator._signature(text)).all()
+
+
+def test_document_service_collapses_duplicates(tmp_path, logger, mocker):
+    text = _text(4)
+    (tmp_path / "a.txt").write_text(text)
+    (tmp_path / "a_copy.txt").write_text(text)
+    (tmp_path / "a_v2.txt").write_text(text + " дополнение")
+    (tmp_path / "b.txt").write_text(_text(5))
+
+    collector = DocumentCollector(
+        reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+    )
+    collect = mocker.spy(collector, "iter_collect")
+    service = DocumentService(
+        scanner=FolderScanner(logger=logger),
+        collector=collector,
+        logger=logger,
+        deduplicator=Deduplicator(logger=logger),
+    )
+
+    documents = service.get_documents(tmp_path)
+
+    assert sorted(doc.path.name for doc in documents) == ["a_v2.txt", "b.txt"]
+    representative = next(doc for doc in documents if doc.path.name == "a_v2.txt")
+    assert sorted(p.name for p in representative.duplicates) == ["a.txt", "a_copy.txt"]
+    # Точная копия отброшена до извлечения текста
+    assert tmp_path / "a_copy.txt" not in collect.call_args.args[0]
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+from src.core.document_collector import DocumentCollector
+from src.core.document_service import DocumentService
+from src.core.document_store import DocumentStore
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.domain.models import ContentType, Document, DocumentContent, ImageData
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+def _document(name, text, images=None):
+    return Document(
+        path=Path(name),
+        size_bytes=len(text),
+        content=DocumentContent(
+            file_path=Path(name),
+            content_type=ContentType.TEXT,
+            text_content=text,
+            images=images or [],
+        ),
+    )
+
+
+def test_documents_beyond_the_ceiling_are_spilled(tmp_path):
+    store = DocumentStore(memory_limit_bytes=3000, spill_dir=tmp_path)
+    image = ImageData(base64_data="aGVsbG8=", mime_type="image/jpeg")
+    store.extend(
+        _document(f"{i}.txt", f"текст {i} " * 100, images=[image]) for i in range(5)
+    )
+
+    assert len(store) == 5
+    assert store.spilled_count > 0
+    assert store.memory_bytes <= 3000
+    for i, document in enumerate(store):
+        assert document.content.text_content == (f"текст {i} " * 100).strip()
+        assert document.content.images == [image]
+    assert store[-1].path == Path("4.txt")
+    assert [doc.path.name for doc in store[1:3]] == ["1.txt", "2.txt"]
+    store.close()
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib"])
+def test_spilled_content_round_trips(tmp_path, compression):
+    store = DocumentStore(
+        memory_limit_bytes=0, spill_dir=tmp_path, compression=compression
+    )
+    store.append(_document("a.txt", "содержимое"))
+
+    assert store.spilled_count == 1
+    assert store[0].content.text_content == "содержимое"
+    store.close()
+
+
+def test_unknown_compression_is_rejected():
+    with pytest.raises(ValueError, match="Unknown compression"):
+        DocumentStore(compression="brotli")
+
+
+def test_discard_and_duplicates_keep_indexes_consistent(tmp_path):
+    store = DocumentStore(memory_limit_bytes=200, spill_dir=tmp_path)
+    store.extend(_document(f"{i}.txt", f"документ {i} " * 10) for i in range(4))
+
+    store.discard({Path("0.txt"), Path("2.txt")})
+    store.add_duplicates(Path("3.txt"), [Path("0.txt")])
+
+    assert store.paths == [Path("1.txt"), Path("3.txt")]
+    assert store[1].content.text_content == ("документ 3 " * 10).strip()
+    assert store[1].duplicates == [Path("0.txt")]
+    store.close()
+
+
+def test_close_removes_spill_directory(tmp_path):
+    store = DocumentStore(memory_limit_bytes=0, spill_dir=tmp_path)
+    store.append(_document("a.txt", "текст"))
+    assert list(tmp_path.iterdir())
+
+    store.close()
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_document_service_returns_store(tmp_path, logger):
+    source = tmp_path / "docs"
+    source.mkdir()
+    for i in range(3):
+        (source / f"{i}.txt").write_text(f"файл номер {i} " * 20)
+
+    service = DocumentService(
+        scanner=FolderScanner(logger=logger),
+        collector=DocumentCollector(
+            reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+        ),
+        logger=logger,
+        store_factory=lambda: DocumentStore(memory_limit_bytes=0, spill_dir=tmp_path),
+    )
+
+    documents = service.get_documents(source)
+
+    assert isinstance(documents, DocumentStore)
+    assert documents.spilled_count == 3
+    assert sorted(doc.content.text_content[:12] for doc in documents) == [
+        "файл номер 0",
+        "файл номер 1",
+        "файл номер 2",
+    ]
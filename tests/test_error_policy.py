@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.document_collector import DocumentCollector
+from src.core.logger import Logger
+from src.core.quarantine import Quarantine
+from src.domain.exceptions import DocumentReadError
+from src.domain.models import ContentType, DocumentContent, ErrorPolicy
+from src.readers.factory import ReaderFactory
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+class FlakyReader:
+    # "broken" в имени - файл не читается никогда, "flaky" - только с первой попытки
+    def __init__(self):
+        self.calls: dict[str, int] = {}
+
+    def supports(self, file_path: Path) -> bool:
+        return file_path.suffix == ".doc"
+
+    def get_supported_extensions(self) -> list[str]:
+        return [".doc"]
+
+    def read(self, file_path: Path) -> DocumentContent:
+        calls = self.calls[file_path.name] = self.calls.get(file_path.name, 0) + 1
+        if "broken" in file_path.name:
+            raise ValueError("corrupt file")
+        if "flaky" in file_path.name and calls == 1:
+            raise OSError("file is locked")
+        return DocumentContent(
+            file_path=file_path,
+            content_type=ContentType.TEXT,
+            text_content=file_path.stem,
+        )
+
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = []
+    for name in ("a.doc", "broken.doc", "flaky.doc"):
+        (tmp_path / name).write_text("x")
+        paths.append(tmp_path / name)
+    return paths
+
+
+def _collector(logger, reader, policy):
+    return DocumentCollector(
+        reader_factory=ReaderFactory([reader]),
+        logger=logger,
+        error_policy=policy,
+        retry_delay_seconds=0,
+    )
+
+
+def test_abort_policy_stops_on_first_failure(paths, logger):
+    collector = _collector(logger, FlakyReader(), ErrorPolicy.ABORT)
+
+    with pytest.raises(DocumentReadError, match="corrupt file"):
+        collector.collect(paths)
+
+
+def test_skip_policy_quarantines_failed_files(paths, logger):
+    reader = FlakyReader()
+    collector = _collector(logger, reader, "skip")
+    quarantine = Quarantine()
+
+    with collector.quarantine_scope(quarantine):
+        documents = collector.collect(paths)
+
+    assert [doc.path.name for doc in documents] == ["a.doc"]
+    assert [entry.path.name for entry in quarantine.entries] == [
+        "broken.doc",
+        "flaky.doc",
+    ]
+    assert reader.calls["flaky.doc"] == 1
+
+
+def test_retry_policy_recovers_transient_failures(paths, logger):
+    reader = FlakyReader()
+    collector = _collector(logger, reader, ErrorPolicy.RETRY)
+
+    results = list(collector.iter_results(paths))
+
+    assert [(r.path.name, r.ok, r.attempts) for r in results] == [
+        ("a.doc", True, 1),
+        ("broken.doc", False, 2),
+        ("flaky.doc", True, 2),
+    ]
+    assert results[1].document is None
+    assert "corrupt file" in results[1].error
+
+
+def test_quarantine_is_written_as_jsonl(paths, logger, tmp_path):
+    collector = _collector(logger, FlakyReader(), ErrorPolicy.RETRY)
+    quarantine = Quarantine()
+    path = tmp_path / "data" / "quarantine.jsonl"
+
+    with collector.quarantine_scope(quarantine):
+        collector.collect(paths)
+    quarantine.write(path)
+
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    assert entries == [
+        {
+            "path": str(paths[1]),
+            "reader": "FlakyReader",
+            "error": "ValueError('corrupt file')",
+            "attempts": 2,
+        }
+    ]
+
+    Quarantine().write(path)
+    assert not path.exists()
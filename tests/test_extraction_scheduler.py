@@ -0,0 +1,153 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.document_collector import DocumentCollector
+from src.core.document_store import DocumentStore
+from src.core.extraction_scheduler import ExtractionScheduler
+from src.core.extraction_timings import ExtractionTimings
+from src.core.logger import Logger
+from src.domain.models import ContentType, Document, DocumentContent, ReadResult
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+class VideoReader:
+    def supports(self, file_path: Path) -> bool:
+        return file_path.suffix == ".mp4"
+
+    def get_supported_extensions(self) -> list[str]:
+        return [".mp4"]
+
+    def read(self, file_path: Path) -> DocumentContent:
+        return DocumentContent(
+            file_path=file_path, content_type=ContentType.TEXT, text_content="video"
+        )
+
+
+@pytest.fixture
+def files(tmp_path):
+    sizes = {"small.txt": 10, "large.txt": 5000, "medium.txt": 500, "clip.mp4": 100}
+    for name, size in sizes.items():
+        (tmp_path / name).write_bytes(b"x" * size)
+    return tmp_path
+
+
+def _scheduler(tmp_path, logger, **kwargs):
+    timings = ExtractionTimings(tmp_path / "timings.json")
+    factory = ReaderFactory([TxtReader(), VideoReader()])
+    return ExtractionScheduler(factory, timings, logger, **kwargs), timings
+
+
+def _recorder(order):
+    def read(path: Path) -> ReadResult:
+        order.append(path.name)
+        return ReadResult(path=path)
+
+    return read
+
+
+def test_classifies_by_observed_cost(tmp_path, logger):
+    scheduler, timings = _scheduler(tmp_path, logger)
+
+    assert scheduler.classify("TxtReader", ".txt") == "light"
+    assert scheduler.classify("VideoReader", ".mp4") == "light"
+
+    timings.record("VideoReader", ".mp4", 1024 * 1024, 30.0, 100)
+    assert scheduler.classify("VideoReader", ".mp4") == "heavy"
+
+
+def test_largest_files_start_first(files, tmp_path, logger):
+    scheduler, _ = _scheduler(tmp_path, logger, light_workers=1, heavy_workers=1)
+    order: list[str] = []
+
+    paths = sorted(files.glob("*.txt"))
+    results = list(scheduler.run(paths, _recorder(order)))
+
+    assert len(results) == 3
+    assert order == ["large.txt", "medium.txt", "small.txt"]
+
+
+def test_heavy_pool_shrinks_when_memory_is_low(files, tmp_path, logger):
+    for i in range(4):
+        (files / f"clip{i}.mp4").write_bytes(b"x")
+    scheduler, timings = _scheduler(
+        tmp_path,
+        logger,
+        heavy_workers=4,
+        heavy_worker_memory_mb=1024,
+        memory_probe=lambda: 512 * 1024 * 1024,
+    )
+    timings.record("VideoReader", ".mp4", 1024 * 1024, 30.0, 100)
+
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+
+    def read(path: Path) -> ReadResult:
+        if path.suffix == ".mp4":
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+        return ReadResult(path=path)
+
+    results = list(scheduler.run(sorted(files.iterdir()), read))
+
+    assert len(results) == 8
+    assert active["max"] == 1
+
+
+def test_stops_dispatching_after_cancellation(files, tmp_path, logger):
+    scheduler, _ = _scheduler(tmp_path, logger, light_workers=1, heavy_workers=1)
+    order: list[str] = []
+
+    results = scheduler.run(sorted(files.iterdir()), _recorder(order), lambda: True)
+
+    assert list(results) == []
+    assert order == []
+
+
+def test_collector_restores_scan_order(files, tmp_path, logger):
+    scheduler, _ = _scheduler(tmp_path, logger, light_workers=3)
+    collector = DocumentCollector(
+        reader_factory=ReaderFactory([TxtReader(), VideoReader()]),
+        logger=logger,
+        scheduler=scheduler,
+    )
+    paths = sorted(files.iterdir())
+
+    documents = DocumentStore()
+    documents.extend(collector.iter_collect(paths))
+    documents.reorder(paths)
+
+    assert documents.paths == paths
+
+
+def test_store_reorder_keeps_spilled_contents(tmp_path):
+    store = DocumentStore(memory_limit_bytes=0, spill_dir=tmp_path)
+    paths = [tmp_path / name for name in ("a.txt", "b.txt", "c.txt")]
+    for path in reversed(paths):
+        store.append(
+            Document(
+                path=path,
+                size_bytes=1,
+                content=DocumentContent(
+                    file_path=path, content_type=ContentType.TEXT, text_content=path.stem
+                ),
+            )
+        )
+
+    store.reorder(paths[1:])
+
+    assert store.paths == [paths[1], paths[2], paths[0]]
+    assert [doc.content.text_content for doc in store] == ["b", "c", "a"]
+    store.close()
@@ -0,0 +1,208 @@
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.cancellation import CancellationToken
+from src.core.document_collector import DocumentCollector
+from src.core.extraction_checkpoint import ExtractionCheckpoint
+from src.core.logger import Logger
+from src.domain.exceptions import (
+    DocumentReadError,
+    ExtractionCancelledError,
+    ExtractionTimeoutError,
+)
+from src.domain.models import ContentType, DocumentContent
+from src.readers.factory import ReaderFactory
+from src.readers.isolation import FORK_AVAILABLE, IsolatedReader
+from src.readers.txt_reader import TxtReader
+
+needs_fork = pytest.mark.skipif(not FORK_AVAILABLE, reason="fork is not available")
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+class SlowReader:
+    # "hang" в имени файла имитирует зависший ридер, "pause" - медленный,
+    # "broken" - падающий
+    def supports(self, file_path: Path) -> bool:
+        return file_path.suffix == ".slow"
+
+    def get_supported_extensions(self) -> list[str]:
+        return [".slow"]
+
+    def read(self, file_path: Path) -> DocumentContent:
+        if "hang" in file_path.name:
+            time.sleep(60)
+        if "pause" in file_path.name:
+            time.sleep(0.5)
+        if "broken" in file_path.name:
+            raise ValueError("corrupt file")
+        return DocumentContent(
+            file_path=file_path,
+            content_type=ContentType.TEXT,
+            text_content=f"pid {os.getpid()}",
+        )
+
+
+@pytest.fixture
+def files(tmp_path):
+    for name in ("a.slow", "hang.slow", "broken.slow", "b.slow"):
+        (tmp_path / name).write_text("x")
+    return tmp_path
+
+
+@needs_fork
+def test_isolated_reader_runs_in_a_reusable_worker(files, logger):
+    reader = IsolatedReader(SlowReader(), logger, timeout_seconds=5)
+    try:
+        first = reader.read(files / "a.slow").text_content
+        second = reader.read(files / "b.slow").text_content
+    finally:
+        reader.close()
+
+    assert first == second
+    assert first != f"pid {os.getpid()}"
+
+
+@needs_fork
+def test_reader_factory_close_stops_idle_workers(files, logger):
+    reader = IsolatedReader(SlowReader(), logger, timeout_seconds=5)
+    reader.read(files / "a.slow")
+    (worker,) = reader._idle
+
+    ReaderFactory([TxtReader(), reader]).close()
+
+    assert reader._idle == []
+    assert not worker.alive
+
+
+@needs_fork
+def test_isolated_reader_kills_hung_worker(files, logger):
+    reader = IsolatedReader(SlowReader(), logger, timeout_seconds=0.5, poll_interval=0.05)
+    try:
+        started = time.monotonic()
+        with pytest.raises(ExtractionTimeoutError):
+            reader.read(files / "hang.slow")
+        assert time.monotonic() - started < 5
+
+        with pytest.raises(DocumentReadError, match="corrupt file"):
+            reader.read(files / "broken.slow")
+        assert reader.read(files / "a.slow").text_content.startswith("pid")
+    finally:
+        reader.close()
+
+
+@needs_fork
+def test_isolated_reader_runs_workers_in_parallel(files, logger):
+    (files / "pause1.slow").write_text("x")
+    (files / "pause2.slow").write_text("x")
+    reader = IsolatedReader(SlowReader(), logger, max_workers=2, poll_interval=0.05)
+    pids: list[str] = []
+
+    def read(name):
+        pids.append(reader.read(files / name).text_content)
+
+    threads = [threading.Thread(target=read, args=(f"pause{i}.slow",)) for i in (1, 2)]
+    try:
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+    finally:
+        reader.close()
+
+    assert len(set(pids)) == 2
+    assert elapsed < 0.9
+
+
+@needs_fork
+def test_isolated_reader_stops_on_cancellation(files, logger):
+    cancellation = CancellationToken()
+    reader = IsolatedReader(
+        SlowReader(), logger, cancellation=cancellation, poll_interval=0.05
+    )
+    cancellation.cancel()
+
+    with pytest.raises(ExtractionCancelledError):
+        reader.read(files / "hang.slow")
+
+
+@needs_fork
+def test_collector_skips_timed_out_files(files, logger):
+    reader = IsolatedReader(SlowReader(), logger, timeout_seconds=0.5, poll_interval=0.05)
+    collector = DocumentCollector(reader_factory=ReaderFactory([reader]), logger=logger)
+    try:
+        documents = collector.collect([files / "a.slow", files / "hang.slow"])
+    finally:
+        reader.close()
+
+    assert [doc.path.name for doc in documents] == ["a.slow"]
+
+
+def test_collector_stops_scheduling_after_cancellation(tmp_path, logger):
+    paths = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name)
+        paths.append(tmp_path / name)
+    cancellation = CancellationToken()
+    collector = DocumentCollector(
+        reader_factory=ReaderFactory([TxtReader()]),
+        logger=logger,
+        cancellation=cancellation,
+    )
+
+    collected = []
+    for document in collector.iter_collect(paths):
+        collected.append(document)
+        cancellation.cancel()
+
+    assert [doc.path.name for doc in collected] == ["a.txt"]
+
+
+def test_sigint_cancels_once_then_aborts(logger):
+    cancellation = CancellationToken()
+
+    with cancellation.handle_sigint(logger):
+        os.kill(os.getpid(), signal.SIGINT)
+        assert cancellation.cancelled
+        with pytest.raises(KeyboardInterrupt):
+            os.kill(os.getpid(), signal.SIGINT)
+
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+
+def test_checkpoint_restores_unchanged_files(tmp_path, logger, mocker):
+    source = tmp_path / "docs"
+    source.mkdir()
+    (source / "a.txt").write_text("первый")
+    (source / "b.txt").write_text("второй")
+    paths = sorted(source.iterdir())
+
+    reader = TxtReader()
+    read = mocker.spy(reader, "read")
+    collector = DocumentCollector(reader_factory=ReaderFactory([reader]), logger=logger)
+    checkpoint = ExtractionCheckpoint.for_folder(tmp_path / "checkpoints", source)
+
+    with collector.checkpoint_scope(checkpoint):
+        collector.collect(paths)
+    (source / "b.txt").write_text("второй, исправленный")
+    with collector.checkpoint_scope(checkpoint):
+        documents = collector.collect(paths)
+
+    assert read.call_count == 3
+    assert [doc.content.text_content for doc in documents] == [
+        "первый",
+        "второй, исправленный",
+    ]
+
+    checkpoint.clear()
+    assert not checkpoint.path.exists()
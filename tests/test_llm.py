@@ -7,6 +7,7 @@ import requests_mock
 from src.core.logger import Logger
 from src.domain.exceptions import LLMResponseError
 from src.domain.models import ContentType, Document, DocumentContent
+from src.llm.contracts import Message
 from src.llm.openrouter import OpenRouterLLMProvider
 
 
@@ -131,3 +132,79 @@ def test_invalid_response_format(provider):
         with pytest.raises(LLMResponseError) as excinfo:
             provider.generate_summary([doc], "prompt")
         assert "no choices found" in str(excinfo.value)
+
+
+def test_cache_control_hint_and_usage(logger):
+    provider = OpenRouterLLMProvider(
+        api_key="test_key", model="anthropic/claude-sonnet", logger=logger, timeout=1
+    )
+    messages = [
+        Message(role="system", content="System"),
+        Message(role="user", content="Instruction", cache_prefix=True),
+        Message(role="user", content="Documents"),
+    ]
+    response = {
+        "choices": [{"message": {"role": "assistant", "content": "ok"}}],
+        "usage": {
+            "prompt_tokens": 1200,
+            "completion_tokens": 50,
+            "prompt_tokens_details": {"cached_tokens": 1100},
+        },
+    }
+
+    with requests_mock.Mocker() as m:
+        m.post(provider.API_URL, json=response)
+        assert provider.generate_response(messages) == "ok"
+        sent = m.request_history[0].json()["messages"]
+
+    assert sent[0] == {"role": "system", "content": "System"}
+    assert sent[1]["content"] == [
+        {"type": "text", "text": "Instruction", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert sent[2] == {"role": "user", "content": "Documents"}
+    assert provider.usage.cached_tokens == 1100
+    assert provider.usage.prompt_tokens == 1200
+
+
+def test_no_cache_control_for_implicit_caching_models(provider):
+    with requests_mock.Mocker() as m:
+        m.post(
+            provider.API_URL,
+            json={"choices": [{"message": {"role": "assistant", "content": "ok"}}]},
+        )
+        provider.generate_response(
+            [Message(role="user", content="Instruction", cache_prefix=True)]
+        )
+        sent = m.request_history[0].json()["messages"]
+
+    assert sent == [{"role": "user", "content": "Instruction"}]
+    assert provider.usage.requests == 0
+
+
+def test_supports_multimodal_uses_model_catalog(logger):
+    provider = OpenRouterLLMProvider(
+        api_key="test_key", model="vendor/vision-model:free", logger=logger
+    )
+    catalog = {
+        "data": [
+            {"id": "vendor/text-model", "architecture": {"input_modalities": ["text"]}},
+            {
+                "id": "vendor/vision-model:free",
+                "architecture": {"input_modalities": ["text", "image"]},
+            },
+        ]
+    }
+
+    with requests_mock.Mocker() as m:
+        m.get(provider.MODELS_URL, json=catalog)
+        assert provider.supports_multimodal()
+        assert provider.supports_multimodal()
+        assert m.call_count == 1
+
+
+def test_supports_multimodal_falls_back_to_false(logger):
+    provider = OpenRouterLLMProvider(api_key="k", model="vendor/model", logger=logger)
+
+    with requests_mock.Mocker() as m:
+        m.get(provider.MODELS_URL, status_code=500)
+        assert not provider.supports_multimodal()
@@ -1,4 +1,4 @@
-from src.core.logger import Logger
+from src.core.logger import _LEVELS, Logger, _QueuedSink, _RotatingFile, _Sampler
 
 
 def test_logger_level_change():
@@ -17,3 +17,63 @@ def test_logger_singleton_configuration():
     l2 = Logger(name="l2", level="DEBUG")
     assert Logger._configured == True
     assert initial_configured == True
+
+
+class Expensive:
+    def __init__(self):
+        self.formatted = 0
+
+    def __format__(self, spec):
+        self.formatted += 1
+        return "expensive"
+
+
+def test_filtered_messages_are_not_formatted():
+    # Уровень общий для всех логгеров: после теста возвращаем прежний
+    previous = {no: name for name, no in _LEVELS.items()}[Logger._min_level]
+    lazy = Logger(name="lazy")
+    lazy.set_level("INFO")
+    value = Expensive()
+    try:
+        lazy.debug("value {}", value)
+        assert value.formatted == 0
+
+        lazy.info("value {}", value)
+        assert value.formatted == 1
+    finally:
+        lazy.set_level(previous)
+
+
+def test_sampler_keeps_first_and_every_nth():
+    sampler = _Sampler(first=2, every=3)
+
+    decisions = [sampler.allow("collect") for _ in range(9)]
+
+    assert decisions == [0, 0, None, None, 2, None, None, 2, None]
+    assert sampler.allow("other") == 0
+    assert sampler.drain() == {"collect": 1}
+    assert sampler.drain() == {}
+
+
+def test_queued_sink_writes_in_background():
+    written = []
+    sink = _QueuedSink(written.append)
+
+    for i in range(100):
+        sink(f"line {i}\n")
+    sink.flush()
+
+    assert written == [f"line {i}\n" for i in range(100)]
+
+
+def test_rotating_file_keeps_backups(tmp_path):
+    path = tmp_path / "logs" / "run.jsonl"
+    write = _RotatingFile(path, max_bytes=20, backups=2)
+
+    for i in range(5):
+        write(f'{{"n": {i}, "pad": 1}}\n')
+
+    assert path.read_text() == '{"n": 4, "pad": 1}\n'
+    assert (tmp_path / "logs" / "run.jsonl.1").read_text() == '{"n": 3, "pad": 1}\n'
+    assert (tmp_path / "logs" / "run.jsonl.2").exists()
+    assert not (tmp_path / "logs" / "run.jsonl.3").exists()
@@ -0,0 +1,14 @@
+from typer.testing import CliRunner
+
+
+def test_cli_module_imports_and_lists_commands():
+    # Тесты ядра не импортируют main_app: без этой проверки синтаксическая
+    # ошибка в нем проходит мимо набора тестов
+    import main
+    from src.core.main_app import App
+
+    result = CliRunner().invoke(main.cli_app, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "run" in result.output
+    assert App is not None
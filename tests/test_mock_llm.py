@@ -0,0 +1,136 @@
+import threading
+
+import pytest
+
+from src.core.logger import Logger
+from src.domain.exceptions import LLMConnectionError, LLMResponseError
+from src.llm.contracts import Message
+from src.llm.mock import MockLLMProvider
+from src.llm.mock_server import MockOpenRouterServer
+from src.llm.openrouter import OpenRouterLLMProvider
+from src.llm.simulation import LLMSimulator, SimulatedCompletion, SimulationProfile
+
+MESSAGES = [
+    Message(role="system", content="Ты аналитик"),
+    Message(role="user", content="Кратко перескажи отчет о продажах за квартал"),
+]
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+@pytest.fixture
+def mock_server(logger):
+    simulator = LLMSimulator(
+        SimulationProfile(latency="fixed", latency_ms=0, completion_ms_per_token=0)
+    )
+    server = MockOpenRouterServer(("127.0.0.1", 0), simulator, logger, vision=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _fast_profile(**kwargs):
+    return SimulationProfile(latency="fixed", latency_ms=0, **kwargs)
+
+
+def test_responses_are_deterministic_and_token_proportional():
+    profile = SimulationProfile(
+        latency="fixed",
+        latency_ms=100,
+        prompt_ms_per_token=1,
+        completion_ms_per_token=10,
+        completion_tokens=20,
+    )
+    dumped = [message.model_dump() for message in MESSAGES]
+
+    first = LLMSimulator(profile).complete(dumped)
+    second = LLMSimulator(profile.model_copy(update={"seed": 7})).complete(dumped)
+
+    assert first.text == second.text
+    assert first.text.startswith("[mock:")
+    assert first.completion_tokens == 20
+    assert first.first_token_delay == pytest.approx(0.1 + first.prompt_tokens / 1000)
+    assert first.total_delay == pytest.approx(first.first_token_delay + 0.2)
+    assert "".join(first.tokens()) == first.text
+
+
+@pytest.mark.parametrize("latency", ["uniform", "normal", "lognormal", "exponential"])
+def test_latency_samples_are_reproducible(latency):
+    profile = SimulationProfile(latency=latency, latency_ms=200, seed=3)
+    dumped = [message.model_dump() for message in MESSAGES]
+
+    delays = [LLMSimulator(profile).complete(dumped).first_token_delay for _ in range(2)]
+
+    assert delays[0] == delays[1]
+    assert delays[0] >= 0
+
+
+def test_mock_provider_retries_simulated_server_errors(logger, mocker):
+    mocker.patch("tenacity.nap.time.sleep", return_value=None)
+    simulator = mocker.Mock()
+    simulator.complete.side_effect = [
+        SimulatedCompletion(status_code=503),
+        SimulatedCompletion(text="готово", prompt_tokens=10, completion_tokens=1),
+    ]
+    provider = MockLLMProvider(simulator, logger, sleep=lambda _: None)
+
+    assert provider.generate_response(MESSAGES) == "готово"
+    assert simulator.complete.call_count == 2
+    assert provider.usage.requests == 1
+
+
+def test_mock_provider_surfaces_rate_limits(logger):
+    simulator = LLMSimulator(_fast_profile(rate_limit_rate=1.0))
+    provider = MockLLMProvider(simulator, logger, sleep=lambda _: None)
+
+    with pytest.raises(LLMResponseError, match="Rate limit"):
+        provider.generate_response(MESSAGES)
+
+
+def test_server_error_rate_exhausts_retries(logger, mocker):
+    mocker.patch("tenacity.nap.time.sleep", return_value=None)
+    simulator = LLMSimulator(_fast_profile(server_error_rate=1.0))
+    provider = MockLLMProvider(simulator, logger, sleep=lambda _: None)
+
+    with pytest.raises(LLMConnectionError):
+        provider.generate_response(MESSAGES)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_openrouter_provider_against_mock_server(mock_server, logger, stream):
+    host, port = mock_server.server_address[:2]
+    provider = OpenRouterLLMProvider(
+        api_key="key",
+        model="mock/model",
+        logger=logger,
+        timeout=5,
+        base_url=f"http://{host}:{port}/api/v1",
+        stream=stream,
+    )
+
+    response = provider.generate_response(MESSAGES)
+
+    expected = mock_server.simulator.complete([m.model_dump() for m in MESSAGES])
+    assert response == expected.text
+    assert provider.usage.completion_tokens == expected.completion_tokens
+    assert provider.supports_multimodal()
+
+
+def test_mock_server_injects_rate_limits(mock_server, logger):
+    mock_server.simulator.profile.rate_limit_rate = 1.0
+    host, port = mock_server.server_address[:2]
+    provider = OpenRouterLLMProvider(
+        api_key="key",
+        model="mock/model",
+        logger=logger,
+        timeout=5,
+        base_url=f"http://{host}:{port}/api/v1",
+    )
+
+    with pytest.raises(LLMResponseError, match="Rate limit"):
+        provider.generate_response(MESSAGES)
@@ -0,0 +1,135 @@
+import multiprocessing
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from src.core.logger import Logger
+from src.core.model_host import ModelHost
+from src.domain.exceptions import (
+    ModelHostError,
+    ModelUnavailableError,
+    OcrEngineUnavailableError,
+)
+from src.domain.models import OcrRegion
+from src.ocr.engines import HostedOcrEngine
+
+needs_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork is not available",
+)
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+def _load_summing_handler():
+    # Вместо модели: сумма массива, размер пачки и pid процесса-хоста
+    def handle(items):
+        if any(options.get("fail") for _, options in items):
+            raise ValueError("bad input")
+        return [
+            (float(array.sum()), array.dtype.str, len(items), os.getpid())
+            for array, _ in items
+        ]
+
+    return handle
+
+
+def _load_broken_handler():
+    raise ImportError("easyocr is not installed")
+
+
+def _load_ocr_handler():
+    def handle(items):
+        return [
+            [OcrRegion(text=f"{array.shape}", confidence=0.9, bbox=(0, 0, 1, 1))]
+            for array, _ in items
+        ]
+
+    return handle
+
+
+@pytest.fixture
+def host(logger):
+    host = ModelHost("test", _load_summing_handler, logger, batch_wait_ms=200).start()
+    yield host
+    host.close()
+
+
+def test_infer_passes_arrays_through_shared_memory(host):
+    client = host.client()
+
+    total, dtype, _, host_pid = client.infer(
+        np.arange(12, dtype=np.float32).reshape(3, 4)
+    )
+
+    assert total == 66.0
+    assert dtype == np.dtype(np.float32).str
+    assert host_pid != os.getpid()
+
+
+def test_concurrent_requests_are_batched(host):
+    client = host.client()
+    results = []
+
+    def infer(value):
+        results.append(client.infer(np.full(4, value, dtype=np.uint8)))
+
+    threads = [threading.Thread(target=infer, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(result[0] for result in results) == [0.0, 4.0, 8.0, 12.0]
+    assert max(result[2] for result in results) > 1
+
+
+def test_handler_errors_do_not_stop_the_host(host):
+    client = host.client()
+
+    with pytest.raises(ModelHostError, match="bad input"):
+        client.infer(np.zeros(2), fail=True)
+    assert client.infer(np.ones(2))[0] == 2.0
+
+
+def _infer_in_child(client, results):
+    results.put(client.infer(np.ones(3))[3])
+
+
+@needs_fork
+def test_forked_workers_share_one_host(host):
+    client = host.client()
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    workers = [
+        context.Process(target=_infer_in_child, args=(client, results)) for _ in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=10)
+
+    pids = {results.get(timeout=5) for _ in workers}
+    assert pids == {client.infer(np.ones(1))[3]}
+
+
+def test_model_load_failure_disables_hosted_ocr_engine(logger):
+    broken = ModelHost("easyocr", _load_broken_handler, logger).start()
+    working = ModelHost("easyocr", _load_ocr_handler, logger).start()
+    try:
+        with pytest.raises(ModelUnavailableError, match="easyocr is not installed"):
+            broken.client().infer(np.zeros(1))
+        with pytest.raises(OcrEngineUnavailableError):
+            HostedOcrEngine("easyocr", broken).recognize(np.zeros((2, 2)))
+
+        regions = HostedOcrEngine("easyocr", working).recognize(np.zeros((5, 7)))
+    finally:
+        broken.close()
+        working.close()
+
+    assert regions[0].text == "(5, 7)"
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from src.core.logger import Logger
+from src.domain.exceptions import OcrEngineUnavailableError
+from src.domain.models import OcrRegion
+from src.ocr.cascade import OcrCascade, create_ocr_cascade
+from src.ocr.engines import TesseractEngine
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+class _FakeEngine:
+    def __init__(self, name, regions, unavailable=False):
+        self.name = name
+        self._regions = regions
+        self._unavailable = unavailable
+        self.shapes = []
+
+    def recognize(self, image):
+        if self._unavailable:
+            raise OcrEngineUnavailableError("missing")
+        self.shapes.append(image.shape)
+        return self._regions(image) if callable(self._regions) else self._regions
+
+
+IMAGE = np.zeros((100, 200, 3), dtype=np.uint8)
+
+
+def test_clean_page_does_not_touch_slow_engine(logger):
+    fast = _FakeEngine(
+        "fast", [OcrRegion(text="clean", confidence=0.95, bbox=(0, 0, 50, 10))]
+    )
+    slow = _FakeEngine("slow", [])
+
+    result = OcrCascade([fast, slow], logger).recognize(IMAGE)
+
+    assert result.text == "clean"
+    assert result.engines == ["fast"]
+    assert slow.shapes == []
+
+
+def test_only_weak_regions_are_escalated(logger):
+    fast = _FakeEngine(
+        "fast",
+        [
+            OcrRegion(text="good line", confidence=0.9, bbox=(0, 0, 100, 10)),
+            OcrRegion(text="b4d", confidence=0.3, bbox=(10, 50, 40, 10)),
+        ],
+    )
+    slow = _FakeEngine(
+        "slow", [OcrRegion(text="bad", confidence=0.8, bbox=(0, 0, 40, 10))]
+    )
+    cascade = OcrCascade([fast, slow], logger, region_threshold=0.6, page_threshold=0.2)
+
+    result = cascade.recognize(IMAGE)
+
+    assert result.text == "good line\nbad"
+    assert result.engines == ["fast", "slow"]
+    # Повторно распознается только вырезанный регион с полями
+    assert slow.shapes == [(18, 48, 3)]
+    assert cascade.stats["slow"].calls == 1
+
+
+def test_unreadable_page_goes_to_slow_engine_whole(logger):
+    fast = _FakeEngine("fast", [OcrRegion(text="#@!", confidence=0.1, bbox=(0, 0, 9, 9))])
+    slow = _FakeEngine(
+        "slow", [OcrRegion(text="real text", confidence=0.7, bbox=(0, 0, 90, 10))]
+    )
+
+    result = OcrCascade([fast, slow], logger).recognize(IMAGE)
+
+    assert result.text == "real text"
+    assert slow.shapes == [IMAGE.shape]
+
+
+def test_unavailable_engine_is_skipped(logger):
+    missing = _FakeEngine("missing", [], unavailable=True)
+    fallback = _FakeEngine(
+        "fallback", [OcrRegion(text="ok", confidence=0.9, bbox=(0, 0, 9, 9))]
+    )
+    cascade = OcrCascade([missing, fallback], logger)
+
+    assert cascade.recognize(IMAGE).engines == ["fallback"]
+    assert cascade.recognize(IMAGE).text == "ok"
+
+    with pytest.raises(OcrEngineUnavailableError):
+        OcrCascade([missing], logger).recognize(IMAGE)
+
+
+def test_tesseract_blocks_are_grouped():
+    data = {
+        "text": ["", "Hello", "world", "next", "", "Other"],
+        "conf": [-1, 90, 80, 70, -1, 50],
+        "block_num": [1, 1, 1, 1, 2, 2],
+        "par_num": [1, 1, 1, 1, 1, 1],
+        "line_num": [1, 1, 1, 2, 1, 1],
+        "left": [0, 10, 60, 10, 0, 5],
+        "top": [0, 10, 10, 30, 0, 80],
+        "width": [0, 40, 45, 30, 0, 50],
+        "height": [0, 12, 12, 12, 0, 12],
+    }
+
+    regions = TesseractEngine(["ru", "en"])._group_blocks(data)
+
+    assert [r.text for r in regions] == ["Hello world\nnext", "Other"]
+    assert regions[0].bbox == (10, 10, 95, 32)
+    assert 0.7 < regions[0].confidence < 0.9
+
+
+def test_create_ocr_cascade_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        create_ocr_cascade("tesseract,unknown", "ru")
@@ -0,0 +1,198 @@
+import zipfile
+
+import pytest
+
+from src.core.archives import ArchiveLimits
+from src.core.document_collector import DocumentCollector
+from src.core.logger import Logger
+from src.domain.exceptions import DocumentReadError
+from src.readers.factory import ReaderFactory
+from src.readers.office_reader import OfficeReader
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+S = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+R = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+A = 'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+P = 'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+REL = 'xmlns="http://schemas.openxmlformats.org/package/2006/relationships"'
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+def _office(path, parts: dict[str, str]):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, xml in parts.items():
+            zf.writestr(name, xml)
+    return path
+
+
+def _rels(*targets: tuple[str, str]) -> str:
+    items = "".join(f'<Relationship Id="{i}" Target="{t}"/>' for i, t in targets)
+    return f"<Relationships {REL}>{items}</Relationships>"
+
+
+def test_docx_paragraphs_and_tables(tmp_path):
+    document = (
+        f"<w:document {W}><w:body>"
+        "<w:p><w:r><w:t>Quarterly</w:t></w:r><w:r><w:tab/><w:t>report</w:t></w:r></w:p>"
+        "<w:tbl>"
+        "<w:tr><w:tc><w:p><w:r><w:t>Region</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>Sales</w:t></w:r></w:p></w:tc></w:tr>"
+        "<w:tr><w:tc><w:p><w:r><w:t>North</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>42</w:t></w:r></w:p></w:tc></w:tr>"
+        "</w:tbl>"
+        "<w:p><w:r><w:instrText>PAGE</w:instrText><w:t>Итого</w:t></w:r></w:p>"
+        "</w:body></w:document>"
+    )
+    path = _office(tmp_path / "report.docx", {"word/document.xml": document})
+
+    content = OfficeReader().read(path)
+
+    assert content.text_content == "Quarterly\treport\nRegion | Sales\nNorth | 42\nИтого"
+
+
+def _xlsx(path, rows: list[list[str | int]]):
+    shared: list[str] = []
+    xml_rows = []
+    for number, values in enumerate(rows, start=1):
+        cells = []
+        for column, value in enumerate(values):
+            ref = f"{chr(ord('A') + column)}{number}"
+            if isinstance(value, str):
+                shared.append(value)
+                cells.append(f'<c r="{ref}" t="s"><v>{len(shared) - 1}</v></c>')
+            else:
+                cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+        xml_rows.append(f'<row r="{number}">{"".join(cells)}</row>')
+    strings = "".join(f"<si><t>{value}</t></si>" for value in shared)
+    return _office(
+        path,
+        {
+            "xl/workbook.xml": (
+                f'<workbook {S} {R}><sheets><sheet name="Data" r:id="rId1"/></sheets>'
+                "</workbook>"
+            ),
+            "xl/_rels/workbook.xml.rels": _rels(("rId1", "worksheets/sheet1.xml")),
+            "xl/sharedStrings.xml": f"<sst {S}>{strings}</sst>",
+            "xl/worksheets/sheet1.xml": (
+                f"<worksheet {S}><sheetData>{''.join(xml_rows)}</sheetData></worksheet>"
+            ),
+        },
+    )
+
+
+def test_xlsx_rows_are_capped_with_summary(tmp_path):
+    rows = [["Item", "Price"]] + [[f"item{i}", i] for i in range(1, 11)]
+    path = _xlsx(tmp_path / "prices.xlsx", rows)
+
+    lines = OfficeReader(max_rows_per_sheet=3).read(path).text_content.splitlines()
+
+    assert lines[:4] == ["## Sheet: Data", "Item | Price", "item1 | 1", "item2 | 2"]
+    assert lines[4] == (
+        "[... 8 more rows not shown (rows 4–11). Omitted rows: "
+        "Item: 8 text values; Price: 8 numbers, min 3, max 10, mean 6.5]"
+    )
+
+
+def test_xlsx_sparse_cells_keep_their_columns(tmp_path):
+    sheet = (
+        f"<worksheet {S}><sheetData>"
+        '<row r="1"><c r="A1" t="inlineStr"><is><t>a</t></is></c>'
+        '<c r="C1" t="b"><v>1</v></c></row>'
+        '<row r="2"><c r="B2"><v></v></c></row>'
+        "</sheetData></worksheet>"
+    )
+    path = _office(
+        tmp_path / "sparse.xlsx",
+        {
+            "xl/workbook.xml": (
+                f'<workbook {S} {R}><sheets><sheet name="S" r:id="rId7"/></sheets>'
+                "</workbook>"
+            ),
+            "xl/_rels/workbook.xml.rels": _rels(("rId7", "/xl/worksheets/s.xml")),
+            "xl/worksheets/s.xml": sheet,
+        },
+    )
+
+    assert OfficeReader().read(path).text_content == "## Sheet: S\na |  | TRUE"
+
+
+def test_pptx_slides_follow_presentation_order(tmp_path):
+    def slide(text: str) -> str:
+        return (
+            f"<p:sld {P} {A}><p:cSld><p:spTree><p:sp><p:txBody>"
+            f"<a:p><a:r><a:t>{text}</a:t></a:r></a:p>"
+            "</p:txBody></p:sp></p:spTree></p:cSld></p:sld>"
+        )
+
+    path = _office(
+        tmp_path / "deck.pptx",
+        {
+            "ppt/presentation.xml": (
+                f'<p:presentation {P} {R}><p:sldIdLst><p:sldId id="1" r:id="rId3"/>'
+                '<p:sldId id="2" r:id="rId2"/></p:sldIdLst></p:presentation>'
+            ),
+            "ppt/_rels/presentation.xml.rels": _rels(
+                ("rId2", "slides/slide1.xml"), ("rId3", "slides/slide2.xml")
+            ),
+            "ppt/slides/slide1.xml": slide("Second"),
+            "ppt/slides/slide2.xml": slide("First"),
+        },
+    )
+
+    assert OfficeReader().read(path).text_content == (
+        "## Slide 1\nFirst\n## Slide 2\nSecond"
+    )
+
+
+def test_odt_headings_spans_and_tables(tmp_path):
+    content = (
+        '<office:document-content xmlns:office="urn:oasis:names:tc:opendocument:'
+        'xmlns:office:1.0" xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+        ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">'
+        "<office:body><office:text>"
+        "<text:h>Title</text:h>"
+        "<text:p>Hello <text:span>bold</text:span> world</text:p>"
+        '<text:p>Name:<text:tab/>Ann<text:s text:c="3"/>Lee<text:s/>'
+        "<text:span>Jr<text:line-break/>Second</text:span> line</text:p>"
+        "<table:table><table:table-row>"
+        "<table:table-cell><text:p>a</text:p></table:table-cell>"
+        "<table:table-cell><text:p>b</text:p></table:table-cell>"
+        "</table:table-row></table:table>"
+        "</office:text></office:body></office:document-content>"
+    )
+    path = _office(tmp_path / "letter.odt", {"content.xml": content})
+
+    assert OfficeReader().read(path).text_content == (
+        "Title\nHello bold world\nName:\tAnn   Lee Jr\nSecond line\na | b"
+    )
+
+
+def test_broken_and_oversized_files_raise_read_errors(tmp_path):
+    broken = tmp_path / "broken.docx"
+    broken.write_bytes(b"not a zip")
+    bomb = _office(
+        tmp_path / "bomb.docx",
+        {
+            "word/document.xml": f"<w:document {W}>"
+            + " " * (4 * 1024 * 1024)
+            + "</w:document>"
+        },
+    )
+
+    with pytest.raises(DocumentReadError, match="broken.docx"):
+        OfficeReader().read(broken)
+    with pytest.raises(DocumentReadError, match="compression ratio"):
+        OfficeReader(archive_limits=ArchiveLimits(max_ratio=100)).read(bomb)
+
+
+def test_collector_reads_office_files(tmp_path, logger):
+    path = _xlsx(tmp_path / "a.xlsx", [["x", 1]])
+    collector = DocumentCollector(ReaderFactory([OfficeReader()]), logger, max_retries=0)
+
+    documents = collector.collect([path])
+
+    assert documents[0].content.text_content == "## Sheet: Data\nx | 1"
@@ -0,0 +1,68 @@
+import csv
+import json
+from pathlib import Path
+
+from src.domain.models import DocumentSummary
+from src.output.formatter import (
+    CsvFormatter,
+    JsonlFormatter,
+    MarkdownFormatter,
+    OutputFormat,
+    create_document_formatter,
+)
+from src.output.writer import StreamingFileWriter
+
+
+def _result(name, summary="Summary", error=None):
+    return DocumentSummary(path=Path(name), size_bytes=10, summary=summary, error=error)
+
+
+def test_jsonl_writer_appends_records(tmp_path):
+    output = tmp_path / "out.jsonl"
+
+    with StreamingFileWriter(output, JsonlFormatter()) as writer:
+        writer.write(_result("a.txt"))
+    # В режиме append повторное открытие дописывает, а не перезаписывает файл
+    with StreamingFileWriter(output, JsonlFormatter(), append=True) as writer:
+        writer.write(_result("b.txt", summary=None, error="boom"))
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r["path"] for r in records] == ["a.txt", "b.txt"]
+    assert records[1]["error"] == "boom"
+
+
+def test_writer_overwrites_previous_run_by_default(tmp_path):
+    output = tmp_path / "out.csv"
+
+    for _ in range(2):
+        with StreamingFileWriter(output, CsvFormatter()) as writer:
+            writer.write(_result("a.txt"))
+
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["path"] for row in rows] == ["a.txt"]
+
+
+def test_csv_writer_writes_header_once(tmp_path):
+    output = tmp_path / "out.csv"
+
+    for name in ("a.txt", "b.txt"):
+        with StreamingFileWriter(output, CsvFormatter(), append=True) as writer:
+            writer.write(_result(name, summary="line1\nline2, with comma"))
+
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["path"] for row in rows] == ["a.txt", "b.txt"]
+    assert rows[0]["summary"] == "line1\nline2, with comma"
+
+
+def test_markdown_formatter_renders_errors():
+    text = MarkdownFormatter().format_document(_result("a.txt", None, "timeout"))
+
+    assert text.startswith("## a.txt")
+    assert "**Error:** timeout" in text
+
+
+def test_create_document_formatter():
+    assert isinstance(create_document_formatter(OutputFormat.CSV), CsvFormatter)
+    assert isinstance(create_document_formatter("jsonl"), JsonlFormatter)
@@ -0,0 +1,96 @@
+import pytest
+from PIL import Image, ImageDraw
+
+from src.core.logger import Logger
+from src.domain.models import OcrRegion, OcrResult
+from src.ocr.cascade import OcrCascade
+from src.ocr.page_cache import OcrPageCache
+from src.readers.isolation import FORK_AVAILABLE, IsolatedReader
+from src.readers.pdf_reader import PdfReader
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+@pytest.fixture
+def scanned_pdf(tmp_path):
+    # PDF из картинок: текстового слоя нет, как у скана
+    pages = []
+    for label in ("first", "second"):
+        page = Image.new("RGB", (300, 200), "white")
+        ImageDraw.Draw(page).text((20, 80), label, fill="black")
+        pages.append(page)
+    path = tmp_path / "scan.pdf"
+    pages[0].save(path, save_all=True, append_images=pages[1:])
+    return path
+
+
+def _reader(mocker, tmp_path, logger):
+    ocr = mocker.Mock()
+    ocr.recognize.side_effect = lambda image: OcrResult(
+        text=f"page {image.shape}", confidence=0.9, engines=["fake"]
+    )
+    cache = OcrPageCache(tmp_path / "cache" / "ocr.sqlite3")
+    reader = PdfReader(
+        ocr=ocr, page_cache=cache, ocr_dpi=72, ocr_workers=2, logger=logger
+    )
+    return reader, ocr
+
+
+def test_scanned_pages_are_ocred_and_cached(scanned_pdf, tmp_path, mocker, logger):
+    reader, ocr = _reader(mocker, tmp_path, logger)
+
+    content = reader.read(scanned_pdf)
+
+    assert ocr.recognize.call_count == 2
+    assert content.text_content.count("page (200, 300)") == 2
+
+    again = reader.read(scanned_pdf)
+    assert ocr.recognize.call_count == 2
+    assert again.text_content == content.text_content
+
+
+def test_unchanged_pages_hit_cache_after_file_change(
+    scanned_pdf, tmp_path, mocker, logger
+):
+    reader, ocr = _reader(mocker, tmp_path, logger)
+    reader.read(scanned_pdf)
+
+    # Меняем байты файла, но не содержимое страниц
+    with open(scanned_pdf, "ab") as f:
+        f.write(b"\n% trailing comment\n")
+    reader.read(scanned_pdf)
+
+    assert ocr.recognize.call_count == 2
+
+
+def test_pdf_without_ocr_keeps_text_layer_only(scanned_pdf):
+    content = PdfReader().read(scanned_pdf)
+
+    assert content.text_content == ""
+    assert content.images == []
+
+
+class _FakeEngine:
+    name = "fake"
+
+    def recognize(self, image):
+        return [OcrRegion(text="scanned", confidence=0.8, bbox=(0, 0, 10, 10))]
+
+
+@pytest.mark.skipif(not FORK_AVAILABLE, reason="fork is not available")
+def test_isolated_pdf_ocr_stats_reach_parent(scanned_pdf, logger):
+    cascade = OcrCascade([_FakeEngine()], logger)
+    reader = IsolatedReader(
+        PdfReader(ocr=cascade, ocr_dpi=72, logger=logger), logger, timeout_seconds=30
+    )
+    try:
+        content = reader.read(scanned_pdf)
+    finally:
+        reader.close()
+
+    assert content.text_content.count("scanned") == 2
+    assert cascade.stats["fake"].calls == 2
+    assert cascade.stats["fake"].mean_confidence == pytest.approx(0.8)
@@ -0,0 +1,141 @@
+import pytest
+import requests_mock
+
+from src.core.deduplicator import Deduplicator
+from src.core.document_collector import DocumentCollector
+from src.core.extraction_timings import ExtractionTimings
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.core.run_planner import RunPlanner
+from src.domain.models import ProviderStatus
+from src.llm.openrouter import OpenRouterLLMProvider
+from src.prompts.template import PromptTemplate
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+@pytest.fixture
+def folder(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("а" * 4000)
+    (docs / "b.txt").write_text("б" * 8000)
+    (docs / "b_copy.txt").write_text("б" * 8000)
+    (docs / "image.bin").write_bytes(b"\x00" * 10)
+    return docs
+
+
+def _planner(tmp_path, logger, mocker, status, max_file_size_bytes=1024 * 1024):
+    factory = ReaderFactory(readers=[TxtReader()])
+    timings = ExtractionTimings(tmp_path / "timings.json")
+    collector = DocumentCollector(
+        reader_factory=factory,
+        logger=logger,
+        max_file_size_bytes=max_file_size_bytes,
+        timings=timings,
+    )
+    llm = mocker.Mock()
+    llm.probe.return_value = status
+    planner = RunPlanner(
+        scanner=FolderScanner(logger=logger),
+        collector=collector,
+        reader_factory=factory,
+        timings=timings,
+        llm_provider=llm,
+        logger=logger,
+        deduplicator=Deduplicator(logger=logger),
+    )
+    return planner, collector, timings
+
+
+def test_timings_are_calibrated_from_history(tmp_path):
+    timings = ExtractionTimings(tmp_path / "timings.json")
+    prior_seconds, prior_tokens = timings.estimate("PdfReader", ".pdf", 1024 * 1024)
+    assert prior_seconds == pytest.approx(1.0)
+
+    timings.record("PdfReader", ".PDF", 1000, 2.0, 400)
+    timings.save()
+
+    reloaded = ExtractionTimings(tmp_path / "timings.json")
+    assert reloaded.estimate("PdfReader", ".pdf", 2000) == (pytest.approx(4.0), 200)
+
+
+def test_collector_records_extraction_timings(folder, tmp_path, logger, mocker):
+    _, collector, timings = _planner(tmp_path, logger, mocker, None)
+
+    collector.collect([folder / "a.txt"])
+
+    assert (tmp_path / "timings.json").exists()
+    _, tokens = ExtractionTimings(tmp_path / "timings.json").estimate(
+        "TxtReader", ".txt", (folder / "a.txt").stat().st_size
+    )
+    assert tokens == 1000
+
+
+def test_plan_lists_files_requests_and_cost(folder, tmp_path, logger, mocker):
+    status = ProviderStatus(
+        ok=True, message="ok", context_length=100_000, prompt_price=1e-6
+    )
+    planner, _, _ = _planner(tmp_path, logger, mocker, status)
+    prompt = PromptTemplate(instruction="Кратко перескажи")
+
+    plan = planner.plan(folder, prompt)
+    per_document = planner.plan(folder, prompt, per_document=True)
+
+    reasons = {file.path.name: file.skip_reason for file in plan.files}
+    assert reasons["a.txt"] is None
+    assert reasons["image.bin"] == "no reader"
+    assert "duplicate of" in (reasons["b.txt"] or reasons["b_copy.txt"])
+    assert plan.requests == 1
+    assert per_document.requests == 2
+    assert plan.prompt_tokens > sum(file.estimated_tokens for file in plan.selected)
+    assert plan.estimated_cost == pytest.approx(plan.prompt_tokens * 1e-6)
+    assert not plan.problems
+
+
+def test_plan_reports_context_overflow_and_provider_errors(
+    folder, tmp_path, logger, mocker
+):
+    prompt = PromptTemplate(instruction="Кратко перескажи")
+    small = ProviderStatus(ok=True, message="ok", context_length=1000)
+    planner, _, _ = _planner(tmp_path, logger, mocker, small)
+
+    assert "exceeds the model context" in planner.plan(folder, prompt).problems[0]
+    assert not planner.plan(folder, prompt, top_k=1).problems
+
+    broken = ProviderStatus(ok=False, message="OPENROUTER_API_KEY is not set")
+    planner, _, _ = _planner(tmp_path, logger, mocker, broken)
+    assert planner.plan(folder, prompt).problems == ["OPENROUTER_API_KEY is not set"]
+
+
+def test_openrouter_probe(logger):
+    assert not OpenRouterLLMProvider(api_key="", model="m", logger=logger).probe().ok
+
+    provider = OpenRouterLLMProvider(api_key="key", model="vendor/model", logger=logger)
+    catalog = {
+        "data": [
+            {
+                "id": "vendor/model",
+                "context_length": 32_000,
+                "pricing": {"prompt": "0.000002", "completion": "0.000004"},
+            }
+        ]
+    }
+    with requests_mock.Mocker() as m:
+        m.get(provider.KEY_URL, json={"data": {}})
+        m.get(provider.MODELS_URL, json=catalog)
+        status = provider.probe()
+
+        m.get(provider.KEY_URL, status_code=401)
+        unauthorized = provider.probe()
+
+    assert status.ok
+    assert status.context_length == 32_000
+    assert status.prompt_price == pytest.approx(2e-6)
+    assert not unauthorized.ok
+    assert "API Key" in unauthorized.message
@@ -0,0 +1,163 @@
+import io
+import json
+import multiprocessing
+import threading
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from src.core.document_collector import DocumentCollector
+from src.core.extraction_scheduler import ExtractionScheduler
+from src.core.extraction_timings import ExtractionTimings
+from src.core.logger import Logger
+from src.core.progress import ProgressTracker
+from src.domain.models import TokenUsage, TranscriptSegment
+from src.llm.tracked import ProgressLLMProvider
+from src.output.progress import JsonProgressStream, render_snapshot
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_collector_reports_bytes_per_reader(tmp_path, logger):
+    for name, size in {"a.txt": 100, "b.txt": 300, "c.txt": 50}.items():
+        (tmp_path / name).write_bytes(b"x" * size)
+    factory = ReaderFactory([TxtReader()])
+    tracker = ProgressTracker()
+    collector = DocumentCollector(
+        reader_factory=factory,
+        logger=logger,
+        max_retries=0,
+        scheduler=ExtractionScheduler(
+            factory, ExtractionTimings(tmp_path / "timings.json"), logger, light_workers=3
+        ),
+        progress=tracker,
+    )
+
+    collector.collect(sorted(tmp_path.glob("*.txt")))
+    snapshot = tracker.snapshot()
+
+    assert snapshot.stage == "extract"
+    assert snapshot.files_total == snapshot.files_done == 3
+    assert snapshot.bytes_done == snapshot.bytes_total == 450
+    assert snapshot.bytes_by_reader == {"TxtReader": 450}
+
+
+def _recognize_pages(tracker: ProgressTracker, pages: int) -> None:
+    for _ in range(pages):
+        tracker.ocr_page()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork is not available",
+)
+def test_ocr_pages_from_worker_processes_are_counted():
+    clock = Clock()
+    tracker = ProgressTracker(clock=clock)
+    tracker.set_stage("extract")
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_recognize_pages, args=(tracker, 5)) for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=10)
+    clock.now += 4
+
+    snapshot = tracker.snapshot()
+
+    assert snapshot.ocr_pages == 10
+    assert snapshot.ocr_pages_per_second == 2.5
+
+
+def test_audio_speed_and_eta():
+    clock = Clock()
+    tracker = ProgressTracker(clock=clock)
+    path = Path("talk.mp3")
+    tracker.set_stage("extract")
+    tracker.on_transcript_start(path)
+    for start in (0.0, 30.0, 60.0):
+        tracker.on_segment(path, TranscriptSegment(start=start, end=start + 30, text="x"))
+    tracker.on_transcript_end(path)
+    with tracker._lock:
+        tracker._bytes_total, tracker._bytes_done = 400, 100
+    clock.now += 10
+
+    snapshot = tracker.snapshot()
+
+    assert snapshot.audio_seconds == 90.0
+    assert snapshot.audio_speed == 9.0
+    assert snapshot.eta_seconds == 30.0
+
+
+def test_llm_requests_in_flight_and_tokens(logger, mocker):
+    usage = TokenUsage(prompt_tokens=1000, completion_tokens=100)
+    tracker = ProgressTracker(usage=usage)
+    tracker.start()
+    started, release = threading.Event(), threading.Event()
+
+    def respond(messages):
+        started.set()
+        release.wait(5)
+        usage.prompt_tokens += 40
+        usage.completion_tokens += 7
+        return "ok"
+
+    provider = mocker.Mock()
+    provider.generate_response.side_effect = respond
+    llm = ProgressLLMProvider(provider, tracker)
+    thread = threading.Thread(target=llm.generate_response, args=([],))
+    thread.start()
+    started.wait(5)
+
+    assert tracker.snapshot().llm_in_flight == 1
+    release.set()
+    thread.join()
+    snapshot = tracker.snapshot()
+    assert (snapshot.llm_in_flight, snapshot.llm_requests) == (0, 1)
+    assert (snapshot.prompt_tokens, snapshot.completion_tokens) == (40, 7)
+
+
+def test_json_stream_ends_with_done_line():
+    tracker = ProgressTracker()
+    tracker.scanned(3)
+    stream = io.StringIO()
+
+    with JsonProgressStream(tracker, stream, interval_seconds=0.01):
+        threading.Event().wait(0.05)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(lines) >= 2
+    assert lines[-1]["stage"] == "done"
+    assert lines[-1]["files_scanned"] == 3
+
+
+def test_render_snapshot_shows_all_stages():
+    tracker = ProgressTracker()
+    tracker.set_stage("extract")
+    tracker.file_done("PdfReader", 2 * 1024 * 1024)
+    tracker.ocr_page()
+    console = Console(record=True, width=160)
+
+    console.print(render_snapshot(tracker.snapshot()))
+    text = console.export_text()
+
+    assert "Extracting" in text
+    assert "PdfReader 2.0 MB" in text
+    assert "OCR 1 pages" in text
+    assert "LLM 0 in flight" in text
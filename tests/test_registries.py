@@ -54,3 +54,59 @@ def test_skill_registry_empty_dir(tmp_path, logger):
     registry = SkillRegistry(str(tmp_path / "non_existent"), logger)
     registry.load()  # Не должно падать
     assert len(registry.list_skills()) == 0
+
+
+def test_prompt_registry_reuses_snapshot(tmp_path, logger, mocker):
+    prompts = tmp_path / "prompts"
+    prompts.mkdir()
+    data = {"name": "cached", "description": "Desc", "prompt": "Body"}
+    (prompts / "cached.yaml").write_text(yaml.dump(data))
+    cache_path = tmp_path / "cache" / "prompts.json"
+
+    PromptRegistry(str(prompts), logger, cache_path=cache_path).load()
+    assert cache_path.exists()
+
+    registry = PromptRegistry(str(prompts), logger, cache_path=cache_path)
+    compile_file = mocker.spy(registry, "_compile_file")
+    registry.load()
+
+    # Неизменившийся файл не разбирается заново, текст читается лениво
+    compile_file.assert_not_called()
+    assert registry.get("cached").prompt == "Body"
+
+
+def test_prompt_registry_reparses_changed_file(tmp_path, logger):
+    prompt_file = tmp_path / "p.yaml"
+    prompt_file.write_text(yaml.dump({"name": "p", "description": "", "prompt": "old"}))
+    registry = PromptRegistry(str(tmp_path), logger)
+    registry.load()
+    assert registry.get("p").prompt == "old"
+
+    prompt_file.write_text(yaml.dump({"name": "p", "description": "", "prompt": "newer"}))
+    registry.load()
+    assert registry.get("p").prompt == "newer"
+
+
+def test_prompt_registry_records_errors(tmp_path, logger):
+    (tmp_path / "bad.yaml").write_text("- just\n- a list\n")
+
+    registry = PromptRegistry(str(tmp_path), logger)
+    registry.load()
+
+    assert list(registry.errors) == [tmp_path / "bad.yaml"]
+
+
+def test_skill_registry_skips_malformed_file(tmp_path, logger):
+    (tmp_path / "good.yaml").write_text(yaml.dump({"name": "good", "prompt": "P"}))
+    (tmp_path / "bad.toml").write_text("name = ")
+    cache_path = tmp_path / "skills.json"
+
+    registry = SkillRegistry(str(tmp_path), logger, cache_path=cache_path)
+    registry.load()
+
+    assert set(registry.list_skills()) == {"good"}
+    assert tmp_path / "bad.toml" in registry.errors
+
+    reloaded = SkillRegistry(str(tmp_path), logger, cache_path=cache_path)
+    reloaded.load()
+    assert reloaded.get("good").prompt == "P"
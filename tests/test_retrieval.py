@@ -0,0 +1,251 @@
+from pathlib import Path
+
+import pytest
+
+from src.core.deduplicator import Deduplicator
+from src.core.document_collector import DocumentCollector
+from src.core.document_service import DocumentService
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.domain.models import SearchHit
+from src.output.tables import display_search_results
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+from src.retrieval.chunker import TextChunker
+from src.retrieval.embedders import HashingEmbedder
+from src.retrieval.fulltext import FullTextIndex
+from src.retrieval.retriever import Retriever
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+@pytest.fixture
+def service(logger):
+    return DocumentService(
+        scanner=FolderScanner(logger=logger),
+        collector=DocumentCollector(
+            reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+        ),
+        logger=logger,
+    )
+
+
+@pytest.fixture
+def dedup_service(logger):
+    return DocumentService(
+        scanner=FolderScanner(logger=logger),
+        collector=DocumentCollector(
+            reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+        ),
+        logger=logger,
+        deduplicator=Deduplicator(logger=logger),
+    )
+
+
+def _write_skipped_files(folder):
+    # Файл без ридера и точная копия civil.txt
+    (folder / "blob.bin").write_bytes(b"\x00\x01")
+    (folder / "copy.txt").write_text((folder / "civil.txt").read_text())
+
+
+@pytest.fixture
+def retriever(tmp_path, logger):
+    return Retriever(
+        scanner=FolderScanner(logger=logger),
+        embedder=HashingEmbedder(dimension=512),
+        chunker=TextChunker(chunk_chars=200, overlap_chars=20),
+        logger=logger,
+        index_root=tmp_path / "indexes",
+    )
+
+
+def _write_corpus(folder):
+    folder.mkdir()
+    (folder / "civil.txt").write_text(
+        "Статья 1. Основные начала гражданского законодательства.\n\n"
+        "Статья 454. Договор купли-продажи: продавец обязуется передать вещь "
+        "в собственность покупателю.\n\n"
+        "Статья 606. Договор аренды: арендодатель предоставляет имущество."
+    )
+    (folder / "recipes.txt").write_text("Рецепт борща: свекла, капуста, картофель.")
+
+
+def test_chunker_respects_size_and_overlap():
+    chunker = TextChunker(chunk_chars=100, overlap_chars=10)
+    chunks = chunker.split("\n\n".join(["абзац " * 10] * 5) + "\n\n" + "x" * 250)
+
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert chunks[1].startswith(chunks[0][-10:])
+
+
+def test_hashing_embedder_is_normalized_and_similarity_aware():
+    embedder = HashingEmbedder(dimension=256)
+    vectors = embedder.embed(["договор купли-продажи", "договор купли", "борщ"])
+
+    assert vectors.shape == (3, 256)
+    assert abs(float((vectors[0] ** 2).sum()) - 1.0) < 1e-5
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+
+def test_retriever_selects_relevant_chunks(tmp_path, retriever, service):
+    folder = tmp_path / "docs"
+    _write_corpus(folder)
+
+    documents = retriever.retrieve(
+        folder, "договор купли-продажи покупатель", 1, service.get_documents_from_files
+    )
+
+    assert len(documents) == 1
+    assert documents[0].path.name == "civil.txt"
+    assert "купли-продажи" in documents[0].content.text_content
+    assert "борща" not in documents[0].content.text_content
+
+
+def test_retriever_reuses_index_and_reextracts_only_changed(
+    tmp_path, retriever, service, mocker
+):
+    folder = tmp_path / "docs"
+    _write_corpus(folder)
+    retriever.retrieve(folder, "аренда", 2, service.get_documents_from_files)
+
+    loader = mocker.Mock(side_effect=service.get_documents_from_files)
+    retriever.retrieve(folder, "аренда", 2, loader)
+    loader.assert_not_called()
+
+    (folder / "recipes.txt").write_text("Рецепт пирога с вишней и договор аренды кухни.")
+    (folder / "civil.txt").unlink()
+    loader.reset_mock()
+    documents = retriever.retrieve(folder, "аренда", 5, loader)
+
+    assert [p.name for p in loader.call_args.args[0]] == ["recipes.txt"]
+    assert [doc.path.name for doc in documents] == ["recipes.txt"]
+
+
+def test_retriever_retries_files_that_failed_to_load(
+    tmp_path, retriever, service, mocker
+):
+    folder = tmp_path / "docs"
+    _write_corpus(folder)
+    failing = mocker.Mock(
+        side_effect=lambda paths: service.get_documents_from_files(
+            [p for p in paths if p.name != "recipes.txt"]
+        )
+    )
+    retriever.retrieve(folder, "аренда", 2, failing)
+
+    loader = mocker.Mock(side_effect=service.get_documents_from_files)
+    retriever.retrieve(folder, "аренда", 2, loader)
+    assert [p.name for p in loader.call_args.args[0]] == ["recipes.txt"]
+
+    loader.reset_mock()
+    retriever.retrieve(folder, "аренда", 2, loader)
+    loader.assert_not_called()
+
+
+def test_retriever_remembers_skipped_and_duplicate_files(
+    tmp_path, retriever, dedup_service, mocker
+):
+    folder = tmp_path / "docs"
+    _write_corpus(folder)
+    _write_skipped_files(folder)
+    retriever.retrieve(folder, "аренда", 2, dedup_service.get_documents_from_files)
+
+    loader = mocker.Mock(side_effect=dedup_service.get_documents_from_files)
+    retriever.retrieve(folder, "аренда", 2, loader)
+    loader.assert_not_called()
+
+
+@pytest.fixture
+def fulltext(tmp_path, logger):
+    index = FullTextIndex(tmp_path / "fts.sqlite3", FolderScanner(logger=logger), logger)
+    yield index
+    index.close()
+
+
+def test_fulltext_search_and_incremental_update(tmp_path, fulltext, service, mocker):
+    folder = tmp_path / "docs"
+    _write_corpus(folder)
+    loader = mocker.Mock(side_effect=service.get_documents_from_files)
+
+    assert fulltext.update(folder, loader) == 2
+    hits = fulltext.search("аренды", folder)
+    assert [hit.path.name for hit in hits] == ["civil.txt"]
+    assert "[аренды]" in hits[0].snippet
+
+    assert fulltext.update(folder, loader) == 0
+    assert loader.call_count == 1
+
+    (folder / "recipes.txt").write_text("Договор аренды кухни")
+    fulltext.update(folder, loader)
+    assert [p.name for p in loader.call_args.args[0]] == ["recipes.txt"]
+    assert {hit.path.name for hit in fulltext.search("аренды", folder)} == {
+        "civil.txt",
+        "recipes.txt",
+    }
+
+
+def test_fulltext_search_accepts_plain_user_input(tmp_path, fulltext, service):
+    folder = tmp_path / "docs"
+    _write_corpus(folder)
+    fulltext.update(folder, service.get_documents_from_files)
+
+    hits = fulltext.search("купли-продажи", folder)
+    documents = fulltext.get_documents([hit.path for hit in hits])
+
+    assert [doc.path.name for doc in documents] == ["civil.txt"]
+    assert "Статья 454" in documents[0].content.text_content
+
+
+def test_fulltext_search_is_scoped_to_folder(tmp_path, fulltext, service):
+    _write_corpus(tmp_path / "docs")
+    (tmp_path / "docs2").mkdir()
+    (tmp_path / "docs2" / "other.txt").write_text("Договор аренды склада")
+    fulltext.update(tmp_path / "docs", service.get_documents_from_files)
+    fulltext.update(tmp_path / "docs2", service.get_documents_from_files)
+
+    hits = fulltext.search("аренды", tmp_path / "docs2")
+
+    assert [hit.path.name for hit in hits] == ["other.txt"]
+    assert len(fulltext.search("аренды")) == 2
+
+
+def test_fulltext_retries_files_that_failed_to_load(tmp_path, fulltext, service, mocker):
+    folder = tmp_path / "docs"
+    _write_corpus(folder)
+    # Первый раз recipes.txt не читается (например, таймаут ридера)
+    failing = mocker.Mock(
+        side_effect=lambda paths: service.get_documents_from_files(
+            [p for p in paths if p.name != "recipes.txt"]
+        )
+    )
+    fulltext.update(folder, failing)
+
+    loader = mocker.Mock(side_effect=service.get_documents_from_files)
+    assert fulltext.update(folder, loader) == 1
+    assert [p.name for p in loader.call_args.args[0]] == ["recipes.txt"]
+    assert fulltext.update(folder, loader) == 0
+
+
+def test_fulltext_remembers_skipped_and_duplicate_files(
+    tmp_path, fulltext, dedup_service
+):
+    folder = tmp_path / "docs"
+    _write_corpus(folder)
+    _write_skipped_files(folder)
+
+    assert fulltext.update(folder, dedup_service.get_documents_from_files) == 4
+    assert fulltext.update(folder, dedup_service.get_documents_from_files) == 0
+    assert [hit.path.name for hit in fulltext.search("аренды", folder)] == ["civil.txt"]
+
+
+def test_search_results_keep_hit_markers(capsys):
+    hit = SearchHit(path=Path("lease[1].txt"), score=1.0, snippet="the [lease] term")
+
+    display_search_results([hit])
+
+    output = capsys.readouterr().out
+    assert "the [lease] term" in output
+    assert "lease[1].txt" in output
@@ -0,0 +1,127 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.core.document_collector import DocumentCollector
+from src.core.document_service import DocumentService
+from src.core.folder_scanner import FolderScanner
+from src.core.logger import Logger
+from src.domain.exceptions import ServiceBusyError
+from src.domain.models import JobStatus
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+from src.server.api import create_server
+from src.server.service import SummaryService
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+def _make_service(logger, mocker, workers=1, queue_size=10):
+    prompt_manager = mocker.Mock()
+    prompt_manager.select.return_value = "Summarize"
+
+    summary_generator = mocker.Mock()
+    summary_generator.generate.side_effect = lambda docs, prompt: (
+        " | ".join(doc.content.text_content for doc in docs)
+    )
+
+    service = DocumentService(
+        scanner=FolderScanner(logger=logger),
+        collector=DocumentCollector(
+            reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+        ),
+        logger=logger,
+    )
+    return SummaryService(
+        prompt_manager=prompt_manager,
+        document_service=service,
+        summary_generator=summary_generator,
+        logger=logger,
+        workers=workers,
+        queue_size=queue_size,
+    )
+
+
+def _wait_for(service, task_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        task = service.get(task_id)
+        if task.status in (JobStatus.DONE, JobStatus.FAILED):
+            return task
+        time.sleep(0.01)
+    raise AssertionError("Task did not finish in time")
+
+
+def test_service_summarizes_files(tmp_path, logger, mocker):
+    (tmp_path / "a.txt").write_text("alpha")
+    service = _make_service(logger, mocker)
+    service.start()
+    try:
+        task = service.submit(files=[tmp_path / "a.txt"])
+        finished = _wait_for(service, task.id)
+    finally:
+        service.stop()
+
+    assert finished.status == JobStatus.DONE
+    assert finished.summary == "alpha"
+
+
+def test_service_rejects_when_queue_full(tmp_path, logger, mocker):
+    service = _make_service(logger, mocker, queue_size=1)
+    # Воркеры не запущены, поэтому очередь не разгружается
+    service.submit(folder=tmp_path)
+
+    with pytest.raises(ServiceBusyError):
+        service.submit(folder=tmp_path)
+
+
+def test_service_requires_single_source(tmp_path, logger, mocker):
+    service = _make_service(logger, mocker)
+
+    with pytest.raises(ValueError):
+        service.submit()
+    with pytest.raises(ValueError):
+        service.submit(folder=tmp_path, files=[tmp_path / "a.txt"])
+
+
+def test_http_api_roundtrip(tmp_path, logger, mocker):
+    (tmp_path / "a.txt").write_text("alpha")
+    service = _make_service(logger, mocker)
+    server = create_server(service, logger, host="127.0.0.1", port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    service.start()
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        request = urllib.request.Request(
+            f"{base_url}/jobs",
+            data=json.dumps({"folder": str(tmp_path)}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request) as response:
+            assert response.status == 202
+            task_id = json.load(response)["id"]
+
+        _wait_for(service, task_id)
+
+        with urllib.request.urlopen(f"{base_url}/jobs/{task_id}") as response:
+            assert json.load(response)["status"] == "done"
+        with urllib.request.urlopen(f"{base_url}/jobs/{task_id}/summary") as response:
+            assert response.read().decode() == "alpha"
+
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"{base_url}/jobs/unknown")
+        assert excinfo.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.stop()
@@ -0,0 +1,124 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.core.logger import Logger
+from src.domain.exceptions import SkillLoadError, SkillTimeoutError
+from src.domain.models import ContentType, Document, DocumentContent
+from src.skills.cache import SkillResultCache
+from src.skills.engine import SkillEngine
+from src.skills.registry import SkillRegistry
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+@pytest.fixture
+def skills_dir(tmp_path):
+    skills = {
+        "upper": {"class": "UppercaseSkill", "stage": "pre"},
+        "sign": {"class": "SignatureSkill", "stage": "post", "config": {"author": "QA"}},
+        "slow": {"class": "SlowSkill", "stage": "post", "timeout": 0.1},
+        "broken": {"module": "tests.missing_module", "class": "X", "stage": "pre"},
+        "prompt_only": {"prompt": "Summarize"},
+    }
+    for name, data in skills.items():
+        data = {"name": name, "module": "tests.sample_skills", **data}
+        (tmp_path / f"{name}.yaml").write_text(yaml.dump(data))
+    return tmp_path
+
+
+def _document(text):
+    return Document(
+        path=Path("a.txt"),
+        size_bytes=len(text),
+        content=DocumentContent(
+            file_path=Path("a.txt"), content_type=ContentType.TEXT, text_content=text
+        ),
+    )
+
+
+def _engine(skills_dir, logger, **kwargs):
+    return SkillEngine(SkillRegistry(str(skills_dir), logger), logger, **kwargs)
+
+
+def test_pre_skill_transforms_documents_and_is_memoized(skills_dir, logger, tmp_path):
+    cache_path = tmp_path / "data" / "skill_cache.sqlite3"
+    engine = _engine(skills_dir, logger, cache=SkillResultCache(cache_path))
+
+    first = engine.run_pre("upper", [_document("hello")])
+    second = engine.run_pre("upper", [_document("hello")])
+    engine.shutdown()
+
+    assert first[0].content.text_content == "HELLO"
+    assert second == first
+    assert engine.stats["upper"].calls == 1
+    assert engine.stats["upper"].cache_hits == 1
+
+
+def test_skill_cache_survives_engine_restart(skills_dir, logger, tmp_path):
+    cache_path = tmp_path / "data" / "skill_cache.sqlite3"
+    first_run = _engine(skills_dir, logger, cache=SkillResultCache(cache_path))
+    first_run.run_post("sign", "Итог", [_document("x")])
+    first_run.shutdown()
+
+    second_run = _engine(skills_dir, logger, cache=SkillResultCache(cache_path))
+    summary = second_run.run_post("sign", "Итог", [_document("x")])
+    second_run.shutdown()
+
+    assert summary == "Итог\n-- QA"
+    assert second_run.stats["sign"].calls == 0
+    assert second_run.stats["sign"].cache_hits == 1
+
+
+def test_post_skill_receives_config(skills_dir, logger):
+    engine = _engine(skills_dir, logger)
+
+    summary = engine.run_post("sign", "Итог", [_document("x")])
+    engine.shutdown()
+
+    assert summary == "Итог\n-- QA"
+
+
+def test_skills_without_stage_are_not_imported(skills_dir, logger, mocker):
+    engine = _engine(skills_dir, logger)
+    load = mocker.patch("src.skills.engine._load_skill_class")
+    documents = [_document("x")]
+
+    assert engine.run_pre("prompt_only", documents) is documents
+    assert engine.run_post(None, "s", documents) == "s"
+    load.assert_not_called()
+
+
+def test_skill_timeout_kills_worker_and_recovers(skills_dir, logger):
+    engine = _engine(skills_dir, logger, max_workers=1)
+    engine.run_post("sign", "s", [])
+    (worker,) = engine._idle
+
+    with pytest.raises(SkillTimeoutError):
+        engine.run_post("slow", "s", [])
+
+    assert not worker.alive
+    assert engine.run_post("sign", "s", []) == "s\n-- QA"
+    engine.shutdown()
+
+
+def test_broken_skill_module(skills_dir, logger):
+    engine = _engine(skills_dir, logger)
+
+    with pytest.raises(SkillLoadError):
+        engine.run_pre("broken", [_document("x")])
+
+
+def test_skills_run_in_worker_process(skills_dir, logger):
+    engine = _engine(skills_dir, logger, max_workers=1)
+
+    result = engine.run_pre("upper", [_document("proc")])
+    (worker,) = engine._idle
+    engine.shutdown()
+
+    assert result[0].content.text_content == "PROC"
+    assert not worker.alive
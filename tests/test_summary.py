@@ -0,0 +1,113 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.logger import Logger
+from src.core.summary_generator import SummaryGenerator
+from src.domain.exceptions import LLMConnectionError
+from src.domain.models import ContentType, Document, DocumentContent
+from src.prompts.template import PromptTemplate
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+def _document(name, text):
+    return Document(
+        path=Path(name),
+        size_bytes=len(text),
+        content=DocumentContent(
+            file_path=Path(name), content_type=ContentType.TEXT, text_content=text
+        ),
+    )
+
+
+class _ConcurrencyTrackingLLM:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def supports_multimodal(self) -> bool:
+        return False
+
+    def generate_response(self, messages):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+
+        content = messages[-1].content
+        if "broken" in content:
+            raise LLMConnectionError("boom")
+        return content.rsplit("\n", 1)[-1].upper()
+
+
+def test_generate_per_document_is_bounded_and_collects_errors(logger):
+    llm = _ConcurrencyTrackingLLM()
+    generator = SummaryGenerator(llm_provider=llm, logger=logger, max_workers=2)
+    documents = [_document(f"{i}.txt", f"text {i}") for i in range(6)]
+    documents.append(_document("bad.txt", "broken"))
+    documents.append(_document("empty.txt", ""))
+
+    results = {r.path.name: r for r in generator.generate_per_document(documents, "P")}
+
+    assert len(results) == 8
+    assert llm.max_active <= 2
+    assert results["3.txt"].summary == "TEXT 3"
+    assert results["bad.txt"].error == "boom"
+    assert results["empty.txt"].summary is None
+    assert results["empty.txt"].error is not None
+
+
+class _RecordingLLM:
+    def __init__(self):
+        self.calls = []
+
+    def supports_multimodal(self) -> bool:
+        return False
+
+    def generate_response(self, messages):
+        self.calls.append(messages)
+        return "ok"
+
+
+def test_static_prompt_prefix_is_shared_between_documents(logger):
+    llm = _RecordingLLM()
+    generator = SummaryGenerator(llm_provider=llm, logger=logger, max_workers=1)
+    template = PromptTemplate(
+        instruction="Summarize for $audience.",
+        sections={"Format": "Bullet points"},
+        variables={"audience": "lawyers"},
+        document_template="<doc name='$name'>$content</doc>",
+    )
+    documents = [_document("a.txt", "alpha $audience"), _document("b.txt", "beta")]
+
+    list(generator.generate_per_document(documents, template))
+
+    first, second = llm.calls
+    assert first[:2] == second[:2]
+    assert first[1].cache_prefix
+    assert first[1].content == "Summarize for lawyers.\n\n## Format\nBullet points"
+    # Текст документа не подставляется как шаблон
+    assert "<doc name='a.txt'>alpha $audience</doc>" in first[2].content
+    assert not first[2].cache_prefix
+
+
+def test_question_goes_after_documents(logger):
+    llm = _RecordingLLM()
+    generator = SummaryGenerator(llm_provider=llm, logger=logger)
+    template = PromptTemplate(instruction="P", system="Custom").with_question("Why?")
+
+    generator.generate([_document("a.txt", "alpha")], template)
+
+    messages = llm.calls[0]
+    assert messages[0].content == "Custom"
+    assert messages[1].content == "P"
+    assert messages[2].content.endswith("Вопрос: Why?")
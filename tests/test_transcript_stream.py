@@ -0,0 +1,189 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.core.document_collector import DocumentCollector
+from src.core.extraction_checkpoint import ExtractionCheckpoint
+from src.core.logger import Logger
+from src.core.summary_generator import SummaryGenerator
+from src.core.transcript_mapper import TranscriptMapper
+from src.domain.models import ContentType, Document, DocumentContent, TranscriptSegment
+from src.readers.factory import ReaderFactory
+from src.readers.isolation import FORK_AVAILABLE, IsolatedSegmentReader, isolate
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+class RecordingReader:
+    # Каждая строка файла - сегмент длиной 10 секунд; "crash" обрывает запись
+    # после третьего сегмента, пока crash=True
+    def __init__(self, crash: bool = False):
+        self.crash = crash
+        self.starts: list[float] = []
+
+    def supports(self, file_path: Path) -> bool:
+        return file_path.suffix == ".rec"
+
+    def get_supported_extensions(self) -> list[str]:
+        return [".rec"]
+
+    def read(self, file_path: Path) -> DocumentContent:
+        return DocumentContent(
+            file_path=file_path,
+            content_type=ContentType.TEXT,
+            text_content=" ".join(s.text for s in self.iter_segments(file_path)),
+        )
+
+    def iter_segments(
+        self, file_path: Path, start_seconds: float = 0.0
+    ) -> Iterator[TranscriptSegment]:
+        self.starts.append(start_seconds)
+        lines = file_path.read_text().splitlines()
+        for i, line in enumerate(lines):
+            start = i * 10.0
+            if start < start_seconds:
+                continue
+            if self.crash and i == 3:
+                raise RuntimeError("decoder crashed")
+            yield TranscriptSegment(start=start, end=start + 10.0, text=line)
+
+
+class Listener:
+    def __init__(self):
+        self.events: list[str] = []
+
+    def on_transcript_start(self, file_path: Path) -> None:
+        self.events.append("start")
+
+    def on_segment(self, file_path: Path, segment: TranscriptSegment) -> None:
+        self.events.append(segment.text)
+
+    def on_transcript_end(self, file_path: Path) -> None:
+        self.events.append("end")
+
+
+@pytest.fixture
+def recording(tmp_path):
+    path = tmp_path / "source" / "meeting.rec"
+    path.parent.mkdir()
+    path.write_text("\n".join(f"part{i}" for i in range(5)))
+    return path
+
+
+def test_crash_keeps_transcribed_segments(recording, tmp_path, logger):
+    reader = RecordingReader(crash=True)
+    listener = Listener()
+    collector = DocumentCollector(
+        reader_factory=ReaderFactory([reader]),
+        logger=logger,
+        max_retries=0,
+        segment_listeners=[listener],
+    )
+    checkpoint = ExtractionCheckpoint.for_folder(
+        tmp_path / "checkpoints", recording.parent
+    )
+
+    with collector.checkpoint_scope(checkpoint):
+        assert collector.collect([recording]) == []
+        reader.crash = False
+        listener.events.clear()
+        documents = collector.collect([recording])
+
+    assert reader.starts == [0.0, 30.0]
+    assert documents[0].content.text_content == "part0 part1 part2 part3 part4"
+    assert listener.events == ["start", *(f"part{i}" for i in range(5)), "end"]
+    checkpoint.close()
+
+
+def test_finished_transcript_drops_segment_rows(recording, tmp_path, logger):
+    reader = RecordingReader()
+    collector = DocumentCollector(reader_factory=ReaderFactory([reader]), logger=logger)
+    checkpoint = ExtractionCheckpoint.for_folder(
+        tmp_path / "checkpoints", recording.parent
+    )
+
+    with collector.checkpoint_scope(checkpoint):
+        collector.collect([recording])
+        collector.collect([recording])
+
+    assert reader.starts == [0.0]
+    assert checkpoint.get_segments(recording) == []
+    checkpoint.close()
+
+
+def _segments(count: int) -> list[TranscriptSegment]:
+    return [
+        TranscriptSegment(start=i * 60.0, end=(i + 1) * 60.0, text=f"slice{i}")
+        for i in range(count)
+    ]
+
+
+def test_mapper_summarizes_chunks_while_transcribing(logger, mocker):
+    llm = mocker.Mock()
+    llm.generate_response.side_effect = lambda messages: messages[-1].content.upper()
+    mapper = TranscriptMapper(llm, logger, chunk_chars=12)
+    path = Path("talk.mp3")
+
+    mapper.on_transcript_start(path)
+    for segment in _segments(5):
+        mapper.on_segment(path, segment)
+    mapper.on_transcript_end(path)
+
+    assert mapper.notes(path) == (
+        "[00:00:00–00:02:00] SLICE0 SLICE1\n\n"
+        "[00:02:00–00:04:00] SLICE2 SLICE3\n\n"
+        "[00:04:00–00:05:00] SLICE4"
+    )
+    assert llm.generate_response.call_count == 3
+
+
+def test_short_transcript_is_left_to_the_summary(logger, mocker):
+    llm = mocker.Mock()
+    mapper = TranscriptMapper(llm, logger, chunk_chars=1000)
+    path = Path("note.mp3")
+
+    mapper.on_transcript_start(path)
+    for segment in _segments(2):
+        mapper.on_segment(path, segment)
+    mapper.on_transcript_end(path)
+
+    assert mapper.notes(path) is None
+    llm.generate_response.assert_not_called()
+
+
+def test_summary_uses_chunk_notes(logger, mocker):
+    llm = mocker.Mock()
+    llm.generate_response.return_value = "notes"
+    mapper = TranscriptMapper(llm, logger, chunk_chars=6)
+    path = Path("talk.mp3")
+    for segment in _segments(2):
+        mapper.on_segment(path, segment)
+    generator = SummaryGenerator(llm, logger, transcript_mapper=mapper)
+    document = Document(
+        path=path,
+        size_bytes=1,
+        content=DocumentContent(
+            file_path=path, content_type=ContentType.TEXT, text_content="slice0 slice1"
+        ),
+    )
+
+    context = generator._build_context_from_docs([document], generator._as_template("x"))
+
+    assert "[00:00:00–00:01:00] notes" in context
+    assert "slice0 slice1" not in context
+
+
+@pytest.mark.skipif(not FORK_AVAILABLE, reason="fork is not available")
+def test_isolated_reader_streams_segments(recording, logger):
+    reader = isolate(RecordingReader(), logger, timeout_seconds=5)
+    try:
+        segments = list(reader.iter_segments(recording, start_seconds=20.0))
+    finally:
+        reader.close()
+
+    assert isinstance(reader, IsolatedSegmentReader)
+    assert [segment.text for segment in segments] == ["part2", "part3", "part4"]
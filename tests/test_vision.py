@@ -0,0 +1,171 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.document_collector import DocumentCollector
+from src.core.logger import Logger
+from src.core.summary_generator import SummaryGenerator
+from src.domain.models import ContentType, Document, DocumentContent, ImageData
+from src.readers.factory import ReaderFactory
+from src.readers.isolation import IsolatedReader
+from src.readers.vision import PayloadBudget, VisionPassThrough, text_density
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+def _text_page():
+    page = np.full((400, 600), 255, dtype=np.uint8)
+    # Строки «букв»: короткие черные штрихи с пробелами
+    for row in range(20, 380, 24):
+        for col in range(20, 580, 6):
+            page[row : row + 12, col : col + 3] = 0
+    return page
+
+
+def _photo():
+    x = np.linspace(0, 255, 600)
+    y = np.linspace(0, 255, 400)[:, None]
+    return ((x + y) / 2).astype(np.uint8)
+
+
+def test_text_density_separates_text_from_photos():
+    assert text_density(_text_page()) > 0.08
+    assert text_density(_photo()) < 0.01
+    assert text_density(np.full((10, 10), 128, dtype=np.uint8)) == 0.0
+
+
+def test_payload_budget_limits_total_size():
+    budget = PayloadBudget(limit_bytes=10)
+
+    assert budget.reserve(6)
+    assert not budget.reserve(6)
+    assert budget.reserve(4)
+    assert budget.used_bytes == 10
+
+
+def _vision(logger, mocker, image, supports=True, budget=1000):
+    encoder = mocker.Mock()
+    encoder.load.return_value = image
+    encoder.to_gray.side_effect = lambda img: img
+    encoder.encode.return_value = ImageData(base64_data="x" * 400, mime_type="image/jpeg")
+    return VisionPassThrough(
+        encoder=encoder,
+        supports_vision=lambda: supports,
+        logger=logger,
+        mode="auto",
+        payload_budget_bytes=budget,
+    )
+
+
+def test_auto_mode_keeps_text_pages_for_ocr(tmp_path, logger, mocker):
+    vision = _vision(logger, mocker, _text_page())
+
+    assert vision.read_image(tmp_path / "scan.png") is None
+
+
+def test_auto_mode_passes_photos_through_within_budget(tmp_path, logger, mocker):
+    vision = _vision(logger, mocker, _photo())
+
+    with vision.budget_scope():
+        first = vision.read_image(tmp_path / "a.png")
+        second = vision.read_image(tmp_path / "b.png")
+        third = vision.read_image(tmp_path / "c.png")
+
+    assert first.content_type == ContentType.MULTIMODAL
+    assert first.mime_type == "image/jpeg"
+    assert second is not None
+    # Бюджет 1000 байт вмещает только два изображения
+    assert third is None
+
+    with vision.budget_scope():
+        assert vision.read_image(tmp_path / "d.png") is not None
+
+
+class RasterReader:
+    # Имитирует PdfReader: каждая страница уходит модели изображением
+    def supports(self, file_path: Path) -> bool:
+        return file_path.suffix == ".pdf"
+
+    def get_supported_extensions(self) -> list[str]:
+        return [".pdf"]
+
+    def read(self, file_path: Path) -> DocumentContent:
+        return DocumentContent(
+            file_path=file_path,
+            content_type=ContentType.MULTIMODAL,
+            text_content="text",
+            images=[ImageData(base64_data="x" * 400, mime_type="image/jpeg")] * 2,
+        )
+
+
+def test_isolated_pages_are_counted_against_parent_budget(tmp_path, logger, mocker):
+    for name in ("a.pdf", "b.pdf"):
+        (tmp_path / name).write_text("x")
+    vision = _vision(logger, mocker, _photo())
+    reader = IsolatedReader(RasterReader(), logger, timeout_seconds=5)
+    collector = DocumentCollector(
+        reader_factory=ReaderFactory([reader]), logger=logger, vision=vision
+    )
+    try:
+        first, second = collector.collect([tmp_path / "a.pdf", tmp_path / "b.pdf"])
+        # Новый запуск получает новый бюджет
+        (third,) = collector.collect([tmp_path / "a.pdf"])
+    finally:
+        reader.close()
+
+    assert len(first.content.images) == 2
+    assert second.content.images == []
+    assert second.content.content_type == ContentType.TEXT
+    assert len(third.content.images) == 2
+
+
+def test_vision_disabled_for_text_only_models(tmp_path, logger, mocker):
+    vision = _vision(logger, mocker, _photo(), supports=False)
+
+    assert vision.read_image(tmp_path / "a.png") is None
+
+
+def test_encoder_downscales_to_pixel_budget():
+    cv2 = pytest.importorskip("cv2")
+    from src.readers.vision import ImageEncoder
+
+    image = np.zeros((2000, 3000, 3), dtype=np.uint8)
+    encoded = ImageEncoder(max_pixels=600_000).encode(image)
+
+    import base64
+
+    decoded = cv2.imdecode(
+        np.frombuffer(base64.b64decode(encoded.base64_data), np.uint8),
+        cv2.IMREAD_COLOR,
+    )
+    assert decoded.shape[0] * decoded.shape[1] <= 600_000
+    assert decoded.shape[1] / decoded.shape[0] == pytest.approx(1.5, rel=0.01)
+
+
+def test_summary_sends_images_as_parts(logger, mocker):
+    llm = mocker.Mock()
+    llm.generate_response.return_value = "ok"
+    generator = SummaryGenerator(llm_provider=llm, logger=logger)
+    document = Document(
+        path=Path("photo.png"),
+        size_bytes=10,
+        content=DocumentContent(
+            file_path=Path("photo.png"),
+            content_type=ContentType.MULTIMODAL,
+            base64_data="AAAA",
+            mime_type="image/jpeg",
+        ),
+    )
+
+    generator.generate([document], "Describe")
+
+    content = llm.generate_response.call_args.args[0][-1].content
+    assert content[-1] == {
+        "type": "image_url",
+        "image_url": {"url": "data:image/jpeg;base64,AAAA"},
+    }
+    assert content[-2]["text"] == "Изображение из photo.png:"
@@ -0,0 +1,147 @@
+import threading
+import zipfile
+
+import pytest
+
+from src.core.archives import ArchiveLimits
+from src.core.document_collector import DocumentCollector
+from src.core.document_service import DocumentService
+from src.core.folder_scanner import FolderScanner
+from src.core.folder_watcher import FolderWatcher
+from src.core.incremental_summarizer import IncrementalSummarizer
+from src.core.logger import Logger
+from src.readers.factory import ReaderFactory
+from src.readers.txt_reader import TxtReader
+
+
+@pytest.fixture
+def logger():
+    return Logger(name="test", level="DEBUG")
+
+
+@pytest.fixture
+def summarizer(logger, mocker):
+    collector = DocumentCollector(
+        reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+    )
+    service = DocumentService(
+        scanner=FolderScanner(logger=logger), collector=collector, logger=logger
+    )
+    generator = mocker.Mock()
+    generator.generate.side_effect = lambda docs, prompt: ",".join(
+        doc.content.text_content for doc in docs
+    )
+    return IncrementalSummarizer(service, collector, generator, logger)
+
+
+def test_incremental_summarizer_reads_only_touched_files(tmp_path, summarizer, mocker):
+    (tmp_path / "a.txt").write_text("a1")
+    (tmp_path / "b.txt").write_text("b1")
+    summarizer.load(tmp_path)
+    assert summarizer.summarize("p") == "a1,b1"
+
+    collect = mocker.spy(summarizer._collector, "iter_results")
+    (tmp_path / "b.txt").write_text("b2")
+    (tmp_path / "a.txt").unlink()
+    (tmp_path / "c.txt").write_text("c1")
+
+    changed = {tmp_path / "a.txt", tmp_path / "b.txt", tmp_path / "c.txt"}
+    assert summarizer.apply_changes(changed)
+
+    assert summarizer.summarize("p") == "b2,c1"
+    collected = [call.args[0] for call in collect.call_args_list]
+    assert collected == [[tmp_path / "b.txt"], [tmp_path / "c.txt"]]
+
+
+def test_incremental_summarizer_keeps_previous_version_on_read_error(
+    tmp_path, summarizer
+):
+    (tmp_path / "a.txt").write_text("a1")
+    summarizer.load(tmp_path)
+
+    (tmp_path / "a.txt").write_bytes(b"\xff\xfe broken")
+
+    assert not summarizer.apply_changes({tmp_path / "a.txt"})
+    assert summarizer.summarize("p") == "a1"
+
+
+def test_incremental_summarizer_ignores_unsupported_changes(tmp_path, summarizer):
+    summarizer.load(tmp_path)
+    (tmp_path / "image.bin").write_bytes(b"\x00")
+
+    assert not summarizer.apply_changes({tmp_path / "image.bin"})
+    assert summarizer.summarize("p") is None
+
+
+def _zip(path, members: dict[str, str]):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, text in members.items():
+            zf.writestr(name, text)
+
+
+@pytest.mark.parametrize("event", ["member", "archive"])
+def test_incremental_summarizer_rereads_changed_archive_members(
+    tmp_path, logger, mocker, event
+):
+    collector = DocumentCollector(
+        reader_factory=ReaderFactory(readers=[TxtReader()]), logger=logger
+    )
+    scanner = FolderScanner(logger=logger, archive_limits=ArchiveLimits())
+    service = DocumentService(scanner=scanner, collector=collector, logger=logger)
+    generator = mocker.Mock()
+    generator.generate.side_effect = lambda docs, prompt: ",".join(
+        doc.content.text_content for doc in docs
+    )
+    summarizer = IncrementalSummarizer(
+        service, collector, generator, logger, scanner=scanner
+    )
+    archive = tmp_path / "b.zip"
+    _zip(archive, {"a.txt": "a1", "old.txt": "o1"})
+    summarizer.load(tmp_path)
+    assert summarizer.summarize("p") == "a1,o1"
+
+    _zip(archive, {"a.txt": "a2", "new.txt": "n1"})
+    # Опрос сообщает о членах архива, watchdog - только о самом архиве
+    if event == "member":
+        changed = {archive / "a.txt", archive / "old.txt", archive / "new.txt"}
+    else:
+        changed = {archive}
+
+    assert summarizer.apply_changes(changed)
+    assert summarizer.summarize("p") == "a2,n1"
+
+    archive.unlink()
+    assert summarizer.apply_changes({archive})
+    assert summarizer.summarize("p") is None
+
+
+def test_folder_watcher_debounces_polling_events(tmp_path, logger, mocker):
+    mocker.patch(
+        "src.core.folder_watcher._WatchdogBackend", side_effect=ImportError("no watchdog")
+    )
+    watcher = FolderWatcher(
+        scanner=FolderScanner(logger=logger),
+        logger=logger,
+        debounce_seconds=0.3,
+        poll_interval=0.05,
+    )
+    stop = threading.Event()
+    batches: list[set] = []
+
+    def on_change(changed):
+        batches.append(changed)
+        stop.set()
+
+    thread = threading.Thread(target=watcher.watch, args=(tmp_path, on_change, stop))
+    thread.start()
+    try:
+        threading.Event().wait(0.1)
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        (tmp_path / ".hidden").write_text("h")
+        thread.join(timeout=5)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert batches == [{tmp_path / "a.txt", tmp_path / "b.txt"}]